@@ -9,20 +9,24 @@ Demonstrates:
 4. Calling specific servers directly
 """
 
-import requests
 from typing import Dict, List, Optional
 from collections import defaultdict
 
+from connectors import ConnectorsSync, Tool, ToolListFilters
+
 
 class MCPServerManager:
     """Manager for discovering and interacting with MCP servers."""
 
-    def __init__(self, gateway_url='http://localhost:3000'):
-        self.gateway_url = gateway_url.rstrip('/')
-        self.session = requests.Session()
-        self.session.headers['Content-Type'] = 'application/json'
+    def __init__(self, gateway_url='http://localhost:3000', tenant_id='demo-user'):
+        # One pooled connection shared by every call below
+        self.client = ConnectorsSync(base_url=gateway_url, tenant_id=tenant_id)
+
+    def close(self):
+        """Release the pooled gateway connection."""
+        self.client.close()
 
-    def list_all_tools(self, integration: Optional[str] = None, category: Optional[str] = None) -> List[Dict]:
+    def list_all_tools(self, integration: Optional[str] = None, category: Optional[str] = None) -> List[Tool]:
         """
         List all available tools.
 
@@ -33,23 +37,19 @@ class MCPServerManager:
         Returns:
             List of tool definitions
         """
-        params = {'limit': 1000}
-        if integration:
-            params['integration'] = integration
-        if category:
-            params['category'] = category
-
-        response = self.session.get(f'{self.gateway_url}/api/v1/tools/list', params=params)
-        response.raise_for_status()
-        return response.json()['tools']
+        # Walks every page, fetching up to 4 pages at once
+        return list(
+            self.client.tools.iter_all(
+                ToolListFilters(integration=integration, category=category, limit=200),
+                concurrency=4,
+            )
+        )
 
     def list_categories(self) -> List[str]:
         """Get all available categories."""
-        response = self.session.get(f'{self.gateway_url}/api/v1/categories')
-        response.raise_for_status()
-        return response.json()['categories']
+        return sorted({integration.category for integration in self.client.mcp.list()})
 
-    def group_by_server(self, tools: List[Dict]) -> Dict:
+    def group_by_server(self, tools: List[Tool]) -> Dict:
         """
         Group tools by their MCP server.
 
@@ -65,25 +65,25 @@ class MCPServerManager:
             if server_id not in servers:
                 servers[server_id] = {
                     'server_id': server_id,
-                    'integration': tool['integration'],
-                    'category': tool['category'],
+                    'integration': tool.integration,
+                    'category': tool.category,
                     'tools': []
                 }
 
             servers[server_id]['tools'].append({
-                'id': tool['id'],
-                'name': tool['name'],
-                'description': tool.get('description', ''),
-                'tokenCost': tool.get('tokenCost', 0)
+                'id': tool.tool_id,
+                'name': tool.name,
+                'description': tool.description or '',
+                'tokenCost': tool.token_cost or 0
             })
 
         return servers
 
-    def _infer_server_id(self, tool: Dict) -> str:
+    def _infer_server_id(self, tool: Tool) -> str:
         """Infer server ID from tool metadata."""
         # In real implementation, this would come from tool metadata
         # For now, use integration-category as identifier
-        return f"{tool['integration']}-{tool['category']}"
+        return f"{tool.integration}-{tool.category}"
 
     def get_server_stats(self) -> Dict:
         """Get comprehensive statistics about MCP servers."""
@@ -125,34 +125,22 @@ class MCPServerManager:
 
     def call_tool(
         self,
-        tool_id: str,
+        tool_name: str,
         integration: str,
-        parameters: Dict,
-        tenant_id: str = 'demo-user'
+        parameters: Dict
     ) -> Dict:
         """
         Call a specific tool (gateway automatically routes to correct server).
 
         Args:
-            tool_id: Tool identifier (e.g., 'github.createPullRequest')
+            tool_name: Tool name without prefix (e.g., 'createPullRequest')
             integration: Integration name (e.g., 'github')
             parameters: Tool parameters
-            tenant_id: Tenant/user identifier
 
         Returns:
             Tool execution result
         """
-        response = self.session.post(
-            f'{self.gateway_url}/api/v1/tools/invoke',
-            json={
-                'toolId': tool_id,
-                'integration': integration,
-                'tenantId': tenant_id,
-                'parameters': parameters
-            }
-        )
-        response.raise_for_status()
-        return response.json()
+        return self.client.mcp.get(integration).call(tool_name, parameters)
 
 
 def main():
@@ -165,7 +153,7 @@ def main():
     try:
         manager = MCPServerManager()
         # Test connection
-        manager.session.get(f'{manager.gateway_url}/health')
+        manager.client.health()
         print("✅ Connected to Connectors Gateway")
     except Exception as e:
         print(f"❌ Cannot connect to gateway: {e}")
@@ -236,10 +224,9 @@ def main():
     print("\nCode:")
     print("""
     result = manager.call_tool(
-        'github.listRepositories',
+        'listRepositories',
         'github',
-        {'type': 'all', 'sort': 'updated', 'per_page': 10},
-        tenant_id='demo-user'
+        {'type': 'all', 'sort': 'updated', 'per_page': 10}
     )
     """)
 
@@ -257,25 +244,27 @@ def main():
     all_tools = manager.list_all_tools()
     matching_tools = [
         tool for tool in all_tools
-        if search_term.lower() in tool.get('name', '').lower()
-        or search_term.lower() in tool.get('description', '').lower()
+        if search_term.lower() in tool.name.lower()
+        or search_term.lower() in (tool.description or '').lower()
     ]
 
     print(f"\nFound {len(matching_tools)} matching tools:")
     for tool in matching_tools[:5]:
-        print(f"\n  🔧 {tool['id']}")
-        print(f"     Integration: {tool['integration']}")
-        print(f"     Description: {tool.get('description', 'N/A')[:80]}...")
+        print(f"\n  🔧 {tool.tool_id}")
+        print(f"     Integration: {tool.integration}")
+        print(f"     Description: {(tool.description or 'N/A')[:80]}...")
 
     # Example 7: Server health check
     print("\n" + "="*70)
     print("Example 7: Gateway Health Check")
     print("="*70)
 
-    health = manager.session.get(f'{manager.gateway_url}/health').json()
-    print(f"Status: {health['status']}")
-    print(f"Uptime: {health['uptime']:.2f} seconds")
-    print(f"Memory: {health['memory']['heapUsed'] / 1024 / 1024:.2f} MB")
+    health = manager.client.health()
+    print(f"Status: {health.status}")
+    print(f"Uptime: {health.uptime or 0} seconds")
+    print(f"Version: {health.version or 'unknown'}")
+
+    manager.close()
 
     print("\n" + "="*70)
     print("✅ All examples completed!")
@@ -0,0 +1,92 @@
+"""Benchmark response decoding for large catalogs and invoke results.
+
+Compares the old two-pass path (JSON into dicts, then one model per tool)
+with validating models straight from the response bytes. Free-form invoke
+results are faster through the codec than through bytes validation, which is
+why ``tools.invoke`` decodes with the codec and validates only the envelope.
+
+Usage:
+    python benchmarks/bench_decode.py [--tools 10000] [--repeat 5]
+"""
+
+import argparse
+import json
+import timeit
+from typing import Any, Dict, List
+
+from connectors.codec import JSONCodec, default_codec
+from connectors.tools import _ToolList
+from connectors.types import Tool, ToolInvocationResponse
+
+
+def make_catalog(count: int) -> bytes:
+    """Build a /tools/list response body with count tools."""
+    tools: List[Dict[str, Any]] = [
+        {
+            "toolId": f"integration{i % 200}.action{i}",
+            "name": f"Action {i}",
+            "description": f"Performs action {i} against integration {i % 200}",
+            "integration": f"integration{i % 200}",
+            "category": ["code", "communication", "productivity", "data"][i % 4],
+            "tokenCost": 120 + i % 50,
+            "parameters": [
+                {"name": "id", "type": "string", "description": "Resource id", "required": True},
+                {"name": "limit", "type": "number", "description": "Page size", "required": False},
+            ],
+        }
+        for i in range(count)
+    ]
+    return json.dumps({"tools": tools, "total": count}).encode()
+
+
+def make_invoke_result(rows: int) -> bytes:
+    """Build a /tools/invoke response body with a spreadsheet-sized result."""
+    values = [[f"r{r}c{c}" for c in range(20)] for r in range(rows)]
+    return json.dumps({"success": True, "data": {"values": values}}).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tools", type=int, default=10000)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    catalog = make_catalog(args.tools)
+    invoke = make_invoke_result(args.rows)
+    body = json.loads(invoke)
+    codec = default_codec()
+
+    cases = {
+        f"tools/list, {args.tools} tools": {
+            "json + model_validate": lambda: [
+                Tool.model_validate(tool) for tool in json.loads(catalog)["tools"]
+            ],
+            "model_validate_json": lambda: _ToolList.model_validate_json(catalog).tools,
+        },
+        f"tools/invoke, {args.rows} rows": {
+            "json + model_validate": lambda: ToolInvocationResponse.model_validate(
+                json.loads(invoke)
+            ),
+            f"{codec.name} + model_validate": lambda: ToolInvocationResponse.model_validate(
+                codec.decode(invoke)
+            ),
+            "model_validate_json": lambda: ToolInvocationResponse.model_validate_json(invoke),
+        },
+        f"request body, {args.rows} rows": {
+            "json.dumps": lambda: JSONCodec().encode(body),
+            f"{codec.name}": lambda: codec.encode(body),
+        },
+    }
+
+    for title, variants in cases.items():
+        print(title)
+        baseline = None
+        for label, fn in variants.items():
+            best = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+            baseline = baseline or best
+            print(f"  {label:<28} {best * 1000:8.1f} ms  ({best / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
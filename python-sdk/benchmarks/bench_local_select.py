@@ -0,0 +1,195 @@
+"""Benchmark local tool selection quality and latency on a fixed query set.
+
+Runs the in-process hybrid retriever (BM25 + hashed embeddings, category →
+tool) over a small labeled catalog padded with synthetic tools, and reports
+hit rate, mean reciprocal rank and per-query latency. With --gateway, the
+labeled catalog is ignored: the gateway's own catalog is synced, every query
+is also sent to the gateway, and the local answers are scored against the
+gateway's (top-1 agreement and overlap), next to both latencies.
+
+Requires numpy (``pip install connectors-sdk[semantic]``).
+
+Usage:
+    python benchmarks/bench_local_select.py [--tools 10000] [--repeat 5]
+    python benchmarks/bench_local_select.py --gateway http://localhost:3000
+"""
+
+import argparse
+import json
+import statistics
+import time
+from typing import Any, Dict, List, Sequence, Tuple
+
+from connectors import ConnectorsSync, LocalSelectOptions, ReplicaOptions
+from connectors.retrieval import HybridRetriever
+
+from bench_decode import make_catalog
+
+CATALOG: List[Tuple[str, str, str]] = [
+    ("github.createPullRequest", "code", "Open a pull request to merge a branch"),
+    ("github.mergePullRequest", "code", "Merge an open pull request"),
+    ("github.createIssue", "code", "Create an issue in a repository"),
+    ("github.listCommits", "code", "List the commits of a branch"),
+    ("gitlab.createMergeRequest", "code", "Open a merge request for a branch"),
+    ("jira.createTicket", "code", "Create a Jira ticket to track a bug or task"),
+    ("jira.transitionTicket", "code", "Move a Jira ticket to another status"),
+    ("slack.sendMessage", "communication", "Post a message to a Slack channel"),
+    ("slack.createChannel", "communication", "Create a new Slack channel"),
+    ("gmail.sendEmail", "communication", "Send an email from a Gmail account"),
+    ("gmail.searchEmails", "communication", "Search the inbox for emails"),
+    ("outlook.scheduleMeeting", "communication", "Schedule a meeting and invite attendees"),
+    ("twilio.sendSms", "communication", "Send an SMS text message to a phone number"),
+    ("notion.createPage", "productivity", "Create a page in a Notion workspace"),
+    ("notion.searchPages", "productivity", "Search Notion pages by title or content"),
+    ("googleCalendar.createEvent", "productivity", "Add an event to a Google Calendar"),
+    ("googleDrive.uploadFile", "productivity", "Upload a file to Google Drive"),
+    ("googleSheets.appendRow", "productivity", "Append a row to a Google Sheets spreadsheet"),
+    ("trello.createCard", "productivity", "Create a card on a Trello board"),
+    ("asana.createTask", "productivity", "Create a task in an Asana project"),
+    ("postgres.runQuery", "data", "Run a SQL query against a Postgres database"),
+    ("snowflake.runQuery", "data", "Execute SQL on a Snowflake warehouse"),
+    ("bigquery.exportTable", "data", "Export a BigQuery table to Cloud Storage"),
+    ("s3.putObject", "data", "Store an object in an S3 bucket"),
+    ("salesforce.createLead", "crm", "Create a sales lead in Salesforce"),
+    ("salesforce.updateOpportunity", "crm", "Update the stage of a Salesforce opportunity"),
+    ("hubspot.createContact", "crm", "Add a contact to HubSpot"),
+    ("stripe.createInvoice", "payments", "Create and send an invoice to a customer"),
+    ("stripe.refundCharge", "payments", "Refund a card payment"),
+    ("shopify.listOrders", "payments", "List recent store orders"),
+]
+
+QUERIES: List[Tuple[str, str]] = [
+    ("open a pull request for my feature branch", "github.createPullRequest"),
+    ("merge the PR", "github.mergePullRequest"),
+    ("file a bug in the repo", "github.createIssue"),
+    ("show recent commits", "github.listCommits"),
+    ("create a jira ticket", "jira.createTicket"),
+    ("move ticket to done", "jira.transitionTicket"),
+    ("post an update in the team slack channel", "slack.sendMessage"),
+    ("email the report to my manager", "gmail.sendEmail"),
+    ("find emails from alice", "gmail.searchEmails"),
+    ("set up a meeting with the design team", "outlook.scheduleMeeting"),
+    ("text the customer", "twilio.sendSms"),
+    ("write meeting notes in notion", "notion.createPage"),
+    ("put the launch on my calendar", "googleCalendar.createEvent"),
+    ("upload the contract pdf to drive", "googleDrive.uploadFile"),
+    ("add a row to the budget spreadsheet", "googleSheets.appendRow"),
+    ("add a card to the trello board", "trello.createCard"),
+    ("create a task for the project", "asana.createTask"),
+    ("run sql on postgres", "postgres.runQuery"),
+    ("store the backup in s3", "s3.putObject"),
+    ("create a new sales lead", "salesforce.createLead"),
+    ("add this person to hubspot contacts", "hubspot.createContact"),
+    ("bill the customer for march", "stripe.createInvoice"),
+    ("refund the payment", "stripe.refundCharge"),
+    ("list shop orders", "shopify.listOrders"),
+]
+
+
+def labeled_catalog() -> List[Dict[str, Any]]:
+    """Build the labeled tools as /tools/list items."""
+    return [
+        {
+            "toolId": tool_id,
+            "name": tool_id.split(".")[1],
+            "description": description,
+            "integration": tool_id.split(".")[0],
+            "category": category,
+        }
+        for tool_id, category, description in CATALOG
+    ]
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+def report_latency(label: str, samples: Sequence[float]) -> None:
+    print(
+        f"  {label:<18} p50 {percentile(samples, 50) * 1000:7.2f} ms"
+        f"   p95 {percentile(samples, 95) * 1000:7.2f} ms"
+    )
+
+
+def bench_labeled(tools: int, repeat: int) -> None:
+    labeled = labeled_catalog()
+    padding = json.loads(make_catalog(tools))["tools"] if tools else []
+    catalog = labeled + padding
+
+    start = time.perf_counter()
+    retriever = HybridRetriever(catalog)
+    print(f"index build, {len(catalog)} tools: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    hits_at_1 = hits_at_5 = 0
+    reciprocal_ranks: List[float] = []
+    latencies: List[float] = []
+    for query, expected in QUERIES:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            results = retriever.search(query)
+            latencies.append(time.perf_counter() - start)
+        ids = [catalog[index]["toolId"] for index, _ in results]
+        rank = ids.index(expected) + 1 if expected in ids else None
+        hits_at_1 += rank == 1
+        hits_at_5 += rank is not None
+        reciprocal_ranks.append(1 / rank if rank else 0.0)
+        if rank != 1:
+            print(f"  miss: {query!r} -> {ids[:3]} (expected {expected})")
+
+    count = len(QUERIES)
+    print(f"quality, {count} labeled queries")
+    print(f"  hit@1 {hits_at_1 / count:.2f}   hit@5 {hits_at_5 / count:.2f}"
+          f"   MRR {statistics.mean(reciprocal_ranks):.2f}")
+    print("latency")
+    report_latency("local select", latencies)
+
+
+def bench_gateway(base_url: str, repeat: int) -> None:
+    with ConnectorsSync(
+        base_url,
+        replica=ReplicaOptions(enabled=True),
+        local_select=LocalSelectOptions(enabled=True, mode="local"),
+    ) as remote, ConnectorsSync(base_url) as gateway:
+        result = remote.catalog.sync(force=True)
+        print(f"synced {result.pages} pages, {result.tools_added} tools")
+
+        top1 = 0
+        overlaps: List[float] = []
+        local_latencies: List[float] = []
+        gateway_latencies: List[float] = []
+        for query, _ in QUERIES:
+            for _ in range(repeat):
+                start = time.perf_counter()
+                local = [tool.tool_id for tool in remote.tools.select(query)]
+                local_latencies.append(time.perf_counter() - start)
+                start = time.perf_counter()
+                expected = [tool.tool_id for tool in gateway.tools.select(query)]
+                gateway_latencies.append(time.perf_counter() - start)
+            top1 += bool(local and expected and local[0] == expected[0])
+            if expected:
+                overlaps.append(len(set(local) & set(expected)) / len(expected))
+
+        count = len(QUERIES)
+        print(f"agreement with gateway, {count} queries")
+        print(f"  top-1 {top1 / count:.2f}   overlap {statistics.mean(overlaps or [0.0]):.2f}")
+        print("latency")
+        report_latency("local select", local_latencies)
+        report_latency("gateway select", gateway_latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tools", type=int, default=10000, help="synthetic tools to add")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--gateway", help="compare against a running gateway")
+    args = parser.parse_args()
+
+    if args.gateway:
+        bench_gateway(args.gateway, args.repeat)
+    else:
+        bench_labeled(args.tools, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark trusted-mode catalog views against full validation.
+
+Times turning a /tools/list body into tools and then reading a few fields
+from every tool, which is what routing and display code typically does.
+
+Usage:
+    python benchmarks/bench_trusted.py [--tools 10000] [--repeat 5]
+"""
+
+import argparse
+import timeit
+from typing import Any, List
+
+from bench_decode import make_catalog
+from connectors.codec import default_codec
+from connectors.tools import _ToolList
+from connectors.views import _tool_views
+
+
+def touch(tools: List[Any]) -> None:
+    """Read the fields a router reads from each tool."""
+    for tool in tools:
+        tool.tool_id, tool.integration, tool.token_cost
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tools", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    catalog = make_catalog(args.tools)
+    codec = default_codec()
+
+    def validated() -> List[Any]:
+        return _ToolList.model_validate_json(catalog).tools  # type: ignore[no-any-return]
+
+    def trusted() -> List[Any]:
+        return _tool_views(codec.decode(catalog))
+
+    cases = {
+        f"parse, {args.tools} tools": {
+            "model_validate_json": validated,
+            f"{codec.name} + views": trusted,
+        },
+        f"parse + read 3 fields, {args.tools} tools": {
+            "model_validate_json": lambda: touch(validated()),
+            f"{codec.name} + views": lambda: touch(trusted()),
+        },
+        f"parse + to_model(), {args.tools} tools": {
+            "model_validate_json": validated,
+            f"{codec.name} + views": lambda: [tool.to_model() for tool in trusted()],
+        },
+    }
+
+    for title, variants in cases.items():
+        print(title)
+        baseline = None
+        for label, fn in variants.items():
+            best = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+            baseline = baseline or best
+            print(f"  {label:<28} {best * 1000:8.1f} ms  ({best / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
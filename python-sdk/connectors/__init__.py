@@ -3,13 +3,50 @@
 from .client import Connectors
 from .tools import ToolsAPI
 from .mcp import MCPRegistry, MCPServer, MCPDeploymentClass
+from .catalog import CatalogAPI, CatalogReplica
+from .sync_client import (
+    ConnectorsSync,
+    SyncToolsAPI,
+    SyncMCPRegistry,
+    SyncMCPServer,
+    SyncMCPDeploymentClass,
+    SyncCatalogAPI,
+)
+from .codec import Codec, JSONCodec, OrjsonCodec
+from .views import ModelView, ToolView, IntegrationView
 from .types import (
     ConnectorsConfig,
+    PoolOptions,
+    RetryBudgetOptions,
+    RetryStats,
+    ConcurrencyOptions,
+    ConcurrencyStats,
+    CircuitBreakerOptions,
+    CircuitBreakerStats,
+    HedgeOptions,
+    HedgeStats,
+    SingleFlightOptions,
+    SingleFlightStats,
+    SelectCacheOptions,
+    SelectCacheStats,
+    ReplicaOptions,
+    CatalogSyncResult,
+    LocalSelectOptions,
+    CompressionOptions,
+    CompressionStats,
+    IdempotencyOptions,
+    IdempotencyStats,
+    HTTPCacheOptions,
+    HTTPCacheStats,
+    RateLimitOptions,
+    RateLimitStats,
     Tool,
     ToolSelectionOptions,
     ToolListFilters,
     InvokeOptions,
     ToolInvocationResponse,
+    InvokeResult,
+    DownloadResult,
     MCPDeploymentConfig,
     MCPSourceType,
     MCPIntegration,
@@ -21,7 +58,11 @@ from .errors import (
     ConnectorsError,
     HTTPError,
     TimeoutError,
+    DeadlineExceededError,
     RetryableError,
+    ConcurrencyLimitError,
+    RateLimitError,
+    CircuitOpenError,
     ValidationError,
     DeploymentTimeoutError,
     DeploymentFailedError,
@@ -36,13 +77,56 @@ __all__ = [
     "MCPRegistry",
     "MCPServer",
     "MCPDeploymentClass",
+    "CatalogAPI",
+    "CatalogReplica",
+    # Sync client
+    "ConnectorsSync",
+    "SyncToolsAPI",
+    "SyncMCPRegistry",
+    "SyncMCPServer",
+    "SyncMCPDeploymentClass",
+    "SyncCatalogAPI",
+    # Codecs
+    "Codec",
+    "JSONCodec",
+    "OrjsonCodec",
+    # Views
+    "ModelView",
+    "ToolView",
+    "IntegrationView",
     # Types
     "ConnectorsConfig",
+    "PoolOptions",
+    "RetryBudgetOptions",
+    "RetryStats",
+    "ConcurrencyOptions",
+    "ConcurrencyStats",
+    "CircuitBreakerOptions",
+    "CircuitBreakerStats",
+    "HedgeOptions",
+    "HedgeStats",
+    "SingleFlightOptions",
+    "SingleFlightStats",
+    "SelectCacheOptions",
+    "SelectCacheStats",
+    "ReplicaOptions",
+    "CatalogSyncResult",
+    "LocalSelectOptions",
+    "CompressionOptions",
+    "CompressionStats",
+    "IdempotencyOptions",
+    "IdempotencyStats",
+    "HTTPCacheOptions",
+    "HTTPCacheStats",
+    "RateLimitOptions",
+    "RateLimitStats",
     "Tool",
     "ToolSelectionOptions",
     "ToolListFilters",
     "InvokeOptions",
     "ToolInvocationResponse",
+    "InvokeResult",
+    "DownloadResult",
     "MCPDeploymentConfig",
     "MCPSourceType",
     "MCPIntegration",
@@ -53,7 +137,11 @@ __all__ = [
     "ConnectorsError",
     "HTTPError",
     "TimeoutError",
+    "DeadlineExceededError",
     "RetryableError",
+    "ConcurrencyLimitError",
+    "RateLimitError",
+    "CircuitOpenError",
     "ValidationError",
     "DeploymentTimeoutError",
     "DeploymentFailedError",
@@ -0,0 +1,163 @@
+"""Client-side cache for tool selection results."""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from .types import SelectCacheOptions, SelectCacheStats, Tool
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Cache keys are (tenant, normalized query, maxTools, categories, tokenBudget)
+_QUERY = 1
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a selection query so trivially different spellings share an entry."""
+    return _WHITESPACE.sub(" ", query.strip().lower())
+
+
+def _context(key: Hashable) -> Tuple[Any, ...]:
+    """Get everything in a cache key but the query text."""
+    return key[:_QUERY] + key[_QUERY + 1 :]  # type: ignore[index, no-any-return]
+
+
+class SelectCache:
+    """
+    Bounded TTL + LRU cache of ``tools.select()`` results.
+
+    Entries are keyed by tenant, normalized query and selection options,
+    expire ttl milliseconds after they were stored, and the least recently
+    used entry is evicted once max_entries is reached. Thread-safe, so the
+    sync client can share it between threads.
+
+    With the semantic option, a query missing from the cache is embedded
+    locally and answered from the most similar cached query with the same
+    tenant and options, if their cosine similarity reaches the threshold.
+    """
+
+    def __init__(self, options: SelectCacheOptions) -> None:
+        self.enabled = options.enabled
+        self._max_entries = options.max_entries
+        self._ttl = options.ttl / 1000
+        self._threshold = options.similarity_threshold
+        # Cache key -> (expiry, tools, vector index slot)
+        self._entries: "OrderedDict[Hashable, Tuple[float, List[Tool], Optional[int]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._semantic_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+        self._index: Any = None
+        if options.enabled and options.semantic:
+            try:
+                from .semantic import HashingVectorizer, VectorIndex
+            except ImportError as e:
+                raise ImportError(
+                    "The semantic select cache requires numpy: "
+                    "pip install connectors-sdk[semantic]"
+                ) from e
+            self._index = VectorIndex(options.max_entries, HashingVectorizer(options.dimensions))
+
+    @staticmethod
+    def key(tenant_id: Optional[str], request_body: Dict[str, Any]) -> Hashable:
+        """Build the cache key for a /tools/select request body."""
+        categories = request_body.get("categories")
+        return (
+            tenant_id,
+            normalize_query(request_body["query"]),
+            request_body.get("maxTools"),
+            tuple(sorted(categories)) if categories is not None else None,
+            request_body.get("tokenBudget"),
+        )
+
+    def get(self, key: Hashable) -> Optional[List[Tool]]:
+        """Get a copy of a fresh cached result, or None on a miss."""
+        with self._lock:
+            now = time.monotonic()
+            entry = self._fresh(key, now)
+            if entry is None and self._index is not None:
+                match, similarity = self._index.nearest(_context(key), key[_QUERY])  # type: ignore[index]
+                if (
+                    match is not None
+                    and similarity >= self._threshold
+                    and _context(match) == _context(key)
+                ):
+                    entry = self._fresh(match, now)
+                    if entry is not None:
+                        key = match
+                        self._semantic_hits += 1
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return list(entry[1])
+
+    def put(self, key: Hashable, tools: List[Tool]) -> None:
+        """Store a result, evicting the least recently used entry if full."""
+        with self._lock:
+            self._drop(key)
+            while len(self._entries) >= self._max_entries:
+                self._drop(next(iter(self._entries)))
+                self._evictions += 1
+            expires = time.monotonic() + self._ttl
+            slot = None
+            if self._index is not None:
+                slot = self._index.add(key, _context(key), key[_QUERY], expires)  # type: ignore[index]
+            self._entries[key] = (expires, list(tools), slot)
+
+    def invalidate(self, query: Optional[str] = None) -> int:
+        """
+        Drop cached results.
+
+        Args:
+            query: Drop only results for this query (any options); drops
+                everything if omitted
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            if query is None:
+                stale = list(self._entries)
+            else:
+                normalized = normalize_query(query)
+                stale = [key for key in self._entries if key[_QUERY] == normalized]  # type: ignore[index]
+            for key in stale:
+                self._drop(key)
+            return len(stale)
+
+    def stats(self) -> SelectCacheStats:
+        """Get cache counters."""
+        with self._lock:
+            return SelectCacheStats(
+                hits=self._hits,
+                semantic_hits=self._semantic_hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+            )
+
+    def _fresh(
+        self, key: Hashable, now: float
+    ) -> Optional[Tuple[float, List[Tool], Optional[int]]]:
+        """Get an unexpired entry, dropping it if it has expired."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= now:
+            self._drop(key)
+            self._expirations += 1
+            return None
+        return entry
+
+    def _drop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None and entry[2] is not None:
+            self._index.remove(entry[2])
@@ -0,0 +1,502 @@
+"""Local replica of the tool catalog, kept current by conditional delta syncs."""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from .codec import Codec
+from .errors import ConnectorsError
+from .http_client import HTTPClient
+from .types import (
+    CatalogSyncResult,
+    ConnectorsConfig,
+    LocalSelectOptions,
+    MCPIntegration,
+    Tool,
+    ToolListFilters,
+)
+from .views import _parse_integration, _parse_tool
+
+TOOLS_PATH = "/api/v1/tools/list"
+INTEGRATIONS_PATH = "/api/v1/mcp/integrations"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tools (
+    tool_id TEXT PRIMARY KEY,
+    integration TEXT,
+    category TEXT,
+    name TEXT,
+    description TEXT,
+    page INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    body BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tools_order ON tools (page, position);
+CREATE INDEX IF NOT EXISTS tools_integration ON tools (integration);
+CREATE TABLE IF NOT EXISTS integrations (
+    name TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    body BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    resource TEXT PRIMARY KEY,
+    etag TEXT,
+    synced_at REAL
+);
+"""
+# sync_state row recording when the last complete sync finished
+_CATALOG = "catalog"
+# sync_state row recording when stored tools last changed
+_CHANGED = "changed"
+_INTEGRATIONS = "integrations"
+
+
+def _page_resource(page_size: int, page: int) -> str:
+    """Name the sync_state row holding a tools page's ETag."""
+    return f"tools:{page_size}:{page}"
+
+
+class CatalogReplica:
+    """
+    SQLite store of the tool catalog and MCP integrations.
+
+    Each tool is kept as its raw JSON with its position in the gateway's
+    listing, next to the ETag of the page it came from, so a sync only
+    rewrites pages that changed. A file-backed replica outlives the process:
+    new workers read the snapshot from disk instead of refetching it. With no
+    path, the replica lives in memory. Thread-safe.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path or ":memory:"
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # Called with the lock held
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            if self.path != ":memory:":
+                # Let other worker processes read while one syncs
+                conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close a file-backed replica; it is reopened on next use."""
+        with self._lock:
+            if self._conn is not None and self.path != ":memory:":
+                self._conn.close()
+                self._conn = None
+
+    def synced_at(self) -> Optional[float]:
+        """Get when the last complete sync finished (Unix time), if ever."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT synced_at FROM sync_state WHERE resource = ?", (_CATALOG,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def changed_at(self) -> Optional[float]:
+        """Get when stored tools last changed (Unix time), if ever."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT synced_at FROM sync_state WHERE resource = ?", (_CHANGED,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def etag(self, resource: str) -> Optional[str]:
+        """Get the stored ETag of a synced resource."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT etag FROM sync_state WHERE resource = ?", (resource,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def page_count(self, page: int) -> int:
+        """Count the stored tools that came from a page."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT COUNT(*) FROM tools WHERE page = ?", (page,)
+            ).fetchone()
+        return int(row[0])
+
+    def replace_page(
+        self,
+        page: int,
+        tools: List[Dict[str, Any]],
+        codec: Codec,
+        resource: str,
+        etag: Optional[str],
+    ) -> Tuple[int, int, int]:
+        """
+        Store a fetched tools page, writing only rows that changed.
+
+        Returns:
+            Numbers of tools added, updated and removed
+        """
+        added = updated = 0
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                ids = set()
+                for position, tool in enumerate(tools):
+                    tool_id = tool.get("toolId")
+                    if not tool_id:
+                        continue
+                    ids.add(tool_id)
+                    body = codec.encode(tool)
+                    row = conn.execute(
+                        "SELECT body, page, position FROM tools WHERE tool_id = ?", (tool_id,)
+                    ).fetchone()
+                    if row is not None and (bytes(row[0]), row[1], row[2]) == (
+                        body,
+                        page,
+                        position,
+                    ):
+                        continue
+                    if row is None:
+                        added += 1
+                    elif bytes(row[0]) != body:
+                        updated += 1
+                    conn.execute(
+                        "INSERT OR REPLACE INTO tools VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            tool_id,
+                            tool.get("integration"),
+                            tool.get("category"),
+                            tool.get("name"),
+                            tool.get("description"),
+                            page,
+                            position,
+                            body,
+                        ),
+                    )
+                stale = [
+                    (tool_id,)
+                    for (tool_id,) in conn.execute(
+                        "SELECT tool_id FROM tools WHERE page = ?", (page,)
+                    )
+                    if tool_id not in ids
+                ]
+                conn.executemany("DELETE FROM tools WHERE tool_id = ?", stale)
+                self._set_etag(conn, resource, etag)
+                if added or updated or stale:
+                    self._set_etag(conn, _CHANGED, None)
+        return added, updated, len(stale)
+
+    def drop_pages_after(self, page: int, page_size: int) -> int:
+        """Remove tools and page ETags past the last page; returns tools removed."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                removed = conn.execute("DELETE FROM tools WHERE page > ?", (page,)).rowcount
+                current = {_page_resource(page_size, p) for p in range(1, page + 1)}
+                stale = [
+                    (resource,)
+                    for (resource,) in conn.execute(
+                        "SELECT resource FROM sync_state WHERE resource LIKE 'tools:%'"
+                    )
+                    if resource not in current
+                ]
+                conn.executemany("DELETE FROM sync_state WHERE resource = ?", stale)
+                if removed:
+                    self._set_etag(conn, _CHANGED, None)
+        return int(removed)
+
+    def replace_integrations(
+        self, integrations: List[Dict[str, Any]], codec: Codec, etag: Optional[str]
+    ) -> bool:
+        """Store the integrations list; returns whether it changed."""
+        rows = [
+            (item["name"], position, codec.encode(item))
+            for position, item in enumerate(integrations)
+            if item.get("name")
+        ]
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                current = [
+                    (name, position, bytes(body))
+                    for name, position, body in conn.execute(
+                        "SELECT name, position, body FROM integrations ORDER BY position"
+                    )
+                ]
+                changed = current != rows
+                if changed:
+                    conn.execute("DELETE FROM integrations")
+                    conn.executemany("INSERT INTO integrations VALUES (?, ?, ?)", rows)
+                self._set_etag(conn, _INTEGRATIONS, etag)
+        return changed
+
+    def mark_synced(self) -> None:
+        """Record that a complete sync just finished."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO sync_state VALUES (?, NULL, ?)",
+                    (_CATALOG, time.time()),
+                )
+
+    def tools(self, filters: Optional[ToolListFilters] = None) -> List[bytes]:
+        """Get the raw JSON of stored tools matching filters, in gateway order."""
+        filters = filters or ToolListFilters()
+        query = "SELECT body FROM tools WHERE 1 = 1"
+        args: List[Any] = []
+        if filters.category:
+            query += " AND category = ?"
+            args.append(filters.category)
+        if filters.integration:
+            query += " AND integration = ?"
+            args.append(filters.integration)
+        if filters.search:
+            query += (
+                " AND (instr(lower(name), ?) > 0 OR instr(lower(description), ?) > 0"
+                " OR instr(lower(tool_id), ?) > 0)"
+            )
+            args.extend([filters.search.lower()] * 3)
+        query += " ORDER BY page, position"
+        if filters.limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            args.extend([filters.limit, ((filters.page or 1) - 1) * filters.limit])
+        with self._lock:
+            rows = self._connection().execute(query, args).fetchall()
+        return [bytes(body) for (body,) in rows]
+
+    def integrations(self) -> List[bytes]:
+        """Get the raw JSON of stored integrations, in gateway order."""
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT body FROM integrations ORDER BY position"
+            ).fetchall()
+        return [bytes(body) for (body,) in rows]
+
+    @staticmethod
+    def _set_etag(conn: sqlite3.Connection, resource: str, etag: Optional[str]) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)", (resource, etag, time.time())
+        )
+
+
+class _SyncPlan:
+    """
+    One replica sync as a sequence of conditional GETs, independent of I/O.
+
+    Tools pages are requested in order with their stored ETags until a short
+    page; a 304 keeps the stored page, a 200 is diffed into the replica.
+    Then the integrations list is synced the same way.
+    """
+
+    def __init__(
+        self, replica: CatalogReplica, codec: Codec, page_size: int, force: bool
+    ) -> None:
+        self.result = CatalogSyncResult()
+        self._replica = replica
+        self._codec = codec
+        self._page_size = page_size
+        self._force = force
+        self._page: Optional[int] = 1
+        self._done = False
+
+    def next_request(self) -> Optional[Tuple[str, Dict[str, Any], Dict[str, str]]]:
+        """Get the (path, params, headers) of the next request, or None when done."""
+        if self._page is not None:
+            params = {
+                "page": self._page,
+                "limit": self._page_size,
+                # The gateway pages by offset; send both
+                "offset": (self._page - 1) * self._page_size,
+            }
+            resource = _page_resource(self._page_size, self._page)
+            return TOOLS_PATH, params, self._conditional(resource)
+        if not self._done:
+            return INTEGRATIONS_PATH, {}, self._conditional(_INTEGRATIONS)
+        return None
+
+    def handle(self, response: httpx.Response) -> None:
+        """Apply the response to the last request."""
+        etag = response.headers.get("etag")
+        unchanged = response.status_code == 304
+        if self._page is None:
+            if not unchanged:
+                body = self._codec.decode(response.content)
+                self.result.integrations_changed = self._replica.replace_integrations(
+                    body.get("integrations") or [], self._codec, etag
+                )
+            self._replica.mark_synced()
+            self._done = True
+            return
+
+        page = self._page
+        self.result.pages += 1
+        if unchanged:
+            self.result.pages_unchanged += 1
+            count = self._replica.page_count(page)
+        else:
+            tools = self._codec.decode(response.content).get("tools") or []
+            added, updated, removed = self._replica.replace_page(
+                page, tools, self._codec, _page_resource(self._page_size, page), etag
+            )
+            self.result.tools_added += added
+            self.result.tools_updated += updated
+            self.result.tools_removed += removed
+            count = len(tools)
+
+        if count < self._page_size:
+            self.result.tools_removed += self._replica.drop_pages_after(page, self._page_size)
+            self._page = None
+        else:
+            self._page = page + 1
+
+    def _conditional(self, resource: str) -> Dict[str, str]:
+        etag = None if self._force else self._replica.etag(resource)
+        return {"If-None-Match": etag} if etag else {}
+
+
+def _local_selector(catalog: "_CatalogBase", options: LocalSelectOptions) -> Any:
+    """Create the in-process tool selector for a catalog; it needs numpy."""
+    try:
+        from .retrieval import LocalSelector
+    except ImportError as e:
+        raise ImportError(
+            "Local tool selection requires numpy: pip install connectors-sdk[semantic]"
+        ) from e
+    selector = LocalSelector(catalog, options)
+    catalog._selector = selector
+    return selector
+
+
+class _CatalogBase:
+    """Replica state and reads shared by the async and sync catalog APIs."""
+
+    def __init__(self, config: ConnectorsConfig, codec: Codec) -> None:
+        self._config = config
+        self._options = config.replica
+        self._codec = codec
+        self.replica = CatalogReplica(self._options.path)
+        # The local tool selector reading this replica, if enabled
+        self._selector: Any = None
+
+    def is_fresh(self) -> bool:
+        """Check whether the replica was synced within max_staleness."""
+        synced_at = self.replica.synced_at()
+        return synced_at is not None and (
+            time.time() - synced_at < self._options.max_staleness / 1000
+        )
+
+    def _plan(self, force: bool) -> _SyncPlan:
+        return _SyncPlan(self.replica, self._codec, self._options.page_size, force)
+
+    def _can_serve_stale(self) -> bool:
+        return self._options.serve_stale and self.replica.synced_at() is not None
+
+    def _read_tools(self, filters: Optional[ToolListFilters]) -> List[Tool]:
+        trusted = self._config.trusted
+        return [_parse_tool(raw, trusted, self._codec) for raw in self.replica.tools(filters)]
+
+    def _read_integrations(self) -> List[MCPIntegration]:
+        trusted = self._config.trusted
+        return [
+            _parse_integration(raw, trusted, self._codec)
+            for raw in self.replica.integrations()
+        ]
+
+    def close(self) -> None:
+        """Close a file-backed replica; it is reopened on next use."""
+        self.replica.close()
+
+
+class CatalogAPI(_CatalogBase):
+    """
+    Local replica of the tool catalog.
+
+    When the replica is enabled, ``tools.list()``, ``mcp.list()`` and
+    ``MCPServer.list_tools()`` read from it. A replica older than
+    max_staleness is first brought up to date with conditional requests, and
+    if the gateway cannot be reached the last snapshot is served instead.
+
+    Example:
+        >>> result = await connectors.catalog.sync()
+        >>> print(f"{result.pages_unchanged}/{result.pages} pages unchanged")
+    """
+
+    def __init__(self, http: HTTPClient, config: ConnectorsConfig) -> None:
+        """Initialize CatalogAPI."""
+        super().__init__(config, http.codec)
+        self._http = http
+        self._refresh: Optional["asyncio.Future[CatalogSyncResult]"] = None
+
+    async def sync(self, force: bool = False) -> CatalogSyncResult:
+        """
+        Bring the replica up to date with the gateway.
+
+        Args:
+            force: Refetch every page instead of sending conditional requests
+
+        Returns:
+            CatalogSyncResult with pages fetched and tools added, updated, removed
+
+        Raises:
+            HTTPError: If a request fails
+        """
+        plan = self._plan(force)
+        request = plan.next_request()
+        while request is not None:
+            path, params, headers = request
+            plan.handle(await self._http.request_raw("GET", path, params=params, headers=headers))
+            request = plan.next_request()
+        if self._selector is not None:
+            # Rebuild the local selection index now and off the event loop,
+            # rather than inside the first select() after a change
+            await asyncio.to_thread(self._selector.build)
+        return plan.result
+
+    async def list_tools(self, filters: Optional[ToolListFilters] = None) -> List[Tool]:
+        """
+        List tools from the replica, syncing it first if it is stale.
+
+        Args:
+            filters: Filters for category, integration, search, pagination
+
+        Returns:
+            List of tools matching filters (lazy ToolView objects in trusted mode)
+        """
+        await self.ensure_fresh()
+        return self._read_tools(filters)
+
+    async def list_integrations(self) -> List[MCPIntegration]:
+        """
+        List MCP integrations from the replica, syncing it first if it is stale.
+
+        Returns:
+            List of MCP integrations (lazy IntegrationView objects in trusted mode)
+        """
+        await self.ensure_fresh()
+        return self._read_integrations()
+
+    async def ensure_fresh(self) -> None:
+        """
+        Sync the replica if it is stale.
+
+        Concurrent callers share one sync. If it fails, the stale replica is
+        kept in use when serve_stale allows it.
+
+        Raises:
+            HTTPError: If the sync fails and the replica cannot be served stale
+        """
+        if self.is_fresh():
+            return
+        # Concurrent readers share one sync
+        if self._refresh is None or self._refresh.done():
+            self._refresh = asyncio.ensure_future(self.sync())
+        try:
+            await asyncio.shield(self._refresh)
+        except ConnectorsError:
+            if not self._can_serve_stale():
+                raise
@@ -0,0 +1,229 @@
+"""Client-side circuit breakers keyed by integration.
+
+Mirrors the gateway's ``utils/circuit-breaker.ts``:
+
+- CLOSED: normal operation, all calls go through
+- OPEN: the integration is failing, calls fail immediately
+- HALF_OPEN: after ``reset_timeout`` a limited number of probe calls test
+  whether the integration recovered
+"""
+
+import threading
+import time
+from enum import Enum
+from typing import Dict, Optional
+
+from .types import CircuitBreakerOptions, CircuitBreakerStats
+from .errors import (
+    CircuitOpenError,
+    ConcurrencyLimitError,
+    HTTPError,
+    RateLimitError,
+    RetryableError,
+    TimeoutError,
+)
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+def is_circuit_failure(error: BaseException) -> bool:
+    """
+    Check whether an error counts against an integration's circuit.
+
+    Server errors, timeouts and connection failures count; client errors
+    (4xx, including 429 rate limiting) and validation errors do not. Nor
+    do errors raised on the client before a request was sent, such as
+    waits for a concurrency or rate limit slot, or a deadline already spent.
+    """
+    if isinstance(error, (CircuitOpenError, ConcurrencyLimitError, RateLimitError)):
+        return False
+    if isinstance(error, HTTPError):
+        return error.status_code is not None and error.status_code >= 500
+    if isinstance(error, TimeoutError):
+        # Timeouts of a request on the wire carry the transport error
+        return error.cause is not None
+    return isinstance(error, RetryableError)
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for a single integration.
+
+    Thread-safe, so one breaker can be shared by async and sync callers.
+
+    Usage:
+        >>> breaker.before_call()        # raises CircuitOpenError when open
+        >>> try:
+        ...     result = call()
+        ... except Exception as e:
+        ...     breaker.record_error(e)
+        ...     raise
+        ... breaker.record_success()
+    """
+
+    def __init__(self, name: str, options: CircuitBreakerOptions) -> None:
+        self.name = name
+        self.failure_threshold = options.failure_threshold
+        self.success_threshold = options.success_threshold
+        self.reset_timeout = options.reset_timeout / 1000
+        self.window_duration = options.window_duration / 1000
+        self.half_open_max_calls = options.half_open_max_calls
+        self._state = CircuitState.CLOSED
+        self._failure_count = 0
+        self._success_count = 0
+        self._last_failure_time = 0.0
+        self._next_attempt_time = 0.0
+        self._half_open_in_flight = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """Get the current state, applying time-based transitions."""
+        with self._lock:
+            self._check_state()
+            return self._state
+
+    def before_call(self) -> None:
+        """
+        Reserve permission for a call.
+
+        Raises:
+            CircuitOpenError: If the circuit is open or all half-open probe
+                slots are taken
+        """
+        with self._lock:
+            self._check_state()
+            if self._state == CircuitState.HALF_OPEN:
+                if self._half_open_in_flight < self.half_open_max_calls:
+                    self._half_open_in_flight += 1
+                    return
+            elif self._state == CircuitState.CLOSED:
+                return
+
+            self._rejected += 1
+            retry_in = max(0.0, self._next_attempt_time - time.monotonic())
+            raise CircuitOpenError(
+                f"Circuit for {self.name} is {self._state.value} - failing fast",
+                integration=self.name,
+                state=self._state.value,
+                retry_in=retry_in,
+            )
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+                self._success_count += 1
+                if self._success_count >= self.success_threshold:
+                    self._transition(CircuitState.CLOSED)
+            elif self._state == CircuitState.CLOSED:
+                self._failure_count = 0
+                self._last_failure_time = 0.0
+
+    def record_failure(self) -> None:
+        """Record a failed call."""
+        with self._lock:
+            self._check_state()
+            self._last_failure_time = time.monotonic()
+            if self._state == CircuitState.HALF_OPEN:
+                # A failed probe immediately reopens the circuit
+                self._transition(CircuitState.OPEN)
+            elif self._state == CircuitState.CLOSED:
+                self._failure_count += 1
+                if self._failure_count >= self.failure_threshold:
+                    self._transition(CircuitState.OPEN)
+
+    def record_error(self, error: BaseException) -> None:
+        """Record a call that raised, counting it only if it is a circuit failure."""
+        if is_circuit_failure(error):
+            self.record_failure()
+        elif isinstance(error, Exception):
+            self.record_success()
+        else:
+            # Cancelled: free the probe slot without judging the integration
+            with self._lock:
+                if self._state == CircuitState.HALF_OPEN:
+                    self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+
+    def reset(self) -> None:
+        """Manually close the circuit."""
+        with self._lock:
+            self._transition(CircuitState.CLOSED)
+
+    def stats(self) -> CircuitBreakerStats:
+        """Get a snapshot of this breaker."""
+        with self._lock:
+            self._check_state()
+            return CircuitBreakerStats(
+                integration=self.name,
+                state=self._state.value,
+                failures=self._failure_count,
+                rejected=self._rejected,
+            )
+
+    def _check_state(self) -> None:
+        now = time.monotonic()
+        if (
+            self._state == CircuitState.CLOSED
+            and self._last_failure_time > 0
+            and now - self._last_failure_time > self.window_duration
+        ):
+            # Failure window expired
+            self._failure_count = 0
+            self._last_failure_time = 0.0
+        if self._state == CircuitState.OPEN and now >= self._next_attempt_time:
+            self._transition(CircuitState.HALF_OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        self._state = state
+        self._success_count = 0
+        self._half_open_in_flight = 0
+        if state == CircuitState.OPEN:
+            self._next_attempt_time = time.monotonic() + self.reset_timeout
+        else:
+            self._failure_count = 0
+            if state == CircuitState.CLOSED:
+                self._last_failure_time = 0.0
+
+
+class CircuitBreakerRegistry:
+    """Circuit breakers keyed by integration name."""
+
+    def __init__(self, options: CircuitBreakerOptions) -> None:
+        self.options = options
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, integration: Optional[str]) -> Optional[CircuitBreaker]:
+        """Get the breaker for an integration, or None if breakers are disabled."""
+        if not self.options.enabled or not integration:
+            return None
+        with self._lock:
+            breaker = self._breakers.get(integration)
+            if breaker is None:
+                breaker = self._breakers[integration] = CircuitBreaker(
+                    integration, self.options
+                )
+            return breaker
+
+    def stats(self) -> Dict[str, CircuitBreakerStats]:
+        """Get breaker state for every integration seen so far."""
+        with self._lock:
+            breakers = list(self._breakers.items())
+        return {name: breaker.stats() for name, breaker in breakers}
+
+    def reset(self, integration: Optional[str] = None) -> None:
+        """Manually close one integration's circuit, or all of them."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        for breaker in breakers:
+            if integration is None or breaker.name == integration:
+                breaker.reset()
@@ -1,10 +1,41 @@
 """Main Connectors SDK client."""
 
-from typing import Optional, Dict
+from types import TracebackType
+from typing import Any, Optional, Dict, Type
 from .http_client import HTTPClient
+from .codec import Codec
+from .cache import SelectCache
+from .catalog import CatalogAPI, _local_selector
+from .errors import ConnectorsError
 from .tools import ToolsAPI
 from .mcp import MCPRegistry
-from .types import ConnectorsConfig, HealthStatus
+from .types import (
+    ConnectorsConfig,
+    HealthStatus,
+    PoolOptions,
+    RetryBudgetOptions,
+    RetryStats,
+    ConcurrencyOptions,
+    ConcurrencyStats,
+    CircuitBreakerOptions,
+    CircuitBreakerStats,
+    HedgeOptions,
+    HedgeStats,
+    SingleFlightOptions,
+    SingleFlightStats,
+    SelectCacheOptions,
+    SelectCacheStats,
+    ReplicaOptions,
+    LocalSelectOptions,
+    CompressionOptions,
+    CompressionStats,
+    IdempotencyOptions,
+    IdempotencyStats,
+    HTTPCacheOptions,
+    HTTPCacheStats,
+    RateLimitOptions,
+    RateLimitStats,
+)
 from .validators import validate_config
 
 
@@ -22,6 +53,12 @@ class Connectors:
         ... )
         >>> tools = await connectors.tools.select("create a GitHub pull request")
         >>> print(f"Selected {len(tools)} tools")
+
+    The client keeps a pooled connection to the gateway. Use it as an async
+    context manager, or call ``aclose()`` when done:
+
+        >>> async with Connectors(base_url="http://localhost:3000") as connectors:
+        ...     tools = await connectors.tools.list()
     """
 
     def __init__(
@@ -32,6 +69,22 @@ class Connectors:
         timeout: int = 120000,
         max_retries: int = 3,
         headers: Optional[Dict[str, str]] = None,
+        pool: Optional[PoolOptions] = None,
+        retry_budget: Optional[RetryBudgetOptions] = None,
+        concurrency: Optional[ConcurrencyOptions] = None,
+        circuit_breaker: Optional[CircuitBreakerOptions] = None,
+        hedging: Optional[HedgeOptions] = None,
+        single_flight: Optional[SingleFlightOptions] = None,
+        deadline: Optional[int] = None,
+        codec: Optional[Codec] = None,
+        trusted: bool = False,
+        select_cache: Optional[SelectCacheOptions] = None,
+        replica: Optional[ReplicaOptions] = None,
+        local_select: Optional[LocalSelectOptions] = None,
+        compression: Optional[CompressionOptions] = None,
+        idempotency: Optional[IdempotencyOptions] = None,
+        http_cache: Optional[HTTPCacheOptions] = None,
+        rate_limit: Optional[RateLimitOptions] = None,
     ) -> None:
         """
         Initialize Connectors client.
@@ -40,9 +93,35 @@ class Connectors:
             base_url: Gateway base URL (e.g., "http://localhost:3000")
             tenant_id: Optional tenant identifier for multi-tenancy
             api_key: Optional API key for authentication
-            timeout: Request timeout in milliseconds (default: 120000)
+            timeout: Per-attempt request timeout in milliseconds (default: 120000)
             max_retries: Maximum retry attempts for failed requests (default: 3)
             headers: Optional custom headers
+            pool: Optional connection pool options (pool size, keep-alive, HTTP/2)
+            retry_budget: Optional client-wide retry budget options
+            concurrency: Optional adaptive per-route concurrency limit options
+            circuit_breaker: Optional per-integration circuit breaker options
+            hedging: Optional hedged request options for idempotent GETs
+            single_flight: Optional coalescing options for identical in-flight requests
+            deadline: Optional default total time budget in milliseconds for a call,
+                including retries and backoff
+            codec: Optional JSON codec for request bodies and untyped responses
+                (default: orjson if installed, else the standard library)
+            trusted: Trust gateway responses and return lazy, unvalidated views
+                from tools.list(), tools.select() and mcp.list() (default: False)
+            select_cache: Optional client-side cache options for tools.select() results
+            replica: Optional local catalog replica options; when enabled,
+                tools.list(), mcp.list() and list_tools() read from the replica
+            local_select: Optional in-process tool selection over the replica,
+                used when the gateway is unavailable or a deadline is tight
+                (requires the replica and numpy)
+            compression: Optional request body compression and response
+                encoding negotiation options
+            idempotency: Optional idempotency key and deduplication options
+                for tool invocations
+            http_cache: Optional conditional GET cache options for
+                tools.list(), mcp.list() and list_tools()
+            rate_limit: Optional pacing of requests per tenant and route to the
+                quota the gateway advertises in its rate limit headers
 
         Raises:
             ValidationError: If configuration is invalid
@@ -52,13 +131,35 @@ class Connectors:
             tenant_id=tenant_id,
             api_key=api_key,
             timeout=timeout,
+            deadline=deadline,
             max_retries=max_retries,
+            trusted=trusted,
             headers=headers or {},
+            pool=pool or PoolOptions(),
+            retry_budget=retry_budget or RetryBudgetOptions(),
+            concurrency=concurrency or ConcurrencyOptions(),
+            circuit_breaker=circuit_breaker or CircuitBreakerOptions(),
+            hedging=hedging or HedgeOptions(),
+            single_flight=single_flight or SingleFlightOptions(),
+            select_cache=select_cache or SelectCacheOptions(),
+            replica=replica or ReplicaOptions(),
+            local_select=local_select or LocalSelectOptions(),
+            compression=compression or CompressionOptions(),
+            idempotency=idempotency or IdempotencyOptions(),
+            http_cache=http_cache or HTTPCacheOptions(),
+            rate_limit=rate_limit or RateLimitOptions(),
         )
         validate_config(config)
 
         self._config = config
-        self._http_client = HTTPClient(config)
+        self._http_client = HTTPClient(config, codec)
+        self._select_cache = SelectCache(config.select_cache)
+        self._catalog: Optional[CatalogAPI] = None
+        if config.replica.enabled:
+            self._catalog = CatalogAPI(self._http_client, config)
+        self._local_select: Any = None
+        if self._catalog is not None and config.local_select.enabled:
+            self._local_select = _local_selector(self._catalog, config.local_select)
         self._tools_api: Optional[ToolsAPI] = None
         self._mcp_registry: Optional[MCPRegistry] = None
 
@@ -71,7 +172,13 @@ class Connectors:
             ToolsAPI instance
         """
         if self._tools_api is None:
-            self._tools_api = ToolsAPI(self._http_client, self._config)
+            self._tools_api = ToolsAPI(
+                self._http_client,
+                self._config,
+                self._select_cache,
+                self._catalog,
+                self._local_select,
+            )
         return self._tools_api
 
     @property
@@ -83,9 +190,150 @@ class Connectors:
             MCPRegistry instance
         """
         if self._mcp_registry is None:
-            self._mcp_registry = MCPRegistry(self._http_client, self._config)
+            self._mcp_registry = MCPRegistry(
+                self._http_client, self._config, self._catalog, self._select_cache
+            )
         return self._mcp_registry
 
+    @property
+    def catalog(self) -> CatalogAPI:
+        """
+        Get the local catalog replica.
+
+        Returns:
+            CatalogAPI instance
+
+        Raises:
+            ConnectorsError: If the replica is not enabled
+        """
+        if self._catalog is None:
+            raise ConnectorsError(
+                "The catalog replica is disabled; pass replica=ReplicaOptions(enabled=True)"
+            )
+        return self._catalog
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        """
+        Get retry counters (requests, retries, denied retries, give-ups).
+
+        Returns:
+            RetryStats snapshot shared by all calls of this client
+        """
+        return self._http_client.retry_stats
+
+    @property
+    def concurrency_stats(self) -> Dict[str, ConcurrencyStats]:
+        """
+        Get adaptive concurrency limiter state per route.
+
+        Returns:
+            Mapping of route (e.g. "POST /api/v1/tools/invoke") to its stats
+        """
+        return self._http_client.concurrency_stats
+
+    @property
+    def hedge_stats(self) -> HedgeStats:
+        """
+        Get hedged request counters (requests, hedges sent, hedge wins).
+
+        Returns:
+            HedgeStats snapshot shared by all calls of this client
+        """
+        return self._http_client.hedge_stats
+
+    @property
+    def single_flight_stats(self) -> SingleFlightStats:
+        """
+        Get request coalescing counters (requests, coalesced, in flight).
+
+        Returns:
+            SingleFlightStats snapshot shared by all calls of this client
+        """
+        return self._http_client.single_flight_stats
+
+    @property
+    def circuit_stats(self) -> Dict[str, CircuitBreakerStats]:
+        """
+        Get circuit breaker state per integration.
+
+        Returns:
+            Mapping of integration name to its breaker stats
+        """
+        return self._http_client.circuit_stats
+
+    @property
+    def compression_stats(self) -> CompressionStats:
+        """
+        Get request and response body sizes, before and after compression.
+
+        Returns:
+            CompressionStats snapshot shared by all calls of this client
+        """
+        return self._http_client.compression_stats
+
+    @property
+    def idempotency_stats(self) -> IdempotencyStats:
+        """
+        Get idempotency key and invocation deduplication counters.
+
+        Returns:
+            IdempotencyStats snapshot shared by all calls of this client
+        """
+        return self._http_client.idempotency_stats
+
+    @property
+    def http_cache_stats(self) -> HTTPCacheStats:
+        """
+        Get conditional GET cache counters (hits, 304s, misses, bytes saved).
+
+        Returns:
+            HTTPCacheStats snapshot shared by all calls of this client
+        """
+        return self._http_client.http_cache_stats
+
+    @property
+    def rate_limit_stats(self) -> Dict[str, RateLimitStats]:
+        """
+        Get rate limit pacing state and queue-wait counters per tenant and route.
+
+        Returns:
+            Mapping of "<tenant> <METHOD> <route>" (e.g. "acme POST /api/v1/tools/invoke")
+            to its stats
+        """
+        return self._http_client.rate_limit_stats
+
+    def reset_circuit(self, integration: Optional[str] = None) -> None:
+        """
+        Manually close an integration's circuit breaker.
+
+        Args:
+            integration: Integration to reset; resets all circuits if omitted
+        """
+        self._http_client.circuit_breakers.reset(integration)
+
+    @property
+    def select_cache_stats(self) -> SelectCacheStats:
+        """
+        Get tool selection cache counters (hits, misses, evictions, size).
+
+        Returns:
+            SelectCacheStats snapshot shared by all calls of this client
+        """
+        return self._select_cache.stats()
+
+    def invalidate_select_cache(self, query: Optional[str] = None) -> int:
+        """
+        Drop cached tool selection results, e.g. after the catalog changed.
+
+        Args:
+            query: Drop only results for this query; drops everything if omitted
+
+        Returns:
+            Number of cached results dropped
+        """
+        return self._select_cache.invalidate(query)
+
     async def health(self) -> HealthStatus:
         """
         Check gateway health status.
@@ -110,3 +358,24 @@ class Connectors:
             return True
         except Exception:
             return False
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying connection pool.
+
+        The client remains usable; a new pool is opened on the next request.
+        """
+        await self._http_client.aclose()
+        if self._catalog is not None:
+            self._catalog.close()
+
+    async def __aenter__(self) -> "Connectors":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
@@ -0,0 +1,69 @@
+"""Pluggable JSON codecs for request bodies and responses.
+
+Response models are validated straight from the response bytes by pydantic
+(``model_validate_json`` / ``TypeAdapter.validate_json``), so the codec is
+only used to encode request bodies and to decode untyped (dict) responses.
+"""
+
+import json
+from typing import Any, Protocol
+
+
+class Codec(Protocol):
+    """Encodes request bodies and decodes untyped responses."""
+
+    name: str
+
+    def encode(self, data: Any) -> bytes:
+        """Serialize a request body to JSON bytes."""
+        ...
+
+    def decode(self, content: bytes) -> Any:
+        """Parse JSON bytes into Python objects."""
+        ...
+
+
+class JSONCodec:
+    """Codec backed by the standard library ``json`` module."""
+
+    name = "json"
+
+    def encode(self, data: Any) -> bytes:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def decode(self, content: bytes) -> Any:
+        return json.loads(content)
+
+
+class OrjsonCodec:
+    """
+    Codec backed by orjson.
+
+    Requires the ``fast`` extra: ``pip install connectors-sdk[fast]``.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError as e:
+            raise ImportError(
+                "OrjsonCodec requires orjson: pip install connectors-sdk[fast]"
+            ) from e
+        self._orjson = orjson
+
+    def encode(self, data: Any) -> bytes:
+        encoded: bytes = self._orjson.dumps(data)
+        return encoded
+
+    def decode(self, content: bytes) -> Any:
+        return self._orjson.loads(content)
+
+
+def default_codec() -> Codec:
+    """Get the fastest available codec: orjson if installed, else stdlib json."""
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return JSONCodec()
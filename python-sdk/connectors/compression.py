@@ -0,0 +1,172 @@
+"""Request and response body compression."""
+
+import importlib
+import threading
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from .concurrency import ConcurrencyLimiter
+from .types import CompressionOptions, CompressionStats
+
+
+def _optional_module(*names: str) -> Any:
+    """Import the first of the named modules that is installed, or get None."""
+    for name in names:
+        try:
+            return importlib.import_module(name)
+        except ImportError:  # pragma: no cover - depends on installed extras
+            continue
+    return None
+
+
+brotli = _optional_module("brotli", "brotlicffi")
+zstandard = _optional_module("zstandard")
+
+IDENTITY = "identity"
+# Request body encodings the SDK can produce
+ENCODINGS = ("gzip", "br", "zstd")
+# gzip framing for zlib.compressobj
+_GZIP_WBITS = 31
+
+
+def available_encodings() -> List[str]:
+    """Get the encodings the installed packages can compress and httpx can decode, best first."""
+    encodings = []
+    if zstandard is not None:
+        encodings.append("zstd")
+    if brotli is not None:
+        encodings.append("br")
+    return encodings + ["gzip", "deflate"]
+
+
+class Compressor:
+    """Incremental compressor with the same interface for every encoding."""
+
+    def __init__(self, encoding: str, level: Optional[int] = None) -> None:
+        self._process: Any
+        self._finish: Any
+        if encoding == "gzip":
+            compressor = zlib.compressobj(-1 if level is None else level, wbits=_GZIP_WBITS)
+            self._process, self._finish = compressor.compress, compressor.flush
+        elif encoding == "br" and brotli is not None:
+            compressor = brotli.Compressor(quality=5 if level is None else level)
+            self._process, self._finish = compressor.process, compressor.finish
+        elif encoding == "zstd" and zstandard is not None:
+            compressor = zstandard.ZstdCompressor(level=3 if level is None else level).compressobj()
+            self._process, self._finish = compressor.compress, compressor.flush
+        else:
+            raise ValueError(f"Unsupported or unavailable encoding: {encoding}")
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a piece of the body; output may be held back until flush()."""
+        return bytes(self._process(data))
+
+    def flush(self) -> bytes:
+        """Get the rest of the compressed body."""
+        return bytes(self._finish())
+
+
+class CompressionPolicy:
+    """
+    Decides how request bodies are compressed and which response encodings are accepted.
+
+    Bodies of at least ``min_size`` bytes are compressed with ``algorithm``,
+    and sent as is if that does not make them smaller. ``routes`` overrides
+    the algorithm per route (``"POST /api/v1/tools/invoke"``); ``"identity"``
+    turns compression off both ways for that route. Byte counters are kept
+    whether or not compression is enabled, so the savings can be measured.
+    Thread-safe.
+    """
+
+    def __init__(self, options: CompressionOptions) -> None:
+        self.options = options
+        accept = options.accept or available_encodings()
+        self._accept = ", ".join(accept)
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._requests_compressed = 0
+        self._request_bytes = 0
+        self._request_bytes_sent = 0
+        self._responses = 0
+        self._responses_compressed = 0
+        self._response_bytes = 0
+        self._response_bytes_received = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether compression is enabled."""
+        return self.options.enabled
+
+    def encoding(self, method: str, path: str) -> Optional[str]:
+        """Get the encoding for request bodies on a route, or None to send them as is."""
+        if not self.options.enabled:
+            return None
+        encoding = self.options.routes.get(
+            ConcurrencyLimiter.route_key(method, path), self.options.algorithm
+        )
+        return None if encoding == IDENTITY else encoding
+
+    def prepare(
+        self, method: str, path: str, content: Optional[bytes]
+    ) -> Tuple[Optional[bytes], Dict[str, str]]:
+        """
+        Compress a request body if the route's policy calls for it.
+
+        Returns:
+            The body to send, and the headers to send with it
+        """
+        if not self.options.enabled:
+            if content is not None:
+                self.record_request(len(content), len(content), compressed=False)
+            return content, {}
+
+        route = ConcurrencyLimiter.route_key(method, path)
+        if self.options.routes.get(route) == IDENTITY:
+            headers = {"Accept-Encoding": IDENTITY}
+        else:
+            headers = {"Accept-Encoding": self._accept}
+        if content is None:
+            return None, headers
+
+        encoding = self.encoding(method, path)
+        if encoding is not None and len(content) >= self.options.min_size:
+            compressor = Compressor(encoding, self.options.level)
+            compressed = compressor.compress(content) + compressor.flush()
+            if len(compressed) < len(content):
+                self.record_request(len(content), len(compressed), compressed=True)
+                return compressed, {**headers, "Content-Encoding": encoding}
+        self.record_request(len(content), len(content), compressed=False)
+        return content, headers
+
+    def record_request(self, size: int, sent: int, compressed: bool) -> None:
+        """Count a request body of size bytes, sent as sent bytes."""
+        with self._lock:
+            self._requests += 1
+            self._requests_compressed += compressed
+            self._request_bytes += size
+            self._request_bytes_sent += sent
+
+    def record_response(self, response: httpx.Response) -> None:
+        """Count a buffered response body, as received and as decoded."""
+        encoding = response.headers.get("content-encoding", IDENTITY).lower()
+        with self._lock:
+            self._responses += 1
+            self._responses_compressed += encoding != IDENTITY
+            self._response_bytes += len(response.content)
+            self._response_bytes_received += response.num_bytes_downloaded
+
+    def stats(self) -> CompressionStats:
+        """Get a snapshot of the compression counters."""
+        with self._lock:
+            return CompressionStats(
+                requests=self._requests,
+                requests_compressed=self._requests_compressed,
+                request_bytes=self._request_bytes,
+                request_bytes_sent=self._request_bytes_sent,
+                responses=self._responses,
+                responses_compressed=self._responses_compressed,
+                response_bytes=self._response_bytes,
+                response_bytes_received=self._response_bytes_received,
+            )
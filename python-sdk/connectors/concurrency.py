@@ -0,0 +1,149 @@
+"""Adaptive client-side concurrency limits per gateway route."""
+
+import asyncio
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from .types import ConcurrencyOptions, ConcurrencyStats
+from .errors import ConcurrencyLimitError
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limit for a single route.
+
+    The limit grows additively (about +1 per limit's worth of successful
+    requests) while the route is saturated and healthy, and shrinks
+    multiplicatively on overload signals: 429/503/504 responses, timeouts,
+    connection errors and, if ``latency_tolerance`` is set, latencies above
+    ``latency_tolerance`` times the best recently observed latency. Requests
+    over the limit wait in a FIFO queue.
+    """
+
+    def __init__(self, route: str, options: ConcurrencyOptions) -> None:
+        self.route = route
+        self.min_limit = options.min_limit
+        self.max_limit = options.max_limit
+        self.backoff_ratio = options.backoff_ratio
+        self.latency_tolerance = options.latency_tolerance
+        self.limit = float(min(max(options.initial_limit, self.min_limit), self.max_limit))
+        self.in_flight = 0
+        self.rejected = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+        self._min_latency: Optional[float] = None
+
+    @property
+    def queued(self) -> int:
+        """Number of requests waiting for a slot."""
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    async def acquire(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for a slot on this route.
+
+        Raises:
+            ConcurrencyLimitError: If no slot frees up within timeout seconds
+        """
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return
+
+        waiter: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # A slot was handed over just as we gave up; pass it on
+                self.in_flight -= 1
+                self._wake()
+            else:
+                waiter.cancel()
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            self.rejected += 1
+            raise ConcurrencyLimitError(
+                f"Timed out waiting for a concurrency slot on {self.route} "
+                f"(limit {int(self.limit)})",
+                route=self.route,
+                limit=int(self.limit),
+            ) from None
+
+    def release(self, latency: Optional[float], overloaded: Optional[bool]) -> None:
+        """
+        Free a slot and adapt the limit.
+
+        Args:
+            latency: Attempt duration in seconds, if it completed
+            overloaded: Whether the attempt signalled overload; None skips
+                adaptation (e.g. for cancelled attempts)
+        """
+        saturated = self.in_flight * 2 >= self.limit
+        self.in_flight -= 1
+        if overloaded is not None:
+            self._adapt(latency, overloaded, saturated)
+        self._wake()
+
+    def _adapt(self, latency: Optional[float], overloaded: bool, saturated: bool) -> None:
+        if latency is not None and not overloaded:
+            if self._min_latency is None:
+                self._min_latency = latency
+            else:
+                # Let the baseline drift up slowly so it tracks real changes
+                # in gateway latency instead of one lucky sample forever
+                self._min_latency = min(latency, self._min_latency * 1.01)
+            if (
+                self.latency_tolerance is not None
+                and latency > self._min_latency * self.latency_tolerance
+            ):
+                overloaded = True
+
+        if overloaded:
+            self.limit = max(float(self.min_limit), self.limit * self.backoff_ratio)
+        elif saturated:
+            self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self.in_flight += 1
+            waiter.set_result(None)
+
+    def stats(self) -> ConcurrencyStats:
+        """Get a snapshot of this route's limiter state."""
+        return ConcurrencyStats(
+            route=self.route,
+            limit=int(self.limit),
+            in_flight=self.in_flight,
+            queued=self.queued,
+            rejected=self.rejected,
+        )
+
+
+class ConcurrencyLimiter:
+    """Registry of adaptive limiters keyed by route (method and path)."""
+
+    def __init__(self, options: ConcurrencyOptions) -> None:
+        self.options = options
+        self._limiters: Dict[str, AdaptiveLimiter] = {}
+
+    @staticmethod
+    def route_key(method: str, path: str) -> str:
+        """Build the route key for a request, ignoring the query string."""
+        return f"{method.upper()} {path.split('?', 1)[0]}"
+
+    def get(self, method: str, path: str) -> Optional[AdaptiveLimiter]:
+        """Get the limiter for a route, or None if limiting is disabled."""
+        if not self.options.enabled:
+            return None
+        key = self.route_key(method, path)
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            limiter = self._limiters[key] = AdaptiveLimiter(key, self.options)
+        return limiter
+
+    def stats(self) -> Dict[str, ConcurrencyStats]:
+        """Get limiter state for every route seen so far."""
+        return {key: limiter.stats() for key, limiter in self._limiters.items()}
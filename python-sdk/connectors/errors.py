@@ -30,10 +30,17 @@ class HTTPError(ConnectorsError):
         message: str,
         status_code: Optional[int] = None,
         response_body: Optional[str] = None,
+        retry_after: Optional[float] = None,
     ) -> None:
-        super().__init__(message, status_code=status_code, response_body=response_body)
+        super().__init__(
+            message,
+            status_code=status_code,
+            response_body=response_body,
+            retry_after=retry_after,
+        )
         self.status_code = status_code
         self.response_body = response_body
+        self.retry_after = retry_after
 
 
 class TimeoutError(ConnectorsError):
@@ -44,6 +51,38 @@ class TimeoutError(ConnectorsError):
         self.cause = cause
 
 
+class DeadlineExceededError(TimeoutError):
+    """Raised when a call's total deadline, including retries, expires."""
+
+
+class ConcurrencyLimitError(TimeoutError):
+    """Raised when a request waits too long for a client-side concurrency slot."""
+
+    def __init__(self, message: str, route: str, limit: int) -> None:
+        super().__init__(message)
+        self.route = route
+        self.limit = limit
+
+
+class RateLimitError(TimeoutError):
+    """Raised when the gateway's rate limit allows a request only after too long a wait."""
+
+    def __init__(self, message: str, key: str, retry_in: float) -> None:
+        super().__init__(message)
+        self.key = key
+        self.retry_in = retry_in
+
+
+class CircuitOpenError(ConnectorsError):
+    """Raised when an integration's circuit breaker is open."""
+
+    def __init__(self, message: str, integration: str, state: str, retry_in: float) -> None:
+        super().__init__(message, integration=integration, state=state, retry_in=retry_in)
+        self.integration = integration
+        self.state = state
+        self.retry_in = retry_in
+
+
 class RetryableError(ConnectorsError):
     """Raised for errors that can be retried."""
 
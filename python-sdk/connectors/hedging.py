@@ -0,0 +1,96 @@
+"""Hedged requests for idempotent gateway reads."""
+
+import math
+from collections import deque
+from typing import Deque, Dict
+
+from .types import HedgeOptions, HedgeStats
+
+# Maximum number of hedges that can be sent back to back after a quiet period
+HEDGE_BURST = 10.0
+
+
+class LatencyWindow:
+    """Recent response latencies for one route."""
+
+    def __init__(self, size: int) -> None:
+        self._samples: Deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, latency: float) -> None:
+        """Add a latency sample in seconds."""
+        self._samples.append(latency)
+
+    def percentile(self, percentile: float) -> float:
+        """Get the nearest-rank percentile of the recorded samples."""
+        ordered = sorted(self._samples)
+        rank = math.ceil(percentile / 100 * len(ordered))
+        return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+
+class HedgePolicy:
+    """
+    Decides when and whether to hedge a request.
+
+    The hedge delay for a route is the configured percentile of its recent
+    latencies, so only the slowest requests get a second attempt. Hedges are
+    paid for from a token bucket that earns ``max_hedge_ratio`` tokens per
+    request, which keeps hedges to that fraction of traffic.
+    """
+
+    def __init__(self, options: HedgeOptions) -> None:
+        self.options = options
+        self._windows: Dict[str, LatencyWindow] = {}
+        self._tokens = 1.0
+        self._requests = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+        self._denied = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether hedging is enabled."""
+        return self.options.enabled
+
+    def delay(self, route: str) -> float:
+        """Get the hedge delay in seconds for a route and count the request."""
+        self._requests += 1
+        self._tokens = min(HEDGE_BURST, self._tokens + self.options.max_hedge_ratio)
+
+        window = self._windows.get(route)
+        if window is None or len(window) < self.options.min_samples:
+            delay = self.options.initial_delay / 1000
+        else:
+            delay = window.percentile(self.options.percentile)
+        return max(delay, self.options.min_delay / 1000)
+
+    def record_latency(self, route: str, latency: float) -> None:
+        """Record how long a completed attempt on a route took."""
+        window = self._windows.get(route)
+        if window is None:
+            window = self._windows[route] = LatencyWindow(self.options.window_size)
+        window.record(latency)
+
+    def try_hedge(self) -> bool:
+        """Spend a token for a hedge, if the hedge rate cap allows one."""
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            self._hedged += 1
+            return True
+        self._denied += 1
+        return False
+
+    def record_hedge_win(self) -> None:
+        """Record that the hedge answered before the original attempt."""
+        self._hedge_wins += 1
+
+    def stats(self) -> HedgeStats:
+        """Get hedging counters."""
+        return HedgeStats(
+            requests=self._requests,
+            hedged=self._hedged,
+            hedge_wins=self._hedge_wins,
+            hedges_denied=self._denied,
+        )
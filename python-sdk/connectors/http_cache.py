@@ -0,0 +1,169 @@
+"""Conditional GET cache for catalog routes."""
+
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import httpx
+
+from .concurrency import ConcurrencyLimiter
+from .types import HTTPCacheOptions, HTTPCacheStats
+
+_MAX_AGE = re.compile(r"(?:^|,)\s*max-age\s*=\s*\"?(\d+)", re.IGNORECASE)
+
+
+def _directives(response: httpx.Response) -> str:
+    directives: str = response.headers.get("cache-control", "")
+    return directives.lower()
+
+
+class CacheEntry:
+    """A cached response body and its validators."""
+
+    __slots__ = ("content", "etag", "last_modified", "fresh_until")
+
+    def __init__(self, response: httpx.Response, fresh_until: float) -> None:
+        self.content = response.content
+        self.etag = response.headers.get("etag")
+        self.last_modified = response.headers.get("last-modified")
+        self.fresh_until = fresh_until
+
+
+class HTTPCache:
+    """
+    Stores GET responses of whitelisted routes with their validators.
+
+    Responses carrying an ``ETag`` or ``Last-Modified`` header are kept;
+    later requests for the same path and params are sent with
+    ``If-None-Match`` / ``If-Modified-Since``, and a 304 Not Modified is
+    answered from the cache. Each caller decodes the cached body into models
+    of its own, so changing one result never changes another's.
+    Within the server's ``Cache-Control: max-age`` (or ``max_age``, if the
+    server sends none) the cache answers without a request at all.
+    ``no-store`` responses are not kept. Thread-safe.
+    """
+
+    def __init__(self, options: HTTPCacheOptions) -> None:
+        self.options = options
+        self._routes = {
+            ConcurrencyLimiter.route_key(*route.split(" ", 1)) for route in options.routes
+        }
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._revalidated = 0
+        self._misses = 0
+        self._bytes_saved = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether responses are cached."""
+        return self.options.enabled
+
+    def cacheable(self, method: str, path: str) -> bool:
+        """Check whether a route's responses are cached."""
+        return self.options.enabled and ConcurrencyLimiter.route_key(method, path) in self._routes
+
+    @staticmethod
+    def key(path: str, params: Optional[Dict[str, Any]]) -> str:
+        """Build the cache key from path and params."""
+        return f"{path} {json.dumps(params or {}, sort_keys=True, default=str)}"
+
+    def get(
+        self, method: str, path: str, params: Optional[Dict[str, Any]]
+    ) -> Optional[CacheEntry]:
+        """Get the cached entry for a request, if its route is cached."""
+        if not self.cacheable(method, path):
+            return None
+        with self._lock:
+            entry = self._entries.get(self.key(path, params))
+            if entry is not None:
+                self._entries.move_to_end(self.key(path, params))
+            return entry
+
+    def fresh(self, entry: CacheEntry) -> bool:
+        """Check whether an entry can be served without revalidating it; counts a hit."""
+        if entry.fresh_until <= time.monotonic():
+            return False
+        with self._lock:
+            self._hits += 1
+            self._bytes_saved += len(entry.content)
+        return True
+
+    @staticmethod
+    def conditional_headers(entry: Optional[CacheEntry]) -> Dict[str, str]:
+        """Get the headers revalidating an entry."""
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def revalidated(self, entry: CacheEntry, response: httpx.Response) -> None:
+        """Record a 304 for an entry, refreshing its validators and freshness."""
+        with self._lock:
+            self._revalidated += 1
+            self._bytes_saved += len(entry.content)
+            entry.etag = response.headers.get("etag", entry.etag)
+            entry.last_modified = response.headers.get("last-modified", entry.last_modified)
+            entry.fresh_until = self._fresh_until(response)
+
+    def store(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        response: httpx.Response,
+    ) -> None:
+        """Keep a response, if its route is cached and it has validators."""
+        if not self.cacheable(method, path):
+            return
+        with self._lock:
+            self._misses += 1
+        if response.status_code != 200 or "no-store" in _directives(response):
+            return
+        if "etag" not in response.headers and "last-modified" not in response.headers:
+            return
+        entry = CacheEntry(response, self._fresh_until(response))
+        key = self.key(path, params)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.options.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> int:
+        """Drop every cached response; returns the number dropped."""
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+
+    def stats(self) -> HTTPCacheStats:
+        """Get a snapshot of the cache counters."""
+        with self._lock:
+            return HTTPCacheStats(
+                hits=self._hits,
+                revalidated=self._revalidated,
+                misses=self._misses,
+                bytes_saved=self._bytes_saved,
+                entries=len(self._entries),
+            )
+
+    def _fresh_until(self, response: httpx.Response) -> float:
+        """Get until when a response may be served without revalidating it."""
+        directives = _directives(response)
+        match = _MAX_AGE.search(directives)
+        if "no-cache" in directives:
+            max_age = 0.0
+        elif match:
+            max_age = float(match.group(1))
+        else:
+            max_age = self.options.max_age / 1000
+        return time.monotonic() + max_age
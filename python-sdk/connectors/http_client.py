@@ -2,21 +2,74 @@
 
 import asyncio
 import random
-from typing import TypeVar, Type, Optional, Dict, Any
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 import httpx
-from .types import ConnectorsConfig
-from .errors import HTTPError, RetryableError, TimeoutError as ConnectorsTimeoutError
+from pydantic import TypeAdapter
+from .codec import Codec, default_codec
+from .types import (
+    ConnectorsConfig,
+    RetryStats,
+    ConcurrencyStats,
+    CircuitBreakerStats,
+    CompressionStats,
+    IdempotencyStats,
+    HTTPCacheStats,
+    RateLimitStats,
+    HedgeStats,
+    SingleFlightStats,
+)
+from .circuit_breaker import CircuitBreakerRegistry
+from .compression import CompressionPolicy
+from .concurrency import AdaptiveLimiter, ConcurrencyLimiter
+from .hedging import HedgePolicy
+from .http_cache import CacheEntry, HTTPCache
+from .idempotency import IdempotencyKeys
+from .rate_limit import RateLimitBucket, RateLimitShaper, tenant_of
+from .singleflight import SingleFlight
+from .uploads import StreamedBody
+from .errors import (
+    HTTPError,
+    RetryableError,
+    TimeoutError as ConnectorsTimeoutError,
+    DeadlineExceededError,
+    RateLimitError,
+)
+from .retry import RetryBudget, parse_retry_after
 
 T = TypeVar("T")
 
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+# 409: the gateway is still running an earlier attempt with the same key
+KEYED_RETRYABLE_STATUS_CODES = RETRYABLE_STATUS_CODES | {409}
+OVERLOAD_STATUS_CODES = {429, 503, 504}
+MAX_BACKOFF = 30.0
+# Remaining client time budget for an attempt, in milliseconds
+DEADLINE_HEADER = "X-Request-Deadline-Ms"
 
-class HTTPClient:
-    """HTTP client with exponential backoff and retry logic."""
 
-    def __init__(self, config: ConnectorsConfig) -> None:
+class _BaseHTTPClient:
+    """Configuration and response handling shared by the async and sync clients."""
+
+    def __init__(self, config: ConnectorsConfig, codec: Optional[Codec] = None) -> None:
         self.base_url = config.base_url.rstrip("/")
         self.timeout = config.timeout / 1000  # Convert ms to seconds
+        self.deadline = config.deadline
+        self.tenant_id = config.tenant_id
         self.max_retries = config.max_retries
+        self.pool = config.pool
         self.headers = {
             "Content-Type": "application/json",
             **config.headers,
@@ -27,13 +80,361 @@ class HTTPClient:
         if config.tenant_id:
             self.headers["X-Tenant-ID"] = config.tenant_id
 
+        self.codec = codec or default_codec()
+        self.retry_budget = RetryBudget(config.retry_budget)
+        self.circuit_breakers = CircuitBreakerRegistry(config.circuit_breaker)
+        self.compression = CompressionPolicy(config.compression)
+        self.idempotency = IdempotencyKeys(config.idempotency)
+        self.http_cache = HTTPCache(config.http_cache)
+        self.rate_limits = RateLimitShaper(config.rate_limit)
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        """Get retry counters shared by all requests of this client."""
+        return self.retry_budget.stats()
+
+    @property
+    def circuit_stats(self) -> Dict[str, CircuitBreakerStats]:
+        """Get circuit breaker state per integration."""
+        return self.circuit_breakers.stats()
+
+    @property
+    def compression_stats(self) -> CompressionStats:
+        """Get request and response body size counters."""
+        return self.compression.stats()
+
+    @property
+    def idempotency_stats(self) -> IdempotencyStats:
+        """Get idempotency key and invocation deduplication counters."""
+        return self.idempotency.stats()
+
+    @property
+    def http_cache_stats(self) -> HTTPCacheStats:
+        """Get conditional GET cache counters."""
+        return self.http_cache.stats()
+
+    @property
+    def rate_limit_stats(self) -> Dict[str, RateLimitStats]:
+        """Get rate limit bucket state and queue-wait counters per tenant and route."""
+        return self.rate_limits.stats()
+
+    def _limits(self) -> httpx.Limits:
+        """Build connection pool limits from pool options."""
+        return httpx.Limits(
+            max_connections=self.pool.max_connections,
+            max_keepalive_connections=self.pool.max_keepalive_connections,
+            keepalive_expiry=self.pool.keepalive_expiry / 1000,
+        )
+
+    def _http_error(self, response: httpx.Response) -> HTTPError:
+        """Build HTTPError from an error response."""
+        return HTTPError(
+            f"HTTP {response.status_code}: {response.text}",
+            status_code=response.status_code,
+            response_body=response.text,
+            retry_after=parse_retry_after(response.headers),
+        )
+
+    def _decode(self, response: httpx.Response, response_type: Type[T]) -> T:
+        """
+        Decode a successful response into response_type.
+
+        Pydantic models and TypeAdapters are validated straight from the
+        response bytes, without building intermediate Python objects.
+        """
+        return self._decode_content(response.content, response_type)
+
+    def _decode_content(self, content: bytes, response_type: Type[T]) -> T:
+        """Decode a response body into response_type."""
+        # Handle Pydantic models
+        if hasattr(response_type, "model_validate_json"):
+            return response_type.model_validate_json(content)  # type: ignore
+        # Handle TypeAdapter instances, e.g. TypeAdapter(List[Tool])
+        if isinstance(response_type, TypeAdapter):
+            return response_type.validate_json(content)
+
+        data = self.codec.decode(content)
+        # Handle dict type
+        if response_type == dict:  # type: ignore
+            return data  # type: ignore
+        else:
+            return response_type(**data)  # type: ignore
+
+    def _cached(
+        self, method: str, path: str, params: Optional[Dict[str, Any]], response_type: Type[T]
+    ) -> Tuple[Optional[CacheEntry], Optional[T]]:
+        """
+        Look a request up in the conditional GET cache.
+
+        Returns:
+            The cached entry to revalidate, if any, and its value if it is
+            fresh enough to be returned without a request
+        """
+        entry = self.http_cache.get(method, path, params)
+        if entry is None or not self.http_cache.fresh(entry):
+            return entry, None
+        return entry, self._decode_content(entry.content, response_type)
+
+    def _decode_cached(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        response: httpx.Response,
+        response_type: Type[T],
+    ) -> T:
+        """Decode a response, answering a 304 from the cache and caching what it can."""
+        if not self.http_cache.cacheable(method, path):
+            return self._decode(response, response_type)
+        if response.status_code == 304:
+            entry = self.http_cache.get(method, path, params)
+            if entry is None:
+                raise HTTPError(
+                    "HTTP 304 for a response that is no longer cached",
+                    status_code=304,
+                    response_body=response.text,
+                )
+            self.http_cache.revalidated(entry, response)
+            return self._decode_content(entry.content, response_type)
+        self.http_cache.store(method, path, params, response)
+        return self._decode(response, response_type)
+
+    def _encode(self, json: Optional[Dict[str, Any]]) -> Optional[bytes]:
+        """Encode a request body once, so retries and hedges reuse the bytes."""
+        return None if json is None else self.codec.encode(json)
+
+    def _calculate_backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Calculate exponential backoff with jitter, or honour a server retry hint."""
+        if retry_after is not None:
+            # Small proportional jitter so clients told the same reset time
+            # do not all retry in the same instant
+            return min(retry_after + random.uniform(0, 0.1 * retry_after), MAX_BACKOFF)
+
+        base_delay = 1.0
+        exponential = base_delay * (2**attempt)
+        jitter = random.uniform(0, 1)
+        return min(exponential + jitter, MAX_BACKOFF)
+
+    def _retry_delay(
+        self, attempt: int, response: Optional[httpx.Response] = None
+    ) -> Optional[float]:
+        """
+        Decide whether a failed attempt is retried.
+
+        Returns the delay in seconds before the next attempt, or None to give
+        up: when attempts are exhausted, the server asks to wait longer than
+        the maximum backoff, or the client-wide retry budget is spent.
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        retry_after = parse_retry_after(response.headers) if response is not None else None
+        if retry_after is not None and retry_after > MAX_BACKOFF:
+            return None
+
+        if not self.retry_budget.try_acquire():
+            return None
+
+        return self._calculate_backoff(attempt, retry_after)
+
+    def _deadline_at(self, deadline: Optional[int]) -> Optional[float]:
+        """Turn a per-call deadline in ms (or the client default) into a monotonic instant."""
+        total = deadline if deadline is not None else self.deadline
+        if total is None:
+            return None
+        return time.monotonic() + total / 1000
+
+    def _attempt_timeout(self, deadline_at: Optional[float]) -> float:
+        """
+        Get the timeout for the next attempt, clipped to the remaining deadline.
+
+        Raises:
+            DeadlineExceededError: If the deadline has already passed
+        """
+        if deadline_at is None:
+            return self.timeout
+        remaining = deadline_at - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceededError("Deadline exceeded before the request could be sent")
+        return min(self.timeout, remaining)
+
+    def _rate_limit_bucket(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        body: Optional[StreamedBody],
+    ) -> Optional[RateLimitBucket]:
+        """Get the rate limit bucket a request is paced by, or None if shaping is disabled."""
+        tenant = tenant_of(json if body is None else body.data, params) or self.tenant_id
+        return self.rate_limits.get(tenant, method, path)
+
+    def _reserve(
+        self, bucket: RateLimitBucket, deadline_at: Optional[float], started: float
+    ) -> Tuple[float, bool]:
+        """
+        Reserve the next slot of a rate limit bucket for a request first paced at started.
+
+        Returns:
+            Seconds to wait, and whether a slot was reserved (see RateLimitBucket.reserve)
+
+        Raises:
+            RateLimitError: If the request would wait more than rate_limit.max_wait
+            DeadlineExceededError: If the call's deadline would pass first
+        """
+        now = time.monotonic()
+        max_wait = started + self.rate_limits.max_wait - now
+        if deadline_at is None or deadline_at - now >= max_wait:
+            return bucket.reserve(max_wait, now)
+        try:
+            return bucket.reserve(deadline_at - now, now)
+        except RateLimitError as e:
+            raise DeadlineExceededError(
+                f"Deadline exceeded waiting {e.retry_in:.1f}s for the rate limit", cause=e
+            ) from e
+
+    def _attempt_headers(
+        self,
+        timeout: float,
+        deadline_at: Optional[float],
+        extra: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, str]:
+        """Get request headers, telling the gateway how long the client will wait."""
+        if deadline_at is None and not extra:
+            return self.headers
+        headers = {**self.headers, **(extra or {})}
+        if deadline_at is not None:
+            headers[DEADLINE_HEADER] = str(max(1, int(timeout * 1000)))
+        return headers
+
+    def _record_sizes(
+        self, response: httpx.Response, stream: bool, body: Optional[StreamedBody]
+    ) -> None:
+        """Count the body sizes of a successful exchange; streamed responses are not read yet."""
+        if body is not None:
+            self.compression.record_request(
+                body.size, body.bytes_sent, compressed=body.encoding is not None
+            )
+        if not stream:
+            self.compression.record_response(response)
+
+    def _timeout_error(self, cause: Exception, timeout: float) -> ConnectorsTimeoutError:
+        """Build the error for a timed-out attempt."""
+        if timeout < self.timeout:
+            # The attempt was cut short by the call's deadline
+            return DeadlineExceededError(
+                f"Deadline exceeded after a {timeout:.3f}s final attempt", cause=cause
+            )
+        return ConnectorsTimeoutError(f"Request timeout after {self.timeout}s", cause=cause)
+
+    @staticmethod
+    def _stream_error(cause: httpx.HTTPError) -> Exception:
+        """Build the error for a failure while reading a streamed body."""
+        if isinstance(cause, httpx.TimeoutException):
+            return ConnectorsTimeoutError("Timed out reading the response stream", cause=cause)
+        return RetryableError(f"Response stream failed: {str(cause)}", cause=cause)
+
+    @staticmethod
+    def _within_deadline(delay: float, deadline_at: Optional[float]) -> bool:
+        """Check whether a retry after delay seconds would start before the deadline."""
+        return deadline_at is None or time.monotonic() + delay < deadline_at
+
+
+class HTTPClient(_BaseHTTPClient):
+    """HTTP client with exponential backoff and retry logic.
+
+    A single pooled ``httpx.AsyncClient`` is shared by all requests so that
+    connections (and TLS sessions) are kept alive between calls. The pool is
+    created lazily on first use and released by :meth:`aclose`.
+
+    When concurrency limiting is enabled, in-flight requests are bounded per
+    route by an adaptive (AIMD) limit and excess requests queue locally.
+
+    Identical concurrent idempotent requests are coalesced into one call.
+
+    When rate limit shaping is enabled, attempts are paced per tenant and
+    route to the quota the gateway advertises in its rate limit headers.
+
+    When hedging is enabled, a GET that has not answered within the route's
+    hedge delay is sent a second time; the first usable response wins and
+    the other attempt is cancelled.
+    """
+
+    def __init__(self, config: ConnectorsConfig, codec: Optional[Codec] = None) -> None:
+        super().__init__(config, codec)
+        self.concurrency = ConcurrencyLimiter(config.concurrency)
+        self._queue_timeout = config.concurrency.queue_timeout / 1000
+        self.hedging = HedgePolicy(config.hedging)
+        self.single_flight = SingleFlight(config.single_flight)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def concurrency_stats(self) -> Dict[str, ConcurrencyStats]:
+        """Get concurrency limiter state per route."""
+        return self.concurrency.stats()
+
+    @property
+    def hedge_stats(self) -> HedgeStats:
+        """Get hedged request counters."""
+        return self.hedging.stats()
+
+    @property
+    def single_flight_stats(self) -> SingleFlightStats:
+        """Get request coalescing counters."""
+        return self.single_flight.stats()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get the pooled httpx client, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        # Pooled connections are bound to the loop that opened them, so a
+        # client used from a new event loop (e.g. repeated asyncio.run calls)
+        # gets a fresh pool instead of reusing dead connections.
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                limits=self._limits(),
+                http2=self.pool.http2,
+                timeout=self.timeout,
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the connection pool. A new pool is opened on the next request."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
     async def get(self, path: str, response_type: Type[T]) -> T:
         """Send GET request."""
         return await self.request("GET", path, response_type=response_type)
 
-    async def post(self, path: str, data: Dict[str, Any], response_type: Type[T]) -> T:
+    async def post(
+        self,
+        path: str,
+        data: Dict[str, Any],
+        response_type: Type[T],
+        circuit: Optional[str] = None,
+        coalesce: bool = False,
+        deadline: Optional[int] = None,
+        body: Optional[StreamedBody] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> T:
         """Send POST request."""
-        return await self.request("POST", path, json=data, response_type=response_type)
+        return await self.request(
+            "POST",
+            path,
+            json=data,
+            response_type=response_type,
+            circuit=circuit,
+            coalesce=coalesce,
+            deadline=deadline,
+            body=body,
+            headers=headers,
+        )
 
     async def delete(self, path: str, response_type: Type[T]) -> T:
         """Send DELETE request."""
@@ -46,63 +447,658 @@ class HTTPClient:
         response_type: Type[T],
         json: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
+        circuit: Optional[str] = None,
+        coalesce: bool = False,
+        deadline: Optional[int] = None,
+        body: Optional[StreamedBody] = None,
+        headers: Optional[Dict[str, str]] = None,
     ) -> T:
-        """Send HTTP request with retry logic."""
+        """
+        Send HTTP request with retry logic.
+
+        The call, including retries and backoff, is bounded by deadline (ms),
+        or by the client's default deadline if one is configured.
+
+        If circuit names an integration, the request (including its retries)
+        is guarded by that integration's circuit breaker.
+
+        Identical concurrent GETs, and POSTs sent with coalesce=True (for
+        read-only POSTs such as tool selection), share one network call. Each
+        caller decodes its own copy of the response.
+
+        A StreamedBody is sent in place of json, encoded as it is sent.
+        Requests carrying an idempotency key in headers are also retried
+        on 409 Conflict.
+
+        GETs of the routes in the HTTP cache are revalidated with the cached
+        response's ETag / Last-Modified; a 304 returns the cached value.
+        """
+        entry, cached = self._cached(method, path, params, response_type)
+        if cached is not None:
+            return cached
+        if entry is not None:
+            headers = {**self.http_cache.conditional_headers(entry), **(headers or {})}
+        deadline_at = self._deadline_at(deadline)
+        breaker = self.circuit_breakers.get(circuit)
+        if breaker is not None:
+            breaker.before_call()
+        try:
+            if body is not None:
+                response = await self._fetch(
+                    method,
+                    path,
+                    None,
+                    params,
+                    deadline_at,
+                    headers={**body.headers, **(headers or {})},
+                    body=body,
+                )
+            else:
+                response = await self._fetch_shared(
+                    method, path, json, params, coalesce, deadline_at, headers
+                )
+        except BaseException as e:
+            if breaker is not None:
+                breaker.record_error(e)
+            raise
+        if breaker is not None:
+            breaker.record_success()
+        return self._decode_cached(method, path, params, response, response_type)
+
+    async def request_raw(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        deadline: Optional[int] = None,
+    ) -> httpx.Response:
+        """
+        Send a request with retry logic and return the undecoded response.
+
+        Any status below 400 is returned, so callers sending conditional
+        requests can handle 304 Not Modified themselves.
+        """
+        return await self._fetch(
+            method, path, None, params, self._deadline_at(deadline), headers=headers
+        )
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        deadline: Optional[int] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        circuit: Optional[str] = None,
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        Open a request whose response body is read incrementally by the caller.
+
+        Failed attempts are retried, and the deadline applies, until the
+        response headers arrive; the body is then streamed without retries.
+        If circuit names an integration, the request is guarded by that
+        integration's circuit breaker until the headers arrive.
+        """
+        breaker = self.circuit_breakers.get(circuit)
+        if breaker is not None:
+            breaker.before_call()
+        try:
+            response = await self._fetch(
+                method,
+                path,
+                json,
+                params,
+                self._deadline_at(deadline),
+                stream=True,
+                headers=headers,
+            )
+        except BaseException as e:
+            if breaker is not None:
+                breaker.record_error(e)
+            raise
+        if breaker is not None:
+            breaker.record_success()
+        try:
+            yield response
+        except httpx.HTTPError as e:
+            raise self._stream_error(e) from e
+        finally:
+            await response.aclose()
+
+    async def _fetch_shared(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        coalesce: bool,
+        deadline_at: Optional[float],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """Fetch a response, joining an identical in-flight request if allowed."""
+        if not self.single_flight.enabled or not (method == "GET" or coalesce):
+            return await self._fetch(method, path, json, params, deadline_at, headers=headers)
+
+        # The shared call runs without a deadline, as callers joining later
+        # may have a longer one (or none); each caller, the first included,
+        # waits only until its own deadline
+        key = SingleFlight.key(method, path, params, json)
+        shared = self.single_flight.do(
+            key, lambda: self._fetch(method, path, json, params, headers=headers)
+        )
+        if deadline_at is None:
+            return await shared
+        # do() shields the shared call, so timing out stops only our wait;
+        # the call is cancelled once every caller has given up
+        try:
+            return await asyncio.wait_for(shared, deadline_at - time.monotonic())
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError("Deadline exceeded waiting for a shared request") from None
+
+    async def _fetch(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        deadline_at: Optional[float] = None,
+        stream: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+        body: Optional[StreamedBody] = None,
+    ) -> httpx.Response:
+        """
+        Send a request, retrying failed attempts, and return the successful response.
+
+        With stream=True the response body is left unread for the caller. A
+        streamed body replaces json, and failed attempts are only retried if
+        the body can be rewound.
+        """
         url = f"{self.base_url}{path}"
-        retryable_codes = {408, 429, 500, 502, 503, 504}
+        content, compression_headers = self.compression.prepare(
+            method, path, self._encode(json)
+        )
+        if compression_headers:
+            headers = {**compression_headers, **(headers or {})}
+        retryable = (
+            KEYED_RETRYABLE_STATUS_CODES
+            if self.idempotency.retries_conflicts(headers)
+            else RETRYABLE_STATUS_CODES
+        )
+        limiter = self.concurrency.get(method, path)
+        bucket = self._rate_limit_bucket(method, path, json, params, body)
 
         last_error: Optional[Exception] = None
+        self.retry_budget.record_request()
 
         for attempt in range(self.max_retries + 1):
+            delay: Optional[float]
+            if bucket is None:
+                timeout = self._attempt_timeout(deadline_at)
+            else:
+                timeout = await self._pace(bucket, deadline_at)
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.request(
-                        method=method,
-                        url=url,
-                        headers=self.headers,
-                        json=json,
-                        params=params,
-                        timeout=self.timeout,
-                    )
-
-                    if response.status_code >= 400:
-                        if (
-                            response.status_code in retryable_codes
-                            and attempt < self.max_retries
-                        ):
-                            delay = self._calculate_backoff(attempt)
-                            await asyncio.sleep(delay)
-                            continue
-
-                        raise HTTPError(
-                            f"HTTP {response.status_code}: {response.text}",
-                            status_code=response.status_code,
-                            response_body=response.text,
-                        )
-
-                    data = response.json()
-
-                    # Handle Pydantic models
-                    if hasattr(response_type, "model_validate"):
-                        return response_type.model_validate(data)  # type: ignore
-                    # Handle dict type
-                    elif response_type == dict:  # type: ignore
-                        return data  # type: ignore
-                    else:
-                        return response_type(**data)  # type: ignore
+                attempt_call = self._attempt(
+                    limiter,
+                    bucket,
+                    path,
+                    stream,
+                    method=method,
+                    url=url,
+                    headers=self._attempt_headers(timeout, deadline_at, headers),
+                    content=content if body is None else body.__aiter__(),
+                    params=params,
+                    timeout=timeout,
+                )
+                if bucket is not None:
+                    attempt_call = self._shaped(bucket, attempt_call)
+                if deadline_at is not None:
+                    # httpx timeouts apply per network operation, so bound
+                    # the whole attempt to honour the deadline
+                    attempt_call = asyncio.wait_for(attempt_call, timeout)
+                response = await attempt_call
+            except (httpx.TimeoutException, asyncio.TimeoutError) as e:
+                last_error = self._timeout_error(e, timeout)
+                if isinstance(last_error, DeadlineExceededError):
+                    delay = None
+                else:
+                    delay = self._retry_delay(attempt)
+            except httpx.RequestError as e:
+                last_error = RetryableError(f"Request failed: {str(e)}", cause=e)
+                delay = self._retry_delay(attempt)
+            else:
+                if response.status_code < 400:
+                    self._record_sizes(response, stream, body)
+                    return response
+                if stream:
+                    # Read the (small) error body, which also frees the connection
+                    await response.aread()
 
-            except httpx.TimeoutException as e:
-                last_error = ConnectorsTimeoutError(
-                    f"Request timeout after {self.timeout}s", cause=e
+                last_error = self._http_error(response)
+                if response.status_code not in retryable:
+                    raise last_error
+
+                delay = self._retry_delay(attempt, response)
+
+            if (
+                delay is None
+                or not self._within_deadline(delay, deadline_at)
+                or (body is not None and not body.rewind())
+            ):
+                break
+            await asyncio.sleep(delay)
+
+        self.retry_budget.record_give_up()
+
+        if last_error:
+            raise last_error
+
+        # Should never reach here
+        raise RetryableError("Request failed after all retries")
+
+    async def _pace(self, bucket: RateLimitBucket, deadline_at: Optional[float]) -> float:
+        """Wait for a slot in the rate limit bucket, then get the attempt's timeout."""
+        started = time.monotonic()
+        reserved = paced = False
+        try:
+            while not reserved:
+                delay, reserved = self._reserve(bucket, deadline_at, started)
+                if delay > 0:
+                    paced = True
+                    bucket.waiting(1)
+                    try:
+                        await asyncio.sleep(delay)
+                    finally:
+                        bucket.waiting(-1)
+            if paced:
+                bucket.record_wait(time.monotonic() - started)
+            return self._attempt_timeout(deadline_at)
+        except BaseException:
+            if reserved:
+                bucket.record(None)
+            raise
+
+    @staticmethod
+    async def _shaped(
+        bucket: RateLimitBucket, attempt_call: Awaitable[httpx.Response]
+    ) -> httpx.Response:
+        """Run an attempt, updating its rate limit bucket from the response headers."""
+        response: Optional[httpx.Response] = None
+        try:
+            response = await attempt_call
+            return response
+        finally:
+            bucket.record(None if response is None else response.headers)
+
+    async def _attempt(
+        self,
+        limiter: Optional[AdaptiveLimiter],
+        bucket: Optional[RateLimitBucket],
+        path: str,
+        stream: bool,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Send one attempt, hedging it if it is an idempotent, buffered GET.
+
+        A hedge on a rate limited route needs a slot of its own in the
+        bucket, free right away; without one the attempt is not hedged.
+        """
+        if stream or not self.hedging.enabled or kwargs["method"] != "GET":
+            return await self._send(limiter, stream, **kwargs)
+
+        route = ConcurrencyLimiter.route_key("GET", path)
+        delay = self.hedging.delay(route)
+        primary = asyncio.ensure_future(self._timed_send(route, limiter, **kwargs))
+        pending = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if not done and self._can_hedge(limiter, bucket):
+                hedge_call = self._timed_send(route, limiter, **kwargs)
+                if bucket is not None:
+                    hedge_call = self._shaped(bucket, hedge_call)
+                pending.add(asyncio.ensure_future(hedge_call))
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
                 )
-                if attempt < self.max_retries:
-                    await asyncio.sleep(self._calculate_backoff(attempt))
-                    continue
+                for task in done:
+                    if task.exception() is None and (
+                        task.result().status_code not in RETRYABLE_STATUS_CODES
+                    ):
+                        if task is not primary:
+                            self.hedging.record_hedge_win()
+                        return task.result()
+            # Neither attempt was usable; report the original one's outcome
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def _can_hedge(
+        self, limiter: Optional[AdaptiveLimiter], bucket: Optional[RateLimitBucket]
+    ) -> bool:
+        # Never queue a hedge behind a saturated route: that adds load
+        # exactly when the gateway is already struggling
+        if limiter is not None and limiter.in_flight >= int(limiter.limit):
+            return False
+        if bucket is not None and not bucket.try_reserve():
+            return False
+        if self.hedging.try_hedge():
+            return True
+        if bucket is not None:
+            # The next response's headers restore the unused token
+            bucket.record(None)
+        return False
+
+    async def _timed_send(
+        self, route: str, limiter: Optional[AdaptiveLimiter], **kwargs: Any
+    ) -> httpx.Response:
+        start = time.monotonic()
+        response = await self._send(limiter, False, **kwargs)
+        if response.status_code < 400:
+            self.hedging.record_latency(route, time.monotonic() - start)
+        return response
+
+    async def _send(
+        self, limiter: Optional[AdaptiveLimiter], stream: bool, **kwargs: Any
+    ) -> httpx.Response:
+        """
+        Send one attempt, holding a concurrency slot on its route if limited.
+
+        A streamed attempt holds its slot until the response headers arrive.
+        """
+        if limiter is None:
+            return await self._request(stream, **kwargs)
+
+        await limiter.acquire(min(self._queue_timeout, kwargs["timeout"]))
+        start = time.monotonic()
+        latency: Optional[float] = None
+        overloaded: Optional[bool] = None
+        try:
+            response = await self._request(stream, **kwargs)
+            latency = time.monotonic() - start
+            overloaded = response.status_code in OVERLOAD_STATUS_CODES
+            return response
+        except httpx.RequestError:
+            overloaded = True
+            raise
+        finally:
+            limiter.release(latency, overloaded)
+
+    async def _request(self, stream: bool, **kwargs: Any) -> httpx.Response:
+        client = self.client
+        if not stream:
+            return await client.request(**kwargs)
+        return await client.send(client.build_request(**kwargs), stream=True)
+
+
+class SyncHTTPClient(_BaseHTTPClient):
+    """Blocking HTTP client with exponential backoff and retry logic.
+
+    Mirrors :class:`HTTPClient` on top of a pooled ``httpx.Client``, which is
+    safe to share between threads.
+    """
+
+    def __init__(self, config: ConnectorsConfig, codec: Optional[Codec] = None) -> None:
+        super().__init__(config, codec)
+        self._client: Optional[httpx.Client] = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        """Get the pooled httpx client, creating it if needed."""
+        with self._lock:
+            if self._client is None or self._client.is_closed:
+                self._client = httpx.Client(
+                    limits=self._limits(),
+                    http2=self.pool.http2,
+                    timeout=self.timeout,
+                )
+            return self._client
+
+    def close(self) -> None:
+        """Close the connection pool. A new pool is opened on the next request."""
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    def get(self, path: str, response_type: Type[T]) -> T:
+        """Send GET request."""
+        return self.request("GET", path, response_type=response_type)
+
+    def post(
+        self,
+        path: str,
+        data: Dict[str, Any],
+        response_type: Type[T],
+        circuit: Optional[str] = None,
+        deadline: Optional[int] = None,
+        body: Optional[StreamedBody] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> T:
+        """Send POST request."""
+        return self.request(
+            "POST",
+            path,
+            json=data,
+            response_type=response_type,
+            circuit=circuit,
+            deadline=deadline,
+            body=body,
+            headers=headers,
+        )
+
+    def delete(self, path: str, response_type: Type[T]) -> T:
+        """Send DELETE request."""
+        return self.request("DELETE", path, response_type=response_type)
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        response_type: Type[T],
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        circuit: Optional[str] = None,
+        deadline: Optional[int] = None,
+        body: Optional[StreamedBody] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> T:
+        """
+        Send HTTP request with retry logic.
+
+        The call, including retries and backoff, is bounded by deadline (ms),
+        or by the client's default deadline if one is configured.
+
+        If circuit names an integration, the request (including its retries)
+        is guarded by that integration's circuit breaker. A StreamedBody is
+        sent in place of json, encoded as it is sent. Requests carrying an
+        idempotency key in headers are also retried on 409 Conflict.
+
+        GETs of the routes in the HTTP cache are revalidated with the cached
+        response's ETag / Last-Modified; a 304 returns the cached value.
+        """
+        entry, cached = self._cached(method, path, params, response_type)
+        if cached is not None:
+            return cached
+        if entry is not None:
+            headers = {**self.http_cache.conditional_headers(entry), **(headers or {})}
+        deadline_at = self._deadline_at(deadline)
+        breaker = self.circuit_breakers.get(circuit)
+        if breaker is not None:
+            breaker.before_call()
+        try:
+            if body is not None:
+                response = self._fetch(
+                    method,
+                    path,
+                    None,
+                    params,
+                    deadline_at,
+                    headers={**body.headers, **(headers or {})},
+                    body=body,
+                )
+            else:
+                response = self._fetch(method, path, json, params, deadline_at, headers=headers)
+        except BaseException as e:
+            if breaker is not None:
+                breaker.record_error(e)
+            raise
+        if breaker is not None:
+            breaker.record_success()
+        return self._decode_cached(method, path, params, response, response_type)
+
+    def request_raw(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        deadline: Optional[int] = None,
+    ) -> httpx.Response:
+        """
+        Send a request with retry logic and return the undecoded response.
+
+        Any status below 400 is returned, so callers sending conditional
+        requests can handle 304 Not Modified themselves.
+        """
+        return self._fetch(method, path, None, params, self._deadline_at(deadline), headers=headers)
+
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        deadline: Optional[int] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        circuit: Optional[str] = None,
+    ) -> Iterator[httpx.Response]:
+        """
+        Open a request whose response body is read incrementally by the caller.
+
+        Failed attempts are retried, and the deadline applies, until the
+        response headers arrive; the body is then streamed without retries.
+        If circuit names an integration, the request is guarded by that
+        integration's circuit breaker until the headers arrive.
+        """
+        breaker = self.circuit_breakers.get(circuit)
+        if breaker is not None:
+            breaker.before_call()
+        try:
+            response = self._fetch(
+                method,
+                path,
+                json,
+                params,
+                self._deadline_at(deadline),
+                stream=True,
+                headers=headers,
+            )
+        except BaseException as e:
+            if breaker is not None:
+                breaker.record_error(e)
+            raise
+        if breaker is not None:
+            breaker.record_success()
+        try:
+            yield response
+        except httpx.HTTPError as e:
+            raise self._stream_error(e) from e
+        finally:
+            response.close()
+
+    def _fetch(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        deadline_at: Optional[float] = None,
+        stream: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+        body: Optional[StreamedBody] = None,
+    ) -> httpx.Response:
+        """
+        Send a request, retrying failed attempts, and return the successful response.
+
+        With stream=True the response body is left unread for the caller. A
+        streamed body replaces json, and failed attempts are only retried if
+        the body can be rewound.
+        """
+        url = f"{self.base_url}{path}"
+        content, compression_headers = self.compression.prepare(
+            method, path, self._encode(json)
+        )
+        if compression_headers:
+            headers = {**compression_headers, **(headers or {})}
+        retryable = (
+            KEYED_RETRYABLE_STATUS_CODES
+            if self.idempotency.retries_conflicts(headers)
+            else RETRYABLE_STATUS_CODES
+        )
+        client = self.client
+        bucket = self._rate_limit_bucket(method, path, json, params, body)
+
+        last_error: Optional[Exception] = None
+        self.retry_budget.record_request()
+
+        for attempt in range(self.max_retries + 1):
+            delay: Optional[float]
+            if bucket is None:
+                timeout = self._attempt_timeout(deadline_at)
+            else:
+                timeout = self._pace(bucket, deadline_at)
+            try:
+                request = client.build_request(
+                    method=method,
+                    url=url,
+                    headers=self._attempt_headers(timeout, deadline_at, headers),
+                    content=content if body is None else iter(body),
+                    params=params,
+                    timeout=timeout,
+                )
+                response = self._send(request, stream, bucket)
+            except httpx.TimeoutException as e:
+                last_error = self._timeout_error(e, timeout)
+                if isinstance(last_error, DeadlineExceededError):
+                    delay = None
+                else:
+                    delay = self._retry_delay(attempt)
             except httpx.RequestError as e:
                 last_error = RetryableError(f"Request failed: {str(e)}", cause=e)
-                if attempt < self.max_retries:
-                    await asyncio.sleep(self._calculate_backoff(attempt))
-                    continue
+                delay = self._retry_delay(attempt)
+            else:
+                if response.status_code < 400:
+                    self._record_sizes(response, stream, body)
+                    return response
+                if stream:
+                    # Read the (small) error body, which also frees the connection
+                    response.read()
+
+                last_error = self._http_error(response)
+                if response.status_code not in retryable:
+                    raise last_error
+
+                delay = self._retry_delay(attempt, response)
+
+            if (
+                delay is None
+                or not self._within_deadline(delay, deadline_at)
+                or (body is not None and not body.rewind())
+            ):
+                break
+            time.sleep(delay)
+
+        self.retry_budget.record_give_up()
 
         if last_error:
             raise last_error
@@ -110,10 +1106,37 @@ class HTTPClient:
         # Should never reach here
         raise RetryableError("Request failed after all retries")
 
-    def _calculate_backoff(self, attempt: int) -> float:
-        """Calculate exponential backoff with jitter."""
-        base_delay = 1.0
-        max_delay = 30.0
-        exponential = base_delay * (2**attempt)
-        jitter = random.uniform(0, 1)
-        return min(exponential + jitter, max_delay)
+    def _pace(self, bucket: RateLimitBucket, deadline_at: Optional[float]) -> float:
+        """Wait for a slot in the rate limit bucket, then get the attempt's timeout."""
+        started = time.monotonic()
+        reserved = paced = False
+        try:
+            while not reserved:
+                delay, reserved = self._reserve(bucket, deadline_at, started)
+                if delay > 0:
+                    paced = True
+                    bucket.waiting(1)
+                    try:
+                        time.sleep(delay)
+                    finally:
+                        bucket.waiting(-1)
+            if paced:
+                bucket.record_wait(time.monotonic() - started)
+            return self._attempt_timeout(deadline_at)
+        except BaseException:
+            if reserved:
+                bucket.record(None)
+            raise
+
+    def _send(
+        self, request: httpx.Request, stream: bool, bucket: Optional[RateLimitBucket]
+    ) -> httpx.Response:
+        """Send one attempt, updating its rate limit bucket from the response headers."""
+        if bucket is None:
+            return self.client.send(request, stream=stream)
+        response: Optional[httpx.Response] = None
+        try:
+            response = self.client.send(request, stream=stream)
+            return response
+        finally:
+            bucket.record(None if response is None else response.headers)
@@ -0,0 +1,172 @@
+"""Idempotency keys and deduplication of repeated tool invocations."""
+
+import hashlib
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from .types import IdempotencyOptions, IdempotencyStats
+from .uploads import has_streams
+
+
+class _Entry:
+    """The key of a recent invocation and, once it succeeded, its response."""
+
+    __slots__ = ("key", "response", "expires_at")
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self.response: Optional[Dict[str, Any]] = None
+        # None while the invocation is in flight
+        self.expires_at: Optional[float] = None
+
+
+class Invocation:
+    """One logical invocation: the key sent with every attempt, or a deduplicated response."""
+
+    __slots__ = ("key", "fingerprint", "response", "coalesce")
+
+    def __init__(
+        self,
+        key: Optional[str],
+        fingerprint: Optional[str] = None,
+        response: Optional[Dict[str, Any]] = None,
+        coalesce: bool = False,
+    ) -> None:
+        self.key = key
+        self.fingerprint = fingerprint
+        # Response of an identical invocation within the dedupe window
+        self.response = response
+        # Whether identical concurrent invocations may share one request
+        self.coalesce = coalesce
+
+
+class IdempotencyKeys:
+    """
+    Issues idempotency keys for tool invocations and deduplicates repeats.
+
+    Each logical invocation gets one key, sent with every retry of its
+    request, so a gateway that honours the header runs the tool at most
+    once. Within ``dedupe_window`` after an identical invocation (same body,
+    same caller-supplied key if any), the key is reused, and once that
+    invocation has succeeded its response is returned without calling the
+    gateway again. Bodies holding files or iterators are never deduplicated.
+    Thread-safe.
+    """
+
+    def __init__(self, options: IdempotencyOptions) -> None:
+        self.options = options
+        self.header = options.header
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._keyed = 0
+        self._keys_reused = 0
+        self._deduplicated = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether idempotency keys are sent."""
+        return self.options.enabled
+
+    @staticmethod
+    def fingerprint(body: Dict[str, Any], key: Optional[str] = None) -> str:
+        """Hash an invocation body, and the caller's key if given."""
+        digest = hashlib.sha256(
+            json.dumps(body, sort_keys=True, separators=(",", ":"), default=str).encode()
+        )
+        if key is not None:
+            digest.update(key.encode())
+        return digest.hexdigest()
+
+    def begin(self, body: Dict[str, Any], key: Optional[str] = None) -> Invocation:
+        """
+        Start a logical invocation of body.
+
+        Args:
+            body: The /tools/invoke request body
+            key: Caller-supplied idempotency key, e.g. one stored with a job
+                so a restarted job reuses it
+
+        Returns:
+            The invocation's key, or the response of an identical invocation
+            within the dedupe window
+        """
+        if not self.options.enabled:
+            return Invocation(None)
+        if not self.options.dedupe_window or has_streams(body):
+            return self._issue(key or uuid.uuid4().hex)
+
+        fingerprint = self.fingerprint(body, key)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is not None and entry.expires_at is not None and entry.expires_at <= now:
+                del self._entries[fingerprint]
+                entry = None
+            if entry is None:
+                entry = _Entry(key or uuid.uuid4().hex)
+                self._entries[fingerprint] = entry
+                while len(self._entries) > self.options.max_entries:
+                    self._entries.popitem(last=False)
+            elif entry.response is not None:
+                self._deduplicated += 1
+                return Invocation(entry.key, fingerprint, entry.response)
+            else:
+                self._keys_reused += 1
+            self._entries.move_to_end(fingerprint)
+            self._keyed += 1
+        return Invocation(entry.key, fingerprint, coalesce=key is None)
+
+    def finish(self, invocation: Invocation, response: Optional[Dict[str, Any]]) -> None:
+        """
+        Record how an invocation ended; response is None if it failed.
+
+        The key is kept for the dedupe window either way, so retrying a
+        failed invocation by hand reuses it; only responses reporting
+        success are returned to later identical invocations.
+        """
+        if invocation.fingerprint is None or invocation.response is not None:
+            return
+        with self._lock:
+            entry = self._entries.get(invocation.fingerprint)
+            if entry is None or entry.key != invocation.key:
+                return
+            entry.expires_at = time.monotonic() + self.options.dedupe_window / 1000
+            if response is not None and response.get("success"):
+                entry.response = response
+
+    def headers(self, invocation: Invocation) -> Dict[str, str]:
+        """Get the headers carrying an invocation's key."""
+        return {self.header: invocation.key} if invocation.key else {}
+
+    def key_headers(self, key: Optional[str] = None) -> Dict[str, str]:
+        """Get headers with a new key, or the given one, for requests never deduplicated."""
+        if not self.options.enabled:
+            return {}
+        return self.headers(self._issue(key or uuid.uuid4().hex))
+
+    def keyed(self, headers: Optional[Dict[str, str]]) -> bool:
+        """Check whether a request carries an idempotency key."""
+        return bool(headers) and self.header in headers  # type: ignore[operator]
+
+    def retries_conflicts(self, headers: Optional[Dict[str, str]]) -> bool:
+        """Check whether a request is retried when answered with 409 Conflict."""
+        return self.options.retry_conflicts and self.keyed(headers)
+
+    def stats(self) -> IdempotencyStats:
+        """Get a snapshot of the idempotency counters."""
+        with self._lock:
+            return IdempotencyStats(
+                keyed=self._keyed,
+                keys_reused=self._keys_reused,
+                deduplicated=self._deduplicated,
+                entries=len(self._entries),
+            )
+
+    def _issue(self, key: str) -> Invocation:
+        with self._lock:
+            self._keyed += 1
+        return Invocation(key)
@@ -1,26 +1,113 @@
 """MCPRegistry for MCP server management and deployment."""
 
-from typing import List, Optional, Dict, Any, TYPE_CHECKING
+from typing import AsyncIterator, List, Optional, Dict, Any, Type, Union, TYPE_CHECKING, cast
 import asyncio
 import time
 import random
 
-from .http_client import HTTPClient
+from pydantic import BaseModel, Field
+from .http_client import HTTPClient, SyncHTTPClient
 from .types import (
     ConnectorsConfig,
+    ToolListFilters,
     MCPDeploymentConfig,
     MCPIntegration,
     DeploymentStatus,
     DeploymentStatusType,
     WaitOptions,
     Tool,
+    ToolInvocationResponse,
 )
+from .cache import SelectCache
+from .catalog import CatalogAPI
+from .tools import _ToolList, _upload_body
 from .errors import DeploymentTimeoutError, DeploymentFailedError
+from .streaming import INVOCATION_STREAM_ACCEPT, InvocationStreamDecoder
+from .views import _integration_views
 
 if TYPE_CHECKING:
     from .mcp import MCPRegistry
 
 
+def _build_call_request(
+    integration: str, tool_name: str, parameters: Dict[str, Any], tenant_id: Optional[str]
+) -> Dict[str, Any]:
+    """Build the /tools/invoke request body for an MCP server call."""
+    return {
+        "toolId": f"{integration}.{tool_name}",
+        "integration": integration,
+        "tenantId": tenant_id,
+        "parameters": parameters,
+    }
+
+
+def _build_add_request(
+    config: MCPDeploymentConfig, tenant_id: Optional[str]
+) -> Dict[str, Any]:
+    """Build the /mcp/add request body from a deployment config."""
+    request_body: Dict[str, Any] = {
+        "name": config.name,
+        "source": config.source.model_dump(exclude_none=True),
+        "category": config.category,
+        "tenantId": tenant_id,
+    }
+
+    if config.description:
+        request_body["description"] = config.description
+    if config.oauth_config:
+        request_body["oauthConfig"] = config.oauth_config
+
+    return request_body
+
+
+class _IntegrationList(BaseModel):
+    """Response body of /mcp/integrations, validated straight from bytes."""
+
+    integrations: List[MCPIntegration] = Field(default_factory=list)
+
+
+def _integration_list_type(config: ConnectorsConfig) -> Type[Any]:
+    """Response type for integration lists: raw JSON in trusted mode, else validated."""
+    return dict if config.trusted else _IntegrationList
+
+
+def _unpack_integrations(
+    response: Union[_IntegrationList, Dict[str, Any]]
+) -> List[MCPIntegration]:
+    """Get validated integrations, or lazy views over a trusted raw response."""
+    if isinstance(response, _IntegrationList):
+        return response.integrations
+    # IntegrationView exposes MCPIntegration's fields read-only; see views.py
+    return cast(List[MCPIntegration], _integration_views(response))
+
+
+def _catalog_changed(
+    http: Union[HTTPClient, SyncHTTPClient], select_cache: Optional[SelectCache]
+) -> None:
+    """Drop cached listings and selections after the integrations changed."""
+    http.http_cache.clear()
+    if select_cache is not None:
+        select_cache.invalidate()
+
+
+def _is_deployment_ready(deployment_id: str, status: DeploymentStatus) -> bool:
+    """Return True once a deployment is running; raise if it failed."""
+    if status.status == DeploymentStatusType.RUNNING:
+        return True
+    elif status.status == DeploymentStatusType.FAILED:
+        raise DeploymentFailedError(
+            f"Deployment {deployment_id} failed: {status.error}",
+            deployment_id=deployment_id,
+            reason=status.error,
+        )
+    return False
+
+
+def _next_poll_interval(current_interval: float) -> float:
+    """Exponential backoff with jitter, capped at 10 seconds."""
+    return min(current_interval * 1.5 + random.uniform(0, 1000), 10000)
+
+
 class MCPServer:
     """
     Bound MCP server instance for direct tool calls.
@@ -31,54 +118,121 @@ class MCPServer:
     """
 
     def __init__(
-        self, integration: str, http: HTTPClient, config: ConnectorsConfig
+        self,
+        integration: str,
+        http: HTTPClient,
+        config: ConnectorsConfig,
+        catalog: Optional[CatalogAPI] = None,
     ) -> None:
         """Initialize MCPServer."""
         self.integration = integration
         self._http = http
         self._config = config
+        self._catalog = catalog
 
-    async def call(self, tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    async def call(
+        self, tool_name: str, parameters: Dict[str, Any], deadline: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Call a tool on this MCP server.
 
         Args:
             tool_name: Tool name (without integration prefix)
             parameters: Tool parameters
+            deadline: Optional total time budget in ms for this call, including
+                retries (overrides the client default)
 
         Returns:
             Tool execution result
 
         Raises:
             HTTPError: If call fails
+            CircuitOpenError: If the integration's circuit breaker is open
+            DeadlineExceededError: If the deadline expires
         """
-        tool_id = f"{self.integration}.{tool_name}"
-        response = await self._http.post(
-            "/api/v1/tools/invoke",
-            {
-                "toolId": tool_id,
-                "integration": self.integration,
-                "tenantId": self._config.tenant_id,
-                "parameters": parameters,
-            },
-            dict,
+        request_body = _build_call_request(
+            self.integration, tool_name, parameters, self._config.tenant_id
         )
+        invocation = self._http.idempotency.begin(request_body)
+        if invocation.response is not None:
+            return dict(invocation.response)
+        response: Optional[Dict[str, Any]] = None
+        try:
+            response = await self._http.request(
+                "POST",
+                "/api/v1/tools/invoke",
+                dict,
+                json=request_body,
+                circuit=request_body["integration"],
+                coalesce=invocation.coalesce,
+                deadline=deadline,
+                body=_upload_body(request_body, None, self._http),
+                headers=self._http.idempotency.headers(invocation),
+            )
+        finally:
+            self._http.idempotency.finish(invocation, response)
         return response  # type: ignore
 
+    async def call_stream(
+        self, tool_name: str, parameters: Dict[str, Any], deadline: Optional[int] = None
+    ) -> AsyncIterator[ToolInvocationResponse]:
+        """
+        Call a tool on this MCP server, yielding its result in chunks as they arrive.
+
+        Args:
+            tool_name: Tool name (without integration prefix)
+            parameters: Tool parameters
+            deadline: Optional time budget in ms to wait for the response
+                to start, including retries (overrides the client default)
+
+        Yields:
+            ToolInvocationResponse chunks, in the order received
+
+        Raises:
+            HTTPError: If call fails or the stream is interrupted
+            CircuitOpenError: If the integration's circuit breaker is open
+            DeadlineExceededError: If the deadline expires
+        """
+        request_body = _build_call_request(
+            self.integration, tool_name, parameters, self._config.tenant_id
+        )
+        async with self._http.stream(
+            "POST",
+            "/api/v1/tools/invoke",
+            json=request_body,
+            headers={"Accept": INVOCATION_STREAM_ACCEPT, **self._http.idempotency.key_headers()},
+            circuit=request_body["integration"],
+            deadline=deadline,
+        ) as response:
+            decoder = InvocationStreamDecoder(
+                response.headers.get("content-type", ""), self._http.codec
+            )
+            async for chunk in response.aiter_bytes():
+                for result in decoder.feed(chunk):
+                    yield result
+                if decoder.done:
+                    break
+        for result in decoder.close():
+            yield result
+
     async def list_tools(self) -> List[Tool]:
         """
         List all tools for this integration.
 
+        Read locally when the catalog replica is enabled.
+
         Returns:
             List of tools for this MCP server
 
         Raises:
             HTTPError: If request fails
         """
+        if self._catalog is not None:
+            return await self._catalog.list_tools(ToolListFilters(integration=self.integration))
         response = await self._http.get(
-            f"/api/v1/tools/list?integration={self.integration}", dict
+            f"/api/v1/tools/list?integration={self.integration}", _ToolList
         )
-        return [Tool.model_validate(tool) for tool in response.get("tools", [])]
+        return list(response.tools)
 
 
 class MCPDeploymentClass:
@@ -132,10 +286,18 @@ class MCPRegistry:
     monitoring deployment status.
     """
 
-    def __init__(self, http: HTTPClient, config: ConnectorsConfig) -> None:
+    def __init__(
+        self,
+        http: HTTPClient,
+        config: ConnectorsConfig,
+        catalog: Optional[CatalogAPI] = None,
+        select_cache: Optional[SelectCache] = None,
+    ) -> None:
         """Initialize MCPRegistry."""
         self._http = http
         self._config = config
+        self._catalog = catalog
+        self._select_cache = select_cache
 
     def get(self, integration: str) -> MCPServer:
         """
@@ -151,14 +313,17 @@ class MCPRegistry:
             >>> github = connectors.mcp.get("github")
             >>> pr = await github.call("createPullRequest", {...})
         """
-        return MCPServer(integration, self._http, self._config)
+        return MCPServer(integration, self._http, self._config, self._catalog)
 
     async def list(self) -> List[MCPIntegration]:
         """
         List all available MCP integrations.
 
+        Read locally when the catalog replica is enabled.
+
         Returns:
-            List of MCP integrations with metadata
+            List of MCP integrations with metadata (lazy IntegrationView
+            objects in trusted mode)
 
         Raises:
             HTTPError: If request fails
@@ -168,11 +333,12 @@ class MCPRegistry:
             >>> for integration in integrations:
             ...     print(f"{integration.name}: {integration.tool_count} tools")
         """
-        response = await self._http.get("/api/v1/mcp/integrations", dict)
-        return [
-            MCPIntegration.model_validate(item)
-            for item in response.get("integrations", [])
-        ]
+        if self._catalog is not None:
+            return await self._catalog.list_integrations()
+        response = await self._http.get(
+            "/api/v1/mcp/integrations", _integration_list_type(self._config)
+        )
+        return _unpack_integrations(response)
 
     async def add(self, config: MCPDeploymentConfig) -> MCPDeploymentClass:
         """
@@ -201,19 +367,9 @@ class MCPRegistry:
             ... )
             >>> await deployment.wait_until_ready()
         """
-        request_body: Dict[str, Any] = {
-            "name": config.name,
-            "source": config.source.model_dump(exclude_none=True),
-            "category": config.category,
-            "tenantId": self._config.tenant_id,
-        }
-
-        if config.description:
-            request_body["description"] = config.description
-        if config.oauth_config:
-            request_body["oauthConfig"] = config.oauth_config
-
+        request_body = _build_add_request(config, self._config.tenant_id)
         response = await self._http.post("/api/v1/mcp/add", request_body, dict)
+        _catalog_changed(self._http, self._select_cache)
         return MCPDeploymentClass(response, self)
 
     async def remove(self, name: str) -> None:
@@ -232,6 +388,7 @@ class MCPRegistry:
         await self._http.delete(
             f"/api/v1/mcp/custom/{name}?tenantId={self._config.tenant_id}", dict
         )
+        _catalog_changed(self._http, self._select_cache)
 
     async def get_deployment_status(self, deployment_id: str) -> DeploymentStatus:
         """
@@ -246,10 +403,9 @@ class MCPRegistry:
         Raises:
             HTTPError: If request fails
         """
-        response = await self._http.get(
-            f"/api/v1/mcp/deployments/{deployment_id}", dict
+        return await self._http.get(
+            f"/api/v1/mcp/deployments/{deployment_id}", DeploymentStatus
         )
-        return DeploymentStatus.model_validate(response)
 
     async def wait_for_deployment(
         self, deployment_id: str, options: Optional[WaitOptions] = None
@@ -292,14 +448,8 @@ class MCPRegistry:
             if opts.on_progress:
                 opts.on_progress(status)
 
-            if status.status == DeploymentStatusType.RUNNING:
+            if _is_deployment_ready(deployment_id, status):
                 return status
-            elif status.status == DeploymentStatusType.FAILED:
-                raise DeploymentFailedError(
-                    f"Deployment {deployment_id} failed: {status.error}",
-                    deployment_id=deployment_id,
-                    reason=status.error,
-                )
 
             elapsed = (time.time() * 1000) - start_time
             if elapsed >= timeout:
@@ -310,7 +460,4 @@ class MCPRegistry:
                 )
 
             await asyncio.sleep(current_interval / 1000)
-            # Exponential backoff with jitter, capped at 10 seconds
-            current_interval = min(
-                current_interval * 1.5 + random.uniform(0, 1000), 10000
-            )
+            current_interval = _next_poll_interval(current_interval)
@@ -0,0 +1,268 @@
+"""Client-side pacing of requests to the gateway's advertised rate limits."""
+
+import math
+import re
+import threading
+import time
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
+
+from .concurrency import ConcurrencyLimiter
+from .errors import RateLimitError
+from .retry import _EPOCH_THRESHOLD, _parse_seconds
+from .types import RateLimitOptions, RateLimitStats
+
+_WINDOW = re.compile(r"[;,]\s*w\s*=\s*(\d+(?:\.\d+)?)", re.IGNORECASE)
+# Keys of the combined RateLimit header, e.g. "limit=100, remaining=42, reset=30"
+# or "default";r=42;t=30
+_LIMIT_KEYS = ("limit", "q")
+_REMAINING_KEYS = ("remaining", "r")
+_RESET_KEYS = ("reset", "t")
+
+
+class Quota(NamedTuple):
+    """A rate limit window as advertised by the gateway."""
+
+    limit: Optional[int]
+    remaining: int
+    # Seconds until the window resets
+    reset: float
+    # Window length in seconds, if the policy was given
+    window: Optional[float]
+
+
+def _parse_int(value: Optional[str]) -> Optional[int]:
+    seconds = _parse_seconds(value.strip()) if value else None
+    return None if seconds is None else int(seconds)
+
+
+def _parse_combined(value: str) -> Dict[str, str]:
+    """Split a structured RateLimit header into its keys and values."""
+    fields = {}
+    for part in re.split(r"[;,]", value):
+        key, sep, item = part.partition("=")
+        if sep:
+            fields[key.strip().lower()] = item.strip().strip('"')
+    return fields
+
+
+def parse_rate_limit(headers: Mapping[str, str], now: Optional[float] = None) -> Optional[Quota]:
+    """
+    Get the rate limit window from response headers.
+
+    Reads ``RateLimit-Limit`` / ``-Remaining`` / ``-Reset`` with the window
+    from ``RateLimit-Policy`` (as sent by express-rate-limit), the
+    ``X-RateLimit-*`` equivalents (whose reset may be an epoch timestamp),
+    or a combined ``RateLimit`` header. Returns None if the response
+    carries no usable quota.
+    """
+    now = time.time() if now is None else now
+    policy = headers.get("ratelimit-policy") or headers.get("x-ratelimit-policy") or ""
+    match = _WINDOW.search(policy)
+    window = float(match.group(1)) if match else None
+
+    limit: Optional[int] = None
+    remaining: Optional[int] = None
+    reset: Optional[float] = None
+    combined = headers.get("ratelimit")
+    if combined:
+        fields = _parse_combined(combined)
+        limit = next((_parse_int(fields[k]) for k in _LIMIT_KEYS if k in fields), None)
+        remaining = next((_parse_int(fields[k]) for k in _REMAINING_KEYS if k in fields), None)
+        reset = next((_parse_seconds(fields[k]) for k in _RESET_KEYS if k in fields), None)
+    else:
+        for prefix in ("ratelimit-", "x-ratelimit-"):
+            remaining = _parse_int(headers.get(f"{prefix}remaining"))
+            value = headers.get(f"{prefix}reset")
+            reset = _parse_seconds(value.strip()) if value else None
+            if remaining is not None and reset is not None:
+                limit = _parse_int(headers.get(f"{prefix}limit"))
+                break
+
+    if remaining is None or reset is None:
+        return None
+    if reset > _EPOCH_THRESHOLD:
+        reset = max(0.0, reset - now)
+    if limit is None:
+        limit = _parse_int(policy.split(";", 1)[0]) if policy else None
+    return Quota(limit, remaining, reset, window)
+
+
+class RateLimitBucket:
+    """
+    Local token bucket mirroring one gateway rate limit window.
+
+    Tokens are the requests the gateway still allows until the window
+    resets; each response's headers correct the count, less the requests
+    still in flight. Slots are handed out only within the current window,
+    spread evenly over what is left of it (GCRA pacing) with up to
+    ``burst`` sent back to back. Once the window is spent, requests wait for
+    its reset and ask again: the gateway starts its next window at the
+    first request after the reset, so later windows cannot be planned
+    ahead. Until the gateway has advertised a limit, requests are not
+    delayed. Thread-safe.
+    """
+
+    def __init__(self, key: str, options: RateLimitOptions) -> None:
+        self.key = key
+        self.burst = options.burst
+        self.limit: Optional[int] = None
+        self.tokens = 0.0
+        # Monotonic time the window resets at; None while unknown
+        self.reset_at: Optional[float] = None
+        self.window: Optional[float] = None
+        self.in_flight = 0
+        self.queued = 0
+        self.waited = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.rejected = 0
+        # Earliest start of the next request, and its theoretical arrival time
+        self._next = 0.0
+        self._tat = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: float, now: Optional[float] = None) -> Tuple[float, bool]:
+        """
+        Reserve a slot for one request in the current window.
+
+        Returns:
+            Seconds to wait, and whether a slot was reserved; if not, the
+            window is spent and the request should wait for its reset, then
+            call reserve() again
+
+        Raises:
+            RateLimitError: If the wait is more than max_wait seconds
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self.tokens, self.reset_at = self._window_at(now)
+            if self.reset_at is None:
+                self.in_flight += 1
+                return 0.0, True
+            start = max(now, self._next)
+            reserved = self.tokens >= 1 and start < self.reset_at
+            delay = start - now if reserved else self.reset_at - now
+            if delay > max_wait:
+                self.rejected += 1
+                raise RateLimitError(
+                    f"Rate limit for {self.key} allows the next request in {delay:.1f}s",
+                    key=self.key,
+                    retry_in=delay,
+                )
+            if reserved:
+                self._take(start, self.reset_at)
+            return delay, reserved
+
+    def try_reserve(self, now: Optional[float] = None) -> bool:
+        """Reserve a slot only if one is free now, for requests that are optional, like hedges."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self.tokens, self.reset_at = self._window_at(now)
+            if self.reset_at is None:
+                self.in_flight += 1
+                return True
+            if self.tokens < 1 or self._next > now or now >= self.reset_at:
+                return False
+            self._take(now, self.reset_at)
+            return True
+
+    def record(self, headers: Optional[Mapping[str, str]], now: Optional[float] = None) -> None:
+        """Finish a reserved request, updating the window from its response headers."""
+        quota = parse_rate_limit(headers) if headers is not None else None
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            if quota is None:
+                return
+            self.limit = quota.limit if quota.limit is not None else self.limit
+            self.window = quota.window if quota.window is not None else self.window
+            # Requests still in flight may not be counted in remaining yet
+            self.tokens = float(max(0, quota.remaining - self.in_flight))
+            self.reset_at = now + quota.reset
+
+    def waiting(self, delta: int) -> None:
+        """Count a request starting (+1) or ending (-1) a wait."""
+        with self._lock:
+            self.queued += delta
+
+    def record_wait(self, seconds: float) -> None:
+        """Count the total time a request waited before being sent."""
+        with self._lock:
+            self.waited += 1
+            self.wait_time += seconds
+            self.max_wait_time = max(self.max_wait_time, seconds)
+
+    def stats(self, now: Optional[float] = None) -> RateLimitStats:
+        """Get a snapshot of this bucket's state and wait counters."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            tokens, reset_at = self._window_at(now)
+            return RateLimitStats(
+                key=self.key,
+                limit=self.limit,
+                remaining=None if reset_at is None else int(tokens),
+                reset_in=None if reset_at is None else reset_at - now,
+                in_flight=self.in_flight,
+                queued=self.queued,
+                waited=self.waited,
+                wait_time=self.wait_time,
+                max_wait_time=self.max_wait_time,
+                rejected=self.rejected,
+            )
+
+    def _take(self, start: float, reset_at: float) -> None:
+        """Spend a token on a request starting at start, spacing the next one after it."""
+        interval = (reset_at - start) / self.tokens
+        self._tat = max(self._tat, start) + interval
+        self._next = self._tat - self.burst * interval
+        self.tokens -= 1
+        self.in_flight += 1
+
+    def _window_at(self, at: float) -> Tuple[float, Optional[float]]:
+        """Get the tokens and reset time of the window at a given time."""
+        if self.reset_at is None or at < self.reset_at:
+            return self.tokens, self.reset_at
+        if self.limit is None or not self.window:
+            # A new window of unknown size; wait for the gateway to describe it
+            return 0.0, None
+        # The gateway's new window starts no earlier than this one would
+        windows = math.floor((at - self.reset_at) / self.window) + 1
+        return float(self.limit), self.reset_at + windows * self.window
+
+
+class RateLimitShaper:
+    """Registry of rate limit buckets keyed by tenant and route."""
+
+    def __init__(self, options: RateLimitOptions) -> None:
+        self.options = options
+        self.max_wait = options.max_wait / 1000
+        self._buckets: Dict[str, RateLimitBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(tenant: Optional[str], method: str, path: str) -> str:
+        """Build the bucket key for a tenant's requests to a route."""
+        return f"{tenant or '-'} {ConcurrencyLimiter.route_key(method, path)}"
+
+    def get(self, tenant: Optional[str], method: str, path: str) -> Optional[RateLimitBucket]:
+        """Get the bucket for a request, or None if shaping is disabled."""
+        if not self.options.enabled:
+            return None
+        key = self.key(tenant, method, path)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = RateLimitBucket(key, self.options)
+            return bucket
+
+    def stats(self) -> Dict[str, RateLimitStats]:
+        """Get the state of every bucket seen so far."""
+        with self._lock:
+            buckets = list(self._buckets.values())
+        return {bucket.key: bucket.stats() for bucket in buckets}
+
+
+def tenant_of(data: Any, params: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Get the tenant a request is counted against, from its body or query."""
+    tenant = data.get("tenantId") if isinstance(data, dict) else None
+    return tenant or (params or {}).get("tenantId")
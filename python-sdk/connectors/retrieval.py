@@ -0,0 +1,296 @@
+"""Local two-level tool retrieval over the catalog replica.
+
+Requires the ``semantic`` extra: ``pip install connectors-sdk[semantic]``.
+"""
+
+import json
+import math
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .catalog import _CatalogBase
+from .errors import ConnectorsError
+from .semantic import HashingVectorizer
+from .types import LocalSelectOptions, Tool
+from .views import _parse_tool
+
+# Gateway defaults for a /tools/select request without options
+DEFAULT_MAX_TOOLS = 5
+DEFAULT_TOKEN_BUDGET = 5000
+# Same estimate as the gateway's token optimizer
+_TOKENS_PER_CHAR = 0.25
+
+_CAMEL = re.compile(r"([a-z0-9])([A-Z])")
+_TERM = re.compile(r"[a-z0-9]+")
+# Words that would otherwise give BM25 matches between unrelated texts
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from i in into is it me my of on or our the this to "
+    "with".split()
+)
+
+
+def _terms(text: str) -> List[str]:
+    """Split text into lowercase terms, breaking camelCase and dotted ids apart."""
+    return [
+        term
+        for term in _TERM.findall(_CAMEL.sub(r"\1 \2", text).lower())
+        if term not in _STOPWORDS
+    ]
+
+
+def _document(tool: Dict[str, Any]) -> str:
+    """Get the searchable text of a tool."""
+    return " ".join(
+        str(tool.get(field) or "") for field in ("toolId", "name", "description")
+    )
+
+
+def estimate_token_cost(tool: Dict[str, Any]) -> int:
+    """Get a tool's token cost, estimated from its schema size like the gateway does."""
+    cost = tool.get("tokenCost")
+    if isinstance(cost, int):
+        return cost
+    chars = len(tool.get("name") or "") + len(tool.get("description") or "")
+    if tool.get("parameters"):
+        chars += len(json.dumps(tool["parameters"], separators=(",", ":")))
+    return math.ceil(chars * _TOKENS_PER_CHAR)
+
+
+class HybridRetriever:
+    """
+    In-memory category → tool retrieval over a fixed set of tools.
+
+    Each tool is scored by a weighted sum of BM25 over its id, name and
+    description (normalized to the best match) and the cosine similarity of
+    hashed embeddings of the same text. Like the gateway, the best categories
+    are picked first, by their best BM25 match and the similarity of their
+    centroid embedding, and tools are then ranked within them and cut to
+    max_tools and token_budget.
+    """
+
+    def __init__(
+        self,
+        tools: Sequence[Dict[str, Any]],
+        dimensions: int = 512,
+        bm25_weight: float = 0.5,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ) -> None:
+        self.size = len(tools)
+        self._vectorizer = HashingVectorizer(dimensions)
+        self._bm25_weight = bm25_weight
+
+        names = [str(tool.get("category") or "") for tool in tools]
+        self.categories = sorted(set(names))
+        codes = {name: code for code, name in enumerate(self.categories)}
+        self._category = np.array([codes[name] for name in names], dtype=np.int64)
+        self._token_cost = np.array([estimate_token_cost(tool) for tool in tools], dtype=np.int64)
+
+        # BM25 postings, grouped by term: term t's postings are
+        # _docs[_offsets[t]:_offsets[t + 1]] with precomputed weights
+        self._vocabulary: Dict[str, int] = {}
+        term_ids: List[int] = []
+        doc_ids: List[int] = []
+        counts: List[int] = []
+        lengths = np.zeros(self.size, dtype=np.float32)
+        documents = []
+        for doc, tool in enumerate(tools):
+            terms = _terms(_document(tool))
+            documents.append(" ".join(terms))
+            lengths[doc] = len(terms)
+            for term, count in Counter(terms).items():
+                term_ids.append(self._vocabulary.setdefault(term, len(self._vocabulary)))
+                doc_ids.append(doc)
+                counts.append(count)
+
+        terms_array = np.array(term_ids, dtype=np.int64)
+        order = np.argsort(terms_array, kind="stable")
+        self._docs = np.array(doc_ids, dtype=np.int64)[order]
+        tf = np.array(counts, dtype=np.float32)[order]
+        df = np.bincount(terms_array, minlength=len(self._vocabulary))
+        self._offsets = np.concatenate(([0], np.cumsum(df)))
+        idf = np.log1p((self.size - df + 0.5) / (df + 0.5)).astype(np.float32)
+        average = float(lengths.mean()) if self.size else 1.0
+        norm = k1 * (1 - b + b * lengths[self._docs] / (average or 1.0))
+        self._weights = idf[terms_array[order]] * tf * (k1 + 1) / (tf + norm)
+
+        self._vectors = np.zeros((self.size, dimensions), dtype=np.float32)
+        for doc, text in enumerate(documents):
+            self._vectors[doc] = self._vectorizer.transform(text)
+        centroids = np.zeros((len(self.categories), dimensions), dtype=np.float32)
+        np.add.at(centroids, self._category, self._vectors)
+        norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+        self._centroids = centroids / np.where(norms > 0, norms, 1.0)
+
+    def scores(self, query: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the hybrid score of every tool and every category for a query."""
+        terms = _terms(query)
+        bm25 = np.zeros(self.size, dtype=np.float32)
+        ids = [self._vocabulary[term] for term in set(terms) if term in self._vocabulary]
+        if ids:
+            postings = np.concatenate(
+                [np.arange(self._offsets[t], self._offsets[t + 1]) for t in ids]
+            )
+            bm25 = np.bincount(
+                self._docs[postings], self._weights[postings], minlength=self.size
+            ).astype(np.float32)
+            best = bm25.max()
+            if best > 0:
+                bm25 /= best
+
+        vector = self._vectorizer.transform(" ".join(terms))
+        weight = self._bm25_weight
+        tool_scores = weight * bm25 + (1 - weight) * np.clip(self._vectors @ vector, 0, None)
+
+        category_bm25 = np.zeros(len(self.categories), dtype=np.float32)
+        np.maximum.at(category_bm25, self._category, bm25)
+        category_scores = weight * category_bm25 + (1 - weight) * np.clip(
+            self._centroids @ vector, 0, None
+        )
+        return tool_scores, category_scores
+
+    def top_categories(self, query: str, count: int) -> List[str]:
+        """Get the names of the count best matching categories."""
+        codes = self._top_categories(self.scores(query)[1], count)
+        return [self.categories[code] for code in codes]
+
+    def search(
+        self,
+        query: str,
+        max_tools: Optional[int] = None,
+        categories: Optional[List[str]] = None,
+        token_budget: Optional[int] = None,
+        max_categories: int = 3,
+    ) -> List[Tuple[int, float]]:
+        """
+        Select tools for a query.
+
+        Args:
+            query: Natural language query
+            max_tools: Maximum number of tools (default: 5, as on the gateway)
+            categories: Only consider these categories, instead of picking
+                the max_categories best ones
+            token_budget: Maximum total token cost (default: 5000, as on the
+                gateway); lower ranked tools that do not fit are skipped
+            max_categories: Number of categories to pick
+
+        Returns:
+            (tool index, score) pairs, best first
+        """
+        tool_scores, category_scores = self.scores(query)
+        if categories is not None:
+            codes = {name: code for code, name in enumerate(self.categories)}
+            allowed = [codes[name] for name in categories if name in codes]
+        else:
+            allowed = self._top_categories(category_scores, max_categories)
+
+        candidates = np.flatnonzero(np.isin(self._category, allowed) & (tool_scores > 0))
+        ranked = candidates[np.argsort(-tool_scores[candidates], kind="stable")]
+
+        budget = token_budget or DEFAULT_TOKEN_BUDGET
+        limit = max_tools or DEFAULT_MAX_TOOLS
+        selected: List[Tuple[int, float]] = []
+        used = 0
+        # Walk past tools that do not fit, so cheaper lower ranked ones fill the slots
+        for index in ranked:
+            cost = int(self._token_cost[index])
+            if used + cost <= budget:
+                selected.append((int(index), float(tool_scores[index])))
+                used += cost
+                if len(selected) == limit or used == budget:
+                    break
+        return selected
+
+    @staticmethod
+    def _top_categories(category_scores: np.ndarray, count: int) -> List[int]:
+        ranked = np.argsort(-category_scores, kind="stable")[:count]
+        return [int(code) for code in ranked if category_scores[code] > 0]
+
+
+class LocalSelector:
+    """
+    Answers ``tools.select()`` in-process from the catalog replica.
+
+    The retriever is built from the replica's current snapshot on first use
+    and rebuilt whenever a sync changes the stored tools. Building reads the
+    whole catalog, so async callers run build() in a thread and only select
+    locally once ready(). Thread-safe.
+    """
+
+    def __init__(self, catalog: _CatalogBase, options: LocalSelectOptions) -> None:
+        self.catalog = catalog
+        self.options = options
+        self._lock = threading.Lock()
+        self._retriever: Optional[HybridRetriever] = None
+        self._raw: List[bytes] = []
+        self._version: Optional[float] = None
+
+    def available(self) -> bool:
+        """Check whether the replica holds a snapshot to select from."""
+        return self.catalog.replica.synced_at() is not None
+
+    def ready(self) -> bool:
+        """Check whether the index is built for the replica's current snapshot."""
+        if not self.available():
+            return False
+        version = self.catalog.replica.changed_at()
+        with self._lock:
+            return self._retriever is not None and version == self._version
+
+    def build(self) -> None:
+        """
+        Build the index for the replica's current snapshot, unless it is up to date.
+
+        Raises:
+            ConnectorsError: If the replica has never been synced
+        """
+        self._index()
+
+    def is_tight(self, deadline: Optional[int]) -> bool:
+        """Check whether a call's deadline is within the latency budget."""
+        budget = self.options.latency_budget
+        return budget is not None and deadline is not None and deadline <= budget
+
+    def select(self, request_body: Dict[str, Any]) -> List[Tool]:
+        """
+        Select tools for a /tools/select request body.
+
+        Raises:
+            ConnectorsError: If the replica has never been synced
+        """
+        retriever, raw = self._index()
+        hits = retriever.search(
+            request_body["query"],
+            max_tools=request_body.get("maxTools"),
+            categories=request_body.get("categories"),
+            token_budget=request_body.get("tokenBudget"),
+            max_categories=self.options.max_categories,
+        )
+        trusted = self.catalog._config.trusted
+        return [_parse_tool(raw[index], trusted, self.catalog._codec) for index, _ in hits]
+
+    def categories(self, query: str) -> List[str]:
+        """Get the best matching categories for a query."""
+        retriever, _ = self._index()
+        return retriever.top_categories(query, self.options.max_categories)
+
+    def _index(self) -> Tuple[HybridRetriever, List[bytes]]:
+        if not self.available():
+            raise ConnectorsError("The catalog replica has not been synced yet")
+        replica = self.catalog.replica
+        with self._lock:
+            version = replica.changed_at()
+            if self._retriever is None or version != self._version:
+                codec = self.catalog._codec
+                self._raw = replica.tools()
+                self._retriever = HybridRetriever(
+                    [codec.decode(raw) for raw in self._raw],
+                    dimensions=self.options.dimensions,
+                    bm25_weight=self.options.bm25_weight,
+                )
+                self._version = version
+            return self._retriever, self._raw
@@ -0,0 +1,139 @@
+"""Retry helpers: server retry hints and a client-wide retry budget."""
+
+import threading
+import time
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+
+from .types import RetryBudgetOptions, RetryStats
+
+# Values above this are treated as epoch timestamps rather than delta seconds
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def _parse_seconds(value: str) -> Optional[float]:
+    """Parse a non-negative number of seconds."""
+    try:
+        seconds = float(value)
+    except ValueError:
+        return None
+    return seconds if seconds >= 0 else None
+
+
+def parse_retry_after(headers: Mapping[str, str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Get the server-requested retry delay in seconds from response headers.
+
+    Checks ``Retry-After`` (delta seconds or HTTP date) first, then the
+    ``RateLimit-Reset`` / ``X-RateLimit-Reset`` headers sent with an
+    exhausted quota. Returns None if the server gave no usable hint.
+    """
+    now = time.time() if now is None else now
+
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        seconds = _parse_seconds(retry_after.strip())
+        if seconds is not None:
+            return seconds
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            retry_at = None
+        if retry_at is not None:
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            return max(0.0, retry_at.timestamp() - now)
+
+    for prefix in ("ratelimit-", "x-ratelimit-"):
+        reset = headers.get(f"{prefix}reset")
+        if not reset:
+            continue
+        remaining = headers.get(f"{prefix}remaining")
+        if remaining is not None and remaining.strip() not in ("0", "0.0"):
+            continue
+        seconds = _parse_seconds(reset.strip())
+        if seconds is None:
+            continue
+        if seconds > _EPOCH_THRESHOLD:
+            return max(0.0, seconds - now)
+        return seconds
+
+    return None
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries to a fraction of request traffic.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one, so
+    under sustained failure retries stay capped at roughly ``ratio`` of the
+    request rate. A small reserve refilled at ``min_retries_per_second`` lets
+    low-traffic clients still retry. The budget is shared by all requests of
+    a client and is thread-safe.
+    """
+
+    def __init__(self, options: RetryBudgetOptions) -> None:
+        self.enabled = options.enabled
+        self.ratio = options.ratio
+        self.min_retries_per_second = options.min_retries_per_second
+        self.max_tokens = options.max_tokens
+        self._tokens = min(options.min_retries_per_second, options.max_tokens)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._retries = 0
+        self._retries_denied = 0
+        self._gave_up = 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(
+            self.max_tokens, self._tokens + elapsed * self.min_retries_per_second
+        )
+
+    def record_request(self) -> None:
+        """Record an original (non-retry) request and deposit its tokens."""
+        with self._lock:
+            self._requests += 1
+            self._refill()
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_acquire(self) -> bool:
+        """Withdraw a token for one retry. Returns False if the budget is spent."""
+        with self._lock:
+            if self.enabled:
+                self._refill()
+                if self._tokens < 1:
+                    self._retries_denied += 1
+                    return False
+                self._tokens -= 1
+            self._retries += 1
+            return True
+
+    def record_give_up(self) -> None:
+        """Record a request that failed with a retryable error and was not retried."""
+        with self._lock:
+            self._gave_up += 1
+
+    def stats(self) -> RetryStats:
+        """Get a snapshot of retry counters."""
+        with self._lock:
+            self._refill()
+            return RetryStats(
+                requests=self._requests,
+                retries=self._retries,
+                retries_denied=self._retries_denied,
+                gave_up=self._gave_up,
+                available_tokens=self._tokens,
+            )
+
+    def reset_stats(self) -> None:
+        """Reset counters (the token balance is kept)."""
+        with self._lock:
+            self._requests = 0
+            self._retries = 0
+            self._retries_denied = 0
+            self._gave_up = 0
@@ -0,0 +1,185 @@
+"""Local query embeddings for near-duplicate tool selection lookups.
+
+Requires the ``semantic`` extra: ``pip install connectors-sdk[semantic]``.
+"""
+
+import re
+import time
+import zlib
+from typing import FrozenSet, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+_WORD = re.compile(r"[^\W_]+")
+
+# Words that say nothing about which tool a query needs
+_STOPWORDS = frozenset(
+    "a an the to in on of for from with by at into onto via and or my our your their "
+    "me us i we you it this that these those some any all please can could would "
+    "should want need new".split()
+)
+
+# Abbreviations and synonyms, folded to one spelling so paraphrases share words
+_SYNONYMS = {
+    "pr": "pull request",
+    "prs": "pull request",
+    "mr": "merge request",
+    "repo": "repository",
+    "msg": "message",
+    "dm": "direct message",
+    "dms": "direct message",
+    "mail": "email",
+    "doc": "document",
+    "db": "database",
+    "open": "create",
+    "add": "create",
+    "make": "create",
+    "start": "create",
+    "remove": "delete",
+    "destroy": "delete",
+    "drop": "delete",
+    "erase": "delete",
+    "post": "send",
+    "find": "search",
+    "lookup": "search",
+    "query": "search",
+    "edit": "update",
+    "modify": "update",
+    "change": "update",
+    "fetch": "get",
+    "read": "get",
+    "retrieve": "get",
+    "show": "get",
+    "view": "get",
+    "enumerate": "list",
+}
+
+# Verbs naming what a query does; queries with different ones never match
+_ACTIONS = frozenset(
+    "create delete send search update get list close merge approve review assign "
+    "invite upload download schedule cancel reply comment archive move copy share "
+    "export import run deploy trigger publish pin star fork join leave "
+    "reopen rename sync transfer refund charge pay subscribe unsubscribe".split()
+)
+
+# Whole words outweigh the character n-grams each word contributes
+_WORD_WEIGHT = 3.0
+
+
+def _stem(word: str) -> str:
+    """Strip a plural "s", so "issues" and "issue" share a word feature."""
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+class HashingVectorizer:
+    """
+    Embeds short texts with hashed word and character n-gram features.
+
+    Runs offline with no model or vocabulary: each feature is hashed into
+    one of dimensions buckets with a hash-derived sign, and the vector is
+    L2-normalized so dot products are cosine similarities. Words are folded
+    through a small table of abbreviations and synonyms ("PR" and "pull
+    request", "open" and "create") and weighted above character n-grams,
+    which keep the embedding robust to typos and inflections.
+    """
+
+    def __init__(self, dimensions: int = 1024, ngram_size: int = 3) -> None:
+        self.dimensions = dimensions
+        self.ngram_size = ngram_size
+
+    @staticmethod
+    def terms(text: str) -> List[str]:
+        """Get the canonical words of a text, without stopwords."""
+        terms: List[str] = []
+        for word in _WORD.findall(text.lower()):
+            stem = _stem(word)
+            canonical = _SYNONYMS.get(word) or _SYNONYMS.get(stem) or stem
+            terms.extend(term for term in canonical.split() if term not in _STOPWORDS)
+        return terms
+
+    def actions(self, text: str) -> FrozenSet[str]:
+        """Get the action verbs of a text, which a near-duplicate must share."""
+        return frozenset(term for term in self.terms(text) if term in _ACTIONS)
+
+    def features(self, text: str) -> List[Tuple[str, float]]:
+        """Get the weighted word and character n-gram features of a text."""
+        features: List[Tuple[str, float]] = []
+        n = self.ngram_size
+        for word in self.terms(text):
+            features.append((f"w:{word}", _WORD_WEIGHT))
+            padded = f" {word} "
+            features.extend(
+                (f"c:{padded[i:i + n]}", 1.0) for i in range(max(1, len(padded) - n + 1))
+            )
+        return features
+
+    def transform(self, text: str) -> np.ndarray:
+        """Embed a text as a unit-length float32 vector."""
+        features = self.features(text)
+        hashes = np.fromiter(
+            (zlib.crc32(feature.encode("utf-8")) for feature, _ in features),
+            dtype=np.uint32,
+            count=len(features),
+        )
+        weights = np.fromiter(
+            (weight for _, weight in features), dtype=np.float32, count=len(features)
+        )
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        # Low bits pick the bucket, the top bit the sign
+        signs = np.where(hashes & 0x80000000, -1.0, 1.0).astype(np.float32)
+        np.add.at(vector, hashes % self.dimensions, signs * weights)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+
+class VectorIndex:
+    """
+    Fixed-capacity in-memory index of query embeddings.
+
+    Each slot holds one embedding, the cache key it belongs to, a context
+    (everything in the key but the query text), the query's action verbs and
+    an expiry time. A lookup only matches fresh entries with the same
+    context and actions, so "delete the channel" never answers for "create
+    the channel" however similar the rest of the wording.
+    """
+
+    def __init__(self, capacity: int, vectorizer: HashingVectorizer) -> None:
+        self.vectorizer = vectorizer
+        self._vectors = np.zeros((capacity, vectorizer.dimensions), dtype=np.float32)
+        self._contexts = np.zeros(capacity, dtype=np.int64)
+        self._actions = np.zeros(capacity, dtype=np.int64)
+        self._expires = np.zeros(capacity, dtype=np.float64)
+        self._keys: List[Optional[Hashable]] = [None] * capacity
+        self._free = list(range(capacity - 1, -1, -1))
+
+    def add(self, key: Hashable, context: Hashable, text: str, expires: float) -> int:
+        """Index a key's query text and return its slot."""
+        slot = self._free.pop()
+        self._vectors[slot] = self.vectorizer.transform(text)
+        self._contexts[slot] = hash(context)
+        self._actions[slot] = hash(self.vectorizer.actions(text))
+        self._expires[slot] = expires
+        self._keys[slot] = key
+        return slot
+
+    def remove(self, slot: int) -> None:
+        """Free a slot."""
+        self._keys[slot] = None
+        self._expires[slot] = 0.0
+        self._free.append(slot)
+
+    def nearest(self, context: Hashable, text: str) -> Tuple[Optional[Hashable], float]:
+        """Get the most similar fresh key with the same context and actions, and its similarity."""
+        scores = self._vectors @ self.vectorizer.transform(text)
+        candidates = (
+            (self._contexts == hash(context))
+            & (self._actions == hash(self.vectorizer.actions(text)))
+            & (self._expires > time.monotonic())
+        )
+        if not candidates.any():
+            return None, 0.0
+        scores[~candidates] = -np.inf
+        slot = int(np.argmax(scores))
+        return self._keys[slot], float(scores[slot])
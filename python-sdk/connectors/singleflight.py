@@ -0,0 +1,88 @@
+"""Single-flight coalescing of identical in-flight requests."""
+
+import asyncio
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from .types import SingleFlightOptions, SingleFlightStats
+
+T = TypeVar("T")
+
+
+class _Flight:
+    """A shared in-flight call and the number of callers waiting on it."""
+
+    def __init__(self, task: "asyncio.Future[Any]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Collapses identical concurrent calls into one.
+
+    The first caller for a key starts the call as a separate task; callers
+    arriving while it is in flight wait on the same task. A caller that is
+    cancelled stops waiting without affecting the others, and the shared call
+    is only cancelled once every caller has given up. Keys are forgotten as
+    soon as the call completes, so results are never cached.
+    """
+
+    def __init__(self, options: SingleFlightOptions) -> None:
+        self.options = options
+        self._flights: Dict[str, _Flight] = {}
+        self._requests = 0
+        self._coalesced = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether coalescing is enabled."""
+        return self.options.enabled
+
+    @staticmethod
+    def key(
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Build the coalescing key from method, path, params and body hash."""
+        query = json.dumps(params or {}, sort_keys=True, default=str)
+        digest = hashlib.sha256(
+            json.dumps(body, sort_keys=True, separators=(",", ":"), default=str).encode()
+        ).hexdigest()
+        return f"{method.upper()} {path} {query} {digest}"
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn, or join an identical call that is already in flight."""
+        self._requests += 1
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(fn()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+        else:
+            self._coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Everyone gave up; stop the shared call
+                flight.task.cancel()
+                self._forget(key, flight)
+
+    def _forget(self, key: str, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def stats(self) -> SingleFlightStats:
+        """Get coalescing counters."""
+        return SingleFlightStats(
+            requests=self._requests,
+            coalesced=self._coalesced,
+            in_flight=len(self._flights),
+        )
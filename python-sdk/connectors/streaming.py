@@ -0,0 +1,461 @@
+"""Incremental parsing of large JSON list responses and streamed tool results."""
+
+import binascii
+import codecs
+import json
+import re
+from typing import Any, List, Optional, Sequence, Tuple
+
+from .codec import Codec
+from .errors import ConnectorsError
+from .types import ToolInvocationResponse
+
+# A complete JSON string, a structural bracket, or the opening quote of a
+# string that continues in the next chunk. Numbers and literals never
+# contain brackets, so only these tokens matter for finding elements.
+_TOKEN = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}\[\]]|"')
+_KEY_SEPARATOR = re.compile(rb"\s*:\s*")
+_OPEN = b"{["
+_QUOTE = ord('"')
+
+
+class JSONArrayParser:
+    """
+    Extracts the elements of one array of a JSON object as bytes arrive.
+
+    Feed response chunks in order; each call returns the raw bytes of the
+    object elements of ``object[key]`` completed so far, ready to be
+    validated one by one. Only the element being read is buffered, so memory
+    stays flat however long the array is.
+    """
+
+    def __init__(self, key: str) -> None:
+        self._key = b'"' + key.encode() + b'"'
+        self._buffer = bytearray()
+        self._pos = 0
+        self._depth = 0
+        # Nesting depth of the array's elements, once the array is found
+        self._array_depth: Optional[int] = None
+        self._item_start: Optional[int] = None
+        # End of a matching key, until the next token shows whether it
+        # introduces the array
+        self._key_end: Optional[int] = None
+        self.done = False
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Add a chunk of the response and get the elements it completes."""
+        if self.done:
+            return []
+        buffer = self._buffer
+        buffer += chunk
+        items: List[bytes] = []
+
+        for match in _TOKEN.finditer(buffer, self._pos):
+            start, end = match.span()
+            token = buffer[start]
+            if token == _QUOTE:
+                if end - start == 1:
+                    # Unterminated string: wait for the rest of it
+                    break
+                is_key = (
+                    self._array_depth is None
+                    and self._depth == 1
+                    and match.group() == self._key
+                )
+                self._key_end = end if is_key else None
+            elif token in _OPEN:
+                if (
+                    self._key_end is not None
+                    and token == _OPEN[1]
+                    and _KEY_SEPARATOR.fullmatch(buffer, self._key_end, start)
+                ):
+                    self._array_depth = self._depth + 1
+                elif self._depth == self._array_depth and self._item_start is None:
+                    self._item_start = start
+                self._key_end = None
+                self._depth += 1
+            else:
+                self._depth -= 1
+                self._key_end = None
+                if self._depth == self._array_depth and self._item_start is not None:
+                    items.append(bytes(buffer[self._item_start : end]))
+                    self._item_start = None
+                elif self._depth == 0 or (
+                    self._array_depth is not None and self._depth < self._array_depth
+                ):
+                    # The array (or a body without it) is complete
+                    self.done = True
+                    self._buffer = bytearray()
+                    return items
+            self._pos = end
+
+        self._compact()
+        return items
+
+    def close(self) -> None:
+        """
+        Check that the whole array was read.
+
+        Raises:
+            ConnectorsError: If the response ended before the array did
+        """
+        if not self.done:
+            raise ConnectorsError("Response ended before the JSON array was complete")
+
+    def _compact(self) -> None:
+        """Drop bytes that no pending element or key still needs."""
+        if self._item_start is not None:
+            cut = self._item_start
+        elif self._key_end is not None:
+            cut = self._key_end
+        else:
+            cut = self._pos
+        if cut:
+            del self._buffer[:cut]
+            self._pos -= cut
+            if self._item_start is not None:
+                self._item_start -= cut
+            if self._key_end is not None:
+                self._key_end -= cut
+
+
+class EventStreamParser:
+    """
+    Splits a ``text/event-stream`` body into server-sent events as bytes arrive.
+
+    Each call to feed() returns the (event type, data) pairs of the events
+    completed so far; multi-line data is joined with newlines and comments,
+    ids and retry hints are dropped. An event cut off by the end of the body
+    is discarded, as in a browser.
+    """
+
+    def __init__(self) -> None:
+        self._lines = LineParser()
+        self._event = ""
+        self._data: List[str] = []
+
+    def feed(self, chunk: bytes) -> List[Tuple[str, str]]:
+        """Add a chunk of the response and get the events it completes."""
+        events: List[Tuple[str, str]] = []
+        for raw in self._lines.feed(chunk):
+            line = raw.decode("utf-8", errors="replace")
+            if not line:
+                if self._data:
+                    events.append((self._event or "message", "\n".join(self._data)))
+                self._event = ""
+                self._data = []
+                continue
+            if line.startswith(":"):
+                continue
+            field, _, value = line.partition(":")
+            if value.startswith(" "):
+                value = value[1:]
+            if field == "data":
+                self._data.append(value)
+            elif field == "event":
+                self._event = value
+        return events
+
+
+class LineParser:
+    """Splits a body into lines as bytes arrive, for newline-delimited JSON."""
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Add a chunk of the response and get the lines it completes, without endings."""
+        self._buffer += chunk
+        end = self._buffer.rfind(b"\n")
+        if end < 0:
+            return []
+        lines = bytes(self._buffer[:end]).split(b"\n")
+        del self._buffer[: end + 1]
+        return [line[:-1] if line.endswith(b"\r") else line for line in lines]
+
+    def close(self) -> bytes:
+        """Get the last line if the body did not end with a newline."""
+        rest = bytes(self._buffer).rstrip(b"\r")
+        self._buffer = bytearray()
+        return rest
+
+
+# Accept header for streamed invocations, preferring incremental formats
+INVOCATION_STREAM_ACCEPT = "text/event-stream, application/x-ndjson, application/json;q=0.9"
+# Sent by streaming APIs in place of a last event's data to end the stream
+_DONE = "[DONE]"
+
+
+class InvocationStreamDecoder:
+    """
+    Turns a streamed /tools/invoke response into ToolInvocationResponse chunks.
+
+    The format follows the response's Content-Type:
+
+    - ``text/event-stream``: one chunk per event; an ``error`` event becomes
+      a failed chunk, and a ``done`` event or ``[DONE]`` data ends the stream
+    - ``application/x-ndjson`` (or ``application/jsonl``): one chunk per line
+    - ``application/json``: the whole body is one chunk, which is how a
+      gateway that does not stream answers
+    - anything else: each piece of the body as it arrives, decoded to text
+      for ``text/*`` types and left as bytes otherwise
+
+    JSON payloads that look like an invocation response (they have a
+    ``success`` field) are validated as one; any other payload becomes the
+    ``data`` of a successful chunk.
+    """
+
+    def __init__(self, content_type: str, codec: Codec) -> None:
+        media_type, _, parameters = content_type.partition(";")
+        media_type = media_type.strip().lower()
+        self._codec = codec
+        self._events: Optional[EventStreamParser] = None
+        self._lines: Optional[LineParser] = None
+        self._body: Optional[bytearray] = None
+        self._text: Optional[codecs.IncrementalDecoder] = None
+        if media_type == "text/event-stream":
+            self._events = EventStreamParser()
+        elif media_type in ("application/x-ndjson", "application/jsonl"):
+            self._lines = LineParser()
+        elif media_type == "application/json" or media_type.endswith("+json"):
+            self._body = bytearray()
+        elif media_type.startswith("text/"):
+            charset = "utf-8"
+            for parameter in parameters.split(";"):
+                name, _, value = parameter.partition("=")
+                if name.strip().lower() == "charset" and value.strip():
+                    charset = value.strip().strip('"')
+            self._text = codecs.getincrementaldecoder(charset)(errors="replace")
+        self.done = False
+
+    def feed(self, chunk: bytes) -> List[ToolInvocationResponse]:
+        """Add a chunk of the response and get the results it completes."""
+        if self.done or not chunk:
+            return []
+        if self._events is not None:
+            results = []
+            for event, data in self._events.feed(chunk):
+                if data == _DONE:
+                    self.done = True
+                    break
+                if event == "error":
+                    results.append(self._error(data))
+                elif data:
+                    results.append(self._result(self._parse(data.encode("utf-8"))))
+                if event == "done":
+                    self.done = True
+                    break
+            return results
+        if self._lines is not None:
+            return [self._line(line) for line in self._lines.feed(chunk) if line.strip()]
+        if self._body is not None:
+            self._body += chunk
+            return []
+        if self._text is not None:
+            text = self._text.decode(chunk)
+            return [_response(success=True, data=text)] if text else []
+        return [_response(success=True, data=chunk)]
+
+    def close(self) -> List[ToolInvocationResponse]:
+        """
+        Get the results still held back when the response ends.
+
+        Raises:
+            ConnectorsError: If a JSON body or line is malformed
+        """
+        if self.done:
+            return []
+        self.done = True
+        if self._lines is not None:
+            rest = self._lines.close()
+            return [self._line(rest)] if rest.strip() else []
+        if self._body is not None:
+            try:
+                payload = self._codec.decode(bytes(self._body))
+            except ValueError as e:
+                raise ConnectorsError(f"Invalid JSON in streamed response: {e}") from e
+            return [self._result(payload)]
+        if self._text is not None:
+            text = self._text.decode(b"", final=True)
+            return [_response(success=True, data=text)] if text else []
+        return []
+
+    def _line(self, line: bytes) -> ToolInvocationResponse:
+        try:
+            return self._result(self._codec.decode(line))
+        except ValueError as e:
+            raise ConnectorsError(f"Invalid JSON line in streamed response: {e}") from e
+
+    def _parse(self, data: bytes) -> Any:
+        """Decode event data as JSON, keeping it as text if it is not."""
+        try:
+            return self._codec.decode(data)
+        except ValueError:
+            return data.decode("utf-8")
+
+    def _error(self, data: str) -> ToolInvocationResponse:
+        payload = self._parse(data.encode("utf-8"))
+        if isinstance(payload, dict):
+            message = payload.get("error") or payload.get("message") or data
+        else:
+            message = data
+        return _response(success=False, error=str(message))
+
+    @staticmethod
+    def _result(payload: Any) -> ToolInvocationResponse:
+        if isinstance(payload, dict) and "success" in payload:
+            return ToolInvocationResponse.model_validate(payload)
+        return _response(success=True, data=payload)
+
+
+def _response(**fields: Any) -> ToolInvocationResponse:
+    """Build a result by field name; the model constructor is typed by alias."""
+    return ToolInvocationResponse.model_validate(fields)
+
+
+# The escape-complete part of a JSON string's contents: stops before the
+# closing quote, or before a backslash whose escape is still to come
+_STRING_BODY = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*')
+# Standard or URL-safe base64, as JSON may escape it
+_BASE64_TEXT = re.compile(rb"(?:[A-Za-z0-9+/=_-]|\\[/nr])*")
+_BASE64_ESCAPES = ((b"\\/", b"/"), (b"\\n", b""), (b"\\r", b""))
+_URLSAFE = bytes.maketrans(b"-_", b"+/")
+# Leading characters checked before a field is taken to be base64
+_SNIFF = 256
+
+
+def _match_end(pattern: "re.Pattern[bytes]", buffer: bytearray, pos: int, endpos: int) -> int:
+    """Get where a pattern that may match the empty string stops matching."""
+    match = pattern.match(buffer, pos, endpos)
+    return pos if match is None else match.end()
+
+_OUTSIDE, _STRING, _CANDIDATE, _BINARY = range(4)
+
+
+class Base64FieldDecoder:
+    """
+    Decodes a base64 string field out of a JSON body as bytes arrive.
+
+    The first string value of one of the given keys (at any depth) that
+    looks like base64 is decoded chunk by chunk and returned from feed();
+    only its undecoded tail is buffered, however large the field is. The
+    rest of the body, with that value replaced by ``null``, is kept and
+    returned by close(). Standard and URL-safe base64 are accepted, with or
+    without padding.
+    """
+
+    def __init__(self, keys: Sequence[str]) -> None:
+        self._keys = {json.dumps(key).encode() for key in keys}
+        self._buffer = bytearray()
+        self._skeleton = bytearray()
+        self._pending = bytearray()
+        self._state = _OUTSIDE
+        self._pos = 0
+        # Opening quote of the string being read, and how far it was scanned
+        self._start = 0
+        self._scan = 0
+        self._key = b""
+        # Key of the decoded field, once found
+        self.field: Optional[str] = None
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Add a chunk of the body and get the bytes it decodes."""
+        buffer = self._buffer
+        buffer += chunk
+        decoded: List[bytes] = []
+
+        while True:
+            if self._state == _OUTSIDE:
+                quote = buffer.find(b'"', self._pos)
+                if quote < 0:
+                    self._skeleton += buffer[self._pos :]
+                    self._pos = len(buffer)
+                    break
+                self._skeleton += buffer[self._pos : quote]
+                is_candidate = (
+                    self.field is None
+                    and self._key in self._keys
+                    and self._skeleton.rstrip().endswith(b":")
+                )
+                self._state = _CANDIDATE if is_candidate else _STRING
+                self._start = quote
+                self._scan = quote + 1
+
+            end = _match_end(_STRING_BODY, buffer, self._scan, len(buffer))
+            closed = end < len(buffer) and buffer[end] == _QUOTE
+            self._scan = end
+
+            if self._state == _CANDIDATE:
+                length = end - self._start - 1
+                if not closed and length < _SNIFF:
+                    break
+                sniffed = self._start + 1 + min(length, _SNIFF)
+                matched = _match_end(_BASE64_TEXT, buffer, self._start + 1, sniffed)
+                if length and matched >= sniffed - 1:
+                    self._state = _BINARY
+                    self.field = json.loads(self._key)
+                    self._pos = self._start + 1
+                else:
+                    self._state = _STRING
+
+            if self._state == _STRING:
+                if not closed:
+                    break
+                self._key = bytes(buffer[self._start : end + 1])
+                self._skeleton += self._key
+                self._state = _OUTSIDE
+                self._pos = end + 1
+                continue
+
+            self._decode(buffer[self._pos : end], decoded, final=closed)
+            self._pos = end
+            if not closed:
+                break
+            self._skeleton += b"null"
+            self._key = b""
+            self._state = _OUTSIDE
+            self._pos = end + 1
+
+        self._compact()
+        return decoded
+
+    def close(self) -> bytes:
+        """
+        Get the rest of the body, with the decoded field replaced by null.
+
+        Raises:
+            ConnectorsError: If the body ended inside a string
+        """
+        if self._state != _OUTSIDE:
+            raise ConnectorsError("Response ended inside a JSON string")
+        skeleton = bytes(self._skeleton)
+        self._skeleton = bytearray()
+        return skeleton
+
+    def _decode(self, text: bytearray, decoded: List[bytes], final: bool) -> None:
+        """Decode the whole base64 quads of text, keeping the rest for later."""
+        if b"\\" in text:
+            for escape, replacement in _BASE64_ESCAPES:
+                text = text.replace(escape, replacement)
+        pending = self._pending
+        pending += text.translate(_URLSAFE)
+        size = len(pending) if final else len(pending) - len(pending) % 4
+        if final:
+            pending += b"=" * (-size % 4)
+            size = len(pending)
+        if not size:
+            return
+        try:
+            decoded.append(binascii.a2b_base64(memoryview(pending)[:size]))
+        except binascii.Error as e:
+            raise ConnectorsError(f"Invalid base64 in field {self.field!r}: {e}") from e
+        del pending[:size]
+
+    def _compact(self) -> None:
+        """Drop bytes that the string being read no longer needs."""
+        cut = self._start if self._state in (_STRING, _CANDIDATE) else self._pos
+        if cut:
+            del self._buffer[:cut]
+            self._pos = max(self._pos - cut, 0)
+            self._start -= min(cut, self._start)
+            self._scan = max(self._scan - cut, 0)
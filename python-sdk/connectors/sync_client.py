@@ -0,0 +1,1249 @@
+"""Synchronous Connectors SDK client.
+
+Blocking counterparts of :class:`Connectors`, :class:`ToolsAPI` and
+:class:`MCPRegistry` for code that cannot ``await`` (Celery tasks, Flask or
+Django handlers, scripts). All calls share one pooled ``httpx.Client``.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from types import TracebackType
+from typing import (
+    List,
+    Optional,
+    Dict,
+    Any,
+    Deque,
+    Iterable,
+    Iterator,
+    Tuple,
+    Type,
+    TYPE_CHECKING,
+)
+
+from .http_client import SyncHTTPClient
+from .cache import SelectCache
+from .catalog import _CatalogBase, _local_selector
+from .codec import Codec
+from .tools import (
+    _build_select_request,
+    _build_list_params,
+    _build_invoke_request,
+    _ToolList,
+    _tool_list_type,
+    _unpack_tools,
+    _list_total,
+    _PageWalk,
+    _gateway_unavailable,
+    _prefilter,
+    _batch_allowed,
+    _batch_response_type,
+    _SelectBatch,
+    _BulkInvoke,
+    _Call,
+    _Download,
+    _idempotency_key,
+    _upload_body,
+    Destination,
+    DOWNLOAD_ACCEPT,
+    DEFAULT_SELECT_CONCURRENCY,
+    DEFAULT_INVOKE_CONCURRENCY,
+    INVOKE_BATCH_PATH,
+)
+from .mcp import (
+    _build_call_request,
+    _build_add_request,
+    _catalog_changed,
+    _integration_list_type,
+    _unpack_integrations,
+    _is_deployment_ready,
+    _next_poll_interval,
+)
+from .types import (
+    ConnectorsConfig,
+    PoolOptions,
+    RetryBudgetOptions,
+    RetryStats,
+    CircuitBreakerOptions,
+    CircuitBreakerStats,
+    SelectCacheOptions,
+    SelectCacheStats,
+    ReplicaOptions,
+    LocalSelectOptions,
+    CompressionOptions,
+    CompressionStats,
+    IdempotencyOptions,
+    IdempotencyStats,
+    HTTPCacheOptions,
+    HTTPCacheStats,
+    RateLimitOptions,
+    RateLimitStats,
+    CatalogSyncResult,
+    HealthStatus,
+    Tool,
+    ToolSelectionOptions,
+    ToolListFilters,
+    InvokeOptions,
+    InvokeResult,
+    DownloadResult,
+    ToolInvocationResponse,
+    MCPDeploymentConfig,
+    MCPIntegration,
+    DeploymentStatus,
+    DeploymentStatusType,
+    WaitOptions,
+)
+from .errors import ConnectorsError, DeploymentTimeoutError
+from .streaming import INVOCATION_STREAM_ACCEPT, InvocationStreamDecoder, JSONArrayParser
+from .validators import validate_config, validate_positive_number
+from .views import _parse_tool
+
+if TYPE_CHECKING:
+    from .retrieval import LocalSelector
+
+
+class SyncCatalogAPI(_CatalogBase):
+    """
+    Blocking local replica of the tool catalog.
+
+    See :class:`CatalogAPI` for details.
+    """
+
+    def __init__(self, http: SyncHTTPClient, config: ConnectorsConfig) -> None:
+        """Initialize SyncCatalogAPI."""
+        super().__init__(config, http.codec)
+        self._http = http
+        self._sync_lock = threading.Lock()
+
+    def sync(self, force: bool = False) -> CatalogSyncResult:
+        """
+        Bring the replica up to date with the gateway.
+
+        Args:
+            force: Refetch every page instead of sending conditional requests
+
+        Returns:
+            CatalogSyncResult with pages fetched and tools added, updated, removed
+
+        Raises:
+            HTTPError: If a request fails
+        """
+        plan = self._plan(force)
+        request = plan.next_request()
+        while request is not None:
+            path, params, headers = request
+            plan.handle(self._http.request_raw("GET", path, params=params, headers=headers))
+            request = plan.next_request()
+        return plan.result
+
+    def list_tools(self, filters: Optional[ToolListFilters] = None) -> List[Tool]:
+        """List tools from the replica, syncing it first if it is stale."""
+        self.ensure_fresh()
+        return self._read_tools(filters)
+
+    def list_integrations(self) -> List[MCPIntegration]:
+        """List MCP integrations from the replica, syncing it first if it is stale."""
+        self.ensure_fresh()
+        return self._read_integrations()
+
+    def ensure_fresh(self) -> None:
+        """Sync the replica if it is stale; see :meth:`CatalogAPI.ensure_fresh`."""
+        if self.is_fresh():
+            return
+        # Threads wait for one sync instead of each running their own
+        with self._sync_lock:
+            if self.is_fresh():
+                return
+            try:
+                self.sync()
+            except ConnectorsError:
+                if not self._can_serve_stale():
+                    raise
+
+
+class SyncToolsAPI:
+    """
+    Blocking API for semantic tool selection and invocation.
+
+    See :class:`ToolsAPI` for details on each method.
+    """
+
+    def __init__(
+        self,
+        http_client: SyncHTTPClient,
+        config: ConnectorsConfig,
+        select_cache: Optional[SelectCache] = None,
+        catalog: Optional[SyncCatalogAPI] = None,
+        local_select: Optional["LocalSelector"] = None,
+    ) -> None:
+        """Initialize SyncToolsAPI."""
+        self._http = http_client
+        self._config = config
+        self._catalog = catalog
+        self._local_select = local_select
+        # Whether the gateway answers batch selections; None until known
+        self._batch_selection: Optional[bool] = None
+        # Whether the gateway has the batch invocation route; None until known
+        self._batch_invocation: Optional[bool] = None
+        self._select_cache = select_cache or SelectCache(
+            config.select_cache or SelectCacheOptions()
+        )
+
+    def select(
+        self,
+        query: str,
+        options: Optional[ToolSelectionOptions] = None,
+        deadline: Optional[int] = None,
+    ) -> List[Tool]:
+        """
+        Semantically select tools using FAISS + GraphRAG.
+
+        Args:
+            query: Natural language query (e.g., "create a GitHub PR")
+            options: Selection options (maxTools, categories, tokenBudget)
+            deadline: Optional total time budget in ms for this call, including
+                retries (overrides the client default)
+
+        Returns:
+            List of selected tools ranked by relevance (lazy ToolView objects
+            in trusted mode)
+
+        Raises:
+            ValidationError: If query is empty or options are invalid
+            HTTPError: If request fails
+            DeadlineExceededError: If the deadline expires
+        """
+        request_body = _build_select_request(query, options)
+        cache_key: Any = None
+        if self._select_cache.enabled:
+            cache_key = SelectCache.key(self._config.tenant_id, request_body)
+            cached = self._select_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        local = self._local_select
+        if local is not None:
+            if local.options.mode == "local":
+                if self._catalog is not None:
+                    self._catalog.ensure_fresh()
+                return local.select(request_body)
+            if local.available():
+                if local.is_tight(deadline if deadline is not None else self._config.deadline):
+                    return local.select(request_body)
+                request_body = _prefilter(local, request_body)
+
+        try:
+            response = self._http.post(
+                "/api/v1/tools/select",
+                request_body,
+                _tool_list_type(self._config),
+                deadline=deadline,
+            )
+        except ConnectorsError as e:
+            if local is None or not _gateway_unavailable(e) or not local.available():
+                raise
+            return local.select(request_body)
+        tools = _unpack_tools(response)
+        if cache_key is not None:
+            self._select_cache.put(cache_key, tools)
+        return tools
+
+    def select_many(
+        self,
+        queries: List[str],
+        options: Optional[ToolSelectionOptions] = None,
+        concurrency: int = DEFAULT_SELECT_CONCURRENCY,
+        deadline: Optional[int] = None,
+    ) -> List[List[Tool]]:
+        """
+        Select tools for several queries at once, e.g. the sub-tasks of a plan.
+
+        Args:
+            queries: Natural language queries
+            options: Selection options applied to every query
+            concurrency: Maximum parallel requests, each on its own thread
+                (default: 4)
+            deadline: Optional total time budget in ms for each request,
+                including retries (overrides the client default)
+
+        Returns:
+            One list of selected tools per query, in input order
+        """
+        validate_positive_number(concurrency, "concurrency")
+        plan = _SelectBatch(list(queries), options, self._config, self._select_cache)
+        local = self._local_select
+        effective_deadline = deadline if deadline is not None else self._config.deadline
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            if (
+                plan.pending()
+                and self._batch_selection is not False
+                and _batch_allowed(local, effective_deadline)
+            ):
+                batches = [
+                    (
+                        keys,
+                        executor.submit(
+                            self._http.post,
+                            "/api/v1/tools/select",
+                            body,
+                            _batch_response_type(self._config),
+                            deadline=deadline,
+                        ),
+                    )
+                    for keys, body in plan.batches()
+                ]
+                for keys, future in batches:
+                    try:
+                        response = future.result()
+                    except ConnectorsError as e:
+                        self._batch_selection = plan.recover(e, self._batch_selection, local)
+                    else:
+                        self._batch_selection = plan.record_batch(keys, response)
+
+            selections = [
+                (key, executor.submit(self.select, body["query"], options, deadline))
+                for key, body in plan.pending()
+            ]
+            for key, selection in selections:
+                plan.record(key, selection.result())
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        return plan.results()
+
+    def list(
+        self, filters: Optional[ToolListFilters] = None, deadline: Optional[int] = None
+    ) -> List[Tool]:
+        """
+        List available tools with optional filters.
+
+        Args:
+            filters: Filters for category, integration, search, pagination
+            deadline: Optional total time budget in ms for this call, including
+                retries (overrides the client default)
+
+        Returns:
+            List of tools matching filters (lazy ToolView objects in trusted mode)
+
+        Raises:
+            HTTPError: If request fails
+            DeadlineExceededError: If the deadline expires
+        """
+        if self._catalog is not None:
+            return self._catalog.list_tools(filters)
+        params = _build_list_params(filters)
+        response = self._http.request(
+            "GET",
+            "/api/v1/tools/list",
+            _tool_list_type(self._config),
+            params=params,
+            deadline=deadline,
+        )
+        return _unpack_tools(response)
+
+    def stream(
+        self, filters: Optional[ToolListFilters] = None, deadline: Optional[int] = None
+    ) -> Iterator[Tool]:
+        """
+        Stream tools matching filters as the response arrives.
+
+        Args:
+            filters: Filters for category, integration, search, pagination
+            deadline: Optional time budget in ms for opening the stream,
+                including retries (overrides the client default)
+
+        Yields:
+            Tools matching filters (lazy ToolView objects in trusted mode)
+
+        Raises:
+            HTTPError: If request fails
+            DeadlineExceededError: If the deadline expires before the
+                response starts
+            ConnectorsError: If the response ends before the tools array does
+        """
+        params = _build_list_params(filters)
+        parser = JSONArrayParser("tools")
+        with self._http.stream(
+            "GET", "/api/v1/tools/list", params=params, deadline=deadline
+        ) as response:
+            for chunk in response.iter_bytes():
+                for item in parser.feed(chunk):
+                    yield _parse_tool(item, self._config.trusted, self._http.codec)
+                if parser.done:
+                    break
+        parser.close()
+
+    def iter_all(
+        self,
+        filters: Optional[ToolListFilters] = None,
+        concurrency: int = 1,
+        deadline: Optional[int] = None,
+    ) -> Iterator[Tool]:
+        """
+        Iterate over every tool matching filters, page by page.
+
+        Pages are fetched ahead on background threads (up to concurrency at
+        once when the total is known); tools are yielded in page order.
+
+        Args:
+            filters: Filters for category, integration and search; limit sets
+                the page size (default 100) and page the first page
+            concurrency: Maximum pages fetched in parallel once the total is
+                known (default: 1, i.e. prefetch only)
+            deadline: Optional total time budget in ms for each page request,
+                including retries (overrides the client default)
+
+        Yields:
+            Tools matching filters (lazy ToolView objects in trusted mode)
+
+        Raises:
+            ValidationError: If concurrency is not positive
+            HTTPError: If a page request fails
+            DeadlineExceededError: If a page's deadline expires
+        """
+        walk = _PageWalk(filters, concurrency)
+        pending: Deque["Future[Tuple[List[Tool], Optional[int]]]"] = deque()
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+
+        def fetch_ahead() -> None:
+            for page in walk.schedule(len(pending)):
+                pending.append(executor.submit(self._list_page, walk.params(page), deadline))
+
+        try:
+            fetch_ahead()
+            while pending:
+                tools, total = pending.popleft().result()
+                walk.record(tools, total)
+                # Request the next pages before handing these to the caller
+                fetch_ahead()
+                yield from tools
+                if walk.done:
+                    break
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _list_page(
+        self, params: Dict[str, Any], deadline: Optional[int]
+    ) -> Tuple[List[Tool], Optional[int]]:
+        response = self._http.request(
+            "GET",
+            "/api/v1/tools/list",
+            _tool_list_type(self._config),
+            params=params,
+            deadline=deadline,
+        )
+        return _unpack_tools(response), _list_total(response)
+
+    def invoke(
+        self,
+        tool_id: str,
+        parameters: Dict[str, Any],
+        options: Optional[InvokeOptions] = None,
+        deadline: Optional[int] = None,
+    ) -> ToolInvocationResponse:
+        """
+        Execute a tool with given parameters.
+
+        Args:
+            tool_id: Tool identifier (e.g., "github.createPullRequest")
+            parameters: Tool-specific parameters
+            options: Invocation options (tenant_id, integration)
+            deadline: Optional total time budget in ms for this call, including
+                retries (overrides the client default)
+
+        Returns:
+            ToolInvocationResponse with success status and data/error
+
+        Raises:
+            ValidationError: If tool_id is invalid
+            HTTPError: If invocation fails
+            CircuitOpenError: If the integration's circuit breaker is open
+            DeadlineExceededError: If the deadline expires
+        """
+        request_body = _build_invoke_request(
+            tool_id, parameters, options, self._config.tenant_id
+        )
+        invocation = self._http.idempotency.begin(request_body, _idempotency_key(options))
+        if invocation.response is not None:
+            return ToolInvocationResponse.model_validate(invocation.response)
+        response: Optional[Dict[str, Any]] = None
+        try:
+            # Results are free-form JSON, which the codec parses faster than
+            # pydantic's bytes validation; only the envelope is validated
+            response = self._http.request(
+                "POST",
+                "/api/v1/tools/invoke",
+                dict,
+                json=request_body,
+                circuit=request_body["integration"],
+                deadline=deadline,
+                body=_upload_body(request_body, options, self._http),
+                headers=self._http.idempotency.headers(invocation),
+            )
+        finally:
+            self._http.idempotency.finish(invocation, response)
+        return ToolInvocationResponse.model_validate(response)
+
+    def invoke_stream(
+        self,
+        tool_id: str,
+        parameters: Dict[str, Any],
+        options: Optional[InvokeOptions] = None,
+        deadline: Optional[int] = None,
+    ) -> Iterator[ToolInvocationResponse]:
+        """Execute a tool and yield its result in chunks as the gateway sends them."""
+        request_body = _build_invoke_request(
+            tool_id, parameters, options, self._config.tenant_id
+        )
+        with self._http.stream(
+            "POST",
+            "/api/v1/tools/invoke",
+            json=request_body,
+            headers={
+                "Accept": INVOCATION_STREAM_ACCEPT,
+                **self._http.idempotency.key_headers(_idempotency_key(options)),
+            },
+            circuit=request_body["integration"],
+            deadline=deadline,
+        ) as response:
+            decoder = InvocationStreamDecoder(
+                response.headers.get("content-type", ""), self._http.codec
+            )
+            for chunk in response.iter_bytes():
+                yield from decoder.feed(chunk)
+                if decoder.done:
+                    break
+        yield from decoder.close()
+
+    def invoke_to_file(
+        self,
+        tool_id: str,
+        parameters: Dict[str, Any],
+        destination: Destination,
+        options: Optional[InvokeOptions] = None,
+        field: Optional[str] = None,
+        deadline: Optional[int] = None,
+    ) -> DownloadResult:
+        """Execute a tool that returns a file and write the file to a destination."""
+        request_body = _build_invoke_request(
+            tool_id, parameters, options, self._config.tenant_id
+        )
+        download = _Download(destination, field, self._http.codec)
+        try:
+            with self._http.stream(
+                "POST",
+                "/api/v1/tools/invoke",
+                json=request_body,
+                headers={
+                    "Accept": DOWNLOAD_ACCEPT,
+                    **self._http.idempotency.key_headers(_idempotency_key(options)),
+                },
+                circuit=request_body["integration"],
+                deadline=deadline,
+            ) as response:
+                download.start(response.headers.get("content-type", ""))
+                for chunk in response.iter_bytes():
+                    for piece in download.pieces(chunk):
+                        download.write(piece)
+            return download.finish()
+        except BaseException:
+            download.abort()
+            raise
+
+    def invoke_many(
+        self,
+        calls: Iterable[Tuple[str, Dict[str, Any]]],
+        options: Optional[InvokeOptions] = None,
+        concurrency: int = DEFAULT_INVOKE_CONCURRENCY,
+        ordered: bool = True,
+        rate_limits: Optional[Dict[str, float]] = None,
+        batch_size: Optional[int] = None,
+        deadline: Optional[int] = None,
+    ) -> Iterator[InvokeResult]:
+        """
+        Execute many tool calls on a thread pool, yielding one result per call.
+
+        Args:
+            calls: (tool_id, parameters) pairs
+            options: Invocation options applied to every call
+            concurrency: Maximum calls (or batches) in flight, each on its own
+                thread (default: 8)
+            ordered: Yield results in input order; if False, yield them as
+                they complete
+            rate_limits: Maximum calls per second by integration name, with
+                "*" for integrations without their own limit
+            batch_size: Send up to this many calls per request to the
+                gateway's batch invocation route, when it has one
+            deadline: Optional total time budget in ms for each request,
+                including retries (overrides the client default)
+
+        Yields:
+            InvokeResult per call, with its input index, response or error
+        """
+        validate_positive_number(concurrency, "concurrency")
+        plan = _BulkInvoke(calls, options, self._config.tenant_id, rate_limits, batch_size)
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        running: Deque["Future[List[InvokeResult]]"] = deque()
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(running) < concurrency:
+                    unit = plan.next_unit(self._batch_invocation is not False)
+                    if unit:
+                        running.append(executor.submit(self._invoke_unit, plan, unit, deadline))
+                    else:
+                        exhausted = True
+                if not running:
+                    return
+                if ordered:
+                    finished = running.popleft()
+                else:
+                    wait(running, return_when=FIRST_COMPLETED)
+                    finished = next(future for future in running if future.done())
+                    running.remove(finished)
+                yield from finished.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _invoke_unit(
+        self, plan: _BulkInvoke, unit: List[_Call], deadline: Optional[int]
+    ) -> List[InvokeResult]:
+        delay = plan.delay(unit)
+        if delay > 0:
+            time.sleep(delay)
+        if plan.batch_size and self._batch_invocation is not False and plan.batchable(unit):
+            response: Optional[Dict[str, Any]] = None
+            error: Optional[ConnectorsError] = None
+            try:
+                response = self._http.post(
+                    INVOKE_BATCH_PATH,
+                    plan.batch_body(unit),
+                    dict,
+                    deadline=deadline,
+                    headers=self._http.idempotency.key_headers(plan.idempotency_key(unit)),
+                )
+            except ConnectorsError as e:
+                error = e
+            except (TypeError, ValueError):
+                # A parameter the codec cannot encode: send the calls one by
+                # one, so only the call holding it fails
+                return [self._invoke_call(plan, call, deadline) for call in unit]
+            results, self._batch_invocation = plan.settle_batch(
+                unit, response, error, self._batch_invocation
+            )
+            if results is not None:
+                return results
+        return [self._invoke_call(plan, call, deadline) for call in unit]
+
+    def _invoke_call(
+        self, plan: _BulkInvoke, call: _Call, deadline: Optional[int]
+    ) -> InvokeResult:
+        if call.body is None:
+            return plan.result(call)
+        invocation = self._http.idempotency.begin(call.body, plan.idempotency_key([call]))
+        if invocation.response is not None:
+            return plan.result(call, invocation.response)
+        response: Optional[Dict[str, Any]] = None
+        try:
+            response = self._http.request(
+                "POST",
+                "/api/v1/tools/invoke",
+                dict,
+                json=call.body,
+                circuit=call.body["integration"],
+                deadline=deadline,
+                body=_upload_body(call.body, plan.options, self._http),
+                headers=self._http.idempotency.headers(invocation),
+            )
+        except (ConnectorsError, TypeError, ValueError) as e:
+            # TypeError and ValueError: parameters the codec cannot encode
+            return plan.result(call, error=e)
+        finally:
+            self._http.idempotency.finish(invocation, response)
+        return plan.result(call, response)
+
+
+class SyncMCPServer:
+    """
+    Blocking bound MCP server instance for direct tool calls.
+
+    Example:
+        >>> github = connectors.mcp.get("github")
+        >>> result = github.call("createPullRequest", {"repo": "owner/repo", ...})
+    """
+
+    def __init__(
+        self,
+        integration: str,
+        http: SyncHTTPClient,
+        config: ConnectorsConfig,
+        catalog: Optional[SyncCatalogAPI] = None,
+    ) -> None:
+        """Initialize SyncMCPServer."""
+        self.integration = integration
+        self._http = http
+        self._config = config
+        self._catalog = catalog
+
+    def call(
+        self, tool_name: str, parameters: Dict[str, Any], deadline: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Call a tool on this MCP server.
+
+        Args:
+            tool_name: Tool name (without integration prefix)
+            parameters: Tool parameters
+            deadline: Optional total time budget in ms for this call, including
+                retries (overrides the client default)
+
+        Returns:
+            Tool execution result
+
+        Raises:
+            HTTPError: If call fails
+            CircuitOpenError: If the integration's circuit breaker is open
+            DeadlineExceededError: If the deadline expires
+        """
+        request_body = _build_call_request(
+            self.integration, tool_name, parameters, self._config.tenant_id
+        )
+        invocation = self._http.idempotency.begin(request_body)
+        if invocation.response is not None:
+            return dict(invocation.response)
+        response: Optional[Dict[str, Any]] = None
+        try:
+            response = self._http.request(
+                "POST",
+                "/api/v1/tools/invoke",
+                dict,
+                json=request_body,
+                circuit=request_body["integration"],
+                deadline=deadline,
+                body=_upload_body(request_body, None, self._http),
+                headers=self._http.idempotency.headers(invocation),
+            )
+        finally:
+            self._http.idempotency.finish(invocation, response)
+        return response
+
+    def call_stream(
+        self, tool_name: str, parameters: Dict[str, Any], deadline: Optional[int] = None
+    ) -> Iterator[ToolInvocationResponse]:
+        """Call a tool on this MCP server, yielding its result in chunks as they arrive."""
+        request_body = _build_call_request(
+            self.integration, tool_name, parameters, self._config.tenant_id
+        )
+        with self._http.stream(
+            "POST",
+            "/api/v1/tools/invoke",
+            json=request_body,
+            headers={"Accept": INVOCATION_STREAM_ACCEPT, **self._http.idempotency.key_headers()},
+            circuit=request_body["integration"],
+            deadline=deadline,
+        ) as response:
+            decoder = InvocationStreamDecoder(
+                response.headers.get("content-type", ""), self._http.codec
+            )
+            for chunk in response.iter_bytes():
+                yield from decoder.feed(chunk)
+                if decoder.done:
+                    break
+        yield from decoder.close()
+
+    def list_tools(self) -> List[Tool]:
+        """
+        List all tools for this integration.
+
+        Returns:
+            List of tools for this MCP server
+
+        Raises:
+            HTTPError: If request fails
+        """
+        if self._catalog is not None:
+            return self._catalog.list_tools(ToolListFilters(integration=self.integration))
+        response = self._http.get(
+            f"/api/v1/tools/list?integration={self.integration}", _ToolList
+        )
+        return list(response.tools)
+
+
+class SyncMCPDeploymentClass:
+    """
+    Blocking deployment object with status tracking and wait methods.
+
+    Example:
+        >>> deployment = connectors.mcp.add(config)
+        >>> deployment.wait_until_ready()
+    """
+
+    def __init__(self, data: Dict[str, Any], registry: "SyncMCPRegistry") -> None:
+        """Initialize SyncMCPDeploymentClass."""
+        self.deployment_id: str = data["deploymentId"]
+        self.name: str = data["name"]
+        self.status: DeploymentStatusType = DeploymentStatusType(data["status"])
+        self.estimated_time: Optional[int] = data.get("estimatedTime")
+        self._registry = registry
+
+    def wait_until_ready(self, options: Optional[WaitOptions] = None) -> None:
+        """
+        Wait until deployment is ready.
+
+        Raises:
+            DeploymentTimeoutError: If deployment times out
+            DeploymentFailedError: If deployment fails
+        """
+        self._registry.wait_for_deployment(self.deployment_id, options)
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Refresh deployment status from server.
+
+        Raises:
+            HTTPError: If request fails
+        """
+        status = self._registry.get_deployment_status(self.deployment_id)
+        self.status = status.status
+
+
+class SyncMCPRegistry:
+    """
+    Blocking registry for managing MCP servers and deployments.
+
+    See :class:`MCPRegistry` for details on each method.
+    """
+
+    def __init__(
+        self,
+        http: SyncHTTPClient,
+        config: ConnectorsConfig,
+        catalog: Optional[SyncCatalogAPI] = None,
+        select_cache: Optional[SelectCache] = None,
+    ) -> None:
+        """Initialize SyncMCPRegistry."""
+        self._http = http
+        self._config = config
+        self._catalog = catalog
+        self._select_cache = select_cache
+
+    def get(self, integration: str) -> SyncMCPServer:
+        """
+        Get bound MCP server instance for direct tool calls.
+
+        Args:
+            integration: Integration name (e.g., "github", "slack")
+
+        Returns:
+            SyncMCPServer instance
+        """
+        return SyncMCPServer(integration, self._http, self._config, self._catalog)
+
+    def list(self) -> List[MCPIntegration]:
+        """
+        List all available MCP integrations.
+
+        Returns:
+            List of MCP integrations with metadata (lazy IntegrationView
+            objects in trusted mode)
+
+        Raises:
+            HTTPError: If request fails
+        """
+        if self._catalog is not None:
+            return self._catalog.list_integrations()
+        response = self._http.get(
+            "/api/v1/mcp/integrations", _integration_list_type(self._config)
+        )
+        return _unpack_integrations(response)
+
+    def add(self, config: MCPDeploymentConfig) -> SyncMCPDeploymentClass:
+        """
+        Deploy custom MCP server from OpenAPI, Docker, NPM, or GitHub.
+
+        Args:
+            config: Deployment configuration
+
+        Returns:
+            SyncMCPDeploymentClass for status tracking
+
+        Raises:
+            HTTPError: If deployment request fails
+        """
+        request_body = _build_add_request(config, self._config.tenant_id)
+        response = self._http.post("/api/v1/mcp/add", request_body, dict)
+        _catalog_changed(self._http, self._select_cache)
+        return SyncMCPDeploymentClass(response, self)
+
+    def remove(self, name: str) -> None:
+        """
+        Remove custom MCP server.
+
+        Args:
+            name: MCP server name
+
+        Raises:
+            HTTPError: If removal fails
+        """
+        self._http.delete(
+            f"/api/v1/mcp/custom/{name}?tenantId={self._config.tenant_id}", dict
+        )
+        _catalog_changed(self._http, self._select_cache)
+
+    def get_deployment_status(self, deployment_id: str) -> DeploymentStatus:
+        """
+        Get deployment status by ID.
+
+        Args:
+            deployment_id: Deployment identifier
+
+        Returns:
+            DeploymentStatus with current status and progress
+
+        Raises:
+            HTTPError: If request fails
+        """
+        return self._http.get(f"/api/v1/mcp/deployments/{deployment_id}", DeploymentStatus)
+
+    def wait_for_deployment(
+        self, deployment_id: str, options: Optional[WaitOptions] = None
+    ) -> DeploymentStatus:
+        """
+        Poll deployment status until ready or failed.
+
+        Args:
+            deployment_id: Deployment identifier
+            options: Wait options (timeout, poll_interval, on_progress)
+
+        Returns:
+            Final DeploymentStatus
+
+        Raises:
+            DeploymentTimeoutError: If deployment times out
+            DeploymentFailedError: If deployment fails
+        """
+        opts = options or WaitOptions.model_validate({})
+        timeout = opts.timeout or 300000  # 5 minutes default
+        poll_interval = opts.poll_interval or 2000  # 2 seconds default
+
+        start_time = time.time() * 1000
+        current_interval: float = poll_interval
+
+        while True:
+            status = self.get_deployment_status(deployment_id)
+
+            if opts.on_progress:
+                opts.on_progress(status)
+
+            if _is_deployment_ready(deployment_id, status):
+                return status
+
+            elapsed = (time.time() * 1000) - start_time
+            if elapsed >= timeout:
+                raise DeploymentTimeoutError(
+                    f"Deployment {deployment_id} timed out after {timeout}ms",
+                    deployment_id=deployment_id,
+                    timeout=timeout,
+                )
+
+            time.sleep(current_interval / 1000)
+            current_interval = _next_poll_interval(current_interval)
+
+
+class ConnectorsSync:
+    """
+    Synchronous Connectors SDK client.
+
+    Mirrors :class:`Connectors` for code that cannot ``await``. One pooled
+    connection is shared by all calls, and the client is safe to share
+    between threads.
+
+    Example:
+        >>> with ConnectorsSync(base_url="http://localhost:3000") as connectors:
+        ...     tools = connectors.tools.select("create a GitHub pull request")
+        ...     print(f"Selected {len(tools)} tools")
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        tenant_id: Optional[str] = None,
+        api_key: Optional[str] = None,
+        timeout: int = 120000,
+        max_retries: int = 3,
+        headers: Optional[Dict[str, str]] = None,
+        pool: Optional[PoolOptions] = None,
+        retry_budget: Optional[RetryBudgetOptions] = None,
+        circuit_breaker: Optional[CircuitBreakerOptions] = None,
+        deadline: Optional[int] = None,
+        codec: Optional[Codec] = None,
+        trusted: bool = False,
+        select_cache: Optional[SelectCacheOptions] = None,
+        replica: Optional[ReplicaOptions] = None,
+        local_select: Optional[LocalSelectOptions] = None,
+        compression: Optional[CompressionOptions] = None,
+        idempotency: Optional[IdempotencyOptions] = None,
+        http_cache: Optional[HTTPCacheOptions] = None,
+        rate_limit: Optional[RateLimitOptions] = None,
+    ) -> None:
+        """
+        Initialize ConnectorsSync client.
+
+        Args:
+            base_url: Gateway base URL (e.g., "http://localhost:3000")
+            tenant_id: Optional tenant identifier for multi-tenancy
+            api_key: Optional API key for authentication
+            timeout: Per-attempt request timeout in milliseconds (default: 120000)
+            max_retries: Maximum retry attempts for failed requests (default: 3)
+            headers: Optional custom headers
+            pool: Optional connection pool options (pool size, keep-alive, HTTP/2)
+            retry_budget: Optional client-wide retry budget options
+            circuit_breaker: Optional per-integration circuit breaker options
+            deadline: Optional default total time budget in milliseconds for a call,
+                including retries and backoff
+            codec: Optional JSON codec for request bodies and untyped responses
+                (default: orjson if installed, else the standard library)
+            trusted: Trust gateway responses and return lazy, unvalidated views
+                from tools.list(), tools.select() and mcp.list() (default: False)
+            select_cache: Optional client-side cache options for tools.select() results
+            replica: Optional local catalog replica options; when enabled,
+                tools.list(), mcp.list() and list_tools() read from the replica
+            local_select: Optional in-process tool selection over the replica,
+                used when the gateway is unavailable or a deadline is tight
+                (requires the replica and numpy)
+            compression: Optional request body compression and response
+                encoding negotiation options
+            idempotency: Optional idempotency key and deduplication options
+                for tool invocations
+            http_cache: Optional conditional GET cache options for
+                tools.list(), mcp.list() and list_tools()
+            rate_limit: Optional pacing of requests per tenant and route to the
+                quota the gateway advertises in its rate limit headers
+
+        Raises:
+            ValidationError: If configuration is invalid
+        """
+        config = ConnectorsConfig(
+            base_url=base_url,
+            tenant_id=tenant_id,
+            api_key=api_key,
+            timeout=timeout,
+            deadline=deadline,
+            max_retries=max_retries,
+            trusted=trusted,
+            headers=headers or {},
+            pool=pool or PoolOptions(),
+            retry_budget=retry_budget or RetryBudgetOptions(),
+            circuit_breaker=circuit_breaker or CircuitBreakerOptions(),
+            select_cache=select_cache or SelectCacheOptions(),
+            replica=replica or ReplicaOptions(),
+            local_select=local_select or LocalSelectOptions(),
+            compression=compression or CompressionOptions(),
+            idempotency=idempotency or IdempotencyOptions(),
+            http_cache=http_cache or HTTPCacheOptions(),
+            rate_limit=rate_limit or RateLimitOptions(),
+        )
+        validate_config(config)
+
+        self._config = config
+        self._http_client = SyncHTTPClient(config, codec)
+        self._select_cache = SelectCache(config.select_cache)
+        self._catalog: Optional[SyncCatalogAPI] = None
+        if config.replica.enabled:
+            self._catalog = SyncCatalogAPI(self._http_client, config)
+        self._local_select: Any = None
+        if self._catalog is not None and config.local_select.enabled:
+            self._local_select = _local_selector(self._catalog, config.local_select)
+        self._tools_api: Optional[SyncToolsAPI] = None
+        self._mcp_registry: Optional[SyncMCPRegistry] = None
+
+    @property
+    def tools(self) -> SyncToolsAPI:
+        """
+        Get SyncToolsAPI instance for semantic tool selection.
+
+        Returns:
+            SyncToolsAPI instance
+        """
+        if self._tools_api is None:
+            self._tools_api = SyncToolsAPI(
+                self._http_client,
+                self._config,
+                self._select_cache,
+                self._catalog,
+                self._local_select,
+            )
+        return self._tools_api
+
+    @property
+    def mcp(self) -> SyncMCPRegistry:
+        """
+        Get SyncMCPRegistry instance for MCP server management.
+
+        Returns:
+            SyncMCPRegistry instance
+        """
+        if self._mcp_registry is None:
+            self._mcp_registry = SyncMCPRegistry(
+                self._http_client, self._config, self._catalog, self._select_cache
+            )
+        return self._mcp_registry
+
+    @property
+    def catalog(self) -> SyncCatalogAPI:
+        """
+        Get the local catalog replica.
+
+        Returns:
+            SyncCatalogAPI instance
+
+        Raises:
+            ConnectorsError: If the replica is not enabled
+        """
+        if self._catalog is None:
+            raise ConnectorsError(
+                "The catalog replica is disabled; pass replica=ReplicaOptions(enabled=True)"
+            )
+        return self._catalog
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        """
+        Get retry counters (requests, retries, denied retries, give-ups).
+
+        Returns:
+            RetryStats snapshot shared by all calls of this client
+        """
+        return self._http_client.retry_stats
+
+    @property
+    def circuit_stats(self) -> Dict[str, CircuitBreakerStats]:
+        """
+        Get circuit breaker state per integration.
+
+        Returns:
+            Mapping of integration name to its breaker stats
+        """
+        return self._http_client.circuit_stats
+
+    @property
+    def compression_stats(self) -> CompressionStats:
+        """
+        Get request and response body sizes, before and after compression.
+
+        Returns:
+            CompressionStats snapshot shared by all calls of this client
+        """
+        return self._http_client.compression_stats
+
+    @property
+    def idempotency_stats(self) -> IdempotencyStats:
+        """
+        Get idempotency key and invocation deduplication counters.
+
+        Returns:
+            IdempotencyStats snapshot shared by all calls of this client
+        """
+        return self._http_client.idempotency_stats
+
+    @property
+    def http_cache_stats(self) -> HTTPCacheStats:
+        """
+        Get conditional GET cache counters (hits, 304s, misses, bytes saved).
+
+        Returns:
+            HTTPCacheStats snapshot shared by all calls of this client
+        """
+        return self._http_client.http_cache_stats
+
+    @property
+    def rate_limit_stats(self) -> Dict[str, RateLimitStats]:
+        """
+        Get rate limit pacing state and queue-wait counters per tenant and route.
+
+        Returns:
+            Mapping of "<tenant> <METHOD> <route>" (e.g. "acme POST /api/v1/tools/invoke")
+            to its stats
+        """
+        return self._http_client.rate_limit_stats
+
+    def reset_circuit(self, integration: Optional[str] = None) -> None:
+        """
+        Manually close an integration's circuit breaker.
+
+        Args:
+            integration: Integration to reset; resets all circuits if omitted
+        """
+        self._http_client.circuit_breakers.reset(integration)
+
+    @property
+    def select_cache_stats(self) -> SelectCacheStats:
+        """
+        Get tool selection cache counters (hits, misses, evictions, size).
+
+        Returns:
+            SelectCacheStats snapshot shared by all calls of this client
+        """
+        return self._select_cache.stats()
+
+    def invalidate_select_cache(self, query: Optional[str] = None) -> int:
+        """
+        Drop cached tool selection results, e.g. after the catalog changed.
+
+        Args:
+            query: Drop only results for this query; drops everything if omitted
+
+        Returns:
+            Number of cached results dropped
+        """
+        return self._select_cache.invalidate(query)
+
+    def health(self) -> HealthStatus:
+        """
+        Check gateway health status.
+
+        Returns:
+            HealthStatus with status, version, and component health
+
+        Raises:
+            HTTPError: If health check fails
+        """
+        return self._http_client.get("/health", HealthStatus)
+
+    def test_connection(self) -> bool:
+        """
+        Test connection to gateway.
+
+        Returns:
+            True if connection successful, False otherwise
+        """
+        try:
+            self.health()
+            return True
+        except Exception:
+            return False
+
+    def close(self) -> None:
+        """
+        Close the underlying connection pool.
+
+        The client remains usable; a new pool is opened on the next request.
+        """
+        self._http_client.close()
+        if self._catalog is not None:
+            self._catalog.close()
+
+    def __enter__(self) -> "ConnectorsSync":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
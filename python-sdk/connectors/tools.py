@@ -1,16 +1,678 @@
 """ToolsAPI for semantic tool selection and invocation."""
 
-from typing import List, Optional, Dict, Any
-from .http_client import HTTPClient
+import asyncio
+import inspect
+import itertools
+import os
+import threading
+import time
+from collections import deque
+from typing import (
+    List,
+    Optional,
+    Dict,
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Deque,
+    Iterable,
+    NamedTuple,
+    Tuple,
+    Type,
+    Union,
+    TYPE_CHECKING,
+    cast,
+)
+from pydantic import BaseModel, Field
+from .cache import SelectCache
+from .catalog import CatalogAPI
+from .codec import Codec
+from .errors import CircuitOpenError, ConnectorsError, HTTPError, RetryableError, TimeoutError
+from .http_client import HTTPClient, _BaseHTTPClient
 from .types import (
     ConnectorsConfig,
     Tool,
     ToolSelectionOptions,
     ToolListFilters,
     InvokeOptions,
+    InvokeResult,
+    DownloadResult,
     ToolInvocationResponse,
+    SelectCacheOptions,
+)
+from .streaming import (
+    INVOCATION_STREAM_ACCEPT,
+    Base64FieldDecoder,
+    InvocationStreamDecoder,
+    JSONArrayParser,
 )
+from .uploads import StreamedBody, has_streams
 from .validators import validate_non_empty_string, validate_positive_number
+from .views import _parse_tool, _tool_views
+
+if TYPE_CHECKING:
+    from .retrieval import LocalSelector
+
+# Page size used by iter_all() when the filters do not set a limit
+DEFAULT_PAGE_SIZE = 100
+# The gateway's limit on queries per batch selection request
+SELECT_BATCH_SIZE = 10
+# Parallel requests used by select_many() when batching is not available
+DEFAULT_SELECT_CONCURRENCY = 4
+# Statuses from gateways that do not accept batch selection requests
+_BATCH_UNSUPPORTED = (400, 404, 405, 501)
+# Parallel invocations used by invoke_many() by default
+DEFAULT_INVOKE_CONCURRENCY = 8
+INVOKE_PATH = "/api/v1/tools/invoke"
+INVOKE_BATCH_PATH = "/api/v1/tools/invoke/batch"
+# Statuses from gateways without the batch invocation route
+_INVOKE_BATCH_UNSUPPORTED = (404, 405, 501)
+# JSON keys tools commonly return base64 file contents in, tried in any object
+BINARY_FIELDS = ("content", "data", "contentBytes", "bytes", "base64")
+DOWNLOAD_ACCEPT = "application/octet-stream, application/json;q=0.9, */*;q=0.8"
+_MIME_KEYS = ("mimeType", "contentType", "mime_type")
+
+# A file path, or a binary file-like object (async writers are accepted by
+# the async client)
+Destination = Union[str, "os.PathLike[str]", BinaryIO]
+
+
+def _build_select_request(
+    query: str, options: Optional[ToolSelectionOptions]
+) -> Dict[str, Any]:
+    """Validate selection input and build the /tools/select request body."""
+    validate_non_empty_string(query, "query")
+    opts = options or ToolSelectionOptions()
+
+    if opts.max_tools is not None:
+        validate_positive_number(opts.max_tools, "maxTools")
+    if opts.token_budget is not None:
+        validate_positive_number(opts.token_budget, "tokenBudget")
+
+    request_body: Dict[str, Any] = {
+        "query": query.strip(),
+    }
+
+    if opts.max_tools is not None:
+        request_body["maxTools"] = opts.max_tools
+    if opts.categories is not None:
+        request_body["categories"] = opts.categories
+    if opts.token_budget is not None:
+        request_body["tokenBudget"] = opts.token_budget
+
+    return request_body
+
+
+def _gateway_unavailable(error: ConnectorsError) -> bool:
+    """Check whether a failed call means the gateway could not answer, not a bad request."""
+    if isinstance(error, HTTPError):
+        status = error.status_code
+        return status is None or status == 429 or status >= 500
+    return isinstance(error, (TimeoutError, RetryableError, CircuitOpenError))
+
+
+def _prefilter(local: "LocalSelector", request_body: Dict[str, Any]) -> Dict[str, Any]:
+    """Narrow a select request to locally picked categories, in prefilter mode."""
+    if local.options.mode != "prefilter" or "categories" in request_body:
+        return request_body
+    categories = local.categories(request_body["query"])
+    return {**request_body, "categories": categories} if categories else request_body
+
+
+def _build_list_params(filters: Optional[ToolListFilters]) -> Dict[str, Any]:
+    """Build /tools/list query parameters from filters."""
+    filters = filters or ToolListFilters()
+
+    params: Dict[str, Any] = {}
+    if filters.category:
+        params["category"] = filters.category
+    if filters.integration:
+        params["integration"] = filters.integration
+    if filters.search:
+        params["search"] = filters.search
+    if filters.page is not None:
+        params["page"] = filters.page
+    if filters.limit is not None:
+        params["limit"] = filters.limit
+
+    return params
+
+
+def _build_invoke_request(
+    tool_id: str,
+    parameters: Dict[str, Any],
+    options: Optional[InvokeOptions],
+    tenant_id: Optional[str],
+) -> Dict[str, Any]:
+    """Validate invocation input and build the /tools/invoke request body."""
+    validate_non_empty_string(tool_id, "toolId")
+
+    # Extract integration from toolId (e.g., "github.createPR" -> "github")
+    if "." not in tool_id:
+        raise ValueError(
+            f"toolId must contain integration prefix (e.g., 'github.createPR'), got: {tool_id}"
+        )
+
+    integration = tool_id.split(".")[0]
+    opts = options or InvokeOptions()
+
+    return {
+        "toolId": tool_id.strip(),
+        "integration": opts.integration or integration,
+        "tenantId": opts.tenant_id or tenant_id,
+        "parameters": parameters,
+    }
+
+
+def _idempotency_key(options: Optional[InvokeOptions]) -> Optional[str]:
+    return options.idempotency_key if options is not None else None
+
+
+def _upload_body(
+    request_body: Dict[str, Any], options: Optional[InvokeOptions], http: _BaseHTTPClient
+) -> Optional[StreamedBody]:
+    """Get a streamed body for parameters holding files, bytes or iterators, or to compress."""
+    compress = options is not None and options.compress
+    if not compress and not has_streams(request_body["parameters"]):
+        return None
+    encoding = http.compression.encoding("POST", INVOKE_PATH)
+    if compress and encoding is None:
+        encoding = http.compression.options.algorithm
+    return StreamedBody(request_body, http.codec, encoding)
+
+
+class _Pagination(BaseModel):
+    total: Optional[int] = None
+
+
+class _ToolList(BaseModel):
+    """Response body containing a "tools" array, validated straight from bytes."""
+
+    tools: List[Tool] = Field(default_factory=list)
+    total: Optional[int] = None
+    pagination: Optional[_Pagination] = None
+
+
+class _BatchResult(BaseModel):
+    index: Optional[int] = None
+    tools: Optional[List[Tool]] = None
+
+
+class _BatchSelection(BaseModel):
+    """Response body of a batch selection request."""
+
+    results: Optional[List[_BatchResult]] = None
+
+
+def _tool_list_type(config: ConnectorsConfig) -> Type[Any]:
+    """Response type for tool lists: raw JSON in trusted mode, else validated."""
+    return dict if config.trusted else _ToolList
+
+
+def _unpack_tools(response: Union[_ToolList, Dict[str, Any]]) -> List[Tool]:
+    """Get validated tools, or lazy views over a trusted raw response."""
+    if isinstance(response, _ToolList):
+        return response.tools
+    # ToolView exposes Tool's fields read-only; see views.py
+    return cast(List[Tool], _tool_views(response))
+
+
+def _list_total(response: Union[_ToolList, Dict[str, Any]]) -> Optional[int]:
+    """Get the total number of matching tools, if the response reports it."""
+    if isinstance(response, _ToolList):
+        if response.total is None and response.pagination is not None:
+            return response.pagination.total
+        return response.total
+    total = response.get("total")
+    if total is None:
+        total = (response.get("pagination") or {}).get("total")
+    return total if isinstance(total, int) else None
+
+
+class _PageWalk:
+    """
+    Decides which pages of a tool listing iter_all() requests next.
+
+    One page is always prefetched ahead of the one being consumed. Once a
+    response reports the total count, up to concurrency pages within that
+    total are fetched in parallel. The walk ends at the first short page, so
+    an inaccurate total never truncates the listing.
+    """
+
+    def __init__(self, filters: Optional[ToolListFilters], concurrency: int) -> None:
+        validate_positive_number(concurrency, "concurrency")
+        filters = filters or ToolListFilters()
+        self.page_size = filters.limit or DEFAULT_PAGE_SIZE
+        self._filters = filters.model_copy(update={"limit": self.page_size})
+        self._concurrency = concurrency
+        self._next_page = filters.page or 1
+        self._last_page: Optional[int] = None
+        self.done = False
+
+    def params(self, page: int) -> Dict[str, Any]:
+        """Get the /tools/list query parameters for a page."""
+        params = _build_list_params(self._filters.model_copy(update={"page": page}))
+        # The gateway pages by offset; send both
+        params["offset"] = (page - 1) * self.page_size
+        return params
+
+    def schedule(self, in_flight: int) -> List[int]:
+        """Get the pages to request now, given how many are already in flight."""
+        pages: List[int] = []
+        while not self.done:
+            known = self._last_page is not None and self._next_page <= self._last_page
+            if in_flight + len(pages) >= (self._concurrency if known else 1):
+                break
+            pages.append(self._next_page)
+            self._next_page += 1
+        return pages
+
+    def record(self, tools: List[Tool], total: Optional[int]) -> None:
+        """Record a fetched page, in page order."""
+        if len(tools) < self.page_size:
+            self.done = True
+        elif total is not None:
+            self._last_page = -(-total // self.page_size)
+
+
+class _SelectBatch:
+    """
+    Plans one select_many() call, independent of I/O.
+
+    Queries are validated up front and deduplicated by their select cache
+    key (tenant, normalized query and options). Cached results are served
+    first; the rest are sent as batch requests of up to SELECT_BATCH_SIZE
+    queries, or one select() call per query when batching is unavailable.
+    """
+
+    def __init__(
+        self,
+        queries: List[str],
+        options: Optional[ToolSelectionOptions],
+        config: ConnectorsConfig,
+        select_cache: SelectCache,
+    ) -> None:
+        self._options = options
+        self._config = config
+        self._cache = select_cache
+        self._bodies: Dict[Any, Dict[str, Any]] = {}
+        self._keys: List[Any] = []
+        for query in queries:
+            body = _build_select_request(query, options)
+            key = SelectCache.key(config.tenant_id, body)
+            self._bodies.setdefault(key, body)
+            self._keys.append(key)
+        self._results: Dict[Any, List[Tool]] = {}
+        if select_cache.enabled:
+            for key in self._bodies:
+                cached = select_cache.get(key)
+                if cached is not None:
+                    self._results[key] = cached
+
+    def pending(self) -> List[Tuple[Any, Dict[str, Any]]]:
+        """Get the key and select request body of each unique query without a result."""
+        return [(key, body) for key, body in self._bodies.items() if key not in self._results]
+
+    def batches(self) -> List[Tuple[List[Any], Dict[str, Any]]]:
+        """Get the pending queries as batch request bodies, with their keys."""
+        pending = self.pending()
+        batches = []
+        for start in range(0, len(pending), SELECT_BATCH_SIZE):
+            chunk = pending[start : start + SELECT_BATCH_SIZE]
+            # Every query shares the options, so any single body carries them
+            body = {k: v for k, v in chunk[0][1].items() if k != "query"}
+            body["queries"] = [{"use_case": single["query"]} for _, single in chunk]
+            batches.append(([key for key, _ in chunk], body))
+        return batches
+
+    def record_batch(
+        self, keys: List[Any], response: Union[_BatchSelection, Dict[str, Any]]
+    ) -> bool:
+        """
+        Store the results of a batch request.
+
+        Returns:
+            False if the response has no per-query tools, i.e. the gateway
+            does not support batch selection in a form this client reads
+
+        Raises:
+            ConnectorsError: If the response has the wrong number of results
+        """
+        results: List[Tuple[Optional[int], Optional[List[Tool]]]]
+        if isinstance(response, _BatchSelection):
+            results = [(item.index, item.tools) for item in response.results or []]
+        else:
+            results = [
+                (
+                    item.get("index"),
+                    cast(List[Tool], _tool_views(item)) if "tools" in item else None,
+                )
+                for item in response.get("results") or []
+            ]
+        if not results or any(tools is None for _, tools in results):
+            return False
+        if len(results) != len(keys):
+            raise ConnectorsError(
+                f"Batch selection returned {len(results)} results for {len(keys)} queries"
+            )
+        # Results carry 1-based indexes; fall back to response order
+        if all(index is not None for index, _ in results):
+            results.sort(key=lambda item: cast(int, item[0]))
+        for key, (_, tools) in zip(keys, results):
+            self._results[key] = cast(List[Tool], tools)
+            if self._cache.enabled:
+                self._cache.put(key, self._results[key])
+        return True
+
+    def recover(
+        self,
+        error: ConnectorsError,
+        batch_selection: Optional[bool],
+        local: Optional["LocalSelector"],
+    ) -> Optional[bool]:
+        """
+        Handle a failed batch request.
+
+        A gateway that never answered a batch and rejects one does not
+        support batching: the queries are left to select(). If the gateway is
+        unavailable, local selection answers them instead.
+
+        Returns:
+            Whether the gateway answers batch selections, if known
+
+        Raises:
+            ConnectorsError: The error, if neither applies
+        """
+        if not batch_selection and _batch_unsupported(error):
+            return False
+        if local is not None and _gateway_unavailable(error) and local.available():
+            for key, body in self.pending():
+                self._results[key] = local.select(body)
+            return batch_selection
+        raise error
+
+    def record(self, key: Any, tools: List[Tool]) -> None:
+        """Store the result of a single select() call."""
+        self._results[key] = tools
+
+    def results(self) -> List[List[Tool]]:
+        """Get one result list per input query, in input order."""
+        return [list(self._results[key]) for key in self._keys]
+
+
+def _batch_response_type(config: ConnectorsConfig) -> Type[Any]:
+    """Response type for batch selections: raw JSON in trusted mode, else validated."""
+    return dict if config.trusted else _BatchSelection
+
+
+def _batch_allowed(local: Optional["LocalSelector"], deadline: Optional[int]) -> bool:
+    """Check whether select_many() may batch, rather than leave queries to local selection."""
+    if local is None:
+        return True
+    if local.options.mode != "fallback":
+        return False
+    return not (local.available() and local.is_tight(deadline))
+
+
+def _batch_unsupported(error: ConnectorsError) -> bool:
+    """Check whether a batch request failed because the gateway does not accept batches."""
+    return isinstance(error, HTTPError) and error.status_code in _BATCH_UNSUPPORTED
+
+
+class _Pacer:
+    """
+    Spaces out request starts per integration to stay under a rate.
+
+    Rates are requests per second by integration name; "*" applies to
+    integrations without their own rate. Thread-safe.
+    """
+
+    def __init__(self, rates: Optional[Dict[str, float]]) -> None:
+        self._intervals: Dict[str, float] = {}
+        for integration, rate in (rates or {}).items():
+            validate_positive_number(rate, f"rate_limits[{integration!r}]")
+            self._intervals[integration] = 1 / rate
+        self._next: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, integration: str) -> float:
+        """Reserve the next start slot for an integration; returns seconds to wait."""
+        interval = self._intervals.get(integration, self._intervals.get("*"))
+        if interval is None:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next.get(integration, now))
+            self._next[integration] = start + interval
+        return start - now
+
+
+class _Call(NamedTuple):
+    position: int
+    tool_id: str
+    body: Optional[Dict[str, Any]]
+    error: Optional[Exception]
+
+
+class _BulkInvoke:
+    """
+    Plans one invoke_many() call, independent of I/O.
+
+    Calls are read from the iterable only as capacity frees up, so memory
+    stays bounded however many there are. Invalid calls become error
+    results instead of failing the whole run.
+    """
+
+    def __init__(
+        self,
+        calls: Iterable[Tuple[str, Dict[str, Any]]],
+        options: Optional[InvokeOptions],
+        tenant_id: Optional[str],
+        rate_limits: Optional[Dict[str, float]],
+        batch_size: Optional[int],
+    ) -> None:
+        if batch_size is not None:
+            validate_positive_number(batch_size, "batch_size")
+        self._calls = iter(calls)
+        self.options = options
+        self._tenant_id = tenant_id
+        self._key = _idempotency_key(options)
+        self._index = 0
+        self.pacer = _Pacer(rate_limits)
+        self.batch_size = batch_size
+
+    def next_unit(self, batch: bool) -> List[_Call]:
+        """Take the next call, or up to batch_size calls when batching; empty when done."""
+        size = self.batch_size if batch and self.batch_size else 1
+        unit = []
+        for tool_id, parameters in itertools.islice(self._calls, size):
+            try:
+                body: Optional[Dict[str, Any]] = _build_invoke_request(
+                    tool_id, parameters, self.options, self._tenant_id
+                )
+                error: Optional[Exception] = None
+            except (ConnectorsError, ValueError) as e:
+                body, error = None, e
+            unit.append(_Call(self._index, str(tool_id), body, error))
+            self._index += 1
+        return unit
+
+    def idempotency_key(self, unit: List[_Call]) -> Optional[str]:
+        """Get a unit's key from the caller's, which is shared by every call, if given."""
+        if self._key is None:
+            return None
+        first, last = unit[0].position, unit[-1].position
+        return f"{self._key}:{first}" if first == last else f"{self._key}:{first}-{last}"
+
+    def delay(self, unit: List[_Call]) -> float:
+        """Reserve rate slots for a unit's calls; returns seconds to wait before sending."""
+        delays = [self.pacer.reserve(call.body["integration"]) for call in unit if call.body]
+        return max(delays, default=0.0)
+
+    @staticmethod
+    def result(
+        call: _Call,
+        response: Optional[Dict[str, Any]] = None,
+        error: Optional[Exception] = None,
+    ) -> InvokeResult:
+        """Build a call's result from its response body or error."""
+        error = error or call.error
+        parsed = None
+        if error is None:
+            try:
+                parsed = ToolInvocationResponse.model_validate(response)
+            except ValueError as e:
+                error = e
+        return InvokeResult(
+            index=call.position, tool_id=call.tool_id, response=parsed, error=error
+        )
+
+    @staticmethod
+    def batchable(unit: List[_Call]) -> bool:
+        """Check whether a unit can be sent as one JSON batch: no files, bytes or iterators."""
+        bodies = [call.body for call in unit if call.body]
+        return bool(bodies) and not any(has_streams(body["parameters"]) for body in bodies)
+
+    @staticmethod
+    def batch_body(unit: List[_Call]) -> Dict[str, Any]:
+        """Build the batch request body for a unit's valid calls."""
+        return {"invocations": [call.body for call in unit if call.body]}
+
+    def settle_batch(
+        self,
+        unit: List[_Call],
+        response: Optional[Dict[str, Any]],
+        error: Optional[ConnectorsError],
+        batch_invocation: Optional[bool],
+    ) -> Tuple[Optional[List[InvokeResult]], Optional[bool]]:
+        """
+        Turn a batch request's outcome into results.
+
+        Returns:
+            The unit's results, or None if its calls should be sent one by
+            one because the gateway has no batch route; and whether the
+            gateway accepts batch invocations, if known
+        """
+        if error is not None:
+            if not batch_invocation and isinstance(error, HTTPError) and (
+                error.status_code in _INVOKE_BATCH_UNSUPPORTED
+            ):
+                return None, False
+            return [self.result(call, error=error) for call in unit], batch_invocation
+        items = (response or {}).get("results")
+        valid = [call for call in unit if call.body]
+        if not isinstance(items, list):
+            return None, False
+        if len(items) != len(valid):
+            mismatch = ConnectorsError(
+                f"Batch invocation returned {len(items)} results for {len(valid)} calls"
+            )
+            return [self.result(call, error=mismatch) for call in unit], True
+        by_position = {call.position: item for call, item in zip(valid, items)}
+        return [self.result(call, by_position.get(call.position)) for call in unit], True
+
+
+class _Download:
+    """
+    Writes a tool's binary result to a destination as the response arrives.
+
+    A JSON response has its base64 field decoded on the fly (see
+    Base64FieldDecoder); any other body is the file itself and is written
+    unchanged. A path is only opened once there is something to write, and
+    removed again if the download fails.
+    """
+
+    def __init__(self, destination: Destination, field: Optional[str], codec: Codec) -> None:
+        self._path: Optional[str] = None
+        self._writer: Any = None
+        if isinstance(destination, (str, os.PathLike)):
+            self._path = os.fspath(destination)
+        else:
+            self._writer = destination
+        self._file: Optional[BinaryIO] = None
+        self._codec = codec
+        self._fields = (field,) if field else BINARY_FIELDS
+        self._decoder: Optional[Base64FieldDecoder] = None
+        self._content_type: Optional[str] = None
+        self.bytes_written = 0
+
+    def start(self, content_type: str) -> None:
+        """Pick how to read the body from the response's Content-Type."""
+        media_type = content_type.partition(";")[0].strip().lower()
+        self._content_type = media_type or None
+        if media_type == "application/json" or media_type.endswith("+json"):
+            self._decoder = Base64FieldDecoder(self._fields)
+
+    def pieces(self, chunk: bytes) -> List[bytes]:
+        """Get the file bytes in a chunk of the body."""
+        return self._decoder.feed(chunk) if self._decoder is not None else [chunk]
+
+    def write(self, piece: bytes) -> Any:
+        """Write file bytes, returning what the destination's write() returns."""
+        self.bytes_written += len(piece)
+        return self._target().write(piece)
+
+    def finish(self) -> DownloadResult:
+        """
+        Close the file and describe the result.
+
+        Raises:
+            ConnectorsError: If a successful JSON result has no base64 field
+        """
+        if self._decoder is None:
+            self._target()
+            self._close()
+            return DownloadResult(
+                success=True,
+                path=self._path,
+                bytes_written=self.bytes_written,
+                content_type=self._content_type,
+            )
+
+        payload = self._codec.decode(self._decoder.close())
+        if isinstance(payload, dict) and "success" in payload:
+            response = ToolInvocationResponse.model_validate(payload)
+        else:
+            response = ToolInvocationResponse.model_validate({"success": True, "data": payload})
+        if response.success:
+            if self._decoder.field is None:
+                raise ConnectorsError(
+                    f"The tool result has no base64 field (looked for {', '.join(self._fields)})"
+                )
+            self._target()
+        self._close()
+
+        data = response.data
+        content_type = None
+        if isinstance(data, dict):
+            content_type = next((data[key] for key in _MIME_KEYS if data.get(key)), None)
+        return DownloadResult(
+            success=response.success,
+            error=response.error,
+            path=self._path if response.success else None,
+            bytes_written=self.bytes_written,
+            content_type=content_type,
+            field=self._decoder.field,
+            data=data,
+            execution_time_ms=response.execution_time_ms,
+        )
+
+    def abort(self) -> None:
+        """Close and remove a partly written file."""
+        if self._file is not None:
+            self._close()
+            os.remove(cast(str, self._path))
+
+    def _target(self) -> Any:
+        if self._writer is None:
+            self._file = open(cast(str, self._path), "wb")
+            self._writer = self._file
+        return self._writer
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
 
 
 class ToolsAPI:
@@ -20,29 +682,58 @@ class ToolsAPI:
     Uses FAISS semantic search + GraphRAG for intelligent tool discovery.
     """
 
-    def __init__(self, http_client: HTTPClient, config: ConnectorsConfig) -> None:
+    def __init__(
+        self,
+        http_client: HTTPClient,
+        config: ConnectorsConfig,
+        select_cache: Optional[SelectCache] = None,
+        catalog: Optional[CatalogAPI] = None,
+        local_select: Optional["LocalSelector"] = None,
+    ) -> None:
         """Initialize ToolsAPI."""
         self._http = http_client
         self._config = config
+        self._catalog = catalog
+        self._local_select = local_select
+        # Whether the gateway answers batch selections; None until known
+        self._batch_selection: Optional[bool] = None
+        # Background build of the local selection index, if one was started
+        self._index_build: Optional["asyncio.Future[None]"] = None
+        # Whether the gateway has the batch invocation route; None until known
+        self._batch_invocation: Optional[bool] = None
+        self._select_cache = select_cache or SelectCache(
+            config.select_cache or SelectCacheOptions()
+        )
 
     async def select(
-        self, query: str, options: Optional[ToolSelectionOptions] = None
+        self,
+        query: str,
+        options: Optional[ToolSelectionOptions] = None,
+        deadline: Optional[int] = None,
     ) -> List[Tool]:
         """
         Semantically select tools using FAISS + GraphRAG.
 
         Implements two-level retrieval (category → tools) for 95% token reduction.
+        When the select cache is enabled, repeated queries are answered locally.
+        With local selection enabled, the same retrieval runs in-process over
+        the catalog replica when the gateway is unavailable or the deadline is
+        within the latency budget.
 
         Args:
             query: Natural language query (e.g., "create a GitHub PR")
             options: Selection options (maxTools, categories, tokenBudget)
+            deadline: Optional total time budget in ms for this call, including
+                retries (overrides the client default)
 
         Returns:
-            List of selected tools ranked by relevance
+            List of selected tools ranked by relevance (lazy ToolView objects
+            in trusted mode)
 
         Raises:
             ValidationError: If query is empty or options are invalid
             HTTPError: If request fails
+            DeadlineExceededError: If the deadline expires
 
         Example:
             >>> tools = await connectors.tools.select(
@@ -50,70 +741,303 @@ class ToolsAPI:
             ...     options=ToolSelectionOptions(max_tools=3, categories=["code"])
             ... )
         """
-        validate_non_empty_string(query, "query")
-        opts = options or ToolSelectionOptions()
+        request_body = _build_select_request(query, options)
+        cache_key: Any = None
+        if self._select_cache.enabled:
+            cache_key = SelectCache.key(self._config.tenant_id, request_body)
+            cached = self._select_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-        if opts.max_tools is not None:
-            validate_positive_number(opts.max_tools, "maxTools")
-        if opts.token_budget is not None:
-            validate_positive_number(opts.token_budget, "tokenBudget")
+        local = self._local_select
+        if local is not None:
+            if local.options.mode == "local":
+                if self._catalog is not None:
+                    await self._catalog.ensure_fresh()
+                await self._local_index(local)
+                return local.select(request_body)
+            # Until the index is built, take the gateway path
+            if local.available() and await self._local_index(local, wait=False):
+                if local.is_tight(deadline if deadline is not None else self._config.deadline):
+                    return local.select(request_body)
+                request_body = _prefilter(local, request_body)
 
-        request_body: Dict[str, Any] = {
-            "query": query.strip(),
-        }
+        try:
+            # Selection is read-only, so identical concurrent queries can share a call
+            response = await self._http.post(
+                "/api/v1/tools/select",
+                request_body,
+                _tool_list_type(self._config),
+                coalesce=True,
+                deadline=deadline,
+            )
+        except ConnectorsError as e:
+            if local is None or not _gateway_unavailable(e) or not local.available():
+                raise
+            await self._local_index(local)
+            return local.select(request_body)
+        tools = _unpack_tools(response)
+        if cache_key is not None:
+            self._select_cache.put(cache_key, tools)
+        return tools
 
-        if opts.max_tools is not None:
-            request_body["maxTools"] = opts.max_tools
-        if opts.categories is not None:
-            request_body["categories"] = opts.categories
-        if opts.token_budget is not None:
-            request_body["tokenBudget"] = opts.token_budget
+    async def _local_index(self, local: "LocalSelector", wait: bool = True) -> bool:
+        """
+        Build the local selection index for the current replica in a thread.
 
-        response = await self._http.post("/api/v1/tools/select", request_body, dict)
-        return [Tool.model_validate(tool) for tool in response.get("tools", [])]
+        Returns:
+            Whether the index is ready; without wait, a missing one is only
+            started in the background
+        """
+        if local.ready():
+            return True
+        if self._index_build is None or self._index_build.done():
+            self._index_build = asyncio.ensure_future(asyncio.to_thread(local.build))
+            # A failed background build is retried on next use; do not warn about it
+            self._index_build.add_done_callback(lambda task: task.cancelled() or task.exception())
+        if not wait:
+            return False
+        await asyncio.shield(self._index_build)
+        return True
 
-    async def list(self, filters: Optional[ToolListFilters] = None) -> List[Tool]:
+    async def select_many(
+        self,
+        queries: List[str],
+        options: Optional[ToolSelectionOptions] = None,
+        concurrency: int = DEFAULT_SELECT_CONCURRENCY,
+        deadline: Optional[int] = None,
+    ) -> List[List[Tool]]:
+        """
+        Select tools for several queries at once, e.g. the sub-tasks of a plan.
+
+        Identical queries (after normalization) are selected once, and cached
+        results are served from the select cache. The rest are sent to the
+        gateway as batch requests of up to 10 queries. If the gateway does not
+        accept batch requests, each query is sent with select() instead, up to
+        concurrency at a time; this is remembered for the client's lifetime.
+
+        Args:
+            queries: Natural language queries
+            options: Selection options applied to every query
+            concurrency: Maximum parallel requests (default: 4)
+            deadline: Optional total time budget in ms for each request,
+                including retries (overrides the client default)
+
+        Returns:
+            One list of selected tools per query, in input order
+
+        Raises:
+            ValidationError: If a query is empty or options are invalid
+            HTTPError: If a request fails
+            DeadlineExceededError: If the deadline expires
+
+        Example:
+            >>> steps = ["find the failing test", "open an issue", "notify #eng"]
+            >>> for step, tools in zip(steps, await connectors.tools.select_many(steps)):
+            ...     print(step, [t.tool_id for t in tools])
+        """
+        validate_positive_number(concurrency, "concurrency")
+        plan = _SelectBatch(list(queries), options, self._config, self._select_cache)
+        semaphore = asyncio.Semaphore(concurrency)
+        local = self._local_select
+        effective_deadline = deadline if deadline is not None else self._config.deadline
+
+        async def send_batch(keys: List[Any], body: Dict[str, Any]) -> bool:
+            async with semaphore:
+                response = await self._http.post(
+                    "/api/v1/tools/select",
+                    body,
+                    _batch_response_type(self._config),
+                    coalesce=True,
+                    deadline=deadline,
+                )
+            return plan.record_batch(keys, response)
+
+        if (
+            plan.pending()
+            and self._batch_selection is not False
+            and _batch_allowed(local, effective_deadline)
+        ):
+            outcomes = await asyncio.gather(
+                *(send_batch(keys, body) for keys, body in plan.batches()),
+                return_exceptions=True,
+            )
+            for outcome in outcomes:
+                if isinstance(outcome, ConnectorsError):
+                    if local is not None and _gateway_unavailable(outcome) and local.available():
+                        await self._local_index(local)
+                    self._batch_selection = plan.recover(outcome, self._batch_selection, local)
+                elif isinstance(outcome, BaseException):
+                    raise outcome
+                else:
+                    self._batch_selection = outcome
+
+        async def select_one(key: Any, body: Dict[str, Any]) -> None:
+            async with semaphore:
+                plan.record(key, await self.select(body["query"], options, deadline))
+
+        failures = await asyncio.gather(
+            *(select_one(key, body) for key, body in plan.pending()), return_exceptions=True
+        )
+        for failure in failures:
+            if isinstance(failure, BaseException):
+                raise failure
+        return plan.results()
+
+    async def list(
+        self, filters: Optional[ToolListFilters] = None, deadline: Optional[int] = None
+    ) -> List[Tool]:
         """
         List available tools with optional filters.
 
+        When the catalog replica is enabled, tools are read from it locally.
+
         Args:
             filters: Filters for category, integration, search, pagination
+            deadline: Optional total time budget in ms for this call, including
+                retries (overrides the client default)
 
         Returns:
-            List of tools matching filters
+            List of tools matching filters (lazy ToolView objects in trusted mode)
 
         Raises:
             HTTPError: If request fails
+            DeadlineExceededError: If the deadline expires
 
         Example:
             >>> tools = await connectors.tools.list(
             ...     filters=ToolListFilters(category="code", integration="github")
             ... )
         """
-        filters = filters or ToolListFilters()
+        if self._catalog is not None:
+            return await self._catalog.list_tools(filters)
+        params = _build_list_params(filters)
+        response = await self._http.request(
+            "GET",
+            "/api/v1/tools/list",
+            _tool_list_type(self._config),
+            params=params,
+            deadline=deadline,
+        )
+        return _unpack_tools(response)
+
+    async def stream(
+        self, filters: Optional[ToolListFilters] = None, deadline: Optional[int] = None
+    ) -> AsyncIterator[Tool]:
+        """
+        Stream tools matching filters as the response arrives.
+
+        Unlike :meth:`list`, the response body is parsed incrementally and
+        each tool is yielded as soon as it has been read, so memory stays flat
+        and the first tools are available before the catalog has downloaded.
+
+        Args:
+            filters: Filters for category, integration, search, pagination
+            deadline: Optional time budget in ms for opening the stream,
+                including retries (overrides the client default)
+
+        Yields:
+            Tools matching filters (lazy ToolView objects in trusted mode)
+
+        Raises:
+            HTTPError: If request fails
+            DeadlineExceededError: If the deadline expires before the
+                response starts
+            ConnectorsError: If the response ends before the tools array does
+
+        Example:
+            >>> async for tool in connectors.tools.stream(ToolListFilters(limit=10000)):
+            ...     print(tool.tool_id)
+        """
+        params = _build_list_params(filters)
+        parser = JSONArrayParser("tools")
+        async with self._http.stream(
+            "GET", "/api/v1/tools/list", params=params, deadline=deadline
+        ) as response:
+            async for chunk in response.aiter_bytes():
+                for item in parser.feed(chunk):
+                    yield _parse_tool(item, self._config.trusted, self._http.codec)
+                if parser.done:
+                    break
+        parser.close()
+
+    async def iter_all(
+        self,
+        filters: Optional[ToolListFilters] = None,
+        concurrency: int = 1,
+        deadline: Optional[int] = None,
+    ) -> AsyncIterator[Tool]:
+        """
+        Iterate over every tool matching filters, page by page.
+
+        The next page is fetched while the current one is consumed. When the
+        gateway reports the total count, up to concurrency pages are fetched
+        in parallel; tools are always yielded in page order.
+
+        Args:
+            filters: Filters for category, integration and search; limit sets
+                the page size (default 100) and page the first page
+            concurrency: Maximum pages fetched in parallel once the total is
+                known (default: 1, i.e. prefetch only)
+            deadline: Optional total time budget in ms for each page request,
+                including retries (overrides the client default)
 
-        params: Dict[str, Any] = {}
-        if filters.category:
-            params["category"] = filters.category
-        if filters.integration:
-            params["integration"] = filters.integration
-        if filters.search:
-            params["search"] = filters.search
-        if filters.page is not None:
-            params["page"] = filters.page
-        if filters.limit is not None:
-            params["limit"] = filters.limit
-
-        # Build path with query params
-        path = "/api/v1/tools/list"
-        response = await self._http.request("GET", path, dict, params=params)
-        return [Tool.model_validate(tool) for tool in response.get("tools", [])]
+        Yields:
+            Tools matching filters (lazy ToolView objects in trusted mode)
+
+        Raises:
+            ValidationError: If concurrency is not positive
+            HTTPError: If a page request fails
+            DeadlineExceededError: If a page's deadline expires
+
+        Example:
+            >>> async for tool in connectors.tools.iter_all(
+            ...     ToolListFilters(category="code"), concurrency=4
+            ... ):
+            ...     print(tool.tool_id)
+        """
+        walk = _PageWalk(filters, concurrency)
+        pending: Deque["asyncio.Future[Tuple[List[Tool], Optional[int]]]"] = deque()
+
+        def fetch_ahead() -> None:
+            for page in walk.schedule(len(pending)):
+                pending.append(asyncio.ensure_future(self._list_page(walk.params(page), deadline)))
+
+        try:
+            fetch_ahead()
+            while pending:
+                tools, total = await pending.popleft()
+                walk.record(tools, total)
+                # Request the next pages before handing these to the caller
+                fetch_ahead()
+                for tool in tools:
+                    yield tool
+                if walk.done:
+                    break
+        finally:
+            for future in pending:
+                future.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _list_page(
+        self, params: Dict[str, Any], deadline: Optional[int]
+    ) -> Tuple[List[Tool], Optional[int]]:
+        response = await self._http.request(
+            "GET",
+            "/api/v1/tools/list",
+            _tool_list_type(self._config),
+            params=params,
+            deadline=deadline,
+        )
+        return _unpack_tools(response), _list_total(response)
 
     async def invoke(
         self,
         tool_id: str,
         parameters: Dict[str, Any],
         options: Optional[InvokeOptions] = None,
+        deadline: Optional[int] = None,
     ) -> ToolInvocationResponse:
         """
         Execute a tool with given parameters.
@@ -124,6 +1048,8 @@ class ToolsAPI:
             tool_id: Tool identifier (e.g., "github.createPullRequest")
             parameters: Tool-specific parameters
             options: Invocation options (tenant_id, integration)
+            deadline: Optional total time budget in ms for this call, including
+                retries (overrides the client default)
 
         Returns:
             ToolInvocationResponse with success status and data/error
@@ -131,6 +1057,8 @@ class ToolsAPI:
         Raises:
             ValidationError: If tool_id is invalid
             HTTPError: If invocation fails
+            CircuitOpenError: If the integration's circuit breaker is open
+            DeadlineExceededError: If the deadline expires
 
         Example:
             >>> result = await connectors.tools.invoke(
@@ -145,23 +1073,292 @@ class ToolsAPI:
             >>> if result.success:
             ...     print(f"PR created: {result.data}")
         """
-        validate_non_empty_string(tool_id, "toolId")
+        request_body = _build_invoke_request(
+            tool_id, parameters, options, self._config.tenant_id
+        )
+        invocation = self._http.idempotency.begin(request_body, _idempotency_key(options))
+        if invocation.response is not None:
+            return ToolInvocationResponse.model_validate(invocation.response)
+        response: Optional[Dict[str, Any]] = None
+        try:
+            # Results are free-form JSON, which the codec parses faster than
+            # pydantic's bytes validation; only the envelope is validated
+            response = await self._http.request(
+                "POST",
+                "/api/v1/tools/invoke",
+                dict,
+                json=request_body,
+                circuit=request_body["integration"],
+                coalesce=invocation.coalesce,
+                deadline=deadline,
+                body=_upload_body(request_body, options, self._http),
+                headers=self._http.idempotency.headers(invocation),
+            )
+        finally:
+            self._http.idempotency.finish(invocation, response)
+        return ToolInvocationResponse.model_validate(response)
+
+    async def invoke_stream(
+        self,
+        tool_id: str,
+        parameters: Dict[str, Any],
+        options: Optional[InvokeOptions] = None,
+        deadline: Optional[int] = None,
+    ) -> AsyncIterator[ToolInvocationResponse]:
+        """
+        Execute a tool and yield its result in chunks as the gateway sends them.
 
-        # Extract integration from toolId (e.g., "github.createPR" -> "github")
-        if "." not in tool_id:
-            raise ValueError(
-                f"toolId must contain integration prefix (e.g., 'github.createPR'), got: {tool_id}"
+        Server-sent events and newline-delimited JSON responses are yielded
+        one event or line at a time, without buffering the whole result; a
+        plain JSON response is yielded as a single chunk (see
+        InvocationStreamDecoder for the formats). The deadline and retries
+        apply until the response headers arrive.
+
+        Args:
+            tool_id: Tool identifier (e.g., "github.createPullRequest")
+            parameters: Tool-specific parameters
+            options: Invocation options (tenant_id, integration)
+            deadline: Optional time budget in ms to wait for the response
+                to start, including retries (overrides the client default)
+
+        Yields:
+            ToolInvocationResponse chunks, in the order received
+
+        Raises:
+            ValidationError: If tool_id is invalid
+            HTTPError: If invocation fails or the stream is interrupted
+            CircuitOpenError: If the integration's circuit breaker is open
+            DeadlineExceededError: If the deadline expires
+            ConnectorsError: If a streamed JSON chunk is malformed
+
+        Example:
+            >>> async for chunk in connectors.tools.invoke_stream(
+            ...     "postgres.runQuery", {"sql": "SELECT * FROM events"}
+            ... ):
+            ...     print(chunk.data)
+        """
+        request_body = _build_invoke_request(
+            tool_id, parameters, options, self._config.tenant_id
+        )
+        async with self._http.stream(
+            "POST",
+            "/api/v1/tools/invoke",
+            json=request_body,
+            headers={
+                "Accept": INVOCATION_STREAM_ACCEPT,
+                **self._http.idempotency.key_headers(_idempotency_key(options)),
+            },
+            circuit=request_body["integration"],
+            deadline=deadline,
+        ) as response:
+            decoder = InvocationStreamDecoder(
+                response.headers.get("content-type", ""), self._http.codec
             )
+            async for chunk in response.aiter_bytes():
+                for result in decoder.feed(chunk):
+                    yield result
+                if decoder.done:
+                    break
+        for result in decoder.close():
+            yield result
 
-        integration = tool_id.split(".")[0]
-        opts = options or InvokeOptions()
+    async def invoke_to_file(
+        self,
+        tool_id: str,
+        parameters: Dict[str, Any],
+        destination: Destination,
+        options: Optional[InvokeOptions] = None,
+        field: Optional[str] = None,
+        deadline: Optional[int] = None,
+    ) -> DownloadResult:
+        """
+        Execute a tool that returns a file and write the file to a destination.
 
-        request_body: Dict[str, Any] = {
-            "toolId": tool_id.strip(),
-            "integration": opts.integration or integration,
-            "tenantId": opts.tenant_id or self._config.tenant_id,
-            "parameters": parameters,
-        }
+        The file is written in chunks as the response arrives instead of being
+        held in memory. A JSON result has its base64 field decoded on the fly,
+        and the rest of the result is returned as metadata; any other response
+        body is written as it is.
 
-        response = await self._http.post("/api/v1/tools/invoke", request_body, dict)
-        return ToolInvocationResponse.model_validate(response)
+        Args:
+            tool_id: Tool identifier (e.g., "googleDrive.exportFile")
+            parameters: Tool-specific parameters
+            destination: File path, or binary file-like object (its write()
+                may be a coroutine)
+            options: Invocation options (tenant_id, integration)
+            field: JSON key holding the base64 contents (default: the first
+                base64 value of one of BINARY_FIELDS)
+            deadline: Optional time budget in ms to wait for the response
+                to start, including retries (overrides the client default)
+
+        Returns:
+            DownloadResult with the bytes written and the result's metadata;
+            nothing is written if the tool reports failure
+
+        Raises:
+            ValidationError: If tool_id is invalid
+            HTTPError: If invocation fails or the download is interrupted
+            CircuitOpenError: If the integration's circuit breaker is open
+            DeadlineExceededError: If the deadline expires
+            ConnectorsError: If a successful JSON result has no base64 field
+
+        Example:
+            >>> result = await connectors.tools.invoke_to_file(
+            ...     "googleDrive.downloadFile", {"fileId": file_id}, "/tmp/report.pdf"
+            ... )
+            >>> print(result.bytes_written, result.content_type)
+        """
+        request_body = _build_invoke_request(
+            tool_id, parameters, options, self._config.tenant_id
+        )
+        download = _Download(destination, field, self._http.codec)
+        try:
+            async with self._http.stream(
+                "POST",
+                "/api/v1/tools/invoke",
+                json=request_body,
+                headers={
+                    "Accept": DOWNLOAD_ACCEPT,
+                    **self._http.idempotency.key_headers(_idempotency_key(options)),
+                },
+                circuit=request_body["integration"],
+                deadline=deadline,
+            ) as response:
+                download.start(response.headers.get("content-type", ""))
+                async for chunk in response.aiter_bytes():
+                    for piece in download.pieces(chunk):
+                        written = download.write(piece)
+                        if inspect.isawaitable(written):
+                            await written
+            return download.finish()
+        except BaseException:
+            download.abort()
+            raise
+
+    async def invoke_many(
+        self,
+        calls: Iterable[Tuple[str, Dict[str, Any]]],
+        options: Optional[InvokeOptions] = None,
+        concurrency: int = DEFAULT_INVOKE_CONCURRENCY,
+        ordered: bool = True,
+        rate_limits: Optional[Dict[str, float]] = None,
+        batch_size: Optional[int] = None,
+        deadline: Optional[int] = None,
+    ) -> AsyncIterator[InvokeResult]:
+        """
+        Execute many tool calls, streaming one result per call.
+
+        Calls run up to concurrency at a time and are read from the iterable
+        only as slots free up, so memory stays bounded for very large inputs.
+        A failed or invalid call yields a result with its error instead of
+        stopping the run.
+
+        Args:
+            calls: (tool_id, parameters) pairs
+            options: Invocation options applied to every call
+            concurrency: Maximum calls (or batches) in flight (default: 8)
+            ordered: Yield results in input order; if False, yield them as
+                they complete
+            rate_limits: Maximum calls per second by integration name, with
+                "*" for integrations without their own limit
+            batch_size: Send up to this many calls per request to the
+                gateway's batch invocation route; falls back to single
+                invocations if the gateway does not have one
+            deadline: Optional total time budget in ms for each request,
+                including retries (overrides the client default)
+
+        Yields:
+            InvokeResult per call, with its input index, response or error
+
+        Example:
+            >>> calls = (("gmail.addLabel", {"messageId": m, "label": "done"}) for m in ids)
+            >>> async for result in connectors.tools.invoke_many(
+            ...     calls, concurrency=16, ordered=False, rate_limits={"gmail": 20}
+            ... ):
+            ...     if not result.success:
+            ...         print(result.index, result.error or result.response.error)
+        """
+        validate_positive_number(concurrency, "concurrency")
+        plan = _BulkInvoke(calls, options, self._config.tenant_id, rate_limits, batch_size)
+        running: Deque["asyncio.Future[List[InvokeResult]]"] = deque()
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(running) < concurrency:
+                    unit = plan.next_unit(self._batch_invocation is not False)
+                    if unit:
+                        task = asyncio.ensure_future(self._invoke_unit(plan, unit, deadline))
+                        running.append(task)
+                    else:
+                        exhausted = True
+                if not running:
+                    return
+                if ordered:
+                    finished = running.popleft()
+                else:
+                    await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                    finished = next(future for future in running if future.done())
+                    running.remove(finished)
+                for result in await finished:
+                    yield result
+        finally:
+            for future in running:
+                future.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+    async def _invoke_unit(
+        self, plan: _BulkInvoke, unit: List[_Call], deadline: Optional[int]
+    ) -> List[InvokeResult]:
+        delay = plan.delay(unit)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if plan.batch_size and self._batch_invocation is not False and plan.batchable(unit):
+            response: Optional[Dict[str, Any]] = None
+            error: Optional[ConnectorsError] = None
+            try:
+                response = await self._http.post(
+                    INVOKE_BATCH_PATH,
+                    plan.batch_body(unit),
+                    dict,
+                    deadline=deadline,
+                    headers=self._http.idempotency.key_headers(plan.idempotency_key(unit)),
+                )
+            except ConnectorsError as e:
+                error = e
+            except (TypeError, ValueError):
+                # A parameter the codec cannot encode: send the calls one by
+                # one, so only the call holding it fails
+                return [await self._invoke_call(plan, call, deadline) for call in unit]
+            results, self._batch_invocation = plan.settle_batch(
+                unit, response, error, self._batch_invocation
+            )
+            if results is not None:
+                return results
+        return [await self._invoke_call(plan, call, deadline) for call in unit]
+
+    async def _invoke_call(
+        self, plan: _BulkInvoke, call: _Call, deadline: Optional[int]
+    ) -> InvokeResult:
+        if call.body is None:
+            return plan.result(call)
+        invocation = self._http.idempotency.begin(call.body, plan.idempotency_key([call]))
+        if invocation.response is not None:
+            return plan.result(call, invocation.response)
+        response: Optional[Dict[str, Any]] = None
+        try:
+            response = await self._http.request(
+                "POST",
+                "/api/v1/tools/invoke",
+                dict,
+                json=call.body,
+                circuit=call.body["integration"],
+                deadline=deadline,
+                body=_upload_body(call.body, plan.options, self._http),
+                headers=self._http.idempotency.headers(invocation),
+            )
+        except (ConnectorsError, TypeError, ValueError) as e:
+            # TypeError and ValueError: parameters the codec cannot encode
+            return plan.result(call, error=e)
+        finally:
+            self._http.idempotency.finish(invocation, response)
+        return plan.result(call, response)
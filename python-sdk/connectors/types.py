@@ -5,6 +5,261 @@ from enum import Enum
 from pydantic import BaseModel, Field, ConfigDict
 
 
+class PoolOptions(BaseModel):
+    """Connection pool options for the HTTP transport."""
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: int = 5000
+    http2: bool = False
+
+
+class RetryBudgetOptions(BaseModel):
+    """Client-wide retry budget options."""
+
+    enabled: bool = True
+    ratio: float = 0.2
+    min_retries_per_second: float = 10.0
+    max_tokens: float = 100.0
+
+
+class RetryStats(BaseModel):
+    """Retry counters for a client."""
+
+    requests: int = 0
+    retries: int = 0
+    retries_denied: int = 0
+    gave_up: int = 0
+    available_tokens: float = 0.0
+
+
+class ConcurrencyOptions(BaseModel):
+    """Adaptive per-route concurrency limit options."""
+
+    enabled: bool = False
+    initial_limit: int = 20
+    min_limit: int = 1
+    max_limit: int = 200
+    backoff_ratio: float = 0.9
+    latency_tolerance: Optional[float] = None
+    queue_timeout: int = 30000
+
+
+class ConcurrencyStats(BaseModel):
+    """Concurrency limiter state for a route."""
+
+    route: str
+    limit: int
+    in_flight: int
+    queued: int
+    rejected: int
+
+
+class CircuitBreakerOptions(BaseModel):
+    """Per-integration circuit breaker options (times in milliseconds)."""
+
+    enabled: bool = True
+    failure_threshold: int = 5
+    success_threshold: int = 2
+    reset_timeout: int = 60000
+    window_duration: int = 10000
+    half_open_max_calls: int = 1
+
+
+class CircuitBreakerStats(BaseModel):
+    """Circuit breaker state for an integration."""
+
+    integration: str
+    state: str
+    failures: int
+    rejected: int
+
+
+class HedgeOptions(BaseModel):
+    """Hedged request options for idempotent GETs (times in milliseconds)."""
+
+    enabled: bool = False
+    percentile: float = 95.0
+    initial_delay: int = 100
+    min_delay: int = 10
+    max_hedge_ratio: float = 0.1
+    min_samples: int = 20
+    window_size: int = 200
+
+
+class HedgeStats(BaseModel):
+    """Hedged request counters for a client."""
+
+    requests: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    hedges_denied: int = 0
+
+
+class SingleFlightOptions(BaseModel):
+    """Coalescing of identical in-flight idempotent requests."""
+
+    enabled: bool = True
+
+
+class SingleFlightStats(BaseModel):
+    """Request coalescing counters for a client."""
+
+    requests: int = 0
+    coalesced: int = 0
+    in_flight: int = 0
+
+
+class SelectCacheOptions(BaseModel):
+    """Client-side cache options for tool selection results (times in milliseconds)."""
+
+    enabled: bool = False
+    max_entries: int = 1024
+    ttl: int = 300000
+    semantic: bool = False
+    similarity_threshold: float = 0.8
+    dimensions: int = 1024
+
+
+class SelectCacheStats(BaseModel):
+    """Tool selection cache counters for a client."""
+
+    hits: int = 0
+    semantic_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+
+
+class ReplicaOptions(BaseModel):
+    """Local catalog replica options (times in milliseconds)."""
+
+    enabled: bool = False
+    path: Optional[str] = None
+    max_staleness: int = 300000
+    page_size: int = 500
+    serve_stale: bool = True
+
+
+class LocalSelectOptions(BaseModel):
+    """In-process tool selection over the catalog replica (times in milliseconds)."""
+
+    enabled: bool = False
+    mode: str = "fallback"
+    latency_budget: Optional[int] = None
+    max_categories: int = 3
+    bm25_weight: float = 0.5
+    dimensions: int = 512
+
+
+class CompressionOptions(BaseModel):
+    """Request and response body compression options (sizes in bytes)."""
+
+    enabled: bool = False
+    algorithm: str = "gzip"
+    min_size: int = 1024
+    level: Optional[int] = None
+    accept: Optional[List[str]] = None
+    routes: Dict[str, str] = Field(default_factory=dict)
+
+
+class CompressionStats(BaseModel):
+    """Body size counters for a client, before and after compression."""
+
+    requests: int = 0
+    requests_compressed: int = 0
+    request_bytes: int = 0
+    request_bytes_sent: int = 0
+    responses: int = 0
+    responses_compressed: int = 0
+    response_bytes: int = 0
+    response_bytes_received: int = 0
+
+
+class IdempotencyOptions(BaseModel):
+    """Idempotency keys for tool invocations (times in milliseconds)."""
+
+    enabled: bool = True
+    header: str = "Idempotency-Key"
+    # Identical invocations within this long of each other share a key and,
+    # once one succeeded, its result; 0 turns deduplication off
+    dedupe_window: int = 0
+    max_entries: int = 1024
+    # Retry keyed requests answered with 409 Conflict (the key is still in
+    # use by an attempt that may yet succeed); only for gateways that
+    # implement idempotency keys, where 409 is not a real conflict
+    retry_conflicts: bool = False
+
+
+class IdempotencyStats(BaseModel):
+    """Idempotency key counters for a client."""
+
+    keyed: int = 0
+    keys_reused: int = 0
+    deduplicated: int = 0
+    entries: int = 0
+
+
+class HTTPCacheOptions(BaseModel):
+    """Conditional GET cache options for catalog routes (times in milliseconds)."""
+
+    enabled: bool = True
+    routes: List[str] = Field(
+        default_factory=lambda: ["GET /api/v1/tools/list", "GET /api/v1/mcp/integrations"]
+    )
+    max_entries: int = 256
+    # Serve cached responses without revalidating for this long, unless the
+    # server sends Cache-Control
+    max_age: int = 0
+
+
+class HTTPCacheStats(BaseModel):
+    """Conditional GET cache counters for a client."""
+
+    hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+    bytes_saved: int = 0
+    entries: int = 0
+
+
+class RateLimitOptions(BaseModel):
+    """Client-side pacing to the gateway's rate limit headers (times in milliseconds)."""
+
+    enabled: bool = False
+    # Requests that may be sent back to back before pacing spreads the rest
+    # of the window's quota evenly
+    burst: int = 10
+    max_wait: int = 30000
+
+
+class RateLimitStats(BaseModel):
+    """Rate limit bucket state and wait counters for a tenant's route."""
+
+    key: str
+    limit: Optional[int] = None
+    remaining: Optional[int] = None
+    reset_in: Optional[float] = None
+    in_flight: int = 0
+    queued: int = 0
+    waited: int = 0
+    wait_time: float = 0.0
+    max_wait_time: float = 0.0
+    rejected: int = 0
+
+
+class CatalogSyncResult(BaseModel):
+    """Outcome of one catalog replica sync."""
+
+    pages: int = 0
+    pages_unchanged: int = 0
+    tools_added: int = 0
+    tools_updated: int = 0
+    tools_removed: int = 0
+    integrations_changed: bool = False
+
+
 class ConnectorsConfig(BaseModel):
     """Configuration for Connectors client."""
 
@@ -12,8 +267,23 @@ class ConnectorsConfig(BaseModel):
     tenant_id: Optional[str] = None
     api_key: Optional[str] = None
     timeout: int = 120000
+    deadline: Optional[int] = None
     max_retries: int = 3
+    trusted: bool = False
     headers: Dict[str, str] = Field(default_factory=dict)
+    pool: PoolOptions = Field(default_factory=PoolOptions)
+    retry_budget: RetryBudgetOptions = Field(default_factory=RetryBudgetOptions)
+    concurrency: ConcurrencyOptions = Field(default_factory=ConcurrencyOptions)
+    circuit_breaker: CircuitBreakerOptions = Field(default_factory=CircuitBreakerOptions)
+    hedging: HedgeOptions = Field(default_factory=HedgeOptions)
+    single_flight: SingleFlightOptions = Field(default_factory=SingleFlightOptions)
+    select_cache: SelectCacheOptions = Field(default_factory=SelectCacheOptions)
+    replica: ReplicaOptions = Field(default_factory=ReplicaOptions)
+    local_select: LocalSelectOptions = Field(default_factory=LocalSelectOptions)
+    compression: CompressionOptions = Field(default_factory=CompressionOptions)
+    idempotency: IdempotencyOptions = Field(default_factory=IdempotencyOptions)
+    http_cache: HTTPCacheOptions = Field(default_factory=HTTPCacheOptions)
+    rate_limit: RateLimitOptions = Field(default_factory=RateLimitOptions)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -67,6 +337,12 @@ class InvokeOptions(BaseModel):
 
     tenant_id: Optional[str] = Field(None, alias="tenantId")
     integration: Optional[str] = None
+    # Compress the request body while it is sent, with the client's
+    # compression algorithm (gzip unless configured), whatever its size
+    compress: bool = False
+    # Key identifying this logical invocation, sent with every attempt;
+    # generated per call if not given
+    idempotency_key: Optional[str] = Field(default=None, alias="idempotencyKey")
 
     model_config = ConfigDict(populate_by_name=True)
 
@@ -82,6 +358,37 @@ class ToolInvocationResponse(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+class InvokeResult(BaseModel):
+    """Outcome of one call made by invoke_many()."""
+
+    index: int
+    tool_id: str
+    response: Optional[ToolInvocationResponse] = None
+    error: Optional[Exception] = None
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @property
+    def success(self) -> bool:
+        """Whether the call was made and the tool reported success."""
+        return self.error is None and self.response is not None and self.response.success
+
+
+class DownloadResult(BaseModel):
+    """Outcome of invoke_to_file(): the binary went to the destination, the rest is here."""
+
+    success: bool
+    error: Optional[str] = None
+    path: Optional[str] = None
+    bytes_written: int = 0
+    content_type: Optional[str] = None
+    # JSON field the bytes were decoded from; None when the body was the file
+    field: Optional[str] = None
+    # Tool result data, with the decoded field set to None
+    data: Optional[Any] = None
+    execution_time_ms: Optional[int] = None
+
+
 class MCPSourceType(str, Enum):
     """MCP source type."""
 
@@ -0,0 +1,296 @@
+"""Streamed JSON request bodies for large tool parameters."""
+
+import binascii
+import inspect
+import json
+from typing import Any, AsyncIterator, Dict, Generator, Iterator, List, Optional, Union
+
+from .codec import Codec
+from .compression import Compressor
+
+# Bytes read from a file per chunk; a multiple of 3, so whole chunks
+# base64-encode without carrying bytes over
+UPLOAD_CHUNK_SIZE = 48 * 1024
+_BINARY = (bytes, bytearray, memoryview)
+_END = object()
+
+
+def _is_file(value: Any) -> bool:
+    return callable(getattr(value, "read", None))
+
+
+def _is_stream(value: Any) -> bool:
+    """Check whether a parameter value is encoded while the body is sent."""
+    return (
+        _is_file(value)
+        or isinstance(value, _BINARY)
+        or isinstance(value, Iterator)
+        or hasattr(value, "__aiter__")
+    )
+
+
+def has_streams(value: Any) -> bool:
+    """Check whether a request body holds files, bytes or iterators anywhere."""
+    if isinstance(value, dict):
+        return any(has_streams(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(has_streams(item) for item in value)
+    return _is_stream(value)
+
+
+class _Pull:
+    """Asks the driver of an encoder for the next piece of a source."""
+
+    __slots__ = ("source", "read")
+
+    def __init__(self, source: Any, read: bool) -> None:
+        self.source = source
+        # True: source.read(UPLOAD_CHUNK_SIZE); False: the iterator's next item
+        self.read = read
+
+
+class StreamedBody:
+    """
+    A JSON request body encoded while it is sent, in chunks.
+
+    Plain values are encoded with the codec as usual. These values are
+    streamed instead, so they are never held in memory whole:
+
+    - binary files (anything with ``read()`` returning bytes, including
+      async files whose ``read()`` is a coroutine): a base64 string
+    - text files: a JSON string
+    - bytes, bytearray and memoryview: a base64 string
+    - iterators and async iterables (e.g. generators of rows): a JSON array,
+      or a base64 string if they yield bytes
+
+    The body can be compressed (gzip, br or zstd) as it is produced; size
+    and bytes_sent count the last attempt's body. Files that support
+    seek() are rewound so failed attempts can be retried; a body with an
+    iterator cannot be sent twice (see rewind()).
+    """
+
+    def __init__(
+        self, data: Dict[str, Any], codec: Codec, encoding: Optional[str] = None
+    ) -> None:
+        self._data = data
+        self._codec = codec
+        self.encoding = encoding
+        self.size = 0
+        self.bytes_sent = 0
+        self._files: List[Any] = []
+        self._replayable = True
+        self._collect(data)
+        # Start offset of every file, to rewind to
+        self._offsets = [_tell(file) for file in self._files]
+        if any(offset is None for offset in self._offsets):
+            self._replayable = False
+        self._started = False
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """The request data the body is produced from."""
+        return self._data
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Headers describing the body."""
+        return {"Content-Encoding": self.encoding} if self.encoding else {}
+
+    def rewind(self) -> bool:
+        """
+        Prepare to send the body again.
+
+        Returns:
+            False if the body was already sent and holds an iterator or an
+            unseekable file, so it cannot be reproduced
+        """
+        if not self._started:
+            return True
+        if not self._replayable:
+            return False
+        for file, offset in zip(self._files, self._offsets):
+            file.seek(offset)
+        return True
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Encode the body, reading sources synchronously."""
+        self._started = True
+        chunks = _Chunker(self)
+        encoder = self._encode(self._data)
+        sent: Any = None
+        while True:
+            try:
+                piece = encoder.send(sent)
+            except StopIteration:
+                break
+            if isinstance(piece, _Pull):
+                sent = _pull(piece)
+                continue
+            sent = None
+            chunk = chunks.add(piece)
+            if chunk:
+                yield chunk
+        chunk = chunks.close()
+        if chunk:
+            yield chunk
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """Encode the body, awaiting async files and iterables."""
+        self._started = True
+        chunks = _Chunker(self)
+        encoder = self._encode(self._data)
+        sent: Any = None
+        while True:
+            try:
+                piece = encoder.send(sent)
+            except StopIteration:
+                break
+            if isinstance(piece, _Pull):
+                sent = await _apull(piece)
+                continue
+            sent = None
+            chunk = chunks.add(piece)
+            if chunk:
+                yield chunk
+        chunk = chunks.close()
+        if chunk:
+            yield chunk
+
+    def _collect(self, value: Any) -> None:
+        """Find the files to rewind, and whether anything cannot be replayed."""
+        if isinstance(value, dict):
+            for item in value.values():
+                self._collect(item)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                self._collect(item)
+        elif _is_file(value):
+            self._files.append(value)
+        elif isinstance(value, Iterator) or hasattr(value, "__aiter__"):
+            self._replayable = False
+
+    def _encode(self, value: Any) -> Generator[Union[bytes, _Pull], Any, None]:
+        """
+        Yield the encoded body piece by piece.
+
+        Reading a source is left to the caller: a _Pull is yielded, and the
+        caller sends back what the source produced (_END once exhausted).
+        """
+        if not has_streams(value):
+            yield self._codec.encode(value)
+        elif isinstance(value, dict):
+            for index, (key, item) in enumerate(value.items()):
+                yield (b"," if index else b"{") + self._codec.encode(str(key)) + b":"
+                yield from self._encode(item)
+            yield b"}"
+        elif isinstance(value, (list, tuple)):
+            for index, item in enumerate(value):
+                yield b"," if index else b"["
+                yield from self._encode(item)
+            yield b"]"
+        elif isinstance(value, _BINARY):
+            yield b'"' + binascii.b2a_base64(value, newline=False) + b'"'
+        elif _is_file(value):
+            yield from self._encode_source(_Pull(value, read=True))
+        else:
+            source = value.__aiter__() if hasattr(value, "__aiter__") else value
+            yield from self._encode_source(_Pull(source, read=False))
+
+    def _encode_source(self, pull: _Pull) -> Generator[Union[bytes, _Pull], Any, None]:
+        """Encode a file or iterator as a base64 string, a JSON string or an array."""
+        first = yield pull
+        if first is _END:
+            yield b"[]" if not pull.read else b'""'
+            return
+        if isinstance(first, str) and pull.read:
+            yield b'"' + _escape(first)
+            while (text := (yield pull)) is not _END:
+                yield _escape(text)
+            yield b'"'
+        elif isinstance(first, _BINARY):
+            yield b'"'
+            carry = b""
+            data: Any = first
+            while data is not _END:
+                data = carry + bytes(data) if carry else data
+                whole = len(data) - len(data) % 3
+                if whole:
+                    yield binascii.b2a_base64(memoryview(data)[:whole], newline=False)
+                carry = bytes(data[whole:])
+                data = yield pull
+            yield binascii.b2a_base64(carry, newline=False) + b'"'
+        else:
+            # Anything else, strings from an iterator included, is an array item
+            yield b"[" + self._codec.encode(first)
+            while (item := (yield pull)) is not _END:
+                yield b"," + self._codec.encode(item)
+            yield b"]"
+
+
+def _escape(text: str) -> bytes:
+    """Encode text as the inside of a JSON string."""
+    return json.dumps(text, ensure_ascii=False)[1:-1].encode("utf-8")
+
+
+def _tell(file: Any) -> Optional[int]:
+    seekable = getattr(file, "seekable", None)
+    if not callable(seekable) or not seekable():
+        return None
+    return int(file.tell())
+
+
+def _pull(pull: _Pull) -> Any:
+    if pull.read:
+        data = pull.source.read(UPLOAD_CHUNK_SIZE)
+        if inspect.isawaitable(data):
+            raise TypeError("Async file objects can only be uploaded with the async client")
+        return data or _END
+    if hasattr(pull.source, "__anext__"):
+        raise TypeError("Async iterables can only be uploaded with the async client")
+    return next(pull.source, _END)
+
+
+async def _apull(pull: _Pull) -> Any:
+    if pull.read:
+        data = pull.source.read(UPLOAD_CHUNK_SIZE)
+        if inspect.isawaitable(data):
+            data = await data
+        return data or _END
+    if hasattr(pull.source, "__anext__"):
+        try:
+            return await pull.source.__anext__()
+        except StopAsyncIteration:
+            return _END
+    return next(pull.source, _END)
+
+
+class _Chunker:
+    """Groups small encoded pieces into chunks, compressing them if asked."""
+
+    def __init__(self, body: StreamedBody) -> None:
+        self._body = body
+        self._buffer = bytearray()
+        self._compressor = Compressor(body.encoding) if body.encoding else None
+        body.size = body.bytes_sent = 0
+
+    def add(self, piece: bytes) -> Optional[bytes]:
+        """Add a piece and get a chunk once enough is buffered."""
+        self._body.size += len(piece)
+        if self._compressor is not None:
+            piece = self._compressor.compress(piece)
+        self._buffer += piece
+        if len(self._buffer) < UPLOAD_CHUNK_SIZE:
+            return None
+        return self._take()
+
+    def close(self) -> Optional[bytes]:
+        """Get the rest of the body."""
+        if self._compressor is not None:
+            self._buffer += self._compressor.flush()
+        return self._take() or None
+
+    def _take(self) -> bytes:
+        chunk = bytes(self._buffer)
+        self._buffer.clear()
+        self._body.bytes_sent += len(chunk)
+        return chunk
@@ -3,6 +3,11 @@
 from typing import Any
 from .errors import ValidationError
 
+# "fallback": ask the gateway, answer locally when it is unavailable;
+# "prefilter": also narrow the gateway's search to locally picked categories;
+# "local": always answer locally
+LOCAL_SELECT_MODES = ("fallback", "prefilter", "local")
+
 
 def validate_non_empty_string(value: Any, field_name: str) -> None:
     """Validate that value is a non-empty string."""
@@ -45,6 +50,9 @@ def validate_config(config: Any) -> None:
     if config.timeout is not None:
         validate_positive_number(config.timeout, "timeout")
 
+    if config.deadline is not None:
+        validate_positive_number(config.deadline, "deadline")
+
     if config.max_retries is not None:
         if not isinstance(config.max_retries, int) or config.max_retries < 0:
             raise ValidationError(
@@ -52,3 +60,194 @@ def validate_config(config: Any) -> None:
                 field="max_retries",
                 value=config.max_retries
             )
+
+    if config.pool is not None:
+        validate_positive_number(config.pool.max_connections, "pool.max_connections")
+        validate_positive_number(
+            config.pool.max_keepalive_connections, "pool.max_keepalive_connections"
+        )
+        validate_positive_number(config.pool.keepalive_expiry, "pool.keepalive_expiry")
+
+    if config.retry_budget is not None:
+        validate_positive_number(config.retry_budget.max_tokens, "retry_budget.max_tokens")
+        if config.retry_budget.ratio < 0 or config.retry_budget.min_retries_per_second < 0:
+            raise ValidationError(
+                "retry_budget ratio and min_retries_per_second must be non-negative",
+                field="retry_budget",
+                value=config.retry_budget
+            )
+
+    if config.concurrency is not None and config.concurrency.enabled:
+        validate_positive_number(config.concurrency.min_limit, "concurrency.min_limit")
+        validate_positive_number(config.concurrency.max_limit, "concurrency.max_limit")
+        validate_positive_number(config.concurrency.queue_timeout, "concurrency.queue_timeout")
+        if config.concurrency.min_limit > config.concurrency.max_limit:
+            raise ValidationError(
+                "concurrency.min_limit cannot exceed concurrency.max_limit",
+                field="concurrency",
+                value=config.concurrency
+            )
+        if not 0 < config.concurrency.backoff_ratio < 1:
+            raise ValidationError(
+                "concurrency.backoff_ratio must be between 0 and 1",
+                field="concurrency.backoff_ratio",
+                value=config.concurrency.backoff_ratio
+            )
+
+    if config.circuit_breaker is not None and config.circuit_breaker.enabled:
+        breaker = config.circuit_breaker
+        validate_positive_number(breaker.failure_threshold, "circuit_breaker.failure_threshold")
+        validate_positive_number(breaker.success_threshold, "circuit_breaker.success_threshold")
+        validate_positive_number(breaker.reset_timeout, "circuit_breaker.reset_timeout")
+        validate_positive_number(breaker.window_duration, "circuit_breaker.window_duration")
+        validate_positive_number(
+            breaker.half_open_max_calls, "circuit_breaker.half_open_max_calls"
+        )
+
+    if config.select_cache is not None and config.select_cache.enabled:
+        validate_positive_number(config.select_cache.max_entries, "select_cache.max_entries")
+        validate_positive_number(config.select_cache.ttl, "select_cache.ttl")
+        validate_positive_number(config.select_cache.dimensions, "select_cache.dimensions")
+        if not 0 < config.select_cache.similarity_threshold <= 1:
+            raise ValidationError(
+                "select_cache.similarity_threshold must be between 0 and 1",
+                field="select_cache.similarity_threshold",
+                value=config.select_cache.similarity_threshold
+            )
+
+    if config.replica is not None and config.replica.enabled:
+        validate_positive_number(config.replica.max_staleness, "replica.max_staleness")
+        validate_positive_number(config.replica.page_size, "replica.page_size")
+
+    if config.local_select is not None and config.local_select.enabled:
+        local = config.local_select
+        if config.replica is None or not config.replica.enabled:
+            raise ValidationError(
+                "local_select requires the catalog replica; "
+                "pass replica=ReplicaOptions(enabled=True)",
+                field="local_select",
+                value=local
+            )
+        if local.mode not in LOCAL_SELECT_MODES:
+            raise ValidationError(
+                f"local_select.mode must be one of {', '.join(LOCAL_SELECT_MODES)}",
+                field="local_select.mode",
+                value=local.mode
+            )
+        if local.latency_budget is not None:
+            validate_positive_number(local.latency_budget, "local_select.latency_budget")
+        validate_positive_number(local.max_categories, "local_select.max_categories")
+        validate_positive_number(local.dimensions, "local_select.dimensions")
+        if not 0 <= local.bm25_weight <= 1:
+            raise ValidationError(
+                "local_select.bm25_weight must be between 0 and 1",
+                field="local_select.bm25_weight",
+                value=local.bm25_weight
+            )
+
+    if config.compression is not None and config.compression.enabled:
+        _validate_compression(config.compression)
+
+    if config.http_cache is not None and config.http_cache.enabled:
+        http_cache = config.http_cache
+        validate_positive_number(http_cache.max_entries, "http_cache.max_entries")
+        if http_cache.max_age < 0:
+            raise ValidationError(
+                "http_cache.max_age must be non-negative",
+                field="http_cache.max_age",
+                value=http_cache.max_age
+            )
+        for route in http_cache.routes:
+            if not route.upper().startswith("GET /"):
+                raise ValidationError(
+                    f"http_cache.routes must be GET routes like 'GET /api/v1/tools/list', "
+                    f"got: {route!r}",
+                    field="http_cache.routes",
+                    value=http_cache.routes
+                )
+
+    if config.rate_limit is not None and config.rate_limit.enabled:
+        validate_positive_number(config.rate_limit.max_wait, "rate_limit.max_wait")
+        if config.rate_limit.burst < 0:
+            raise ValidationError(
+                "rate_limit.burst must be non-negative",
+                field="rate_limit.burst",
+                value=config.rate_limit.burst
+            )
+
+    if config.idempotency is not None and config.idempotency.enabled:
+        idempotency = config.idempotency
+        validate_non_empty_string(idempotency.header, "idempotency.header")
+        validate_positive_number(idempotency.max_entries, "idempotency.max_entries")
+        if idempotency.dedupe_window < 0:
+            raise ValidationError(
+                "idempotency.dedupe_window must be non-negative",
+                field="idempotency.dedupe_window",
+                value=idempotency.dedupe_window
+            )
+
+    if config.hedging is not None and config.hedging.enabled:
+        hedging = config.hedging
+        validate_positive_number(hedging.initial_delay, "hedging.initial_delay")
+        validate_positive_number(hedging.min_samples, "hedging.min_samples")
+        validate_positive_number(hedging.window_size, "hedging.window_size")
+        if not 0 < hedging.percentile <= 100:
+            raise ValidationError(
+                "hedging.percentile must be between 0 and 100",
+                field="hedging.percentile",
+                value=hedging.percentile
+            )
+        if not 0 < hedging.max_hedge_ratio <= 1:
+            raise ValidationError(
+                "hedging.max_hedge_ratio must be between 0 and 1",
+                field="hedging.max_hedge_ratio",
+                value=hedging.max_hedge_ratio
+            )
+
+
+def _validate_compression(compression: Any) -> None:
+    """Check compression options, including that their encodings are installed."""
+    from .compression import ENCODINGS, IDENTITY, Compressor, available_encodings
+
+    available = available_encodings()
+    if compression.min_size < 0:
+        raise ValidationError(
+            "compression.min_size must be non-negative",
+            field="compression.min_size",
+            value=compression.min_size
+        )
+    encodings = {"compression.algorithm": compression.algorithm}
+    for route, encoding in compression.routes.items():
+        if encoding != IDENTITY:
+            encodings[f"compression.routes[{route!r}]"] = encoding
+    for field, encoding in encodings.items():
+        if encoding not in ENCODINGS:
+            raise ValidationError(
+                f"{field} must be one of {', '.join(ENCODINGS)}",
+                field=field,
+                value=encoding
+            )
+        if encoding not in available:
+            package = "brotli" if encoding == "br" else "zstandard"
+            raise ValidationError(
+                f"{field} {encoding!r} requires the {package} package; "
+                "install it with: pip install connectors-sdk[compression]",
+                field=field,
+                value=encoding
+            )
+        try:
+            Compressor(encoding, compression.level)
+        except Exception as e:
+            raise ValidationError(
+                f"compression.level {compression.level} is invalid for {encoding}: {e}",
+                field="compression.level",
+                value=compression.level
+            ) from e
+    for encoding in compression.accept or []:
+        if encoding not in available + [IDENTITY]:
+            raise ValidationError(
+                f"compression.accept: {encoding!r} cannot be decoded; "
+                f"available: {', '.join(available)}",
+                field="compression.accept",
+                value=compression.accept
+            )
@@ -0,0 +1,177 @@
+"""Lazy read-only views over trusted catalog responses.
+
+Building fully validated models for thousands of catalog entries costs more
+CPU than parsing the JSON itself. In trusted mode, list responses are parsed
+by the codec and each entry is wrapped in a view that reads its fields from
+the raw JSON on first access, without validation. Fields holding nested
+models are validated on access, and :meth:`ModelView.to_model` validates the
+whole entry when a real model is needed.
+"""
+
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+    overload,
+)
+
+from pydantic import BaseModel, TypeAdapter
+
+from .codec import Codec
+from .types import MCPIntegration, Tool, ToolParameter
+
+M = TypeVar("M", bound=BaseModel)
+
+_MISSING = object()
+_MODEL = "__model__"
+
+
+class _Field:
+    """Descriptor reading one model field from a view's raw JSON."""
+
+    __slots__ = ("name", "key", "adapter")
+
+    def __init__(self, name: str, key: str, adapter: Optional[TypeAdapter]) -> None:  # type: ignore[type-arg]
+        self.name = name
+        self.key = key
+        self.adapter = adapter
+
+    @overload
+    def __get__(self, view: None, owner: type) -> "_Field": ...
+
+    @overload
+    def __get__(self, view: "ModelView[Any]", owner: type) -> Any: ...
+
+    def __get__(self, view: Optional["ModelView[Any]"], owner: type) -> Any:
+        if view is None:
+            return self
+        raw = view._raw
+        if self.adapter is None and self.key in raw:
+            # Plain values are read straight from the raw JSON
+            return raw[self.key]
+
+        cache = view._cache
+        if self.name in cache:
+            return cache[self.name]
+        value = raw.get(self.key, raw.get(self.name, _MISSING))
+        if value is _MISSING:
+            field = view.model.model_fields[self.name]
+            if field.is_required():
+                # Surface the same ValidationError full validation would
+                view.to_model()
+            value = field.get_default(call_default_factory=True)
+        elif value is not None and self.adapter is not None:
+            value = self.adapter.validate_python(value)
+        cache[self.name] = value
+        return value
+
+
+class ModelView(Generic[M]):
+    """
+    Read-only view over one raw JSON object of a trusted response.
+
+    Subclasses set ``model`` and may list ``validated_fields`` whose values
+    are validated (once) when first read.
+    """
+
+    __slots__ = ("_raw", "_cache")
+
+    model: ClassVar[Type[BaseModel]]
+    validated_fields: ClassVar[Tuple[str, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for name, field in cls.model.model_fields.items():
+            adapter = (
+                TypeAdapter(field.annotation)
+                if name in cls.validated_fields and field.annotation is not None
+                else None
+            )
+            setattr(cls, name, _Field(name, field.alias or name, adapter))
+
+    def __init__(self, raw: Dict[str, Any]) -> None:
+        self._raw = raw
+        # Validated fields, defaults and the validated model
+        self._cache: Dict[str, Any] = {}
+
+    def to_model(self) -> M:
+        """Validate the whole entry into a model (cached)."""
+        model = self._cache.get(_MODEL)
+        if model is None:
+            model = self._cache[_MODEL] = self.model.model_validate(self._raw)
+        return cast(M, model)
+
+    def model_dump(self, **kwargs: Any) -> Dict[str, Any]:
+        """Dump the validated model, as ``BaseModel.model_dump`` does."""
+        return self.to_model().model_dump(**kwargs)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ModelView):
+            return type(self) is type(other) and self._raw == other._raw
+        if isinstance(other, BaseModel):
+            return self.to_model() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._raw!r})"
+
+
+class ToolView(ModelView[Tool]):
+    """Lazy view of a :class:`Tool`."""
+
+    __slots__ = ()
+    model = Tool
+    validated_fields = ("parameters",)
+
+    tool_id: str
+    name: str
+    description: str
+    integration: str
+    category: str
+    parameters: Optional[List[ToolParameter]]
+    token_cost: Optional[int]
+
+
+class IntegrationView(ModelView[MCPIntegration]):
+    """Lazy view of an :class:`MCPIntegration`."""
+
+    __slots__ = ()
+    model = MCPIntegration
+
+    name: str
+    category: str
+    description: Optional[str]
+    tool_count: int
+    version: Optional[str]
+    custom: bool
+
+
+def _tool_views(response: Dict[str, Any]) -> List[ToolView]:
+    """Wrap the "tools" array of a trusted response in views."""
+    return [ToolView(tool) for tool in response.get("tools") or []]
+
+
+def _integration_views(response: Dict[str, Any]) -> List[IntegrationView]:
+    """Wrap the "integrations" array of a trusted response in views."""
+    return [IntegrationView(item) for item in response.get("integrations") or []]
+
+
+def _parse_tool(raw: bytes, trusted: bool, codec: Codec) -> Tool:
+    """Parse one tool's JSON: a lazy view when trusted, else a validated model."""
+    if trusted:
+        return cast(Tool, ToolView(codec.decode(raw)))
+    return Tool.model_validate_json(raw)
+
+
+def _parse_integration(raw: bytes, trusted: bool, codec: Codec) -> MCPIntegration:
+    """Parse one integration's JSON: a lazy view when trusted, else a validated model."""
+    if trusted:
+        return cast(MCPIntegration, IntegrationView(codec.decode(raw)))
+    return MCPIntegration.model_validate_json(raw)
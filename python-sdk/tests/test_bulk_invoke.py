@@ -0,0 +1,221 @@
+"""Tests for bulk tool invocation."""
+
+import asyncio
+import json
+import time
+from typing import Any, Dict, Iterator, List, Tuple
+
+import pytest
+import respx
+import httpx
+from connectors import Connectors, ConnectorsSync, HTTPError, InvokeResult
+
+INVOKE_URL = "http://localhost:3000/api/v1/tools/invoke"
+BATCH_URL = "http://localhost:3000/api/v1/tools/invoke/batch"
+
+
+def echo(body: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the result a fake gateway returns for an invocation."""
+    if body["parameters"].get("fail"):
+        return {"success": False, "error": "tool failed"}
+    return {"success": True, "data": body["parameters"]}
+
+
+def calls(count: int, integration: str = "sheets") -> List[Tuple[str, Dict[str, Any]]]:
+    return [(f"{integration}.read", {"n": i}) for i in range(count)]
+
+
+class TestInvokeMany:
+    """Test ToolsAPI.invoke_many()."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_ordered_partial_results(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test every call gets a result in input order, failures included."""
+        def gateway(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            if body["parameters"].get("crash"):
+                return httpx.Response(400, text="bad parameters")
+            return httpx.Response(200, json=echo(body))
+
+        respx.post(INVOKE_URL).mock(side_effect=gateway)
+        connectors = Connectors(base_url="http://localhost:3000")
+        monkeypatch.setattr(connectors._http_client, "_calculate_backoff", lambda *args: 0)
+        batch = [
+            ("sheets.read", {"n": 0}),
+            ("sheets.read", {"crash": True}),
+            ("not-a-tool-id", {}),
+            ("sheets.read", {"fail": True}),
+            ("sheets.read", {"n": 4}),
+        ]
+
+        results = [r async for r in connectors.tools.invoke_many(batch, concurrency=2)]
+
+        assert [r.index for r in results] == [0, 1, 2, 3, 4]
+        assert [r.success for r in results] == [True, False, False, False, True]
+        assert results[0].response is not None and results[0].response.data == {"n": 0}
+        assert isinstance(results[1].error, HTTPError)
+        assert isinstance(results[2].error, ValueError)
+        assert results[3].error is None and results[3].response is not None
+        assert results[3].response.error == "tool failed"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_as_completed_and_bounded(self) -> None:
+        """Test unordered results stream as they finish, reading input lazily."""
+        in_flight = 0
+        peak = 0
+
+        async def gateway(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            body = json.loads(request.content)
+            await asyncio.sleep(0.05 if body["parameters"]["n"] == 0 else 0.001)
+            in_flight -= 1
+            return httpx.Response(200, json=echo(body))
+
+        respx.post(INVOKE_URL).mock(side_effect=gateway)
+        connectors = Connectors(base_url="http://localhost:3000")
+        pulled = 0
+
+        def source() -> Iterator[Tuple[str, Dict[str, Any]]]:
+            nonlocal pulled
+            for call in calls(100):
+                pulled += 1
+                yield call
+
+        stream = connectors.tools.invoke_many(source(), concurrency=4, ordered=False)
+        first = await stream.__anext__()
+        pulled_at_first = pulled
+        rest = [r async for r in stream]
+
+        assert first.index != 0
+        assert pulled_at_first <= 5
+        assert peak <= 4
+        assert sorted(r.index for r in [first, *rest]) == list(range(100))
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_rate_limits_per_integration(self) -> None:
+        """Test a rate-limited integration is paced while others are not."""
+        starts: Dict[str, List[float]] = {"gmail": [], "sheets": []}
+
+        def gateway(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            starts[body["integration"]].append(time.monotonic())
+            return httpx.Response(200, json=echo(body))
+
+        respx.post(INVOKE_URL).mock(side_effect=gateway)
+        connectors = Connectors(base_url="http://localhost:3000")
+        began = time.monotonic()
+
+        results = [
+            r
+            async for r in connectors.tools.invoke_many(
+                calls(4, "gmail") + calls(4, "sheets"), concurrency=8, rate_limits={"gmail": 20}
+            )
+        ]
+
+        assert all(r.success for r in results)
+        # Four gmail calls at 20/s: the last starts 3 intervals after the first
+        assert starts["gmail"][-1] - began >= 3 / 20
+        assert max(starts["sheets"]) < starts["gmail"][-1]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_batch_route(self) -> None:
+        """Test batch_size groups calls into batch requests."""
+        def gateway(request: httpx.Request) -> httpx.Response:
+            bodies = json.loads(request.content)["invocations"]
+            return httpx.Response(200, json={"results": [echo(body) for body in bodies]})
+
+        batch = respx.post(BATCH_URL).mock(side_effect=gateway)
+        single = respx.post(INVOKE_URL).mock(return_value=httpx.Response(500))
+        connectors = Connectors(base_url="http://localhost:3000")
+
+        results = [r async for r in connectors.tools.invoke_many(calls(5), batch_size=3)]
+
+        assert [r.response.data for r in results if r.response] == [{"n": i} for i in range(5)]
+        assert batch.call_count == 2
+        assert not single.called
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_batch_falls_back_without_route(self) -> None:
+        """Test a missing batch route falls back to single invocations, remembered."""
+        batch = respx.post(BATCH_URL).mock(return_value=httpx.Response(404, text="Not Found"))
+        respx.post(INVOKE_URL).mock(
+            side_effect=lambda request: httpx.Response(200, json=echo(json.loads(request.content)))
+        )
+        connectors = Connectors(base_url="http://localhost:3000")
+
+        first = [r async for r in connectors.tools.invoke_many(calls(4), batch_size=2)]
+        second = [r async for r in connectors.tools.invoke_many(calls(4), batch_size=2)]
+
+        assert all(r.success for r in first + second)
+        assert batch.call_count <= 2
+        assert [r.index for r in second] == [0, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_binary_and_unencodable_parameters(self) -> None:
+        """Test bytes are uploaded as in invoke(), and an unencodable call fails alone."""
+        def gateway(request: httpx.Request) -> httpx.Response:
+            bodies = json.loads(request.content)["invocations"]
+            return httpx.Response(200, json={"results": [echo(body) for body in bodies]})
+
+        batch = respx.post(BATCH_URL).mock(side_effect=gateway)
+        respx.post(INVOKE_URL).mock(
+            side_effect=lambda request: httpx.Response(200, json=echo(json.loads(request.content)))
+        )
+        connectors = Connectors(base_url="http://localhost:3000")
+        mixed = [
+            ("drive.upload", {"content": b"report"}),
+            ("drive.upload", {"content": object()}),
+            ("drive.upload", {"n": 2}),
+            ("drive.upload", {"n": 3}),
+            ("drive.upload", {"at": object()}),
+        ]
+
+        single = [r async for r in connectors.tools.invoke_many(mixed[:3])]
+        batched = [r async for r in connectors.tools.invoke_many(mixed[2:], batch_size=3)]
+
+        assert [r.success for r in single] == [True, False, True]
+        assert single[0].response is not None
+        assert single[0].response.data == {"content": "cmVwb3J0"}
+        assert isinstance(single[1].error, TypeError)
+        assert [r.success for r in batched] == [True, True, False]
+        assert isinstance(batched[2].error, TypeError)
+        assert not batch.called
+
+    @respx.mock
+    def test_sync_client(self) -> None:
+        """Test the blocking client streams results the same way."""
+        respx.post(INVOKE_URL).mock(
+            side_effect=lambda request: httpx.Response(200, json=echo(json.loads(request.content)))
+        )
+        with ConnectorsSync(base_url="http://localhost:3000") as connectors:
+            ordered = list(connectors.tools.invoke_many(calls(10), concurrency=3))
+            unordered = list(
+                connectors.tools.invoke_many(calls(10) + [("bad", {})], ordered=False)
+            )
+
+        assert [r.index for r in ordered] == list(range(10))
+        assert all(isinstance(r, InvokeResult) and r.success for r in ordered)
+        assert sorted(r.index for r in unordered) == list(range(11))
+        assert sum(not r.success for r in unordered) == 1
+
+    @respx.mock
+    def test_sync_binary_and_unencodable_parameters(self) -> None:
+        """Test the blocking client uploads bytes and isolates unencodable calls too."""
+        respx.post(INVOKE_URL).mock(
+            side_effect=lambda request: httpx.Response(200, json=echo(json.loads(request.read())))
+        )
+        mixed = [("drive.upload", {"content": b"report"}), ("drive.upload", {"at": object()})]
+        with ConnectorsSync(base_url="http://localhost:3000") as connectors:
+            results = list(connectors.tools.invoke_many(mixed, batch_size=2))
+
+        assert results[0].success and results[0].response is not None
+        assert results[0].response.data == {"content": "cmVwb3J0"}
+        assert isinstance(results[1].error, TypeError)
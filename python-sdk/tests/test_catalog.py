@@ -0,0 +1,205 @@
+"""Tests for the local catalog replica."""
+
+import hashlib
+import json
+import time
+from typing import Dict, List
+
+import pytest
+import respx
+import httpx
+from connectors import (
+    CatalogReplica,
+    Connectors,
+    ConnectorsError,
+    ConnectorsSync,
+    ReplicaOptions,
+    ToolListFilters,
+)
+from connectors.codec import JSONCodec
+
+LIST_URL = "http://localhost:3000/api/v1/tools/list"
+INTEGRATIONS_URL = "http://localhost:3000/api/v1/mcp/integrations"
+
+
+def tool(i: int, integration: str = "github", description: str = "") -> Dict[str, object]:
+    return {
+        "toolId": f"{integration}.action{i}",
+        "name": f"Action {i}",
+        "description": description or f"Does thing {i}",
+        "integration": integration,
+        "category": "code" if integration == "github" else "communication",
+    }
+
+
+class Gateway:
+    """Fake gateway serving a mutable catalog with ETags."""
+
+    def __init__(self, tools: List[Dict[str, object]]) -> None:
+        self.tools = tools
+        self.integrations = [{"name": "github", "category": "code", "toolCount": 1}]
+        self.requests: List[httpx.Request] = []
+        self.fail = False
+
+    def respond(self, request: httpx.Request, body: Dict[str, object]) -> httpx.Response:
+        self.requests.append(request)
+        if self.fail:
+            return httpx.Response(503, text="down")
+        content = json.dumps(body).encode()
+        etag = f'W/"{hashlib.sha1(content).hexdigest()}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, content=content, headers={"ETag": etag})
+
+    def list_tools(self, request: httpx.Request) -> httpx.Response:
+        limit = int(request.url.params["limit"])
+        offset = int(request.url.params["offset"])
+        return self.respond(request, {"tools": self.tools[offset : offset + limit]})
+
+    def list_integrations(self, request: httpx.Request) -> httpx.Response:
+        return self.respond(request, {"integrations": self.integrations})
+
+    def mock(self) -> None:
+        respx.get(LIST_URL).mock(side_effect=self.list_tools)
+        respx.get(INTEGRATIONS_URL).mock(side_effect=self.list_integrations)
+
+
+def replica_options(**kwargs: object) -> ReplicaOptions:
+    return ReplicaOptions(enabled=True, page_size=2, **kwargs)
+
+
+class TestCatalogReplica:
+    """Test the SQLite store."""
+
+    def test_replace_page_diffs_rows(self) -> None:
+        """Test only changed rows are counted as added, updated or removed."""
+        replica = CatalogReplica()
+        codec = JSONCodec()
+
+        assert replica.replace_page(1, [tool(1), tool(2)], codec, "tools:2:1", '"a"') == (2, 0, 0)
+        assert replica.replace_page(1, [tool(1), tool(2)], codec, "tools:2:1", '"a"') == (0, 0, 0)
+        changed = [tool(1, description="new"), tool(3)]
+        assert replica.replace_page(1, changed, codec, "tools:2:1", '"b"') == (1, 1, 1)
+        assert replica.etag("tools:2:1") == '"b"'
+
+    def test_filters(self) -> None:
+        """Test local filtering and pagination follow gateway order."""
+        replica = CatalogReplica()
+        tools = [tool(1), tool(2, "slack"), tool(3, description="Open a Pull Request"), tool(4)]
+        replica.replace_page(1, tools, JSONCodec(), "tools:4:1", None)
+
+        def ids(**filters: object) -> List[str]:
+            return [json.loads(raw)["toolId"] for raw in replica.tools(ToolListFilters(**filters))]
+
+        assert ids(integration="github") == ["github.action1", "github.action3", "github.action4"]
+        assert ids(category="communication") == ["slack.action2"]
+        assert ids(search="pull request") == ["github.action3"]
+        assert ids(page=2, limit=3) == ["github.action4"]
+
+
+class TestCatalogSync:
+    """Test syncing and reading through the clients."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_initial_sync_then_local_reads(self) -> None:
+        """Test a cold replica syncs once and then serves reads locally."""
+        gateway = Gateway([tool(i) for i in range(3)])
+        gateway.mock()
+        connectors = Connectors(base_url="http://localhost:3000", replica=replica_options())
+
+        tools = await connectors.tools.list(ToolListFilters(integration="github"))
+        integrations = await connectors.mcp.list()
+        server_tools = await connectors.mcp.get("github").list_tools()
+
+        assert [t.tool_id for t in tools] == ["github.action0", "github.action1", "github.action2"]
+        assert integrations[0].tool_count == 1
+        assert len(server_tools) == 3
+        # Two tools pages (the second one short) and the integrations list
+        assert len(gateway.requests) == 3
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_delta_sync(self) -> None:
+        """Test unchanged pages answer 304 and only changes are applied."""
+        gateway = Gateway([tool(i) for i in range(5)])
+        gateway.mock()
+        connectors = Connectors(base_url="http://localhost:3000", replica=replica_options())
+        await connectors.catalog.sync()
+
+        gateway.tools = [tool(0), tool(1), tool(2, description="changed"), tool(3)]
+        result = await connectors.catalog.sync()
+
+        assert (result.pages, result.pages_unchanged) == (3, 1)
+        assert (result.tools_added, result.tools_updated, result.tools_removed) == (0, 1, 1)
+        assert result.integrations_changed is False
+        assert "If-None-Match" in gateway.requests[-1].headers
+        tools = await connectors.tools.list()
+        assert [t.description for t in tools][2] == "changed"
+        assert len(tools) == 4
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_serves_stale_when_gateway_down(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the last snapshot is served when a refresh fails."""
+        gateway = Gateway([tool(1)])
+        gateway.mock()
+        connectors = Connectors(
+            base_url="http://localhost:3000", replica=replica_options(max_staleness=1)
+        )
+        monkeypatch.setattr(connectors._http_client, "_calculate_backoff", lambda *args: 0)
+        await connectors.catalog.sync()
+        # Step the replica's clock past max_staleness rather than sleeping
+        synced = time.time()
+        monkeypatch.setattr("connectors.catalog.time.time", lambda: synced + 1)
+        gateway.fail = True
+
+        tools = await connectors.tools.list()
+
+        assert [t.tool_id for t in tools] == ["github.action1"]
+        assert not connectors.catalog.is_fresh()
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_cold_replica_raises_when_gateway_down(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a replica that never synced surfaces the error."""
+        gateway = Gateway([])
+        gateway.fail = True
+        gateway.mock()
+        connectors = Connectors(base_url="http://localhost:3000", replica=replica_options())
+        monkeypatch.setattr(connectors._http_client, "_calculate_backoff", lambda *args: 0)
+
+        with pytest.raises(ConnectorsError):
+            await connectors.tools.list()
+        await connectors.aclose()
+
+    @respx.mock
+    def test_snapshot_survives_restart(self, tmp_path: object) -> None:
+        """Test a new client reads a fresh on-disk snapshot without refetching."""
+        gateway = Gateway([tool(i) for i in range(3)])
+        gateway.mock()
+        options = replica_options(path=str(tmp_path / "catalog.db"))  # type: ignore[operator]
+
+        first = ConnectorsSync(base_url="http://localhost:3000", replica=options)
+        first.catalog.sync()
+        first.close()
+        requests = len(gateway.requests)
+
+        second = ConnectorsSync(base_url="http://localhost:3000", replica=options)
+        tools = second.mcp.get("github").list_tools()
+
+        assert len(tools) == 3
+        assert len(gateway.requests) == requests
+        second.close()
+
+    def test_catalog_requires_replica(self) -> None:
+        """Test the catalog API is only available when enabled."""
+        connectors = ConnectorsSync(base_url="http://localhost:3000")
+
+        with pytest.raises(ConnectorsError):
+            connectors.catalog
@@ -0,0 +1,229 @@
+"""Tests for per-integration circuit breakers."""
+
+import asyncio
+import time
+
+import pytest
+import respx
+import httpx
+from connectors import Connectors, ConnectorsSync
+from connectors.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, CircuitState
+from connectors.types import CircuitBreakerOptions, ConcurrencyOptions
+from connectors.errors import (
+    CircuitOpenError,
+    ConcurrencyLimitError,
+    DeadlineExceededError,
+    HTTPError,
+    RateLimitError,
+    TimeoutError,
+    ValidationError,
+)
+
+
+def make_breaker(**kwargs: object) -> CircuitBreaker:
+    options = {"failure_threshold": 3, "reset_timeout": 1000, **kwargs}
+    return CircuitBreaker("github", CircuitBreakerOptions(**options))
+
+
+def server_error() -> HTTPError:
+    return HTTPError("HTTP 502", status_code=502)
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state machine."""
+
+    def test_opens_after_threshold(self) -> None:
+        """Test the circuit opens after consecutive failures and fails fast."""
+        breaker = make_breaker()
+        for _ in range(3):
+            breaker.before_call()
+            breaker.record_error(server_error())
+
+        assert breaker.state == CircuitState.OPEN
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_call()
+
+        assert exc_info.value.integration == "github"
+        assert exc_info.value.retry_in > 0
+        assert breaker.stats().rejected == 1
+
+    def test_client_errors_do_not_count(self) -> None:
+        """Test 4xx responses and rate limiting leave the circuit closed."""
+        breaker = make_breaker()
+        for status in (400, 404, 429, 429, 429):
+            breaker.record_error(HTTPError("client error", status_code=status))
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_client_side_timeouts_do_not_count(self) -> None:
+        """Test waits for client-side slots or a spent deadline leave the circuit closed."""
+        breaker = make_breaker()
+        for error in (
+            ConcurrencyLimitError("queue full", route="POST /api/v1/tools/invoke", limit=1),
+            RateLimitError("paced", key="- POST /api/v1/tools/invoke", retry_in=5),
+            DeadlineExceededError("Deadline exceeded before the request could be sent"),
+        ):
+            breaker.record_error(error)
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.stats().failures == 0
+
+    def test_success_resets_failures(self) -> None:
+        """Test a success in the closed state clears the failure count."""
+        breaker = make_breaker()
+        breaker.record_error(server_error())
+        breaker.record_error(TimeoutError("timeout", cause=httpx.ReadTimeout("timed out")))
+        breaker.record_success()
+
+        breaker.record_error(server_error())
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.stats().failures == 1
+
+    def test_failure_window_expires(self) -> None:
+        """Test failures older than the window are forgotten."""
+        breaker = make_breaker(window_duration=10)
+        breaker.record_error(server_error())
+        breaker.record_error(server_error())
+        time.sleep(0.02)
+
+        breaker.record_error(server_error())
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_probe_closes_circuit(self) -> None:
+        """Test enough successful probes close the circuit again."""
+        breaker = make_breaker(failure_threshold=1, reset_timeout=10, success_threshold=2)
+        breaker.record_error(server_error())
+        time.sleep(0.02)
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_success()
+        breaker.before_call()
+        breaker.record_success()
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_failure_reopens(self) -> None:
+        """Test a failed probe reopens the circuit."""
+        breaker = make_breaker(failure_threshold=1, reset_timeout=10)
+        breaker.record_error(server_error())
+        time.sleep(0.02)
+        breaker.before_call()
+
+        breaker.record_error(server_error())
+
+        assert breaker.stats().state == "open"
+
+    def test_cancelled_probe_frees_slot(self) -> None:
+        """Test a cancelled probe does not hold the half-open slot."""
+        breaker = make_breaker(failure_threshold=1, reset_timeout=10)
+        breaker.record_error(server_error())
+        time.sleep(0.02)
+        breaker.before_call()
+
+        breaker.record_error(asyncio.CancelledError())
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        breaker.before_call()
+
+    def test_registry_disabled(self) -> None:
+        """Test no breaker is returned when breakers are disabled."""
+        registry = CircuitBreakerRegistry(CircuitBreakerOptions(enabled=False))
+
+        assert registry.get("github") is None
+
+
+class TestClientCircuitBreaker:
+    """Test circuit breakers through the clients."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_invoke_fails_fast_per_integration(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a failing integration trips its circuit without affecting others."""
+        connectors = Connectors(
+            base_url="http://localhost:3000",
+            max_retries=0,
+            circuit_breaker=CircuitBreakerOptions(failure_threshold=2),
+        )
+
+        def invoke(request: httpx.Request) -> httpx.Response:
+            if b'"integration":"github"' in request.content.replace(b" ", b""):
+                return httpx.Response(503, json={"error": "down"})
+            return httpx.Response(200, json={"success": True})
+
+        route = respx.post("http://localhost:3000/api/v1/tools/invoke").mock(side_effect=invoke)
+
+        for _ in range(2):
+            with pytest.raises(HTTPError):
+                await connectors.tools.invoke("github.getUser", {})
+        with pytest.raises(CircuitOpenError):
+            await connectors.mcp.get("github").call("getUser", {})
+        result = await connectors.tools.invoke("slack.sendMessage", {})
+
+        assert result.success is True
+        assert route.call_count == 3
+        assert connectors.circuit_stats["github"].state == "open"
+        assert connectors.circuit_stats["slack"].state == "closed"
+
+        connectors.reset_circuit("github")
+        assert connectors.circuit_stats["github"].state == "closed"
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_concurrency_rejections_keep_circuit_closed(self) -> None:
+        """Test calls rejected by the concurrency limiter do not trip a healthy circuit."""
+        connectors = Connectors(
+            base_url="http://localhost:3000",
+            circuit_breaker=CircuitBreakerOptions(failure_threshold=5),
+            concurrency=ConcurrencyOptions(
+                enabled=True, initial_limit=1, min_limit=1, max_limit=1, queue_timeout=50
+            ),
+        )
+
+        async def invoke(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.3)
+            return httpx.Response(200, json={"success": True})
+
+        route = respx.post("http://localhost:3000/api/v1/tools/invoke").mock(side_effect=invoke)
+
+        results = await asyncio.gather(
+            *(connectors.tools.invoke("github.getUser", {}) for _ in range(8)),
+            return_exceptions=True,
+        )
+        result = await connectors.tools.invoke("github.getUser", {})
+
+        assert sum(isinstance(r, ConcurrencyLimitError) for r in results) == 7
+        assert result.success is True and route.call_count == 2
+        assert connectors.circuit_stats["github"].state == "closed"
+        await connectors.aclose()
+
+    @respx.mock
+    def test_sync_client_shares_breaker_semantics(self) -> None:
+        """Test the sync client trips the circuit the same way."""
+        client = ConnectorsSync(
+            base_url="http://localhost:3000",
+            max_retries=0,
+            circuit_breaker=CircuitBreakerOptions(failure_threshold=1),
+        )
+        respx.post("http://localhost:3000/api/v1/tools/invoke").mock(
+            return_value=httpx.Response(500, json={"error": "boom"})
+        )
+
+        with pytest.raises(HTTPError):
+            client.tools.invoke("github.getUser", {})
+        with pytest.raises(CircuitOpenError):
+            client.mcp.get("github").call("getUser", {})
+        client.close()
+
+    def test_invalid_options(self) -> None:
+        """Test invalid breaker options are rejected."""
+        with pytest.raises(ValidationError):
+            Connectors(
+                base_url="http://localhost:3000",
+                circuit_breaker=CircuitBreakerOptions(failure_threshold=0),
+            )
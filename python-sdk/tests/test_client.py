@@ -4,6 +4,7 @@ import pytest
 import respx
 import httpx
 from connectors import Connectors
+from connectors.types import PoolOptions
 from connectors.errors import ValidationError, HTTPError
 
 
@@ -60,6 +61,13 @@ class TestConnectorsClient:
 
         assert "timeout must be positive" in str(exc_info.value)
 
+    def test_initialization_invalid_pool(self, base_url: str) -> None:
+        """Test initialization fails with invalid pool options."""
+        with pytest.raises(ValidationError) as exc_info:
+            Connectors(base_url=base_url, pool=PoolOptions(max_connections=0))
+
+        assert "pool.max_connections must be positive" in str(exc_info.value)
+
     def test_initialization_invalid_max_retries(self, base_url: str) -> None:
         """Test initialization fails with invalid max_retries."""
         with pytest.raises(ValidationError) as exc_info:
@@ -151,6 +159,20 @@ class TestConnectorsClient:
 
         assert result is False
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_async_context_manager(self, base_url: str) -> None:
+        """Test client closes its connection pool on context exit."""
+        respx.get("http://localhost:3000/health").mock(
+            return_value=httpx.Response(200, json={"status": "healthy"})
+        )
+
+        async with Connectors(base_url=base_url) as client:
+            await client.health()
+            pool = client._http_client.client
+
+        assert pool.is_closed
+
     def test_custom_headers(self, base_url: str) -> None:
         """Test custom headers are set correctly."""
         client = Connectors(
@@ -0,0 +1,145 @@
+"""Tests for pluggable JSON codecs."""
+
+import json
+from typing import Any, List
+
+import pytest
+import respx
+import httpx
+from pydantic import TypeAdapter
+from connectors import Connectors, JSONCodec, OrjsonCodec, Tool
+from connectors.types import ConnectorsConfig
+from connectors.http_client import HTTPClient
+
+
+class RecordingCodec(JSONCodec):
+    """JSON codec that records what it encodes and decodes."""
+
+    name = "recording"
+
+    def __init__(self) -> None:
+        self.encoded: List[Any] = []
+        self.decoded = 0
+
+    def encode(self, data: Any) -> bytes:
+        self.encoded.append(data)
+        return super().encode(data)
+
+    def decode(self, content: bytes) -> Any:
+        self.decoded += 1
+        return super().decode(content)
+
+
+TOOL = {
+    "toolId": "github.createPullRequest",
+    "name": "Create Pull Request",
+    "description": "Create a PR",
+    "integration": "github",
+    "category": "code",
+}
+
+
+class TestCodecs:
+    """Test codec implementations."""
+
+    def test_json_codec_round_trip(self) -> None:
+        """Test the stdlib codec emits compact UTF-8 JSON."""
+        codec = JSONCodec()
+
+        encoded = codec.encode({"query": "créer une PR", "n": 1})
+
+        assert encoded == '{"query":"créer une PR","n":1}'.encode()
+        assert codec.decode(encoded) == {"query": "créer une PR", "n": 1}
+
+    def test_orjson_codec_round_trip(self) -> None:
+        """Test the orjson codec matches stdlib output."""
+        pytest.importorskip("orjson")
+        codec = OrjsonCodec()
+        data = {"query": "créer une PR", "values": [1, 2.5, None, True]}
+
+        assert json.loads(codec.encode(data)) == data
+        assert codec.decode(JSONCodec().encode(data)) == data
+
+
+class TestClientCodec:
+    """Test codec use in the HTTP client."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_request_body_encoded_by_codec(self) -> None:
+        """Test request bodies are encoded once by the configured codec."""
+        codec = RecordingCodec()
+        connectors = Connectors(base_url="http://localhost:3000", codec=codec)
+        route = respx.post("http://localhost:3000/api/v1/tools/invoke").mock(
+            return_value=httpx.Response(200, json={"success": True, "data": {"n": 1}})
+        )
+
+        result = await connectors.tools.invoke("github.getUser", {"username": "octocat"})
+
+        assert result.data == {"n": 1}
+        assert codec.encoded[0]["parameters"] == {"username": "octocat"}
+        assert json.loads(route.calls[0].request.content)["toolId"] == "github.getUser"
+        assert route.calls[0].request.headers["Content-Type"] == "application/json"
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_typed_response_bypasses_codec(self) -> None:
+        """Test model responses are validated from bytes, not through the codec."""
+        codec = RecordingCodec()
+        connectors = Connectors(base_url="http://localhost:3000", codec=codec)
+        respx.get("http://localhost:3000/api/v1/tools/list").mock(
+            return_value=httpx.Response(200, json={"tools": [TOOL]})
+        )
+
+        tools = await connectors.tools.list()
+
+        assert tools[0].tool_id == "github.createPullRequest"
+        assert codec.decoded == 0
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_untyped_response_decoded_by_codec(self) -> None:
+        """Test dict responses go through the codec."""
+        codec = RecordingCodec()
+        connectors = Connectors(base_url="http://localhost:3000", codec=codec)
+        respx.post("http://localhost:3000/api/v1/tools/invoke").mock(
+            return_value=httpx.Response(200, json={"success": True})
+        )
+
+        result = await connectors.mcp.get("github").call("getUser", {})
+
+        assert result == {"success": True}
+        assert codec.decoded == 1
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_type_adapter_response(self) -> None:
+        """Test TypeAdapter response types are validated from bytes."""
+        client = HTTPClient(ConnectorsConfig(base_url="http://localhost:3000"))
+        respx.get("http://localhost:3000/tools").mock(return_value=httpx.Response(200, json=[TOOL]))
+
+        tools = await client.get("/tools", TypeAdapter(List[Tool]))
+
+        assert tools[0].tool_id == "github.createPullRequest"
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_tool_list_envelope(self) -> None:
+        """Test tool lists are parsed, with a missing "tools" key giving no tools."""
+        connectors = Connectors(base_url="http://localhost:3000")
+        respx.get("http://localhost:3000/api/v1/tools/list").mock(
+            side_effect=[
+                httpx.Response(200, json={"tools": [TOOL], "total": 1}),
+                httpx.Response(200, json={}),
+            ]
+        )
+
+        assert [tool.tool_id for tool in await connectors.tools.list()] == [
+            "github.createPullRequest"
+        ]
+        assert await connectors.tools.list() == []
+        await connectors.aclose()
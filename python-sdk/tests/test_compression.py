@@ -0,0 +1,184 @@
+"""Tests for request and response body compression."""
+
+import gzip
+import io
+import json
+from typing import Any, Dict
+
+import pytest
+import respx
+import httpx
+from connectors import (
+    CompressionOptions,
+    Connectors,
+    ConnectorsSync,
+    InvokeOptions,
+    ValidationError,
+)
+from connectors.compression import Compressor, available_encodings
+
+SELECT_URL = "http://localhost:3000/api/v1/tools/select"
+INVOKE_URL = "http://localhost:3000/api/v1/tools/invoke"
+OK = {"success": True}
+ROWS = [[i, f"customer {i}", "active"] for i in range(500)]
+
+
+def received(request: httpx.Request) -> Dict[str, Any]:
+    """Decode a request body as the gateway would."""
+    content = request.content
+    if request.headers.get("content-encoding") == "gzip":
+        content = gzip.decompress(content)
+    return json.loads(content)
+
+
+def gzipped(data: Any) -> httpx.Response:
+    """Build a gzip-encoded JSON response."""
+    return httpx.Response(
+        200,
+        headers={"content-type": "application/json", "content-encoding": "gzip"},
+        content=gzip.compress(json.dumps(data).encode()),
+    )
+
+
+class TestCompression:
+    """Test compression of request bodies and negotiation of response encodings."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_large_bodies_compressed(self) -> None:
+        """Test bodies over min_size are gzipped, smaller ones are sent as is."""
+        route = respx.post(INVOKE_URL).mock(return_value=httpx.Response(200, json=OK))
+        connectors = Connectors(
+            base_url="http://localhost:3000", compression=CompressionOptions(enabled=True)
+        )
+
+        await connectors.tools.invoke("sheets.appendRows", {"values": ROWS})
+        await connectors.tools.invoke("sheets.appendRows", {"values": ROWS[:1]})
+
+        large, small = (call.request for call in route.calls)
+        assert large.headers["content-encoding"] == "gzip"
+        assert received(large)["parameters"]["values"] == ROWS
+        assert "content-encoding" not in small.headers
+        assert received(small)["parameters"]["values"] == ROWS[:1]
+        assert "gzip" in large.headers["accept-encoding"]
+
+        stats = connectors.compression_stats
+        assert stats.requests == 2 and stats.requests_compressed == 1
+        assert stats.request_bytes_sent < stats.request_bytes / 4
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_compressed_responses_counted(self) -> None:
+        """Test compressed responses are decoded, and counted even when disabled."""
+        tools = [
+            {
+                "toolId": f"github.action{i}",
+                "name": f"action{i}",
+                "description": "Does a thing on a repository",
+                "integration": "github",
+                "category": "code",
+            }
+            for i in range(200)
+        ]
+        respx.post(SELECT_URL).mock(return_value=gzipped({"tools": tools}))
+        connectors = Connectors(base_url="http://localhost:3000")
+
+        selected = await connectors.tools.select("repository actions")
+
+        stats = connectors.compression_stats
+        assert len(selected) == 200
+        assert stats.requests == 1 and stats.requests_compressed == 0
+        assert stats.responses == 1 and stats.responses_compressed == 1
+        assert stats.response_bytes_received < stats.response_bytes / 4
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_route_policy(self) -> None:
+        """Test routes can opt out of compression both ways."""
+        invoke = respx.post(INVOKE_URL).mock(return_value=httpx.Response(200, json=OK))
+        select = respx.post(SELECT_URL).mock(return_value=httpx.Response(200, json={"tools": []}))
+        connectors = Connectors(
+            base_url="http://localhost:3000",
+            compression=CompressionOptions(
+                enabled=True,
+                accept=["gzip"],
+                routes={"POST /api/v1/tools/invoke": "identity"},
+            ),
+        )
+
+        await connectors.tools.invoke("sheets.appendRows", {"values": ROWS})
+        await connectors.tools.select("find " * 400)
+
+        assert "content-encoding" not in invoke.calls[0].request.headers
+        assert invoke.calls[0].request.headers["accept-encoding"] == "identity"
+        assert select.calls[0].request.headers["content-encoding"] == "gzip"
+        assert select.calls[0].request.headers["accept-encoding"] == "gzip"
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_streamed_bodies_use_policy(self) -> None:
+        """Test streamed uploads are compressed with the configured algorithm and counted."""
+        route = respx.post(INVOKE_URL).mock(return_value=httpx.Response(200, json=OK))
+        connectors = Connectors(
+            base_url="http://localhost:3000", compression=CompressionOptions(enabled=True)
+        )
+
+        await connectors.tools.invoke("drive.upload", {"content": io.BytesIO(b"a" * 100_000)})
+
+        request = route.calls[0].request
+        assert request.headers["content-encoding"] == "gzip"
+        assert len(received(request)["parameters"]["content"]) == 133_336
+        stats = connectors.compression_stats
+        assert stats.requests_compressed == 1
+        assert stats.request_bytes > 133_336 > 10 * stats.request_bytes_sent
+        await connectors.aclose()
+
+    @pytest.mark.parametrize("encoding", ["br", "zstd"])
+    def test_other_encodings(self, encoding: str) -> None:
+        """Test brotli and zstd compress when their packages are installed."""
+        if encoding not in available_encodings():
+            with pytest.raises(ValidationError):
+                Connectors(
+                    base_url="http://localhost:3000",
+                    compression=CompressionOptions(enabled=True, algorithm=encoding),
+                )
+            return
+        compressor = Compressor(encoding)
+        body = json.dumps(ROWS).encode()
+
+        assert len(compressor.compress(body) + compressor.flush()) < len(body) / 4
+
+    def test_invalid_options(self) -> None:
+        """Test unknown encodings and bad sizes are rejected."""
+        for options in (
+            CompressionOptions(enabled=True, algorithm="lzma"),
+            CompressionOptions(enabled=True, min_size=-1),
+            CompressionOptions(enabled=True, level=42),
+            CompressionOptions(enabled=True, accept=["snappy"]),
+            CompressionOptions(enabled=True, routes={"GET /api/v1/tools/list": "lz4"}),
+        ):
+            with pytest.raises(ValidationError):
+                Connectors(base_url="http://localhost:3000", compression=options)
+
+    @respx.mock
+    def test_sync_client(self) -> None:
+        """Test the sync client compresses and counts the same way."""
+        route = respx.post(INVOKE_URL).mock(return_value=gzipped({"success": True, "data": ROWS}))
+        with ConnectorsSync(
+            base_url="http://localhost:3000",
+            compression=CompressionOptions(enabled=True, min_size=0),
+        ) as connectors:
+            result = connectors.tools.invoke("sheets.read", {"range": "A1"})
+            connectors.tools.invoke("sheets.read", {"range": "A1"}, InvokeOptions(compress=True))
+            stats = connectors.compression_stats
+
+        tiny, forced = (call.request for call in route.calls)
+        assert result.data == ROWS
+        # Compressing a tiny body would make it larger, unless asked for
+        assert "content-encoding" not in tiny.headers
+        assert forced.headers["content-encoding"] == "gzip"
+        assert received(forced)["parameters"] == {"range": "A1"}
+        assert stats.responses == 2 and stats.responses_compressed == 2
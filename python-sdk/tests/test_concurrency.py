@@ -0,0 +1,150 @@
+"""Tests for adaptive concurrency limiting."""
+
+import asyncio
+
+import pytest
+import respx
+import httpx
+from connectors import Connectors
+from connectors.concurrency import AdaptiveLimiter, ConcurrencyLimiter
+from connectors.types import ConcurrencyOptions
+from connectors.errors import ConcurrencyLimitError
+
+
+def make_limiter(**kwargs: object) -> AdaptiveLimiter:
+    return AdaptiveLimiter("POST /api/v1/tools/invoke", ConcurrencyOptions(**kwargs))
+
+
+class TestAdaptiveLimiter:
+    """Test AIMD limiter behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_requests_over_limit_queue(self) -> None:
+        """Test requests beyond the limit wait for a free slot."""
+        limiter = make_limiter(initial_limit=1)
+        await limiter.acquire()
+
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+
+        assert not waiter.done()
+        assert limiter.queued == 1
+
+        limiter.release(0.01, False)
+        await waiter
+
+        assert limiter.in_flight == 1
+        assert limiter.queued == 0
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout(self) -> None:
+        """Test queued requests fail fast once their deadline passes."""
+        limiter = make_limiter(initial_limit=1)
+        await limiter.acquire()
+
+        with pytest.raises(ConcurrencyLimitError) as exc_info:
+            await limiter.acquire(timeout=0.01)
+
+        assert exc_info.value.route == "POST /api/v1/tools/invoke"
+        assert limiter.stats().rejected == 1
+        assert limiter.queued == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self) -> None:
+        """Test cancelling a queued request leaves the limiter consistent."""
+        limiter = make_limiter(initial_limit=1)
+        await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release(0.01, None)
+
+        assert limiter.in_flight == 0
+        await limiter.acquire(timeout=0.01)
+
+    @pytest.mark.asyncio
+    async def test_multiplicative_decrease_on_overload(self) -> None:
+        """Test overload signals shrink the limit."""
+        limiter = make_limiter(initial_limit=20, backoff_ratio=0.5)
+        await limiter.acquire()
+
+        limiter.release(0.01, True)
+
+        assert limiter.stats().limit == 10
+
+    @pytest.mark.asyncio
+    async def test_additive_increase_when_saturated(self) -> None:
+        """Test healthy saturated traffic grows the limit."""
+        limiter = make_limiter(initial_limit=2)
+        for _ in range(2):
+            await limiter.acquire()
+        for _ in range(2):
+            limiter.release(0.01, False)
+
+        assert limiter.limit > 2
+
+    @pytest.mark.asyncio
+    async def test_latency_tolerance(self) -> None:
+        """Test slow responses count as overload when latency tolerance is set."""
+        limiter = make_limiter(initial_limit=10, latency_tolerance=2.0, backoff_ratio=0.5)
+        await limiter.acquire()
+        limiter.release(0.1, False)
+        await limiter.acquire()
+
+        limiter.release(1.0, False)
+
+        assert limiter.limit < 10
+
+    def test_registry_disabled(self) -> None:
+        """Test no limiter is returned when limiting is disabled."""
+        registry = ConcurrencyLimiter(ConcurrencyOptions())
+
+        assert registry.get("GET", "/api/v1/tools/list") is None
+
+    def test_registry_keys_by_route(self) -> None:
+        """Test limiters are shared per method and path, ignoring the query."""
+        registry = ConcurrencyLimiter(ConcurrencyOptions(enabled=True))
+
+        first = registry.get("GET", "/api/v1/tools/list?integration=github")
+
+        assert registry.get("GET", "/api/v1/tools/list") is first
+        assert registry.get("POST", "/api/v1/tools/select") is not first
+
+
+class TestClientConcurrency:
+    """Test concurrency limiting through the client."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_in_flight_bounded_per_route(self) -> None:
+        """Test concurrent invokes never exceed the route limit."""
+        connectors = Connectors(
+            base_url="http://localhost:3000",
+            concurrency=ConcurrencyOptions(enabled=True, initial_limit=2, max_limit=2),
+        )
+        in_flight = 0
+        peak = 0
+
+        async def slow_invoke(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"success": True})
+
+        respx.post("http://localhost:3000/api/v1/tools/invoke").mock(side_effect=slow_invoke)
+
+        results = await asyncio.gather(
+            *(connectors.tools.invoke("github.getUser", {}) for _ in range(6))
+        )
+
+        assert all(result.success for result in results)
+        assert peak == 2
+        stats = connectors.concurrency_stats["POST /api/v1/tools/invoke"]
+        assert stats.in_flight == 0
+        assert stats.limit == 2
+        await connectors.aclose()
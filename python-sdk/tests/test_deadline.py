@@ -0,0 +1,109 @@
+"""Tests for total call deadlines."""
+
+import asyncio
+
+import pytest
+import respx
+import httpx
+from connectors import Connectors, ConnectorsSync
+from connectors.errors import DeadlineExceededError, HTTPError, TimeoutError, ValidationError
+from connectors.http_client import DEADLINE_HEADER
+
+
+class TestDeadline:
+    """Test deadlines spanning retries."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_deadline_clips_slow_attempt(self) -> None:
+        """Test a slow attempt is cut off at the call deadline and not retried."""
+        connectors = Connectors(base_url="http://localhost:3000", max_retries=3)
+        calls = 0
+
+        async def slow_invoke(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(5)
+            return httpx.Response(200, json={"success": True})
+
+        respx.post("http://localhost:3000/api/v1/tools/invoke").mock(side_effect=slow_invoke)
+
+        with pytest.raises(DeadlineExceededError) as exc_info:
+            await asyncio.wait_for(
+                connectors.tools.invoke("github.getUser", {}, deadline=50), timeout=2
+            )
+
+        assert isinstance(exc_info.value, TimeoutError)
+        assert calls == 1
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_no_retry_past_deadline(self) -> None:
+        """Test retries whose backoff would overrun the deadline are skipped."""
+        connectors = Connectors(base_url="http://localhost:3000", deadline=500)
+        route = respx.post("http://localhost:3000/api/v1/tools/invoke").mock(
+            return_value=httpx.Response(503, json={"error": "unavailable"})
+        )
+
+        with pytest.raises(HTTPError):
+            await connectors.tools.invoke("github.getUser", {})
+
+        # Exponential backoff starts at 1s, beyond the 500ms deadline
+        assert route.call_count == 1
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_retries_within_deadline(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test retries still happen while the deadline allows."""
+        connectors = Connectors(base_url="http://localhost:3000", deadline=5000)
+        monkeypatch.setattr(connectors._http_client, "_calculate_backoff", lambda *args: 0)
+        route = respx.post("http://localhost:3000/api/v1/tools/invoke").mock(
+            side_effect=[
+                httpx.Response(503, json={"error": "unavailable"}),
+                httpx.Response(200, json={"success": True}),
+            ]
+        )
+
+        result = await connectors.tools.invoke("github.getUser", {})
+
+        assert result.success is True
+        assert route.call_count == 2
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_deadline_header_propagated(self) -> None:
+        """Test the remaining budget is sent to the gateway."""
+        connectors = Connectors(base_url="http://localhost:3000")
+        route = respx.post("http://localhost:3000/api/v1/tools/invoke").mock(
+            return_value=httpx.Response(200, json={"success": True})
+        )
+
+        await connectors.tools.invoke("github.getUser", {}, deadline=2000)
+        await connectors.tools.invoke("github.getUser", {})
+
+        sent = route.calls[0].request.headers[DEADLINE_HEADER]
+        assert 0 < int(sent) <= 2000
+        assert DEADLINE_HEADER not in route.calls[1].request.headers
+        await connectors.aclose()
+
+    @respx.mock
+    def test_sync_deadline(self) -> None:
+        """Test the sync client honours per-call deadlines."""
+        client = ConnectorsSync(base_url="http://localhost:3000")
+        route = respx.post("http://localhost:3000/api/v1/tools/invoke").mock(
+            side_effect=httpx.ReadTimeout("timed out")
+        )
+
+        with pytest.raises(DeadlineExceededError):
+            client.mcp.get("github").call("getUser", {}, deadline=100)
+
+        assert route.call_count == 1
+        client.close()
+
+    def test_invalid_deadline(self) -> None:
+        """Test a non-positive default deadline is rejected."""
+        with pytest.raises(ValidationError):
+            Connectors(base_url="http://localhost:3000", deadline=0)
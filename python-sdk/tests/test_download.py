@@ -0,0 +1,213 @@
+"""Tests for downloading binary tool results to files."""
+
+import base64
+import io
+import json
+import os
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List
+
+import pytest
+import respx
+import httpx
+from connectors import Connectors, ConnectorsError, ConnectorsSync, DownloadResult, HTTPError
+from connectors.streaming import Base64FieldDecoder
+
+INVOKE_URL = "http://localhost:3000/api/v1/tools/invoke"
+FILE = os.urandom(200_003)
+JSON = {"content-type": "application/json"}
+
+
+def chunks(body: bytes, size: int) -> Iterator[bytes]:
+    for i in range(0, len(body), size):
+        yield body[i : i + size]
+
+
+async def achunks(body: bytes, size: int) -> AsyncIterator[bytes]:
+    for chunk in chunks(body, size):
+        yield chunk
+
+
+def export_result(contents: bytes = FILE, **data: Any) -> Dict[str, Any]:
+    """Build a Drive-style export result with base64 contents."""
+    return {
+        "success": True,
+        "data": {
+            "name": 'Q3 "final" report.pdf',
+            "mimeType": "application/pdf",
+            "content": base64.b64encode(contents).decode(),
+            **data,
+        },
+        "executionTimeMs": 42,
+    }
+
+
+def decode(body: bytes, size: int, keys: List[str]) -> tuple:
+    decoder = Base64FieldDecoder(keys)
+    contents = b"".join(piece for chunk in chunks(body, size) for piece in decoder.feed(chunk))
+    return contents, json.loads(decoder.close()), decoder.field
+
+
+class TestBase64FieldDecoder:
+    """Test decoding a base64 field out of a JSON body."""
+
+    @pytest.mark.parametrize("size", [1, 5, 4096, 10_000_000])
+    def test_any_chunking(self, size: int) -> None:
+        """Test the field is decoded whatever the chunk boundaries, the rest kept."""
+        body = json.dumps(export_result(notes="after \\ the content")).encode()
+
+        contents, rest, field = decode(body, size, ["content"])
+
+        assert contents == FILE
+        assert field == "content"
+        assert rest["data"]["content"] is None
+        assert rest["data"]["name"] == 'Q3 "final" report.pdf'
+        assert rest["data"]["notes"] == "after \\ the content"
+
+    def test_urlsafe_and_escaped(self) -> None:
+        """Test unpadded URL-safe base64 and escaped slashes decode the same."""
+        urlsafe = base64.urlsafe_b64encode(FILE).rstrip(b"=").decode()
+        escaped = json.dumps({"data": base64.b64encode(FILE).decode()}).replace("/", "\\/")
+
+        assert decode(json.dumps({"data": urlsafe}).encode(), 999, ["data"])[0] == FILE
+        assert decode(escaped.encode(), 999, ["data"])[0] == FILE
+
+    def test_buffer_stays_bounded(self) -> None:
+        """Test only a small tail of the field is held while decoding."""
+        decoder = Base64FieldDecoder(["content"])
+        peak = 0
+        for chunk in chunks(json.dumps(export_result()).encode(), 4096):
+            decoder.feed(chunk)
+            peak = max(peak, len(decoder._buffer) + len(decoder._pending))
+
+        assert peak < 2 * 4096
+
+    def test_text_and_other_keys_left_alone(self) -> None:
+        """Test only base64 values of the given keys are decoded."""
+        body = json.dumps(
+            {"data": {"content": "plain text, not base64", "thumbnail": "aGVsbG8=", "b": "aGk="}}
+        ).encode()
+
+        contents, rest, field = decode(body, 3, ["content", "b"])
+
+        assert contents == b"hi"
+        assert field == "b"
+        assert rest["data"]["content"] == "plain text, not base64"
+
+
+class TestInvokeToFile:
+    """Test ToolsAPI.invoke_to_file()."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_json_result_to_path(self, tmp_path: Path) -> None:
+        """Test base64 contents are written to the path and metadata returned."""
+        body = json.dumps(export_result()).encode()
+        route = respx.post(INVOKE_URL).mock(
+            return_value=httpx.Response(200, headers=JSON, content=achunks(body, 8192))
+        )
+        connectors = Connectors(base_url="http://localhost:3000")
+        path = tmp_path / "report.pdf"
+
+        result = await connectors.tools.invoke_to_file(
+            "googleDrive.exportFile", {"fileId": "abc"}, path
+        )
+
+        assert isinstance(result, DownloadResult)
+        assert path.read_bytes() == FILE
+        assert result.success and result.path == str(path)
+        assert result.bytes_written == len(FILE)
+        assert result.field == "content"
+        assert result.content_type == "application/pdf"
+        assert result.execution_time_ms == 42
+        assert result.data["content"] is None
+        assert "application/octet-stream" in route.calls[0].request.headers["accept"]
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_binary_body_to_async_writer(self) -> None:
+        """Test a binary body is written as is, awaiting an async writer."""
+        respx.post(INVOKE_URL).mock(
+            return_value=httpx.Response(
+                200, headers={"content-type": "application/pdf"}, content=FILE
+            )
+        )
+        connectors = Connectors(base_url="http://localhost:3000")
+
+        class AsyncWriter:
+            def __init__(self) -> None:
+                self.buffer = io.BytesIO()
+
+            async def write(self, data: bytes) -> int:
+                return self.buffer.write(data)
+
+        writer = AsyncWriter()
+        result = await connectors.tools.invoke_to_file("googleDrive.downloadFile", {}, writer)
+
+        assert writer.buffer.getvalue() == FILE
+        assert result.path is None and result.field is None
+        assert result.content_type == "application/pdf"
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_failures_leave_no_file(self, tmp_path: Path) -> None:
+        """Test failed results, missing contents and errors do not leave files behind."""
+        respx.post(INVOKE_URL).mock(
+            side_effect=[
+                httpx.Response(200, json={"success": False, "error": "not found"}),
+                httpx.Response(200, json={"success": True, "data": {"name": "x"}}),
+                httpx.Response(400, text="bad file id"),
+            ]
+        )
+        connectors = Connectors(base_url="http://localhost:3000")
+        path = tmp_path / "out.bin"
+
+        failed = await connectors.tools.invoke_to_file("googleDrive.downloadFile", {}, path)
+        with pytest.raises(ConnectorsError):
+            await connectors.tools.invoke_to_file("googleDrive.downloadFile", {}, path)
+        with pytest.raises(HTTPError):
+            await connectors.tools.invoke_to_file("googleDrive.downloadFile", {}, path)
+
+        assert not failed.success and failed.error == "not found"
+        assert failed.path is None
+        assert not path.exists()
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_corrupt_contents_remove_partial_file(self, tmp_path: Path) -> None:
+        """Test a download failing midway removes what was written."""
+        contents = base64.b64encode(FILE).decode()
+        body = json.dumps({"success": True, "data": {"bytes": contents[:-3]}}).encode()
+        respx.post(INVOKE_URL).mock(
+            return_value=httpx.Response(200, headers=JSON, content=achunks(body, 4096))
+        )
+        connectors = Connectors(base_url="http://localhost:3000")
+        path = tmp_path / "out.bin"
+
+        with pytest.raises(ConnectorsError):
+            await connectors.tools.invoke_to_file(
+                "gmail.getAttachment", {}, path, field="bytes"
+            )
+
+        assert not path.exists()
+        await connectors.aclose()
+
+    @respx.mock
+    def test_sync_client(self, tmp_path: Path) -> None:
+        """Test the sync client downloads to paths and file objects."""
+        respx.post(INVOKE_URL).mock(
+            side_effect=lambda request: httpx.Response(
+                200, headers=JSON, content=chunks(json.dumps(export_result()).encode(), 1000)
+            )
+        )
+        path = tmp_path / "report.pdf"
+        buffer = io.BytesIO()
+        with ConnectorsSync(base_url="http://localhost:3000") as connectors:
+            to_path = connectors.tools.invoke_to_file("googleDrive.exportFile", {}, str(path))
+            connectors.tools.invoke_to_file("googleDrive.exportFile", {}, buffer)
+
+        assert path.read_bytes() == FILE == buffer.getvalue()
+        assert to_path.bytes_written == len(FILE)
@@ -0,0 +1,153 @@
+"""Tests for hedged requests."""
+
+import asyncio
+
+import pytest
+import respx
+import httpx
+from connectors import Connectors
+from connectors.hedging import HedgePolicy, LatencyWindow
+from connectors.types import HedgeOptions
+from connectors.errors import ValidationError
+
+
+def make_client(**kwargs: object) -> Connectors:
+    options = {"enabled": True, "initial_delay": 20, "max_hedge_ratio": 1.0, **kwargs}
+    return Connectors(base_url="http://localhost:3000", hedging=HedgeOptions(**options))
+
+
+class TestHedgePolicy:
+    """Test hedge delay and rate cap."""
+
+    def test_percentile(self) -> None:
+        """Test nearest-rank percentile of recorded latencies."""
+        window = LatencyWindow(100)
+        for latency in range(1, 101):
+            window.record(latency / 1000)
+
+        assert window.percentile(95) == 0.095
+        assert window.percentile(50) == 0.05
+
+    def test_initial_delay_until_enough_samples(self) -> None:
+        """Test the configured initial delay is used until samples accumulate."""
+        policy = HedgePolicy(HedgeOptions(enabled=True, initial_delay=100, min_samples=3))
+        policy.record_latency("GET /health", 0.01)
+
+        assert policy.delay("GET /health") == 0.1
+
+        policy.record_latency("GET /health", 0.02)
+        policy.record_latency("GET /health", 0.03)
+        assert policy.delay("GET /health") == 0.03
+
+    def test_min_delay(self) -> None:
+        """Test the hedge delay never drops below min_delay."""
+        policy = HedgePolicy(HedgeOptions(enabled=True, min_samples=1, min_delay=50))
+        policy.record_latency("GET /health", 0.001)
+
+        assert policy.delay("GET /health") == 0.05
+
+    def test_hedge_rate_cap(self) -> None:
+        """Test hedges are capped to max_hedge_ratio of requests."""
+        policy = HedgePolicy(HedgeOptions(enabled=True, max_hedge_ratio=0.25))
+        policy.try_hedge()  # Spend the initial token
+
+        hedges = 0
+        for _ in range(100):
+            policy.delay("GET /health")
+            hedges += policy.try_hedge()
+
+        assert hedges == 25
+        assert policy.stats().hedges_denied == 75
+
+
+class TestClientHedging:
+    """Test hedging through the client."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_slow_primary_is_hedged(self) -> None:
+        """Test a hedge answers for a slow first attempt and the loser is cancelled."""
+        connectors = make_client()
+        calls = 0
+        cancelled = asyncio.Event()
+
+        async def health(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return httpx.Response(200, json={"status": "healthy"})
+
+        respx.get("http://localhost:3000/health").mock(side_effect=health)
+
+        result = await asyncio.wait_for(connectors.health(), timeout=1)
+
+        assert result.status == "healthy"
+        assert calls == 2
+        assert cancelled.is_set()
+        stats = connectors.hedge_stats
+        assert stats.hedged == 1
+        assert stats.hedge_wins == 1
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_fast_response_not_hedged(self) -> None:
+        """Test requests answering within the delay are sent once."""
+        connectors = make_client(initial_delay=1000)
+        route = respx.get("http://localhost:3000/health").mock(
+            return_value=httpx.Response(200, json={"status": "healthy"})
+        )
+
+        await connectors.health()
+
+        assert route.call_count == 1
+        assert connectors.hedge_stats.hedged == 0
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_posts_never_hedged(self) -> None:
+        """Test non-idempotent requests are not hedged."""
+        connectors = make_client(initial_delay=10)
+
+        async def invoke(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"success": True})
+
+        route = respx.post("http://localhost:3000/api/v1/tools/invoke").mock(side_effect=invoke)
+
+        await connectors.tools.invoke("github.getUser", {})
+
+        assert route.call_count == 1
+        assert connectors.hedge_stats.requests == 0
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_hedge_denied_by_rate_cap(self) -> None:
+        """Test the rate cap stops hedging once its tokens are spent."""
+        connectors = make_client(max_hedge_ratio=0.01)
+
+        async def health(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.04)
+            return httpx.Response(200, json={"status": "healthy"})
+
+        route = respx.get("http://localhost:3000/health").mock(side_effect=health)
+
+        await connectors.health()
+        await connectors.health()
+
+        assert route.call_count == 3
+        assert connectors.hedge_stats.hedged == 1
+        assert connectors.hedge_stats.hedges_denied == 1
+        await connectors.aclose()
+
+    def test_invalid_options(self) -> None:
+        """Test invalid hedging options are rejected."""
+        with pytest.raises(ValidationError):
+            make_client(percentile=0)
@@ -0,0 +1,194 @@
+"""Tests for the conditional GET cache of catalog routes."""
+
+from typing import Any, Dict
+
+import httpx
+import pytest
+import respx
+from connectors import (
+    Connectors,
+    ConnectorsSync,
+    HTTPCacheOptions,
+    MCPDeploymentConfig,
+    ToolListFilters,
+    ValidationError,
+)
+from connectors.types import MCPSource, MCPSourceType
+
+LIST_URL = "http://localhost:3000/api/v1/tools/list"
+SELECT_URL = "http://localhost:3000/api/v1/tools/select"
+INTEGRATIONS_URL = "http://localhost:3000/api/v1/mcp/integrations"
+TOOLS = {
+    "tools": [
+        {
+            "toolId": f"github.action{i}",
+            "name": f"action{i}",
+            "description": "Does a thing on a repository",
+            "integration": "github",
+            "category": "code",
+        }
+        for i in range(50)
+    ]
+}
+INTEGRATIONS = {"integrations": [{"name": "github", "category": "code", "toolCount": 50}]}
+
+
+def cached(request: httpx.Request, body: Dict[str, Any], **headers: str) -> httpx.Response:
+    """Answer like the gateway: 304 if the client's ETag matches, else the full body."""
+    if request.headers.get("if-none-match") == '"v1"':
+        return httpx.Response(304, headers={"etag": '"v1"', **headers})
+    return httpx.Response(200, json=body, headers={"etag": '"v1"', **headers})
+
+
+class TestHTTPCache:
+    """Test conditional requests and 304s served from the cache."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_not_modified_served_from_cache(self) -> None:
+        """Test a 304 returns models of the caller's own, decoded from the cached body."""
+        route = respx.get(LIST_URL).mock(side_effect=lambda request: cached(request, TOOLS))
+        connectors = Connectors(base_url="http://localhost:3000")
+
+        first = await connectors.tools.list()
+        first[0].name = "renamed"
+        first.pop()
+        second = await connectors.tools.list()
+
+        assert len(second) == 50 and second[0].name == "action0"
+        assert second[1] == first[1] and second[1] is not first[1]
+        assert "if-none-match" not in route.calls[0].request.headers
+        assert route.calls[1].request.headers["if-none-match"] == '"v1"'
+        stats = connectors.http_cache_stats
+        assert stats.misses == 1 and stats.revalidated == 1 and stats.entries == 1
+        assert stats.bytes_saved == len(route.calls[0].response.content)
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_keys_and_routes(self) -> None:
+        """Test entries are kept per path and params, and only for whitelisted routes."""
+        route = respx.get(LIST_URL).mock(side_effect=lambda request: cached(request, TOOLS))
+        status = respx.get("http://localhost:3000/api/v1/mcp/deployments/dep-1").mock(
+            return_value=httpx.Response(
+                200,
+                json={"deploymentId": "dep-1", "name": "api", "status": "running"},
+                headers={"etag": '"v1"'},
+            )
+        )
+        connectors = Connectors(base_url="http://localhost:3000")
+
+        await connectors.tools.list(ToolListFilters(category="code"))
+        await connectors.tools.list(ToolListFilters(category="data"))
+        await connectors.mcp.get("github").list_tools()
+        await connectors.mcp.get("github").list_tools()
+        for _ in range(2):
+            await connectors.mcp.get_deployment_status("dep-1")
+
+        conditional = [call.request.headers.get("if-none-match") for call in route.calls]
+        assert conditional == [None, None, None, '"v1"']
+        assert "if-none-match" not in status.calls[1].request.headers
+        assert connectors.http_cache_stats.entries == 3
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_freshness(self) -> None:
+        """Test max-age answers without a request, and no-store is never kept."""
+        integrations = respx.get(INTEGRATIONS_URL).mock(
+            side_effect=lambda request: cached(
+                request, INTEGRATIONS, **{"cache-control": "public, max-age=60"}
+            )
+        )
+        tools = respx.get(LIST_URL).mock(
+            return_value=httpx.Response(
+                200, json=TOOLS, headers={"etag": '"v1"', "cache-control": "no-store"}
+            )
+        )
+        connectors = Connectors(base_url="http://localhost:3000")
+
+        results = [await connectors.mcp.list() for _ in range(3)]
+        for _ in range(2):
+            await connectors.tools.list()
+
+        assert integrations.call_count == 1
+        assert results[2][0] == results[0][0] and results[2][0] is not results[0][0]
+        assert "if-none-match" not in tools.calls[1].request.headers
+        assert connectors.http_cache_stats.hits == 2
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_deployments_clear_cache(self) -> None:
+        """Test adding or removing an MCP server drops cached lists and selections."""
+        integrations = respx.get(INTEGRATIONS_URL).mock(
+            return_value=httpx.Response(
+                200, json=INTEGRATIONS, headers={"last-modified": "Tue, 01 Sep 2026 10:00:00 GMT"}
+            )
+        )
+        respx.post("http://localhost:3000/api/v1/mcp/add").mock(
+            return_value=httpx.Response(
+                200, json={"deploymentId": "dep-1", "name": "api", "status": "pending"}
+            )
+        )
+        respx.delete(url__startswith="http://localhost:3000/api/v1/mcp/custom/api").mock(
+            return_value=httpx.Response(200, json={})
+        )
+        select = respx.post(SELECT_URL).mock(return_value=httpx.Response(200, json=TOOLS))
+        connectors = Connectors(
+            base_url="http://localhost:3000", http_cache=HTTPCacheOptions(max_age=60_000)
+        )
+
+        await connectors.mcp.list()
+        await connectors.mcp.list()
+        await connectors.tools.select("open a pull request")
+        await connectors.mcp.add(
+            MCPDeploymentConfig(
+                name="api",
+                source=MCPSource(type=MCPSourceType.OPENAPI, url="https://example.com/api.json"),
+                category="custom",
+            )
+        )
+        await connectors.mcp.list()
+        await connectors.tools.select("open a pull request")
+        await connectors.mcp.remove("api")
+        await connectors.tools.select("open a pull request")
+
+        assert integrations.call_count == 2
+        assert select.call_count == 3
+        assert "if-modified-since" not in integrations.calls[1].request.headers
+        await connectors.aclose()
+
+    def test_invalid_options(self) -> None:
+        """Test non-GET routes and negative ages are rejected."""
+        for options in (
+            HTTPCacheOptions(routes=["POST /api/v1/tools/select"]),
+            HTTPCacheOptions(max_age=-1),
+            HTTPCacheOptions(max_entries=0),
+        ):
+            with pytest.raises(ValidationError):
+                Connectors(base_url="http://localhost:3000", http_cache=options)
+
+    @respx.mock
+    def test_sync_client_trusted(self) -> None:
+        """Test the sync client revalidates and invalidates the same way, even if trusted."""
+        route = respx.get(LIST_URL).mock(side_effect=lambda request: cached(request, TOOLS))
+        respx.delete(url__startswith="http://localhost:3000/api/v1/mcp/custom/api").mock(
+            return_value=httpx.Response(200, json={})
+        )
+        select = respx.post(SELECT_URL).mock(return_value=httpx.Response(200, json=TOOLS))
+        with ConnectorsSync(base_url="http://localhost:3000", trusted=True) as connectors:
+            first = connectors.tools.list()
+            second = connectors.tools.list()
+            connectors.tools.select("open a pull request")
+            connectors.mcp.remove("api")
+            connectors.tools.select("open a pull request")
+        with ConnectorsSync(
+            base_url="http://localhost:3000", http_cache=HTTPCacheOptions(enabled=False)
+        ) as connectors:
+            connectors.tools.list()
+
+        assert second[0].tool_id == first[0].tool_id == "github.action0"
+        assert select.call_count == 2
+        assert route.calls[1].response.status_code == 304
+        assert "if-none-match" not in route.calls[2].request.headers
@@ -4,7 +4,7 @@ import pytest
 import respx
 import httpx
 from connectors.http_client import HTTPClient
-from connectors.types import ConnectorsConfig
+from connectors.types import ConnectorsConfig, PoolOptions, RetryBudgetOptions
 from connectors.errors import HTTPError, TimeoutError, RetryableError
 
 
@@ -254,3 +254,108 @@ class TestHTTPClient:
         await http_client.request(
             "GET", "/api/test", dict, params={"param1": "value1", "param2": "value2"}
         )
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_connection_pool_reused(self, http_client: HTTPClient) -> None:
+        """Test requests share one pooled httpx client."""
+        respx.get("http://localhost:3000/api/test").mock(
+            return_value=httpx.Response(200, json={"result": "success"})
+        )
+
+        await http_client.get("/api/test", dict)
+        client = http_client.client
+        await http_client.get("/api/test", dict)
+
+        assert http_client.client is client
+        await http_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_pool_options_applied(self, config: ConnectorsConfig) -> None:
+        """Test pool options configure the httpx transport limits."""
+        config.pool = PoolOptions(
+            max_connections=7, max_keepalive_connections=3, keepalive_expiry=2000
+        )
+        client = HTTPClient(config)
+
+        pool = client.client._transport._pool  # type: ignore[attr-defined]
+
+        assert pool._max_connections == 7
+        assert pool._max_keepalive_connections == 3
+        assert pool._keepalive_expiry == 2.0
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_releases_pool(self, http_client: HTTPClient) -> None:
+        """Test aclose closes the pool and a new one is opened on demand."""
+        client = http_client.client
+
+        await http_client.aclose()
+
+        assert client.is_closed
+        assert http_client.client is not client
+        await http_client.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_retry_after_header_respected(
+        self, http_client: HTTPClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test retry delay follows the server Retry-After header."""
+        delays = []
+
+        async def fake_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        monkeypatch.setattr("connectors.http_client.asyncio.sleep", fake_sleep)
+        respx.get("http://localhost:3000/api/test").mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "3"}, text="Rate Limited"),
+                httpx.Response(200, json={"result": "success"}),
+            ]
+        )
+
+        await http_client.get("/api/test", dict)
+
+        assert len(delays) == 1
+        assert 3.0 <= delays[0] <= 3.3
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_retry_after_too_long_gives_up(self, http_client: HTTPClient) -> None:
+        """Test no retry when the server asks to wait longer than the max backoff."""
+        route = respx.get("http://localhost:3000/api/test").mock(
+            return_value=httpx.Response(503, headers={"Retry-After": "120"}, text="Busy")
+        )
+
+        with pytest.raises(HTTPError) as exc_info:
+            await http_client.get("/api/test", dict)
+
+        assert route.call_count == 1
+        assert exc_info.value.retry_after == 120.0
+        assert http_client.retry_stats.gave_up == 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_retry_budget_exhausted(
+        self, config: ConnectorsConfig, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test retries stop once the client-wide budget is spent."""
+        config.retry_budget = RetryBudgetOptions(
+            ratio=0.0, min_retries_per_second=1, max_tokens=1
+        )
+        client = HTTPClient(config)
+        monkeypatch.setattr(client, "_calculate_backoff", lambda *args: 0)
+        route = respx.get("http://localhost:3000/api/test").mock(
+            return_value=httpx.Response(500, text="Server Error")
+        )
+
+        with pytest.raises(HTTPError):
+            await client.get("/api/test", dict)
+
+        stats = client.retry_stats
+        # One retry from the reserve, then the budget denies the second
+        assert route.call_count == 2
+        assert stats.retries == 1
+        assert stats.retries_denied == 1
+        assert stats.gave_up == 1
@@ -0,0 +1,209 @@
+"""Tests for idempotency keys and deduplication of tool invocations."""
+
+import asyncio
+import io
+from typing import List
+
+import httpx
+import pytest
+import respx
+from connectors import (
+    Connectors,
+    ConnectorsSync,
+    HTTPError,
+    IdempotencyOptions,
+    InvokeOptions,
+    ValidationError,
+)
+
+INVOKE_URL = "http://localhost:3000/api/v1/tools/invoke"
+OK = {"success": True, "data": {"number": 42}}
+
+
+def keys(route: respx.Route) -> List[str]:
+    return [call.request.headers.get("idempotency-key") for call in route.calls]
+
+
+class TestIdempotencyKeys:
+    """Test idempotency keys sent with tool invocations."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_key_kept_across_retries(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test every attempt of an invocation carries the same key, and 409 is retried if asked."""
+        route = respx.post(INVOKE_URL).mock(
+            side_effect=[
+                httpx.ReadTimeout("timed out"),
+                httpx.Response(409, text="already in progress"),
+                httpx.Response(200, json=OK),
+                httpx.Response(200, json=OK),
+            ]
+        )
+        connectors = Connectors(
+            base_url="http://localhost:3000",
+            idempotency=IdempotencyOptions(retry_conflicts=True),
+        )
+        monkeypatch.setattr(connectors._http_client, "_calculate_backoff", lambda *args: 0)
+
+        result = await connectors.tools.invoke("github.createPullRequest", {"title": "x"})
+        await connectors.tools.invoke("github.createPullRequest", {"title": "x"})
+
+        first, retry, conflict, second = keys(route)
+        assert result.data == {"number": 42}
+        assert first == retry == conflict
+        assert second and second != first
+        assert connectors.idempotency_stats.keyed == 2
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_conflict_not_retried_by_default(self) -> None:
+        """Test a keyed request answered with 409 fails without retrying by default."""
+        route = respx.post(INVOKE_URL).mock(return_value=httpx.Response(409, text="conflict"))
+        connectors = Connectors(base_url="http://localhost:3000")
+
+        with pytest.raises(HTTPError) as error:
+            await connectors.tools.invoke("github.createPullRequest", {"title": "x"})
+
+        assert error.value.status_code == 409
+        assert route.call_count == 1 and keys(route)[0]
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_caller_keys(self) -> None:
+        """Test caller keys are sent as is, and suffixed per call by invoke_many()."""
+        route = respx.post(INVOKE_URL).mock(return_value=httpx.Response(200, json=OK))
+        connectors = Connectors(base_url="http://localhost:3000")
+        options = InvokeOptions(idempotency_key="job-7")
+
+        await connectors.tools.invoke("gmail.sendEmail", {"to": "a@example.com"}, options)
+        calls = [("gmail.sendEmail", {"to": f"{name}@example.com"}) for name in "bc"]
+        results = [result async for result in connectors.tools.invoke_many(calls, options)]
+        async for _ in connectors.tools.invoke_stream("gmail.sendEmail", {}, options):
+            pass
+
+        assert all(result.success for result in results)
+        assert keys(route) == ["job-7", "job-7:0", "job-7:1", "job-7"]
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_disabled(self) -> None:
+        """Test no key is sent when disabled, and 409 is then not retried."""
+        route = respx.post(INVOKE_URL).mock(return_value=httpx.Response(409, text="conflict"))
+        connectors = Connectors(
+            base_url="http://localhost:3000",
+            idempotency=IdempotencyOptions(enabled=False),
+        )
+
+        with pytest.raises(HTTPError):
+            await connectors.tools.invoke("github.createPullRequest", {"title": "x"})
+
+        assert keys(route) == [None]
+        await connectors.aclose()
+
+
+class TestDeduplication:
+    """Test the client-side deduplication window for repeated invocations."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_repeats_within_window(self) -> None:
+        """Test an identical successful invocation is answered locally within the window."""
+        route = respx.post(INVOKE_URL).mock(return_value=httpx.Response(200, json=OK))
+        connectors = Connectors(
+            base_url="http://localhost:3000",
+            idempotency=IdempotencyOptions(dedupe_window=60_000),
+        )
+
+        first = await connectors.tools.invoke("github.createPullRequest", {"title": "x"})
+        repeat = await connectors.tools.invoke("github.createPullRequest", {"title": "x"})
+        other = await connectors.tools.invoke("github.createPullRequest", {"title": "y"})
+        mcp = await connectors.mcp.get("github").call("createPullRequest", {"title": "x"})
+
+        assert route.call_count == 2
+        assert first == repeat == other
+        assert mcp == OK
+        stats = connectors.idempotency_stats
+        assert stats.deduplicated == 2 and stats.entries == 2
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_failures_reuse_key(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a repeat of a failed invocation is sent again, with the same key."""
+        route = respx.post(INVOKE_URL).mock(
+            side_effect=[
+                httpx.Response(503, text="busy"),
+                httpx.Response(200, json={"success": False, "error": "rate limited"}),
+                httpx.Response(200, json=OK),
+            ]
+        )
+        connectors = Connectors(
+            base_url="http://localhost:3000",
+            max_retries=0,
+            idempotency=IdempotencyOptions(dedupe_window=60_000),
+        )
+
+        with pytest.raises(HTTPError):
+            await connectors.tools.invoke("slack.postMessage", {"text": "hi"})
+        failed = await connectors.tools.invoke("slack.postMessage", {"text": "hi"})
+        result = await connectors.tools.invoke("slack.postMessage", {"text": "hi"})
+
+        assert not failed.success and result.success
+        assert len(set(keys(route))) == 1
+        assert connectors.idempotency_stats.keys_reused == 2
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_concurrent_repeats_share_a_call(self) -> None:
+        """Test identical concurrent invocations share one request; uploads never do."""
+
+        async def slow(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json=OK)
+
+        route = respx.post(INVOKE_URL).mock(side_effect=slow)
+        connectors = Connectors(
+            base_url="http://localhost:3000",
+            idempotency=IdempotencyOptions(dedupe_window=60_000),
+        )
+
+        results = await asyncio.gather(
+            *(connectors.tools.invoke("slack.postMessage", {"text": "hi"}) for _ in range(5))
+        )
+        for _ in range(2):
+            await connectors.tools.invoke("drive.upload", {"content": io.BytesIO(b"report")})
+
+        assert all(result.success for result in results)
+        assert route.call_count == 3
+        await connectors.aclose()
+
+    @respx.mock
+    def test_sync_client(self) -> None:
+        """Test the sync client sends keys and deduplicates the same way."""
+        route = respx.post(INVOKE_URL).mock(return_value=httpx.Response(200, json=OK))
+        with ConnectorsSync(
+            base_url="http://localhost:3000",
+            idempotency=IdempotencyOptions(dedupe_window=60_000, header="X-Request-Id"),
+        ) as connectors:
+            connectors.tools.invoke("github.createIssue", {"title": "bug"})
+            connectors.tools.invoke("github.createIssue", {"title": "bug"})
+            connectors.mcp.get("github").call("createIssue", {"title": "bug"})
+            stats = connectors.idempotency_stats
+
+        assert route.call_count == 1
+        assert route.calls[0].request.headers["x-request-id"]
+        assert stats.deduplicated == 2
+
+    def test_invalid_options(self) -> None:
+        """Test negative windows, empty headers and empty tables are rejected."""
+        for options in (
+            IdempotencyOptions(dedupe_window=-1),
+            IdempotencyOptions(header=" "),
+            IdempotencyOptions(max_entries=0),
+        ):
+            with pytest.raises(ValidationError):
+                Connectors(base_url="http://localhost:3000", idempotency=options)
@@ -0,0 +1,145 @@
+"""Tests for auto-paginating tool iteration."""
+
+import asyncio
+from typing import Optional
+
+import pytest
+import respx
+import httpx
+from connectors import Connectors, ConnectorsSync, ToolListFilters, ValidationError
+
+LIST_URL = "http://localhost:3000/api/v1/tools/list"
+
+
+def tool(i: int) -> dict:
+    return {
+        "toolId": f"github.action{i}",
+        "name": f"Action {i}",
+        "description": "",
+        "integration": "github",
+        "category": "code",
+    }
+
+
+class Catalog:
+    """Fake paginated /tools/list endpoint that records concurrency."""
+
+    def __init__(self, count: int, total: Optional[int] = None, delay: float = 0) -> None:
+        self.count = count
+        self.total = total
+        self.delay = delay
+        self.pages: list = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def body(self, request: httpx.Request) -> dict:
+        page = int(request.url.params["page"])
+        limit = int(request.url.params["limit"])
+        self.pages.append(page)
+        start = (page - 1) * limit
+        body: dict = {"tools": [tool(i) for i in range(start, min(start + limit, self.count))]}
+        if self.total is not None:
+            body["pagination"] = {"total": self.total, "limit": limit}
+        return body
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            return httpx.Response(200, json=self.body(request))
+        finally:
+            self.in_flight -= 1
+
+
+class TestIterAll:
+    """Test ToolsAPI.iter_all."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_walks_until_short_page(self) -> None:
+        """Test every page is fetched in order and the walk stops at a short page."""
+        catalog = Catalog(250)
+        respx.get(LIST_URL).mock(side_effect=catalog)
+        connectors = Connectors(base_url="http://localhost:3000")
+
+        tools = [t async for t in connectors.tools.iter_all(ToolListFilters(category="code"))]
+
+        assert [t.tool_id for t in tools] == [f"github.action{i}" for i in range(250)]
+        assert catalog.pages == [1, 2, 3]
+        assert respx.calls[0].request.url.params["category"] == "code"
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_parallel_pages_with_known_total(self) -> None:
+        """Test pages are fetched concurrently once the total is known."""
+        catalog = Catalog(1000, total=1000, delay=0.01)
+        respx.get(LIST_URL).mock(side_effect=catalog)
+        connectors = Connectors(base_url="http://localhost:3000")
+
+        tools = [
+            t async for t in connectors.tools.iter_all(ToolListFilters(limit=100), concurrency=4)
+        ]
+
+        assert [t.tool_id for t in tools] == [f"github.action{i}" for i in range(1000)]
+        assert catalog.max_in_flight == 4
+        # The last page is full, so one more page confirms the end
+        assert sorted(catalog.pages) == list(range(1, 12))
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_inaccurate_total(self) -> None:
+        """Test a total smaller than the catalog does not truncate the walk."""
+        catalog = Catalog(150, total=50)
+        respx.get(LIST_URL).mock(side_effect=catalog)
+        connectors = Connectors(base_url="http://localhost:3000")
+
+        tools = [
+            t async for t in connectors.tools.iter_all(ToolListFilters(limit=50), concurrency=4)
+        ]
+
+        assert len(tools) == 150
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_early_exit_cancels_prefetch(self) -> None:
+        """Test leaving the loop early stops fetching."""
+        catalog = Catalog(1000, delay=0.01)
+        respx.get(LIST_URL).mock(side_effect=catalog)
+        connectors = Connectors(base_url="http://localhost:3000")
+
+        iterator = connectors.tools.iter_all()
+        async for _ in iterator:
+            break
+        await iterator.aclose()  # type: ignore[attr-defined]
+
+        assert catalog.in_flight == 0
+        assert len(catalog.pages) <= 2
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency(self) -> None:
+        """Test concurrency must be positive."""
+        connectors = Connectors(base_url="http://localhost:3000")
+
+        with pytest.raises(ValidationError):
+            async for _ in connectors.tools.iter_all(concurrency=0):
+                pass
+
+    @respx.mock
+    def test_sync_iter_all(self) -> None:
+        """Test the sync client walks every page with threads."""
+        catalog = Catalog(250, total=250)
+        respx.get(LIST_URL).mock(
+            side_effect=lambda request: httpx.Response(200, json=catalog.body(request))
+        )
+        connectors = ConnectorsSync(base_url="http://localhost:3000")
+
+        tools = list(connectors.tools.iter_all(concurrency=2))
+
+        assert [t.tool_id for t in tools] == [f"github.action{i}" for i in range(250)]
+        assert sorted(catalog.pages) == [1, 2, 3]
+        connectors.close()
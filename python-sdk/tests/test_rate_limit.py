@@ -0,0 +1,242 @@
+"""Tests for client-side pacing to the gateway's rate limit headers."""
+
+import asyncio
+import time
+from typing import Dict
+
+import httpx
+import pytest
+import respx
+from connectors import (
+    Connectors,
+    ConnectorsSync,
+    DeadlineExceededError,
+    HedgeOptions,
+    InvokeOptions,
+    RateLimitError,
+    RateLimitOptions,
+    ValidationError,
+)
+from connectors.rate_limit import RateLimitBucket, parse_rate_limit
+
+INVOKE_URL = "http://localhost:3000/api/v1/tools/invoke"
+OK = {"success": True, "data": {}}
+
+
+class FixedWindow:
+    """Gateway stand-in counting requests in fixed windows, like express-rate-limit."""
+
+    def __init__(self, limit: int, window: float) -> None:
+        self.limit = limit
+        self.window = window
+        self.reset_at = 0.0
+        self.hits = 0
+        self.rejected = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        now = time.monotonic()
+        if now >= self.reset_at:
+            self.reset_at, self.hits = now + self.window, 0
+        self.hits += 1
+        headers = {
+            "RateLimit-Policy": f"{self.limit};w={self.window}",
+            "RateLimit-Limit": str(self.limit),
+            "RateLimit-Remaining": str(max(0, self.limit - self.hits)),
+            "RateLimit-Reset": f"{self.reset_at - now:.3f}",
+        }
+        if self.hits > self.limit:
+            self.rejected += 1
+            return httpx.Response(429, json={"error": "Too many requests"}, headers=headers)
+        return httpx.Response(200, json=OK, headers=headers)
+
+
+def exhausted(reset: int) -> Dict[str, str]:
+    return {"RateLimit-Limit": "20", "RateLimit-Remaining": "0", "RateLimit-Reset": str(reset)}
+
+
+class TestParseRateLimit:
+    """Test reading quotas from rate limit headers."""
+
+    def test_header_styles(self) -> None:
+        """Test draft headers with a policy, legacy epoch resets and the combined header."""
+        standard = httpx.Headers(
+            {
+                "RateLimit-Policy": "20;w=60",
+                "RateLimit-Remaining": "7",
+                "RateLimit-Reset": "12",
+            }
+        )
+        legacy = httpx.Headers(
+            {
+                "X-RateLimit-Limit": "100",
+                "X-RateLimit-Remaining": "3",
+                "X-RateLimit-Reset": "1700000030",
+            }
+        )
+        combined = httpx.Headers({"RateLimit": "limit=50, remaining=49, reset=5"})
+
+        assert parse_rate_limit(standard) == (20, 7, 12.0, 60.0)
+        assert parse_rate_limit(legacy, now=1_700_000_000) == (100, 3, 30.0, None)
+        assert parse_rate_limit(combined) == (50, 49, 5.0, None)
+        assert parse_rate_limit(httpx.Headers({"RateLimit-Remaining": "3"})) is None
+
+
+class TestRateLimitBucket:
+    """Test pacing within a bucket."""
+
+    def test_spreads_quota_over_window(self) -> None:
+        """Test requests are spaced over the window, and wait for the reset once spent."""
+        bucket = RateLimitBucket("- POST /api/v1/tools/invoke", RateLimitOptions(burst=0))
+        assert bucket.reserve(30, now=0.0) == (0.0, True)
+        bucket.record(
+            {"ratelimit-policy": "10;w=2", "ratelimit-remaining": "4", "ratelimit-reset": "2"},
+            now=0.0,
+        )
+
+        slots = [bucket.reserve(30, now=0.0) for _ in range(5)]
+        after_reset = bucket.reserve(30, now=2.0)
+        with pytest.raises(RateLimitError) as error:
+            bucket.reserve(0.1, now=2.0)
+
+        assert slots == [(0.0, True), (0.5, True), (1.0, True), (1.5, True), (2.0, False)]
+        assert after_reset == (0.0, True)
+        assert error.value.retry_in == pytest.approx(0.2)
+        stats = bucket.stats(now=2.0)
+        assert stats.limit == 10 and stats.remaining == 9 and stats.reset_in == 2.0
+        assert stats.in_flight == 5 and stats.rejected == 1
+
+    def test_burst(self) -> None:
+        """Test up to burst requests go back to back before pacing starts."""
+        bucket = RateLimitBucket("key", RateLimitOptions(burst=2))
+        bucket.reserve(30, now=0.0)
+        bucket.record({"ratelimit-remaining": "10", "ratelimit-reset": "10"}, now=0.0)
+
+        delays = [bucket.reserve(30, now=0.0)[0] for _ in range(5)]
+
+        assert delays[:3] == [0.0, 0.0, 0.0]
+        assert 0 < delays[3] < delays[4] < 10
+
+
+class TestRateLimitShaping:
+    """Test request pacing in the clients."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_bulk_invokes_avoid_429(self) -> None:
+        """Test a burst of invocations is paced to the quota instead of hitting 429."""
+        gateway = FixedWindow(limit=5, window=0.2)
+        respx.post(INVOKE_URL).mock(side_effect=gateway)
+        connectors = Connectors(
+            base_url="http://localhost:3000",
+            max_retries=0,
+            rate_limit=RateLimitOptions(enabled=True, burst=0),
+        )
+
+        await connectors.tools.invoke("slack.postMessage", {"text": "first"})
+        results = await asyncio.gather(
+            *(connectors.tools.invoke("slack.postMessage", {"text": str(i)}) for i in range(12))
+        )
+
+        assert all(result.success for result in results)
+        assert gateway.rejected == 0
+        stats = connectors.rate_limit_stats["- POST /api/v1/tools/invoke"]
+        assert stats.limit == 5 and stats.waited > 0 and stats.wait_time > 0
+        assert stats.in_flight == 0 and stats.queued == 0
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_buckets_per_tenant_and_limits(self) -> None:
+        """Test tenants are paced separately, and long waits fail fast."""
+        respx.post(INVOKE_URL).mock(
+            return_value=httpx.Response(200, json=OK, headers=exhausted(60))
+        )
+        connectors = Connectors(
+            base_url="http://localhost:3000",
+            tenant_id="default",
+            rate_limit=RateLimitOptions(enabled=True, max_wait=5000),
+        )
+
+        await connectors.tools.invoke("slack.postMessage", {}, InvokeOptions(tenant_id="acme"))
+        await connectors.tools.invoke("slack.postMessage", {})
+        with pytest.raises(RateLimitError) as error:
+            await connectors.tools.invoke("slack.postMessage", {})
+        hurried = Connectors(
+            base_url="http://localhost:3000",
+            deadline=2000,
+            rate_limit=RateLimitOptions(enabled=True),
+        )
+        await hurried.tools.invoke("slack.postMessage", {})
+        with pytest.raises(DeadlineExceededError):
+            await hurried.tools.invoke("slack.postMessage", {})
+
+        assert error.value.key == "default POST /api/v1/tools/invoke"
+        assert error.value.retry_in > 55
+        stats = connectors.rate_limit_stats
+        assert sorted(stats) == [
+            "acme POST /api/v1/tools/invoke",
+            "default POST /api/v1/tools/invoke",
+        ]
+        assert stats["acme POST /api/v1/tools/invoke"].remaining == 0
+        assert stats["acme POST /api/v1/tools/invoke"].in_flight == 0
+        await connectors.aclose()
+        await hurried.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_hedges_take_their_own_slot(self) -> None:
+        """Test a hedge is sent only when the bucket has a slot free for it."""
+        calls = 0
+
+        async def health(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            # Warm-up, a primary with no slot left to hedge, then a hedged primary
+            await asyncio.sleep({2: 0.1, 3: 5}.get(calls, 0))
+            remaining = "1" if calls == 1 else "5"
+            headers = {"RateLimit-Remaining": remaining, "RateLimit-Reset": "60"}
+            return httpx.Response(200, json={"status": "healthy"}, headers=headers)
+
+        respx.get("http://localhost:3000/health").mock(side_effect=health)
+        connectors = Connectors(
+            base_url="http://localhost:3000",
+            hedging=HedgeOptions(enabled=True, initial_delay=20, max_hedge_ratio=1.0),
+            rate_limit=RateLimitOptions(enabled=True),
+        )
+
+        await connectors.health()
+        await connectors.health()
+        assert calls == 2 and connectors.hedge_stats.hedged == 0
+        await asyncio.wait_for(connectors.health(), timeout=1)
+
+        assert calls == 4 and connectors.hedge_stats.hedge_wins == 1
+        assert connectors.rate_limit_stats["- GET /health"].in_flight == 0
+        await connectors.aclose()
+
+    @respx.mock
+    def test_sync_client(self) -> None:
+        """Test the sync client paces the same way, and is unpaced by default."""
+        gateway = FixedWindow(limit=3, window=0.2)
+        respx.post(INVOKE_URL).mock(side_effect=gateway)
+        with ConnectorsSync(
+            base_url="http://localhost:3000",
+            max_retries=0,
+            rate_limit=RateLimitOptions(enabled=True, burst=0),
+        ) as connectors:
+            for i in range(7):
+                connectors.tools.invoke("slack.postMessage", {"text": str(i)})
+            stats = connectors.rate_limit_stats
+        with ConnectorsSync(base_url="http://localhost:3000") as connectors:
+            assert connectors.rate_limit_stats == {}
+
+        assert gateway.rejected == 0
+        assert stats["- POST /api/v1/tools/invoke"].waited > 0
+
+    def test_invalid_options(self) -> None:
+        """Test non-positive waits and negative bursts are rejected."""
+        for options in (
+            RateLimitOptions(enabled=True, max_wait=0),
+            RateLimitOptions(enabled=True, burst=-1),
+        ):
+            with pytest.raises(ValidationError):
+                Connectors(base_url="http://localhost:3000", rate_limit=options)
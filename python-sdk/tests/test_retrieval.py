@@ -0,0 +1,278 @@
+"""Tests for local tool selection."""
+
+import json
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+import respx
+import httpx
+from connectors import (
+    Connectors,
+    ConnectorsSync,
+    HTTPError,
+    LocalSelectOptions,
+    ReplicaOptions,
+    ToolSelectionOptions,
+    ValidationError,
+)
+
+from tests.test_catalog import Gateway
+
+SELECT_URL = "http://localhost:3000/api/v1/tools/select"
+
+pytest.importorskip("numpy")
+
+
+def tool(tool_id: str, category: str, description: str, **extra: object) -> Dict[str, object]:
+    return {
+        "toolId": tool_id,
+        "name": tool_id.split(".")[1],
+        "description": description,
+        "integration": tool_id.split(".")[0],
+        "category": category,
+        **extra,
+    }
+
+
+CATALOG = [
+    tool("github.createPullRequest", "code", "Open a pull request to merge a branch"),
+    tool("github.createIssue", "code", "Create an issue in a repository"),
+    tool("jira.createTicket", "code", "Create a Jira ticket to track a bug"),
+    tool("slack.sendMessage", "communication", "Post a message to a Slack channel"),
+    tool("gmail.sendEmail", "communication", "Send an email from a Gmail account"),
+    tool("notion.createPage", "productivity", "Create a page in a Notion workspace"),
+    tool("stripe.createInvoice", "payments", "Create and send an invoice to a customer"),
+]
+
+
+def ids(tools: List[object]) -> List[str]:
+    return [t.tool_id for t in tools]  # type: ignore[attr-defined]
+
+
+class TestHybridRetriever:
+    """Test ranking over an in-memory tool set."""
+
+    def test_ranks_lexical_and_fuzzy_matches(self) -> None:
+        """Test exact terms, camelCase ids and misspellings find the right tool."""
+        from connectors.retrieval import HybridRetriever
+
+        retriever = HybridRetriever(CATALOG)
+
+        def top(query: str) -> str:
+            return str(CATALOG[retriever.search(query)[0][0]]["toolId"])
+
+        assert top("open a pull request") == "github.createPullRequest"
+        assert top("send message on slack") == "slack.sendMessage"
+        assert top("pull requets") == "github.createPullRequest"
+        assert top("invoise the customer") == "stripe.createInvoice"
+        assert top("createInvoice") == "stripe.createInvoice"
+
+    def test_picks_categories_first(self) -> None:
+        """Test tools outside the best categories are never returned."""
+        from connectors.retrieval import HybridRetriever
+
+        retriever = HybridRetriever(CATALOG)
+
+        assert retriever.top_categories("post to the slack channel", 1) == ["communication"]
+        results = retriever.search("post to the slack channel", max_categories=1)
+        assert {CATALOG[index]["category"] for index, _ in results} == {"communication"}
+        restricted = retriever.search("post to the slack channel", categories=["code"])
+        assert {CATALOG[index]["category"] for index, _ in restricted} <= {"code"}
+
+    def test_max_tools_and_token_budget(self) -> None:
+        """Test results are cut to max_tools, with lower ranked tools filling skipped slots."""
+        from connectors.retrieval import HybridRetriever, estimate_token_cost
+
+        catalog = [
+            tool("github.createIssue", "code", "Create an issue", tokenCost=400),
+            tool("jira.createIssue", "code", "Create an issue in Jira", tokenCost=900),
+            tool("linear.createIssue", "code", "Create an issue in Linear", tokenCost=300),
+        ]
+        retriever = HybridRetriever(catalog)
+
+        assert len(retriever.search("create an issue", max_tools=2)) == 2
+        budgeted = retriever.search("create an issue", token_budget=1000)
+        assert sum(estimate_token_cost(catalog[index]) for index, _ in budgeted) <= 1000
+        assert "jira.createIssue" not in [catalog[index]["toolId"] for index, _ in budgeted]
+        # jira ranks second but does not fit, so linear takes its slot
+        filled = retriever.search("create an issue", max_tools=2, token_budget=1000)
+        assert [catalog[index]["toolId"] for index, _ in filled] == [
+            "github.createIssue",
+            "linear.createIssue",
+        ]
+        # Estimated like the gateway: a quarter token per schema character
+        assert estimate_token_cost({"name": "abcd", "description": "efgh"}) == 2
+
+
+class TestLocalSelect:
+    """Test tools.select() falling back to and running on the replica."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_falls_back_when_gateway_unavailable(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a synced replica answers selections while the gateway is down."""
+        Gateway(CATALOG).mock()
+        select = respx.post(SELECT_URL).mock(return_value=httpx.Response(503, text="down"))
+        connectors = Connectors(
+            base_url="http://localhost:3000",
+            replica=ReplicaOptions(enabled=True),
+            local_select=LocalSelectOptions(enabled=True),
+        )
+        monkeypatch.setattr(connectors._http_client, "_calculate_backoff", lambda *args: 0)
+        await connectors.catalog.sync()
+
+        tools = await connectors.tools.select("open a pull request")
+
+        assert ids(tools)[0] == "github.createPullRequest"
+        assert select.called
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_bad_requests_do_not_fall_back(self) -> None:
+        """Test client errors from the gateway are raised, not answered locally."""
+        Gateway(CATALOG).mock()
+        respx.post(SELECT_URL).mock(return_value=httpx.Response(400, text="bad"))
+        connectors = Connectors(
+            base_url="http://localhost:3000",
+            replica=ReplicaOptions(enabled=True),
+            local_select=LocalSelectOptions(enabled=True),
+        )
+        await connectors.catalog.sync()
+
+        with pytest.raises(HTTPError) as exc_info:
+            await connectors.tools.select("open a pull request")
+
+        assert exc_info.value.status_code == 400
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_tight_deadline_runs_locally(self) -> None:
+        """Test deadlines within the latency budget skip the gateway."""
+        Gateway(CATALOG).mock()
+        select = respx.post(SELECT_URL).mock(
+            return_value=httpx.Response(200, json={"tools": [CATALOG[0]]})
+        )
+        connectors = Connectors(
+            base_url="http://localhost:3000",
+            replica=ReplicaOptions(enabled=True),
+            local_select=LocalSelectOptions(enabled=True, latency_budget=50),
+        )
+        await connectors.catalog.sync()
+
+        local = await connectors.tools.select("post to slack", deadline=20)
+        remote = await connectors.tools.select("post to slack", deadline=5000)
+
+        assert ids(local)[0] == "slack.sendMessage"
+        assert ids(remote) == ["github.createPullRequest"]
+        assert select.call_count == 1
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_gateway_used_until_index_built(self, tmp_path: Path) -> None:
+        """Test a replica synced elsewhere is indexed in the background, not inline."""
+        Gateway(CATALOG).mock()
+        select = respx.post(SELECT_URL).mock(
+            return_value=httpx.Response(200, json={"tools": [CATALOG[0]]})
+        )
+        options = ReplicaOptions(enabled=True, path=str(tmp_path / "catalog.db"))
+        writer = Connectors(base_url="http://localhost:3000", replica=options)
+        await writer.catalog.sync()
+        await writer.aclose()
+        connectors = Connectors(
+            base_url="http://localhost:3000",
+            replica=options,
+            local_select=LocalSelectOptions(enabled=True, latency_budget=50),
+        )
+        local = connectors.tools._local_select
+        assert local is not None and local.available() and not local.ready()
+
+        first = await connectors.tools.select("post to slack", deadline=20)
+        assert connectors.tools._index_build is not None
+        await connectors.tools._index_build
+        second = await connectors.tools.select("post to slack", deadline=20)
+
+        assert ids(first) == ["github.createPullRequest"]
+        assert ids(second)[0] == "slack.sendMessage"
+        assert select.call_count == 1
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_prefilter_sends_local_categories(self) -> None:
+        """Test prefilter mode narrows the gateway's search to local categories."""
+        Gateway(CATALOG).mock()
+        select = respx.post(SELECT_URL).mock(return_value=httpx.Response(200, json={"tools": []}))
+        connectors = Connectors(
+            base_url="http://localhost:3000",
+            replica=ReplicaOptions(enabled=True),
+            local_select=LocalSelectOptions(enabled=True, mode="prefilter", max_categories=1),
+        )
+        await connectors.catalog.sync()
+
+        await connectors.tools.select("send an invoice to the customer")
+        await connectors.tools.select(
+            "send an invoice", ToolSelectionOptions(categories=["code"])
+        )
+
+        bodies = [json.loads(call.request.content) for call in select.calls]
+        assert bodies[0]["categories"] == ["payments"]
+        assert bodies[1]["categories"] == ["code"]
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_index_rebuilt_after_catalog_change(self) -> None:
+        """Test local mode picks up tools added by a later sync."""
+        gateway = Gateway(list(CATALOG))
+        gateway.mock()
+        connectors = Connectors(
+            base_url="http://localhost:3000",
+            replica=ReplicaOptions(enabled=True),
+            local_select=LocalSelectOptions(enabled=True, mode="local"),
+        )
+
+        before = await connectors.tools.select("create a trello card")
+        gateway.tools.append(tool("trello.createCard", "productivity", "Create a Trello card"))
+        await connectors.catalog.sync()
+        after = await connectors.tools.select("create a trello card")
+
+        assert "trello.createCard" not in ids(before)
+        assert ids(after)[0] == "trello.createCard"
+        await connectors.aclose()
+
+    @respx.mock
+    def test_sync_client_falls_back(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the blocking client falls back the same way."""
+        Gateway(CATALOG).mock()
+        respx.post(SELECT_URL).mock(side_effect=httpx.ConnectError("refused"))
+        with ConnectorsSync(
+            base_url="http://localhost:3000",
+            replica=ReplicaOptions(enabled=True),
+            local_select=LocalSelectOptions(enabled=True),
+        ) as connectors:
+            monkeypatch.setattr(connectors._http_client, "_calculate_backoff", lambda *args: 0)
+            connectors.catalog.sync()
+
+            tools = connectors.tools.select("send an email")
+
+        assert ids(tools)[0] == "gmail.sendEmail"
+
+    def test_requires_replica(self) -> None:
+        """Test local selection cannot be enabled without the replica."""
+        with pytest.raises(ValidationError):
+            Connectors(
+                base_url="http://localhost:3000",
+                local_select=LocalSelectOptions(enabled=True),
+            )
+        with pytest.raises(ValidationError):
+            Connectors(
+                base_url="http://localhost:3000",
+                replica=ReplicaOptions(enabled=True),
+                local_select=LocalSelectOptions(enabled=True, mode="remote"),
+            )
@@ -0,0 +1,98 @@
+"""Tests for retry hints and retry budget."""
+
+from connectors.retry import RetryBudget, parse_retry_after
+from connectors.types import RetryBudgetOptions
+
+
+class TestParseRetryAfter:
+    """Test parsing of server retry hints."""
+
+    def test_retry_after_seconds(self) -> None:
+        """Test Retry-After given in delta seconds."""
+        assert parse_retry_after({"retry-after": "7"}) == 7.0
+
+    def test_retry_after_http_date(self) -> None:
+        """Test Retry-After given as an HTTP date."""
+        headers = {"retry-after": "Wed, 21 Oct 2015 07:28:10 GMT"}
+
+        delay = parse_retry_after(headers, now=1445412485.0)
+
+        assert delay == 5.0
+
+    def test_retry_after_date_in_past(self) -> None:
+        """Test a Retry-After date in the past means retry now."""
+        headers = {"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}
+
+        assert parse_retry_after(headers, now=1445412485.0) == 0.0
+
+    def test_ratelimit_reset_when_exhausted(self) -> None:
+        """Test RateLimit-Reset is used when the quota is exhausted."""
+        headers = {"ratelimit-remaining": "0", "ratelimit-reset": "12"}
+
+        assert parse_retry_after(headers) == 12.0
+
+    def test_ratelimit_reset_ignored_with_quota_left(self) -> None:
+        """Test reset headers are ignored while quota remains."""
+        headers = {"x-ratelimit-remaining": "5", "x-ratelimit-reset": "12"}
+
+        assert parse_retry_after(headers) is None
+
+    def test_x_ratelimit_reset_epoch(self) -> None:
+        """Test X-RateLimit-Reset given as an epoch timestamp."""
+        headers = {"x-ratelimit-remaining": "0", "x-ratelimit-reset": "1700000010"}
+
+        assert parse_retry_after(headers, now=1700000000.0) == 10.0
+
+    def test_no_hint(self) -> None:
+        """Test missing or malformed headers give no hint."""
+        assert parse_retry_after({}) is None
+        assert parse_retry_after({"retry-after": "soon"}) is None
+
+
+class TestRetryBudget:
+    """Test client-wide retry budget."""
+
+    def test_budget_caps_retries_to_ratio(self) -> None:
+        """Test retries are capped at a fraction of requests once the reserve is spent."""
+        budget = RetryBudget(
+            RetryBudgetOptions(ratio=0.5, min_retries_per_second=0, max_tokens=100)
+        )
+
+        for _ in range(10):
+            budget.record_request()
+
+        granted = sum(budget.try_acquire() for _ in range(10))
+        stats = budget.stats()
+
+        assert granted == 5
+        assert stats.requests == 10
+        assert stats.retries == 5
+        assert stats.retries_denied == 5
+
+    def test_reserve_allows_retries_at_low_traffic(self) -> None:
+        """Test the per-second reserve lets a quiet client retry."""
+        budget = RetryBudget(RetryBudgetOptions(ratio=0.0, min_retries_per_second=2))
+
+        assert budget.try_acquire() is True
+        assert budget.try_acquire() is True
+        assert budget.try_acquire() is False
+
+    def test_disabled_budget_always_allows(self) -> None:
+        """Test a disabled budget still counts retries."""
+        budget = RetryBudget(
+            RetryBudgetOptions(enabled=False, ratio=0, min_retries_per_second=0)
+        )
+
+        assert all(budget.try_acquire() for _ in range(5))
+        assert budget.stats().retries == 5
+
+    def test_reset_stats(self) -> None:
+        """Test counters can be reset."""
+        budget = RetryBudget(RetryBudgetOptions())
+        budget.record_request()
+        budget.record_give_up()
+
+        budget.reset_stats()
+
+        assert budget.stats().requests == 0
+        assert budget.stats().gave_up == 0
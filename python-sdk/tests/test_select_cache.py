@@ -0,0 +1,255 @@
+"""Tests for the tool selection cache."""
+
+from typing import Any
+
+import pytest
+import respx
+import httpx
+from connectors import (
+    Connectors,
+    ConnectorsSync,
+    SelectCacheOptions,
+    ToolSelectionOptions,
+    ValidationError,
+)
+from connectors.cache import SelectCache
+
+SELECT_URL = "http://localhost:3000/api/v1/tools/select"
+TOOL = {
+    "toolId": "github.createPullRequest",
+    "name": "Create Pull Request",
+    "description": "Create a PR",
+    "integration": "github",
+    "category": "code",
+}
+
+
+def make_cache(**kwargs: Any) -> SelectCache:
+    return SelectCache(SelectCacheOptions(enabled=True, **kwargs))
+
+
+def key(query: str, **body: object) -> object:
+    return SelectCache.key("acme", {"query": query, **body})
+
+
+class TestSelectCache:
+    """Test the cache itself."""
+
+    def test_key_normalization(self) -> None:
+        """Test case, whitespace and category order do not change the key."""
+        assert key("Create  a PR ") == key("create a pr")
+        assert key("q", categories=["b", "a"]) == key("q", categories=["a", "b"])
+        assert key("q", maxTools=3) != key("q", maxTools=5)
+        assert SelectCache.key("other", {"query": "q"}) != key("q")
+
+    def test_lru_eviction(self) -> None:
+        """Test the least recently used entry is evicted when full."""
+        cache = make_cache(max_entries=2)
+        cache.put(key("a"), [])
+        cache.put(key("b"), [])
+        cache.get(key("a"))
+        cache.put(key("c"), [])
+
+        assert cache.get(key("b")) is None
+        assert cache.get(key("a")) == []
+        stats = cache.stats()
+        assert (stats.evictions, stats.size) == (1, 2)
+
+    def test_ttl_expiry(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test entries expire after their TTL."""
+        now = [1000.0]
+        monkeypatch.setattr("connectors.cache.time.monotonic", lambda: now[0])
+        cache = make_cache(ttl=1000)
+        cache.put(key("a"), [])
+
+        now[0] += 0.5
+        assert cache.get(key("a")) == []
+        now[0] += 0.6
+        assert cache.get(key("a")) is None
+        assert cache.stats().expirations == 1
+
+    def test_invalidate(self) -> None:
+        """Test invalidating one query or everything."""
+        cache = make_cache()
+        cache.put(key("a"), [])
+        cache.put(key("a", maxTools=3), [])
+        cache.put(key("b"), [])
+
+        assert cache.invalidate("A") == 2
+        assert cache.invalidate() == 1
+        assert cache.stats().size == 0
+
+
+class TestClientSelectCache:
+    """Test select caching through the clients."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_repeated_select_hits_cache(self) -> None:
+        """Test repeated queries are answered without a request."""
+        connectors = Connectors(
+            base_url="http://localhost:3000",
+            tenant_id="acme",
+            select_cache=SelectCacheOptions(enabled=True),
+        )
+        route = respx.post(SELECT_URL).mock(
+            return_value=httpx.Response(200, json={"tools": [TOOL]})
+        )
+        options = ToolSelectionOptions(max_tools=3)
+
+        first = await connectors.tools.select("create a pull request", options)
+        second = await connectors.tools.select("Create a pull  request", options)
+        first.clear()
+        third = await connectors.tools.select("create a pull request", options)
+
+        assert route.call_count == 1
+        assert second[0].tool_id == third[0].tool_id == "github.createPullRequest"
+        stats = connectors.select_cache_stats
+        assert (stats.hits, stats.misses) == (2, 1)
+
+        assert connectors.invalidate_select_cache() == 1
+        await connectors.tools.select("create a pull request", options)
+        assert route.call_count == 2
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_disabled_by_default(self) -> None:
+        """Test the cache is opt-in."""
+        connectors = Connectors(base_url="http://localhost:3000")
+        route = respx.post(SELECT_URL).mock(
+            return_value=httpx.Response(200, json={"tools": [TOOL]})
+        )
+
+        await connectors.tools.select("create a pull request")
+        await connectors.tools.select("create a pull request")
+
+        assert route.call_count == 2
+        assert connectors.select_cache_stats.misses == 0
+        await connectors.aclose()
+
+    @respx.mock
+    def test_sync_select_cache(self) -> None:
+        """Test the sync client caches selections."""
+        connectors = ConnectorsSync(
+            base_url="http://localhost:3000", select_cache=SelectCacheOptions(enabled=True)
+        )
+        route = respx.post(SELECT_URL).mock(
+            return_value=httpx.Response(200, json={"tools": [TOOL]})
+        )
+
+        connectors.tools.select("create a pull request")
+        connectors.tools.select("create a pull request")
+
+        assert route.call_count == 1
+        assert connectors.select_cache_stats.hits == 1
+        connectors.close()
+
+    def test_invalid_options(self) -> None:
+        """Test cache options are validated when enabled."""
+        with pytest.raises(ValidationError):
+            Connectors(
+                base_url="http://localhost:3000",
+                select_cache=SelectCacheOptions(enabled=True, ttl=0),
+            )
+
+
+class TestSemanticSelectCache:
+    """Test near-duplicate lookups."""
+
+    def setup_method(self) -> None:
+        pytest.importorskip("numpy")
+
+    def test_vectorizer_similarity(self) -> None:
+        """Test rephrasings and synonyms score higher than unrelated queries."""
+        from connectors.semantic import HashingVectorizer
+
+        vectorizer = HashingVectorizer()
+        query = vectorizer.transform("create a github pull request")
+
+        def similarity(first: str, second: str) -> float:
+            return float(vectorizer.transform(first) @ vectorizer.transform(second))
+
+        assert float(query @ vectorizer.transform("create github pull requests")) > 0.85
+        assert float(query @ vectorizer.transform("send a slack message")) < 0.2
+        assert float(query @ query) == pytest.approx(1.0)
+        assert similarity("open a PR on repo X", "create pull request in X") > 0.8
+        assert similarity("create a github issue", "create a github pull request") < 0.7
+        assert vectorizer.actions("Open a PR") == vectorizer.actions("create pull requests")
+
+    def test_near_duplicate_hit(self) -> None:
+        """Test a similar query with the same options is a semantic hit."""
+        cache = make_cache(semantic=True)
+        cache.put(key("send a slack message", maxTools=3), [])
+
+        assert cache.get(key("send a message to slack", maxTools=3)) == []
+        assert cache.get(key("send a message to slack", maxTools=5)) is None
+        assert cache.get(key("list jira issues", maxTools=3)) is None
+        stats = cache.stats()
+        assert (stats.hits, stats.semantic_hits, stats.misses) == (1, 1, 2)
+
+    def test_paraphrase_hit(self) -> None:
+        """Test abbreviations and synonyms of the same request hit by default."""
+        cache = make_cache(semantic=True)
+        cache.put(key("open a PR on repo X"), [])
+
+        assert cache.get(key("create pull request in X")) == []
+        assert cache.stats().semantic_hits == 1
+
+    @pytest.mark.parametrize(
+        "cached, query",
+        [
+            ("create the slack channel X", "delete the slack channel X"),
+            ("create a PR", "close a PR"),
+            ("open pull request 12", "close pull request 12"),
+            ("send an email to bob", "search emails from bob"),
+            ("send a slack message", "search slack messages"),
+        ],
+    )
+    def test_different_actions_miss(self, cached: str, query: str) -> None:
+        """Test queries asking for a different action never reuse a cached selection."""
+        cache = make_cache(semantic=True, similarity_threshold=0.5)
+        cache.put(key(cached), [])
+
+        assert cache.get(key(query)) is None
+        assert cache.stats().semantic_hits == 0
+
+    def test_threshold(self) -> None:
+        """Test the similarity threshold is configurable."""
+        cache = SelectCache(
+            SelectCacheOptions(enabled=True, semantic=True, similarity_threshold=0.95)
+        )
+        cache.put(key("open a PR on repo X"), [])
+
+        assert cache.get(key("create pull request in X")) is None
+
+    def test_slots_reused(self) -> None:
+        """Test evicted and invalidated entries free their index slots."""
+        cache = make_cache(semantic=True, max_entries=2)
+        for i in range(5):
+            cache.put(key(f"query {i}"), [])
+        cache.invalidate()
+        cache.put(key("send a slack message"), [])
+
+        assert cache.get(key("send a message to slack")) == []
+        assert cache.stats().evictions == 3
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_client_semantic_hit(self) -> None:
+        """Test rephrased selections are answered without a request."""
+        connectors = Connectors(
+            base_url="http://localhost:3000",
+            select_cache=SelectCacheOptions(enabled=True, semantic=True),
+        )
+        route = respx.post(SELECT_URL).mock(
+            return_value=httpx.Response(200, json={"tools": [TOOL]})
+        )
+
+        await connectors.tools.select("create a github pull request")
+        tools = await connectors.tools.select("github: create pull request")
+
+        assert route.call_count == 1
+        assert tools[0].tool_id == "github.createPullRequest"
+        assert connectors.select_cache_stats.semantic_hits == 1
+        await connectors.aclose()
@@ -0,0 +1,214 @@
+"""Tests for single-flight request coalescing."""
+
+import asyncio
+
+import pytest
+import respx
+import httpx
+from connectors import Connectors, DeadlineExceededError, SingleFlightOptions
+from connectors.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test coalescing primitives."""
+
+    def test_key_ignores_ordering(self) -> None:
+        """Test keys are stable across param and body key order."""
+        first = SingleFlight.key("POST", "/select", {"a": 1, "b": 2}, {"x": 1, "y": [1, 2]})
+        second = SingleFlight.key("post", "/select", {"b": 2, "a": 1}, {"y": [1, 2], "x": 1})
+
+        assert first == second
+        assert first != SingleFlight.key("POST", "/select", {"a": 1, "b": 2}, {"x": 2})
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_result(self) -> None:
+        """Test identical concurrent calls run once."""
+        flight = SingleFlight(SingleFlightOptions())
+        calls = 0
+
+        async def fetch() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 42
+
+        results = await asyncio.gather(*(flight.do("k", fetch) for _ in range(5)))
+
+        assert results == [42] * 5
+        assert calls == 1
+        assert flight.stats().coalesced == 4
+        assert flight.stats().in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_shared(self) -> None:
+        """Test all waiters see the shared call's error."""
+        flight = SingleFlight(SingleFlightOptions())
+
+        async def fetch() -> int:
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            *(flight.do("k", fetch) for _ in range(3)), return_exceptions=True
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_others(self) -> None:
+        """Test cancelling one caller leaves the shared call running for the rest."""
+        flight = SingleFlight(SingleFlightOptions())
+
+        async def fetch() -> int:
+            await asyncio.sleep(0.02)
+            return 42
+
+        first = asyncio.ensure_future(flight.do("k", fetch))
+        second = asyncio.ensure_future(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == 42
+        assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_shared_call_cancelled_when_all_waiters_leave(self) -> None:
+        """Test the shared call is cancelled once nobody is waiting."""
+        flight = SingleFlight(SingleFlightOptions())
+        cancelled = asyncio.Event()
+
+        async def fetch() -> int:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return 42
+
+        waiter = asyncio.ensure_future(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+        assert flight.stats().in_flight == 0
+
+
+class TestClientSingleFlight:
+    """Test coalescing through the client."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_identical_selects_coalesced(self) -> None:
+        """Test identical concurrent selects share one request but not models."""
+        connectors = Connectors(base_url="http://localhost:3000")
+
+        async def select(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            return httpx.Response(
+                200,
+                json={
+                    "tools": [
+                        {
+                            "toolId": "github.createPullRequest",
+                            "name": "Create Pull Request",
+                            "description": "Create a PR",
+                            "integration": "github",
+                            "category": "code",
+                        }
+                    ]
+                },
+            )
+
+        route = respx.post("http://localhost:3000/api/v1/tools/select").mock(side_effect=select)
+
+        first, second = await asyncio.gather(
+            connectors.tools.select("create a PR"),
+            connectors.tools.select("create a PR"),
+        )
+        await connectors.tools.select("send a message")
+
+        assert route.call_count == 2
+        assert first == second
+        assert first[0] is not second[0]
+        assert connectors.single_flight_stats.coalesced == 1
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_callers_keep_their_own_deadlines(self) -> None:
+        """Test a short deadline fails only its own caller, whoever sent first."""
+        connectors = Connectors(base_url="http://localhost:3000")
+
+        async def select(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.1)
+            return httpx.Response(200, json={"tools": []})
+
+        route = respx.post("http://localhost:3000/api/v1/tools/select").mock(side_effect=select)
+
+        for query, order in (("create a PR", (50, None)), ("send a message", (None, 50))):
+            results = await asyncio.gather(
+                *(connectors.tools.select(query, deadline=d) for d in order),
+                return_exceptions=True,
+            )
+            hurried, patient = results if order[0] == 50 else results[::-1]
+            assert isinstance(hurried, DeadlineExceededError)
+            assert patient == []
+
+        assert route.call_count == 2
+        assert connectors.single_flight_stats.coalesced == 2
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_coalesces_with_default_deadline(self) -> None:
+        """Test calls under a client-wide deadline still share one request."""
+        connectors = Connectors(base_url="http://localhost:3000", deadline=10000)
+
+        async def select(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"tools": []})
+
+        route = respx.post("http://localhost:3000/api/v1/tools/select").mock(side_effect=select)
+
+        results = await asyncio.gather(
+            *(connectors.tools.select("create a PR") for _ in range(10))
+        )
+
+        assert results == [[]] * 10
+        assert route.call_count == 1
+        assert connectors.single_flight_stats.coalesced == 9
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_invokes_not_coalesced(self) -> None:
+        """Test identical invocations are each sent."""
+        connectors = Connectors(base_url="http://localhost:3000")
+        route = respx.post("http://localhost:3000/api/v1/tools/invoke").mock(
+            return_value=httpx.Response(200, json={"success": True})
+        )
+
+        await asyncio.gather(*(connectors.tools.invoke("github.getUser", {}) for _ in range(3)))
+
+        assert route.call_count == 3
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_disabled(self) -> None:
+        """Test coalescing can be turned off."""
+        connectors = Connectors(
+            base_url="http://localhost:3000",
+            single_flight=SingleFlightOptions(enabled=False),
+        )
+
+        async def health(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"status": "healthy"})
+
+        route = respx.get("http://localhost:3000/health").mock(side_effect=health)
+
+        await asyncio.gather(connectors.health(), connectors.health())
+
+        assert route.call_count == 2
+        await connectors.aclose()
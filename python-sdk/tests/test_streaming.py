@@ -0,0 +1,318 @@
+"""Tests for streaming tool lists and tool results."""
+
+import json
+from typing import AsyncIterator, Iterator
+
+import pytest
+import respx
+import httpx
+from connectors import (
+    CircuitBreakerOptions,
+    CircuitOpenError,
+    Connectors,
+    ConnectorsError,
+    ConnectorsSync,
+    HTTPError,
+    Tool,
+    ToolView,
+)
+from connectors.codec import JSONCodec
+from connectors.streaming import InvocationStreamDecoder, JSONArrayParser
+
+INVOKE_URL = "http://localhost:3000/api/v1/tools/invoke"
+
+
+def make_tool(i: int) -> dict:
+    return {
+        "toolId": f"github.action{i}",
+        "name": f"Action {i}",
+        "description": 'Handles "quoted" {braces} and [brackets] \\ too',
+        "integration": "github",
+        "category": "code",
+        "parameters": [{"name": "repo", "type": "string", "required": True}],
+    }
+
+
+def chunks(body: bytes, size: int) -> Iterator[bytes]:
+    for i in range(0, len(body), size):
+        yield body[i : i + size]
+
+
+def parse(body: bytes, size: int) -> list:
+    parser = JSONArrayParser("tools")
+    items = [json.loads(item) for chunk in chunks(body, size) for item in parser.feed(chunk)]
+    parser.close()
+    return items
+
+
+class TestJSONArrayParser:
+    """Test the incremental array parser."""
+
+    @pytest.mark.parametrize("size", [1, 3, 64, 100000])
+    def test_any_chunking(self, size: int) -> None:
+        """Test elements are extracted whatever the chunk boundaries."""
+        tools = [make_tool(i) for i in range(5)]
+        body = json.dumps({"name": "tools", "tools": tools, "total": 5}).encode()
+
+        assert parse(body, size) == tools
+
+    def test_key_must_introduce_array(self) -> None:
+        """Test the key is only matched as a key of the top-level object."""
+        body = json.dumps(
+            {"meta": {"tools": [{"nested": True}]}, "label": "tools", "tools": [{"a": 1}]}
+        ).encode()
+
+        assert parse(body, 7) == [{"a": 1}]
+
+    def test_missing_array(self) -> None:
+        """Test a body without the array yields nothing."""
+        assert parse(b'{"total": 0}', 4) == []
+
+    def test_truncated_body(self) -> None:
+        """Test a body ending inside the array raises."""
+        parser = JSONArrayParser("tools")
+        parser.feed(b'{"tools": [{"a": 1}, {"a"')
+
+        with pytest.raises(ConnectorsError):
+            parser.close()
+
+    def test_buffer_stays_bounded(self) -> None:
+        """Test only the element being read is buffered."""
+        body = json.dumps({"tools": [make_tool(i) for i in range(2000)]}).encode()
+        item_size = len(json.dumps(make_tool(1999)))
+        parser = JSONArrayParser("tools")
+        largest = 0
+        count = 0
+        for chunk in chunks(body, 4096):
+            count += len(parser.feed(chunk))
+            largest = max(largest, len(parser._buffer))
+
+        assert count == 2000
+        assert largest < 4096 + item_size
+
+
+class TestToolsStream:
+    """Test ToolsAPI.stream and SyncToolsAPI.stream."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_stream_yields_tools(self) -> None:
+        """Test tools are yielded from a chunked response."""
+        body = json.dumps({"tools": [make_tool(i) for i in range(3)]}).encode()
+
+        async def content() -> AsyncIterator[bytes]:
+            for chunk in chunks(body, 50):
+                yield chunk
+
+        connectors = Connectors(base_url="http://localhost:3000")
+        route = respx.get("http://localhost:3000/api/v1/tools/list").mock(
+            return_value=httpx.Response(200, content=content())
+        )
+
+        tools = [tool async for tool in connectors.tools.stream()]
+
+        assert [tool.tool_id for tool in tools] == [f"github.action{i}" for i in range(3)]
+        assert isinstance(tools[0], Tool)
+        assert tools[0].parameters is not None
+        assert route.calls[0].request.url.params == httpx.QueryParams()
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_stream_retries_before_body(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test failed attempts are retried until the response starts."""
+        connectors = Connectors(base_url="http://localhost:3000", trusted=True)
+        monkeypatch.setattr(connectors._http_client, "_calculate_backoff", lambda *args: 0)
+        respx.get("http://localhost:3000/api/v1/tools/list").mock(
+            side_effect=[
+                httpx.Response(503, text="busy"),
+                httpx.Response(200, json={"tools": [make_tool(1)]}),
+            ]
+        )
+
+        tools = [tool async for tool in connectors.tools.stream()]
+
+        assert isinstance(tools[0], ToolView)
+        assert tools[0].tool_id == "github.action1"
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_stream_error_response(self) -> None:
+        """Test error responses raise HTTPError with their body."""
+        connectors = Connectors(base_url="http://localhost:3000")
+        respx.get("http://localhost:3000/api/v1/tools/list").mock(
+            return_value=httpx.Response(400, text="bad filter")
+        )
+
+        with pytest.raises(HTTPError) as exc_info:
+            async for _ in connectors.tools.stream():
+                pass
+
+        assert exc_info.value.response_body == "bad filter"
+        await connectors.aclose()
+
+    @respx.mock
+    def test_sync_stream(self) -> None:
+        """Test the sync client streams tools."""
+        body = json.dumps({"tools": [make_tool(i) for i in range(3)]}).encode()
+        connectors = ConnectorsSync(base_url="http://localhost:3000")
+        respx.get("http://localhost:3000/api/v1/tools/list").mock(
+            return_value=httpx.Response(200, content=chunks(body, 50))
+        )
+
+        assert len(list(connectors.tools.stream())) == 3
+        connectors.close()
+
+
+def decode(content_type: str, body: bytes, size: int) -> list:
+    decoder = InvocationStreamDecoder(content_type, JSONCodec())
+    results = [result for chunk in chunks(body, size) for result in decoder.feed(chunk)]
+    return results + decoder.close()
+
+
+SSE_BODY = (
+    b": keep-alive\r\n\r\n"
+    b'data: {"rows": [1, 2]}\n\n'
+    b"event: progress\ndata: half\ndata: way\n\n"
+    b'event: error\ndata: {"error": "row 3 unreadable"}\n\n'
+    b'data: {"success": true, "data": {"rows": [4]}, "executionTimeMs": 12}\n\n'
+    b"data: [DONE]\n\n"
+    b"data: ignored\n\n"
+)
+
+
+class TestInvocationStreamDecoder:
+    """Test decoding streamed invocation responses by content type."""
+
+    @pytest.mark.parametrize("size", [1, 7, 100000])
+    def test_event_stream(self, size: int) -> None:
+        """Test events become chunks whatever the chunk boundaries, up to [DONE]."""
+        results = decode("text/event-stream; charset=utf-8", SSE_BODY, size)
+
+        assert [r.data for r in results] == [{"rows": [1, 2]}, "half\nway", None, {"rows": [4]}]
+        assert [r.success for r in results] == [True, True, False, True]
+        assert results[2].error == "row 3 unreadable"
+        assert results[3].execution_time_ms == 12
+
+    @pytest.mark.parametrize("size", [1, 5, 100000])
+    def test_ndjson(self, size: int) -> None:
+        """Test each line is a chunk, including a last line without a newline."""
+        body = b'{"a": 1}\r\n\n{"success": false, "error": "nope"}\n[3]'
+
+        results = decode("application/x-ndjson", body, size)
+
+        assert [r.data for r in results] == [{"a": 1}, None, [3]]
+        assert results[1].error == "nope"
+
+    def test_json_body_is_one_chunk(self) -> None:
+        """Test a buffered JSON response is yielded whole, as invoke() returns it."""
+        body = json.dumps({"success": True, "data": {"rows": list(range(100))}}).encode()
+
+        results = decode("application/json", body, 16)
+
+        assert len(results) == 1
+        assert results[0].data == {"rows": list(range(100))}
+        with pytest.raises(ConnectorsError):
+            decode("application/json", body[:-1], 16)
+
+    def test_text_and_binary(self) -> None:
+        """Test other bodies are passed through as text or bytes as they arrive."""
+        text = decode("text/plain; charset=utf-8", "héllo wörld".encode(), 2)
+        binary = decode("application/octet-stream", b"\x00\x01\x02", 2)
+
+        assert "".join(r.data for r in text) == "héllo wörld"
+        assert [r.data for r in binary] == [b"\x00\x01", b"\x02"]
+
+
+class TestInvokeStream:
+    """Test ToolsAPI.invoke_stream and MCPServer.call_stream."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_yields_chunks_as_they_arrive(self) -> None:
+        """Test chunks are yielded before the response body ends."""
+        sent = 0
+
+        async def content() -> AsyncIterator[bytes]:
+            nonlocal sent
+            for i in range(3):
+                sent += 1
+                yield json.dumps({"row": i}).encode() + b"\n"
+
+        route = respx.post(INVOKE_URL).mock(
+            return_value=httpx.Response(
+                200, headers={"content-type": "application/x-ndjson"}, content=content()
+            )
+        )
+        connectors = Connectors(base_url="http://localhost:3000", tenant_id="acme")
+
+        stream = connectors.tools.invoke_stream("postgres.runQuery", {"sql": "SELECT 1"})
+        first = await stream.__anext__()
+        sent_at_first = sent
+        rest = [chunk async for chunk in stream]
+
+        assert first.data == {"row": 0}
+        assert sent_at_first == 1
+        assert [chunk.data for chunk in rest] == [{"row": 1}, {"row": 2}]
+        request = route.calls[0].request
+        assert "text/event-stream" in request.headers["accept"]
+        assert json.loads(request.content) == {
+            "toolId": "postgres.runQuery",
+            "integration": "postgres",
+            "tenantId": "acme",
+            "parameters": {"sql": "SELECT 1"},
+        }
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_mcp_call_stream(self) -> None:
+        """Test MCP servers stream calls the same way."""
+        respx.post(INVOKE_URL).mock(
+            return_value=httpx.Response(200, json={"success": True, "data": {"login": "octo"}})
+        )
+        connectors = Connectors(base_url="http://localhost:3000")
+
+        results = [r async for r in connectors.mcp.get("github").call_stream("getUser", {})]
+
+        assert [r.data for r in results] == [{"login": "octo"}]
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_errors_trip_the_circuit(self) -> None:
+        """Test failed streamed calls count against the integration's breaker."""
+        respx.post(INVOKE_URL).mock(return_value=httpx.Response(500, text="boom"))
+        connectors = Connectors(
+            base_url="http://localhost:3000",
+            max_retries=0,
+            circuit_breaker=CircuitBreakerOptions(failure_threshold=1),
+        )
+
+        with pytest.raises(HTTPError) as exc_info:
+            async for _ in connectors.tools.invoke_stream("github.getUser", {}):
+                pass
+        with pytest.raises(CircuitOpenError):
+            async for _ in connectors.tools.invoke_stream("github.getUser", {}):
+                pass
+
+        assert exc_info.value.response_body == "boom"
+        await connectors.aclose()
+
+    @respx.mock
+    def test_sync_client(self) -> None:
+        """Test the sync client streams invocation results."""
+        respx.post(INVOKE_URL).mock(
+            side_effect=lambda request: httpx.Response(
+                200,
+                headers={"content-type": "text/event-stream"},
+                content=chunks(SSE_BODY, 9),
+            )
+        )
+        with ConnectorsSync(base_url="http://localhost:3000") as connectors:
+            tool_results = list(connectors.tools.invoke_stream("postgres.runQuery", {}))
+            mcp_results = list(connectors.mcp.get("postgres").call_stream("runQuery", {}))
+
+        assert len(tool_results) == 4
+        assert [r.data for r in mcp_results] == [r.data for r in tool_results]
@@ -0,0 +1,221 @@
+"""Tests for synchronous Connectors client."""
+
+import pytest
+import respx
+import httpx
+from connectors import ConnectorsSync
+from connectors.types import (
+    ToolListFilters,
+    MCPDeploymentConfig,
+    MCPSource,
+    MCPSourceType,
+    WaitOptions,
+    DeploymentStatusType,
+)
+from connectors.errors import HTTPError, ValidationError, DeploymentFailedError
+
+
+@pytest.fixture
+def connectors() -> ConnectorsSync:
+    return ConnectorsSync(
+        base_url="http://localhost:3000", tenant_id="test-tenant", api_key="test-key"
+    )
+
+
+TOOL = {
+    "toolId": "github.createPullRequest",
+    "name": "Create Pull Request",
+    "description": "Create a new pull request",
+    "integration": "github",
+    "category": "code",
+}
+
+
+class TestConnectorsSync:
+    """Test synchronous client behaviour."""
+
+    def test_initialization_empty_base_url(self) -> None:
+        """Test initialization fails with empty base URL."""
+        with pytest.raises(ValidationError):
+            ConnectorsSync(base_url="")
+
+    @respx.mock
+    def test_health(self, connectors: ConnectorsSync) -> None:
+        """Test health check."""
+        respx.get("http://localhost:3000/health").mock(
+            return_value=httpx.Response(200, json={"status": "healthy", "version": "1.0.0"})
+        )
+
+        health = connectors.health()
+
+        assert health.status == "healthy"
+        assert connectors.test_connection() is True
+
+    @respx.mock
+    def test_connection_pool_reused(self, connectors: ConnectorsSync) -> None:
+        """Test calls share one pooled httpx client and close releases it."""
+        respx.get("http://localhost:3000/health").mock(
+            return_value=httpx.Response(200, json={"status": "healthy"})
+        )
+
+        with connectors:
+            connectors.health()
+            pool = connectors._http_client.client
+            connectors.health()
+            assert connectors._http_client.client is pool
+
+        assert pool.is_closed
+
+    @respx.mock
+    def test_select(self, connectors: ConnectorsSync) -> None:
+        """Test tool selection."""
+        route = respx.post("http://localhost:3000/api/v1/tools/select").mock(
+            return_value=httpx.Response(200, json={"tools": [TOOL]})
+        )
+
+        tools = connectors.tools.select("create a pull request")
+
+        assert route.called
+        assert route.calls[0].request.headers["Authorization"] == "Bearer test-key"
+        assert tools[0].tool_id == "github.createPullRequest"
+
+    def test_select_empty_query(self, connectors: ConnectorsSync) -> None:
+        """Test tool selection fails with empty query."""
+        with pytest.raises(ValidationError):
+            connectors.tools.select("  ")
+
+    @respx.mock
+    def test_list(self, connectors: ConnectorsSync) -> None:
+        """Test tool listing with filters."""
+        route = respx.get("http://localhost:3000/api/v1/tools/list").mock(
+            return_value=httpx.Response(200, json={"tools": [TOOL]})
+        )
+
+        tools = connectors.tools.list(ToolListFilters(integration="github", limit=10))
+
+        assert "integration=github" in str(route.calls[0].request.url)
+        assert len(tools) == 1
+
+    @respx.mock
+    def test_invoke(self, connectors: ConnectorsSync) -> None:
+        """Test tool invocation."""
+        route = respx.post("http://localhost:3000/api/v1/tools/invoke").mock(
+            return_value=httpx.Response(200, json={"success": True, "data": {"id": 1}})
+        )
+
+        result = connectors.tools.invoke("github.createPullRequest", {"repo": "o/r"})
+
+        assert result.success is True
+        assert b'"tenantId":"test-tenant"' in route.calls[0].request.content.replace(b" ", b"")
+
+    @respx.mock
+    def test_invoke_http_error(self, connectors: ConnectorsSync) -> None:
+        """Test tool invocation surfaces HTTP errors."""
+        respx.post("http://localhost:3000/api/v1/tools/invoke").mock(
+            return_value=httpx.Response(400, text="Bad Request")
+        )
+
+        with pytest.raises(HTTPError) as exc_info:
+            connectors.tools.invoke("github.createPullRequest", {})
+
+        assert exc_info.value.status_code == 400
+
+    @respx.mock
+    def test_retry_on_503(
+        self, connectors: ConnectorsSync, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test retries on retryable status codes."""
+        monkeypatch.setattr(connectors._http_client, "_calculate_backoff", lambda *args: 0)
+        route = respx.get("http://localhost:3000/api/v1/mcp/integrations").mock(
+            side_effect=[
+                httpx.Response(503, text="Service Unavailable"),
+                httpx.Response(200, json={"integrations": []}),
+            ]
+        )
+
+        assert connectors.mcp.list() == []
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_mcp_server_call_and_list(self, connectors: ConnectorsSync) -> None:
+        """Test bound MCP server calls."""
+        respx.post("http://localhost:3000/api/v1/tools/invoke").mock(
+            return_value=httpx.Response(200, json={"success": True})
+        )
+        respx.get("http://localhost:3000/api/v1/tools/list").mock(
+            return_value=httpx.Response(200, json={"tools": [TOOL]})
+        )
+
+        github = connectors.mcp.get("github")
+
+        assert github.call("createPullRequest", {})["success"] is True
+        assert github.list_tools()[0].integration == "github"
+
+    @respx.mock
+    def test_mcp_add_and_wait(self, connectors: ConnectorsSync) -> None:
+        """Test deployment and polling until running."""
+        respx.post("http://localhost:3000/api/v1/mcp/add").mock(
+            return_value=httpx.Response(
+                200, json={"deploymentId": "dep-1", "name": "custom", "status": "pending"}
+            )
+        )
+        respx.get("http://localhost:3000/api/v1/mcp/deployments/dep-1").mock(
+            side_effect=[
+                httpx.Response(
+                    200, json={"deploymentId": "dep-1", "name": "custom", "status": "building"}
+                ),
+                httpx.Response(
+                    200, json={"deploymentId": "dep-1", "name": "custom", "status": "running"}
+                ),
+                httpx.Response(
+                    200, json={"deploymentId": "dep-1", "name": "custom", "status": "running"}
+                ),
+            ]
+        )
+
+        deployment = connectors.mcp.add(
+            MCPDeploymentConfig(
+                name="custom",
+                source=MCPSource(type=MCPSourceType.OPENAPI, url="https://x/openapi.json"),
+                category="custom",
+            )
+        )
+        deployment.wait_until_ready(WaitOptions(poll_interval=10))
+
+        assert deployment.status == DeploymentStatusType.RUNNING
+
+    @respx.mock
+    def test_wait_for_deployment_failed(self, connectors: ConnectorsSync) -> None:
+        """Test failed deployments raise DeploymentFailedError."""
+        respx.get("http://localhost:3000/api/v1/mcp/deployments/dep-1").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "deploymentId": "dep-1",
+                    "name": "custom",
+                    "status": "failed",
+                    "error": "build error",
+                },
+            )
+        )
+
+        with pytest.raises(DeploymentFailedError):
+            connectors.mcp.wait_for_deployment("dep-1")
+
+    @respx.mock
+    def test_select_many(self, connectors: ConnectorsSync) -> None:
+        """Test batched selection falls back to one select per query."""
+        def gateway(request: httpx.Request) -> httpx.Response:
+            if b'"queries"' in request.content:
+                return httpx.Response(404, text="Not Found")
+            return httpx.Response(200, json={"tools": [TOOL]})
+
+        route = respx.post("http://localhost:3000/api/v1/tools/select").mock(
+            side_effect=gateway
+        )
+
+        results = connectors.tools.select_many(["open a pr", "merge it", "open a pr"])
+
+        assert [len(tools) for tools in results] == [1, 1, 1]
+        # One rejected batch, then one select per unique query
+        assert route.call_count == 3
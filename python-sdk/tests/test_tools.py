@@ -1,10 +1,12 @@
 """Tests for ToolsAPI."""
 
+import json
+
 import pytest
 import respx
 import httpx
 from connectors import Connectors
-from connectors.types import ToolSelectionOptions, ToolListFilters
+from connectors.types import SelectCacheOptions, ToolSelectionOptions, ToolListFilters
 from connectors.errors import ValidationError, HTTPError
 
 
@@ -277,3 +279,138 @@ class TestToolsAPI:
             await connectors.tools.select("test query")
 
         assert exc_info.value.status_code == 500
+
+
+def selection(query: str) -> dict:
+    """Build the tool a fake gateway selects for a query."""
+    slug = query.replace(" ", "_")
+    return {
+        "toolId": f"demo.{slug}",
+        "name": slug,
+        "description": query,
+        "integration": "demo",
+        "category": "code",
+    }
+
+
+def batch_gateway(request: httpx.Request) -> httpx.Response:
+    """Answer batch selections, results in reverse order with 1-based indexes."""
+    body = json.loads(request.content)
+    if "queries" not in body:
+        return httpx.Response(200, json={"tools": [selection(body["query"])]})
+    results = [
+        {"index": i + 1, "use_case": q["use_case"], "tools": [selection(q["use_case"])]}
+        for i, q in enumerate(body["queries"])
+    ]
+    return httpx.Response(200, json={"results": results[::-1]})
+
+
+def single_gateway(request: httpx.Request) -> httpx.Response:
+    """Answer single selections only, like a gateway without batch mode."""
+    body = json.loads(request.content)
+    if "queries" in body:
+        return httpx.Response(400, json={"error": "Must provide query"})
+    return httpx.Response(200, json={"tools": [selection(body["query"])]})
+
+
+class TestSelectMany:
+    """Test batched selection."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_batches_and_dedupes_in_input_order(self, connectors: Connectors) -> None:
+        """Test unique queries go out in one batch and results follow input order."""
+        route = respx.post("http://localhost:3000/api/v1/tools/select").mock(
+            side_effect=batch_gateway
+        )
+
+        results = await connectors.tools.select_many(
+            ["open pr", "send email", "Open  PR", "file issue"],
+            ToolSelectionOptions(max_tools=2),
+        )
+
+        assert [tools[0].tool_id for tools in results] == [
+            "demo.open_pr", "demo.send_email", "demo.open_pr", "demo.file_issue"
+        ]
+        assert route.call_count == 1
+        body = json.loads(route.calls[0].request.content)
+        assert body["queries"] == [
+            {"use_case": "open pr"}, {"use_case": "send email"}, {"use_case": "file issue"}
+        ]
+        assert body["maxTools"] == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_splits_large_batches(self, connectors: Connectors) -> None:
+        """Test more queries than the gateway's batch limit are sent in several batches."""
+        route = respx.post("http://localhost:3000/api/v1/tools/select").mock(
+            side_effect=batch_gateway
+        )
+        queries = [f"task {i}" for i in range(15)]
+
+        results = await connectors.tools.select_many(queries)
+
+        assert [tools[0].description for tools in results] == queries
+        assert sorted(len(json.loads(c.request.content)["queries"]) for c in route.calls) == [
+            5, 10
+        ]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_fans_out_without_batch_support(self, connectors: Connectors) -> None:
+        """Test a gateway rejecting batches gets one select per query, remembered."""
+        route = respx.post("http://localhost:3000/api/v1/tools/select").mock(
+            side_effect=single_gateway
+        )
+
+        first = await connectors.tools.select_many(["a b", "c d", "a b"], concurrency=2)
+        sent = route.call_count
+        second = await connectors.tools.select_many(["e f"])
+
+        assert [tools[0].tool_id for tools in first] == ["demo.a_b", "demo.c_d", "demo.a_b"]
+        # One rejected batch, then one select per unique query
+        assert sent == 3
+        assert second[0][0].tool_id == "demo.e_f"
+        assert "queries" not in json.loads(route.calls[-1].request.content)
+        assert route.call_count == 4
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_fans_out_on_slug_only_batch_results(self, connectors: Connectors) -> None:
+        """Test batch results without tools are treated as unsupported."""
+        def gateway(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            if "queries" in body:
+                return httpx.Response(
+                    200, json={"results": [{"index": 1, "main_tool_slugs": ["x"]}]}
+                )
+            return httpx.Response(200, json={"tools": [selection(body["query"])]})
+
+        respx.post("http://localhost:3000/api/v1/tools/select").mock(side_effect=gateway)
+
+        results = await connectors.tools.select_many(["only one"])
+
+        assert results[0][0].tool_id == "demo.only_one"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_serves_cached_queries(self) -> None:
+        """Test queries in the select cache are not sent again."""
+        connectors = Connectors(
+            base_url="http://localhost:3000", select_cache=SelectCacheOptions(enabled=True)
+        )
+        route = respx.post("http://localhost:3000/api/v1/tools/select").mock(
+            side_effect=batch_gateway
+        )
+        await connectors.tools.select("open pr")
+
+        results = await connectors.tools.select_many(["open pr", "send email"])
+
+        assert [tools[0].tool_id for tools in results] == ["demo.open_pr", "demo.send_email"]
+        assert json.loads(route.calls[1].request.content)["queries"] == [
+            {"use_case": "send email"}
+        ]
+        assert (await connectors.tools.select_many(["send email"]))[0][0].tool_id == (
+            "demo.send_email"
+        )
+        assert route.call_count == 2
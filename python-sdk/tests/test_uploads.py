@@ -0,0 +1,185 @@
+"""Tests for streamed tool parameter uploads."""
+
+import base64
+import gzip
+import io
+import json
+import os
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List
+
+import pytest
+import respx
+import httpx
+from connectors import Connectors, ConnectorsSync, HTTPError, InvokeOptions
+from connectors.codec import JSONCodec
+from connectors.uploads import UPLOAD_CHUNK_SIZE, StreamedBody
+
+INVOKE_URL = "http://localhost:3000/api/v1/tools/invoke"
+FILE = os.urandom(3 * UPLOAD_CHUNK_SIZE + 7)
+OK = {"success": True}
+
+
+def rows(count: int) -> Iterator[List[Any]]:
+    for i in range(count):
+        yield [i, f"row {i}"]
+
+
+def encode(data: Dict[str, Any], compress: bool = False) -> Any:
+    body = b"".join(StreamedBody(data, JSONCodec(), "gzip" if compress else None))
+    return json.loads(gzip.decompress(body) if compress else body)
+
+
+def received(request: httpx.Request) -> Dict[str, Any]:
+    """Decode a request body as the gateway would."""
+    content = request.content
+    if request.headers.get("content-encoding") == "gzip":
+        content = gzip.decompress(content)
+    return json.loads(content)
+
+
+class TestStreamedBody:
+    """Test encoding request bodies as they are sent."""
+
+    def test_encodes_like_json(self) -> None:
+        """Test streamed values encode to the JSON the gateway expects."""
+        data = {
+            "toolId": "googleDrive.uploadFile",
+            "parameters": {
+                "name": "report.pdf",
+                "content": io.BytesIO(FILE),
+                "notes": io.StringIO('line "one"\nline two é'),
+                "thumbnail": b"\x00\xff",
+                "values": rows(3),
+                "lines": (line for line in ["a", "b"]),
+                "empty": iter([]),
+                "nested": [{"chunks": iter([FILE[:10], FILE[10:]])}],
+            },
+        }
+
+        decoded = encode(data)
+
+        parameters = decoded["parameters"]
+        assert base64.b64decode(parameters["content"]) == FILE
+        assert parameters["notes"] == 'line "one"\nline two é'
+        assert base64.b64decode(parameters["thumbnail"]) == b"\x00\xff"
+        assert parameters["values"] == [[0, "row 0"], [1, "row 1"], [2, "row 2"]]
+        assert parameters["lines"] == ["a", "b"]
+        assert parameters["empty"] == []
+        assert base64.b64decode(parameters["nested"][0]["chunks"]) == FILE
+        assert decoded["toolId"] == "googleDrive.uploadFile"
+
+    def test_compressed_in_chunks(self) -> None:
+        """Test the body is gzipped on the fly and sent in bounded chunks."""
+        body = StreamedBody({"parameters": {"content": io.BytesIO(FILE)}}, JSONCodec())
+        chunks = list(body)
+
+        assert len(chunks) > 1
+        assert max(len(chunk) for chunk in chunks) < 2 * UPLOAD_CHUNK_SIZE
+        assert encode({"values": rows(1000)}, compress=True)["values"][999] == [999, "row 999"]
+
+    def test_rewind(self) -> None:
+        """Test seekable files are rewound for a retry, iterators are not."""
+        file = io.BytesIO(b"xxheader" + FILE)
+        file.seek(8)
+        body = StreamedBody({"content": file}, JSONCodec())
+        first = b"".join(body)
+
+        assert body.rewind()
+        assert b"".join(body) == first
+        with_rows = StreamedBody({"values": rows(2)}, JSONCodec())
+        assert with_rows.rewind()
+        b"".join(with_rows)
+        assert not with_rows.rewind()
+
+
+class TestStreamedInvoke:
+    """Test invoke() streaming parameters to the gateway."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_uploads_file_and_async_rows(self, tmp_path: Path) -> None:
+        """Test files and async iterables are sent chunked, and gzipped if asked."""
+        route = respx.post(INVOKE_URL).mock(return_value=httpx.Response(200, json=OK))
+        path = tmp_path / "report.pdf"
+        path.write_bytes(FILE)
+
+        async def values() -> AsyncIterator[List[int]]:
+            for i in range(500):
+                yield [i, i * i]
+
+        connectors = Connectors(base_url="http://localhost:3000")
+        with path.open("rb") as file:
+            await connectors.tools.invoke(
+                "googleDrive.uploadFile", {"name": "report.pdf", "content": file}
+            )
+        await connectors.tools.invoke(
+            "googleSheets.appendRows",
+            {"range": "A1", "values": values()},
+            InvokeOptions(compress=True),
+        )
+
+        upload, append = (call.request for call in route.calls)
+        assert upload.headers.get("transfer-encoding") == "chunked"
+        assert base64.b64decode(received(upload)["parameters"]["content"]) == FILE
+        assert append.headers["content-encoding"] == "gzip"
+        assert received(append)["parameters"]["values"][499] == [499, 499 * 499]
+        assert received(append)["integration"] == "googleSheets"
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_retries_only_replayable_bodies(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a failed upload is resent from seekable files but not from iterators."""
+        responses = [
+            httpx.Response(503, text="busy"),
+            httpx.Response(200, json={"success": True}),
+        ]
+        route = respx.post(INVOKE_URL).mock(side_effect=responses + responses)
+        connectors = Connectors(base_url="http://localhost:3000")
+        monkeypatch.setattr(connectors._http_client, "_calculate_backoff", lambda *args: 0)
+
+        result = await connectors.tools.invoke("drive.upload", {"content": io.BytesIO(FILE)})
+        with pytest.raises(HTTPError):
+            await connectors.tools.invoke("sheets.append", {"values": rows(3)})
+
+        assert result.success
+        assert base64.b64decode(received(route.calls[1].request)["parameters"]["content"]) == FILE
+        assert route.call_count == 3
+        await connectors.aclose()
+
+    @respx.mock
+    def test_sync_client_and_mcp(self) -> None:
+        """Test the sync client and MCP servers stream parameters the same way."""
+        route = respx.post(INVOKE_URL).mock(return_value=httpx.Response(200, json=OK))
+        with ConnectorsSync(base_url="http://localhost:3000") as connectors:
+            connectors.tools.invoke("drive.upload", {"content": io.BytesIO(FILE)})
+            connectors.mcp.get("sheets").call("appendRows", {"values": rows(10)})
+
+        upload, append = (received(call.request) for call in route.calls)
+        assert base64.b64decode(upload["parameters"]["content"]) == FILE
+        assert append["toolId"] == "sheets.appendRows"
+        assert append["parameters"]["values"][9] == [9, "row 9"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_post_sends_streamed_body(self) -> None:
+        """Test post() sends a streamed body in place of its JSON data, in both clients."""
+        route = respx.post(INVOKE_URL).mock(return_value=httpx.Response(200, json=OK))
+        data = {"toolId": "drive.upload", "parameters": {"content": io.BytesIO(FILE)}}
+        connectors = Connectors(base_url="http://localhost:3000")
+        http = connectors._http_client
+        await http.post("/api/v1/tools/invoke", {}, dict, body=StreamedBody(data, http.codec))
+        with ConnectorsSync(base_url="http://localhost:3000") as sync:
+            data["parameters"]["content"].seek(0)
+            sync_http = sync._http_client
+            sync_http.post(
+                "/api/v1/tools/invoke", {}, dict, body=StreamedBody(data, sync_http.codec)
+            )
+
+        for call in route.calls:
+            assert base64.b64decode(received(call.request)["parameters"]["content"]) == FILE
+        assert route.call_count == 2
+        await connectors.aclose()
@@ -0,0 +1,116 @@
+"""Tests for trusted mode and lazy catalog views."""
+
+import pytest
+import respx
+import httpx
+from pydantic import ValidationError as PydanticValidationError
+from connectors import Connectors, ConnectorsSync, IntegrationView, Tool, ToolView
+from connectors.types import ToolParameter
+
+TOOL = {
+    "toolId": "github.createPullRequest",
+    "name": "Create Pull Request",
+    "description": "Create a PR",
+    "integration": "github",
+    "category": "code",
+    "tokenCost": 150,
+    "parameters": [{"name": "title", "type": "string", "required": True}],
+}
+
+
+class TestToolView:
+    """Test lazy tool views."""
+
+    def test_fields_read_from_raw(self) -> None:
+        """Test fields are read by alias from the raw JSON."""
+        view = ToolView(TOOL)
+
+        assert view.tool_id == "github.createPullRequest"
+        assert view.token_cost == 150
+        assert view.category == "code"
+
+    def test_nested_fields_validated(self) -> None:
+        """Test parameters are validated into models on access."""
+        view = ToolView(TOOL)
+
+        assert view.parameters == [ToolParameter(name="title", type="string", required=True)]
+        assert view.parameters is view.parameters
+
+    def test_missing_fields(self) -> None:
+        """Test optional fields default and required fields raise on access."""
+        view = ToolView({"toolId": "x.y", "integration": "x"})
+
+        assert view.token_cost is None
+        assert view.parameters is None
+        with pytest.raises(PydanticValidationError):
+            _ = view.name
+
+    def test_unknown_attribute(self) -> None:
+        """Test non-field attributes raise AttributeError."""
+        with pytest.raises(AttributeError):
+            _ = ToolView(TOOL).unknown  # type: ignore[attr-defined]
+
+    def test_to_model(self) -> None:
+        """Test views validate into equal models."""
+        view = ToolView(TOOL)
+        model = view.to_model()
+
+        assert isinstance(model, Tool)
+        assert view.to_model() is model
+        assert view == Tool.model_validate(TOOL)
+        assert view.model_dump(by_alias=True)["toolId"] == "github.createPullRequest"
+
+
+class TestTrustedMode:
+    """Test trusted mode on catalog endpoints."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_list_and_select_return_views(self) -> None:
+        """Test tools.list() and tools.select() return views when trusted."""
+        connectors = Connectors(base_url="http://localhost:3000", trusted=True)
+        respx.get("http://localhost:3000/api/v1/tools/list").mock(
+            return_value=httpx.Response(200, json={"tools": [TOOL]})
+        )
+        respx.post("http://localhost:3000/api/v1/tools/select").mock(
+            return_value=httpx.Response(200, json={"tools": [TOOL]})
+        )
+
+        listed = await connectors.tools.list()
+        selected = await connectors.tools.select("create a pull request")
+
+        assert isinstance(listed[0], ToolView)
+        assert selected[0].tool_id == "github.createPullRequest"
+        await connectors.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_untrusted_returns_models(self) -> None:
+        """Test the default mode still validates into models."""
+        connectors = Connectors(base_url="http://localhost:3000")
+        respx.get("http://localhost:3000/api/v1/tools/list").mock(
+            return_value=httpx.Response(200, json={"tools": [TOOL]})
+        )
+
+        tools = await connectors.tools.list()
+
+        assert isinstance(tools[0], Tool)
+        await connectors.aclose()
+
+    @respx.mock
+    def test_sync_mcp_list(self) -> None:
+        """Test the sync client returns integration views when trusted."""
+        connectors = ConnectorsSync(base_url="http://localhost:3000", trusted=True)
+        respx.get("http://localhost:3000/api/v1/mcp/integrations").mock(
+            return_value=httpx.Response(
+                200,
+                json={"integrations": [{"name": "github", "category": "code", "toolCount": 12}]},
+            )
+        )
+
+        integrations = connectors.mcp.list()
+
+        assert isinstance(integrations[0], IntegrationView)
+        assert integrations[0].tool_count == 12
+        assert integrations[0].custom is False
+        connectors.close()